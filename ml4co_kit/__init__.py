@@ -23,10 +23,13 @@ from .data import TSPLIBOriDataset, TSPUniformDataset, TSPLIB4MLDataset, ML4TSPD
 #######################################################
 #                      Evaluator                      #
 #######################################################
-from .evaluate import ATSPEvaluator
+from .evaluate import ATSPEvaluator, atsp_batch_tours_cost, atsp_batch_evaluate
 from .evaluate import CVRPEvaluator, CVRPUniformEvaluator
+from .evaluate import cvrp_pad_tours, cvrp_batch_tours_cost
+from .evaluate import cvrp_batch_check_tours, cvrp_batch_evaluate
 from .evaluate import SATLIBEvaluator
 from .evaluate import TSPEvaluator, TSPLIBOriEvaluator, TSPLIB4MLEvaluator, TSPUniformEvaluator
+from .evaluate import tsp_held_karp_bound, atsp_held_karp_bound
 
 #######################################################
 #                    Data Generator                   #
@@ -46,11 +49,11 @@ from .generator import TSPDataGenerator
 #######################################################
 from .solver import ATSPSolver, ATSPLKHSolver
 from .solver import CVRPSolver, CVRPPyVRPSolver, CVRPLKHSolver, CVRPHGSSolver
-from .solver import LPSolver, LPGurobiSolver
-from .solver import MClSolver, MClGurobiSolver
-from .solver import MCutSolver, MCutGurobiSolver
-from .solver import MISSolver, KaMISSolver, MISGurobiSolver
-from .solver import MVCSolver, MVCGurobiSolver
+from .solver import LPSolver, LPGurobiSolver, LPHiGHSSolver
+from .solver import MClSolver, MClGurobiSolver, MClHiGHSSolver
+from .solver import MCutSolver, MCutGurobiSolver, MCutHiGHSSolver
+from .solver import MISSolver, KaMISSolver, MISGurobiSolver, MISHiGHSSolver
+from .solver import MVCSolver, MVCGurobiSolver, MVCHiGHSSolver
 from .solver import (
     TSPSolver, TSPLKHSolver, TSPConcordeSolver, 
     TSPConcordeLargeSolver, TSPGAEAXSolver, TSPGAEAXLargeSolver
@@ -59,11 +62,30 @@ from .solver import (
 #######################################################
 #                    Utils Function                   #
 #######################################################
-from .utils import download, compress_folder, extract_archive, _get_md5
+from .utils import download, compress_folder, extract_archive, _get_md5, parallel_load
 from .utils import iterative_execution_for_file, iterative_execution, Timer
-from .utils import np_dense_to_sparse, np_sparse_to_dense, GraphData, tsplib95
+from .utils import np_dense_to_sparse, np_sparse_to_dense, GraphData, GraphBatch, tsplib95
+from .utils import edge_incidence_matrix
 from .utils import MISGraphData, MVCGraphData, MClGraphData, MCutGraphData
+from .utils import (
+    mcut_cut_value, mis_check_independence, mvc_check_cover, mcl_check_clique,
+    batch_mcut_cut_value, batch_mis_check_independence, 
+    batch_mvc_check_cover, batch_mcl_check_clique
+)
+from .utils import (
+    mis_violations, mvc_violations, mcl_violations, mis_repair, mvc_repair, mcl_repair,
+    batch_mis_violations, batch_mvc_violations, batch_mcl_violations,
+    batch_mis_repair, batch_mvc_repair, batch_mcl_repair
+)
+from .utils import (
+    erdos_renyi_edges, barabasi_albert_edges, holme_kim_edges, watts_strogatz_edges
+)
+from .utils import complement_edges, degeneracy_order, greedy_clique
 from .utils import sat_to_mis_graph, cnf_folder_to_gpickle_folder, cnf_to_gpickle
+from .utils import cnf_to_npz, cnf_folder_to_npz_folder, read_graph_npz, write_graph_npz
+from .utils import floyd_warshall, knn_graph, read_tsplib, tsplib_edge_weight_matrix
+from .utils import np_distance, distance_matrix
+from .utils import render_tsp, render_atsp, render_vrp, render_tour
 
 #######################################################
 #           Extension Function (matplotlib)           #
@@ -1,12 +1,13 @@
 #######################################
 #            ATSP Evaluator           #  
 #######################################
-from .atsp.base import ATSPEvaluator
+from .atsp.base import ATSPEvaluator, atsp_batch_tours_cost, atsp_batch_evaluate
 
 #######################################
 #             ATSP Evaluator             #  
 #######################################
-from .cvrp.base import CVRPEvaluator
+from .cvrp.base import CVRPEvaluator, cvrp_pad_tours, cvrp_batch_tours_cost
+from .cvrp.base import cvrp_batch_check_tours, cvrp_batch_evaluate
 from .cvrp.uniform_eval import CVRPUniformEvaluator
 
 #######################################
@@ -18,6 +19,7 @@ from .mis.satlib_eval import SATLIBEvaluator
 #            TSP Evaluator            #  
 #######################################
 from .tsp.base import TSPEvaluator
+from .tsp.lower_bound import tsp_held_karp_bound, atsp_held_karp_bound
 from .tsp.tsplib_original_eval import TSPLIBOriEvaluator
 from .tsp.uniform_eval import TSPUniformEvaluator
 from .tsp.tsplib4ml_eval import TSPLIB4MLEvaluator
@@ -1,7 +1,8 @@
 import math
 import numpy as np
 from typing import Union
-from pyvrp.read import ROUND_FUNCS
+from ml4co_kit.evaluate.tsp.base import _get_round_func
+from ml4co_kit.evaluate.tsp.lower_bound import atsp_held_karp_bound
 
 
 class ATSPEvaluator(object):
@@ -18,21 +19,72 @@ class ATSPEvaluator(object):
         self, route: Union[np.ndarray, list], 
         to_int: bool = False, round_func: str="round"
     ):
-        if not to_int:
-            round_func = "none"
-        
-        if (key := str(round_func)) in ROUND_FUNCS:
-            round_func = ROUND_FUNCS[key]
-        
-        if not callable(round_func):
-            raise TypeError(
-                f"round_func = {round_func} is not understood. Can be a function,"
-                f" or one of {ROUND_FUNCS.keys()}."
-            )
-        
-        total_cost = 0
-        for i in range(len(route) - 1):
-            cost = self.dists[route[i]][route[i + 1]]
-            total_cost += round_func(cost)
-
-        return total_cost
\ No newline at end of file
+        round_func = _get_round_func(to_int, round_func)
+        route = np.asarray(route, dtype=np.int64)
+        return np.sum(round_func(self.dists[route[:-1], route[1:]]))
+
+    def lower_bound(
+        self, upper_bound: float = None, max_iters: int = 300,
+        to_int: bool = False, round_func: str = "round"
+    ):
+        r"""
+        Held-Karp lower bound of the optimal tour length, see ``atsp_held_karp_bound``.
+        """
+        return atsp_held_karp_bound(
+            dists=self.dists, upper_bound=upper_bound, 
+            max_iters=max_iters, to_int=to_int, round_func=round_func
+        )
+
+
+def atsp_batch_tours_cost(
+    dists: np.ndarray, tours: np.ndarray, 
+    to_int: bool = False, round_func: str = "round"
+) -> np.ndarray:
+    r"""
+    Computes the costs of many ATSP tours with a single fancy-indexed gather
+    ``dists[b, tour[:, :-1], tour[:, 1:]]`` followed by a sum reduction.
+    :param dists: np.ndarray, the dist matrices with shape (B, N, N).
+    :param tours: np.ndarray, the tours with shape (B, N+1) or (B, M, N+1) 
+        if every problem has M tours.
+    :param to_int: boolean, whether to round the cost of every edge.
+    :param round_func: string, the category of the rounding function, used when ``to_int`` is True.
+    :return: np.ndarray with shape (B,) or (B, M), the cost of every tour.
+    """
+    round_func = _get_round_func(to_int, round_func)
+    dists = np.asarray(dists)
+    tours = np.asarray(tours, dtype=np.int64)
+    if dists.ndim == 2:
+        dists = np.expand_dims(dists, axis=0)
+    if dists.shape[0] != tours.shape[0]:
+        raise ValueError("The number of problems and tours does not match!")
+    batch_idx = np.arange(tours.shape[0]).reshape((-1,) + (1,) * (tours.ndim - 1))
+    edge_costs = dists[batch_idx, tours[..., :-1], tours[..., 1:]]
+    return np.sum(round_func(edge_costs), axis=-1)
+
+
+def atsp_batch_evaluate(
+    dists: np.ndarray, 
+    tours: np.ndarray, 
+    ref_tours: np.ndarray = None,
+    to_int: bool = False, 
+    round_func: str = "round"
+):
+    r"""
+    Evaluates a batch of ATSP problems instance-wise.
+    :param dists: np.ndarray, the dist matrices with shape (B, N, N).
+    :param tours: np.ndarray, the tours with shape (B, N+1) or (B, M, N+1). If every 
+        problem has M tours, the best one is taken as the solution.
+    :param ref_tours: np.ndarray, the reference tours with shape (B, N+1). 
+    :param to_int: boolean, whether to round the cost of every edge.
+    :param round_func: string, the category of the rounding function, used when ``to_int`` is True.
+    :return: costs with shape (B,); if ``ref_tours`` is given, (costs, ref_costs, gaps) 
+        where gaps are percentages.
+    """
+    costs = atsp_batch_tours_cost(dists, tours, to_int, round_func)
+    if costs.ndim == 2:
+        costs = np.min(costs, axis=1)
+    if ref_tours is None:
+        return costs
+    ref_costs = atsp_batch_tours_cost(dists, ref_tours, to_int, round_func)
+    gaps = (costs - ref_costs) / ref_costs * 100
+    return costs, ref_costs, gaps
@@ -1,6 +1,6 @@
 import numpy as np
-from typing import Union
-from ml4co_kit.evaluate.tsp.base import TSPEvaluator
+from typing import Union, List
+from ml4co_kit.evaluate.tsp.base import TSPEvaluator, _get_round_func, _get_weights
 
 
 class CVRPEvaluator(TSPEvaluator):
@@ -31,4 +31,156 @@ class CVRPEvaluator(TSPEvaluator):
         coords[0] = depots
         coords[1:] = points
         self.points = coords
-        self.set_norm(norm)
\ No newline at end of file
+        self.set_norm(norm)
+
+
+def cvrp_pad_tours(tours: List[np.ndarray], pad_value: int = -1) -> np.ndarray:
+    r"""
+    Packs tours of different lengths into one (B, L) array padded with ``pad_value``.
+    :param tours: list of np.ndarray, the tours of every problem.
+    :param pad_value: int, the value filled after the end of every tour.
+    """
+    lengths = np.array([len(tour) for tour in tours], dtype=np.int64)
+    max_length = lengths.max() if len(lengths) > 0 else 0
+    np_tours = np.full(shape=(len(tours), max_length), fill_value=pad_value, dtype=np.int32)
+    if len(tours) > 0:
+        np_tours[np.arange(max_length) < lengths[:, None]] = np.concatenate(tours)
+    return np_tours
+
+
+def _valid_tours(tours: np.ndarray):
+    # everything from the first "-1" on is padding
+    tours = np.asarray(tours, dtype=np.int64)
+    if tours.ndim == 1:
+        tours = np.expand_dims(tours, axis=0)
+    valid = np.cumprod(tours != -1, axis=1).astype(bool)
+    return np.where(valid, tours, 0), valid
+
+
+def cvrp_batch_tours_cost(
+    depots: np.ndarray,
+    points: np.ndarray,
+    tours: np.ndarray,
+    norm: str = "EUC_2D",
+    to_int: bool = False, 
+    round_func: str = "round"
+) -> np.ndarray:
+    r"""
+    Computes the costs of many CVRP tours with vectorized gathers.
+    :param depots: np.ndarray, the depots coordinates with shape (B, 2).
+    :param points: np.ndarray, the customer coordinates with shape (B, N, 2).
+    :param tours: np.ndarray, the tours with shape (B, L), padded with "-1".
+    :param norm: string, the norm used to calcuate the distance ("EUC_2D" or "GEO").
+    :param to_int: boolean, whether to round the cost of every edge.
+    :param round_func: string, the category of the rounding function, used when ``to_int`` is True.
+    :return: np.ndarray with shape (B,), the cost of every tour.
+    """
+    round_func = _get_round_func(to_int, round_func)
+    depots = np.asarray(depots).reshape(-1, 1, np.shape(points)[-1])
+    coords = np.concatenate([depots, np.asarray(points)], axis=1)
+    tours, valid = _valid_tours(tours)
+    if tours.shape[0] != coords.shape[0]:
+        raise ValueError("The number of problems and tours does not match!")
+    if np.any(tours >= coords.shape[1]) or np.any(tours < 0):
+        raise ValueError("The tours contain invalid node indices.")
+    
+    # gather the coordinates of every node in the tours
+    nodes_coords = coords[np.arange(tours.shape[0])[:, None], tours]
+    weights = _get_weights(nodes_coords[:, :-1], nodes_coords[:, 1:], norm)
+    weights = np.where(valid[:, 1:], round_func(weights), 0)
+    return np.sum(weights, axis=1)
+
+
+def cvrp_batch_check_tours(
+    tours: np.ndarray,
+    demands: np.ndarray,
+    capacities: np.ndarray,
+    return_loads: bool = False
+):
+    r"""
+    Checks the feasibility of many CVRP tours in one pass. A tour is feasible if 
+    it starts and ends at the depot, visits every customer exactly once, and the 
+    load of every route (computed by ``np.add.reduceat`` on the depot boundaries) 
+    does not exceed the capacity.
+    :param tours: np.ndarray, the tours with shape (B, L), padded with "-1".
+    :param demands: np.ndarray, the customer demands with shape (B, N).
+    :param capacities: np.ndarray, the capacities with shape (B,) or (1,).
+    :param return_loads: boolean, whether to also return the route loads and 
+        the index of the problem every route belongs to.
+    :return: np.ndarray with shape (B,), the feasibility of every tour.
+    """
+    demands = np.asarray(demands, dtype=np.float64)
+    if demands.ndim == 1:
+        demands = np.expand_dims(demands, axis=0)
+    tours, valid = _valid_tours(tours)
+    batch_size, length = tours.shape
+    nodes_num = demands.shape[1]
+    capacities = np.broadcast_to(
+        np.asarray(capacities, dtype=np.float64).reshape(-1), (batch_size,)
+    )
+    if np.any(tours > nodes_num) or np.any(tours < 0):
+        raise ValueError("The tours contain invalid node indices.")
+    
+    # routes begin at every depot (and at the beginning of every tour)
+    batch_idx = np.arange(batch_size)[:, None]
+    demands = np.concatenate([np.zeros(shape=(batch_size, 1)), demands], axis=1)
+    nodes_demand = np.where(valid, demands[batch_idx, tours], 0)
+    starts = valid & (tours == 0)
+    starts[:, 0] = True
+    flat_starts = np.flatnonzero(starts)
+    loads = np.add.reduceat(nodes_demand.reshape(-1), flat_starts)
+    route_batch = flat_starts // length
+    overload = loads > capacities[route_batch] + 1e-5
+    feasible = np.bincount(route_batch[overload], minlength=batch_size) == 0
+    
+    # every customer is visited exactly once
+    customers = valid & (tours > 0)
+    visit_key = (batch_idx * (nodes_num + 1) + tours)[customers]
+    visits = np.bincount(visit_key, minlength=batch_size * (nodes_num + 1))
+    visits = visits.reshape(batch_size, nodes_num + 1)[:, 1:]
+    feasible &= np.all(visits == 1, axis=1)
+    
+    # start and end at the depot
+    last_idx = np.maximum(valid.sum(axis=1) - 1, 0)
+    feasible &= (tours[:, 0] == 0) & (tours[np.arange(batch_size), last_idx] == 0)
+    
+    if return_loads:
+        return feasible, loads, route_batch
+    return feasible
+
+
+def cvrp_batch_evaluate(
+    depots: np.ndarray,
+    points: np.ndarray,
+    tours: np.ndarray,
+    demands: np.ndarray = None,
+    capacities: np.ndarray = None,
+    ref_tours: np.ndarray = None,
+    norm: str = "EUC_2D",
+    to_int: bool = False,
+    round_func: str = "round"
+):
+    r"""
+    Evaluates a batch of CVRP problems instance-wise in one pass.
+    :param depots: np.ndarray, the depots coordinates with shape (B, 2).
+    :param points: np.ndarray, the customer coordinates with shape (B, N, 2).
+    :param tours: np.ndarray, the tours with shape (B, L), padded with "-1".
+    :param demands: np.ndarray, the customer demands with shape (B, N). If given 
+        together with ``capacities``, the feasibility of the tours is checked.
+    :param capacities: np.ndarray, the capacities with shape (B,).
+    :param ref_tours: np.ndarray, the reference tours with shape (B, L'), padded with "-1".
+    :param norm: string, the norm used to calcuate the distance ("EUC_2D" or "GEO").
+    :param to_int: boolean, whether to round the cost of every edge.
+    :param round_func: string, the category of the rounding function, used when ``to_int`` is True.
+    :return: (costs, feasible); if ``ref_tours`` is given, (costs, ref_costs, gaps, feasible)
+        where gaps are percentages. ``feasible`` is None if no demands are given.
+    """
+    costs = cvrp_batch_tours_cost(depots, points, tours, norm, to_int, round_func)
+    feasible = None
+    if demands is not None and capacities is not None:
+        feasible = cvrp_batch_check_tours(tours, demands, capacities)
+    if ref_tours is None:
+        return costs, feasible
+    ref_costs = cvrp_batch_tours_cost(depots, points, ref_tours, norm, to_int, round_func)
+    gaps = (costs - ref_costs) / ref_costs * 100
+    return costs, ref_costs, gaps, feasible
@@ -2,12 +2,32 @@ import math
 import numpy as np
 from typing import Union
 from pyvrp.read import ROUND_FUNCS
-from ml4co_kit.utils.distance_utils import geographical
+from ml4co_kit.utils.distance_utils import geographical, np_distance
 
 
 SUPPORT_NORM_TYPE = ["EUC_2D", "GEO"]
 
 
+def _get_round_func(to_int: bool, round_func: str):
+    if not to_int:
+        round_func = "none"
+    
+    if (key := str(round_func)) in ROUND_FUNCS:
+        round_func = ROUND_FUNCS[key]
+    
+    if not callable(round_func):
+        raise TypeError(
+            f"round_func = {round_func} is not understood. Can be a function,"
+            f" or one of {ROUND_FUNCS.keys()}."
+        )
+    return round_func
+
+
+def _get_weights(x: np.ndarray, y: np.ndarray, norm: str) -> np.ndarray:
+    # pairwise distances between coordinates with shape (..., 2)
+    return np_distance(x, y, norm)
+
+
 class TSPEvaluator(object):
     def __init__(self, points: Union[list, np.ndarray], norm: str = "EUC_2D"):
         if type(points) == list:
@@ -38,21 +58,21 @@ class TSPEvaluator(object):
         self, route: Union[np.ndarray, list], 
         to_int: bool = False, round_func: str="round"
     ):
-        if not to_int:
-            round_func = "none"
-        
-        if (key := str(round_func)) in ROUND_FUNCS:
-            round_func = ROUND_FUNCS[key]
-        
-        if not callable(round_func):
-            raise TypeError(
-                f"round_func = {round_func} is not understood. Can be a function,"
-                f" or one of {ROUND_FUNCS.keys()}."
-            )
-        
-        total_cost = 0
-        for i in range(len(route) - 1):
-            cost = self.get_weight(self.points[route[i]], self.points[route[i + 1]])
-            total_cost += round_func(cost)
+        round_func = _get_round_func(to_int, round_func)
+        route = np.asarray(route, dtype=np.int64)
+        weights = _get_weights(self.points[route[:-1]], self.points[route[1:]], self.norm)
+        return np.sum(round_func(weights))
 
-        return total_cost
\ No newline at end of file
+    def lower_bound(
+        self, upper_bound: float = None, max_iters: int = 300,
+        to_int: bool = False, round_func: str = "round"
+    ):
+        r"""
+        Held-Karp lower bound of the optimal tour length, see ``tsp_held_karp_bound``.
+        """
+        # imported here since the lower bound module depends on this one
+        from ml4co_kit.evaluate.tsp.lower_bound import tsp_held_karp_bound
+        return tsp_held_karp_bound(
+            points=self.points, norm=self.norm, upper_bound=upper_bound,
+            max_iters=max_iters, to_int=to_int, round_func=round_func
+        )
@@ -0,0 +1,276 @@
+import numpy as np
+from typing import Union, Callable
+from scipy.spatial import cKDTree, Delaunay, QhullError
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import minimum_spanning_tree, connected_components
+from ml4co_kit.evaluate.tsp.base import _get_round_func, _get_weights
+
+
+def _nearest_neighbor_cost(row_fn: Callable, nodes_num: int) -> float:
+    # cost of the greedy nearest neighbor tour starting from node 0
+    visited = np.zeros(shape=(nodes_num,), dtype=bool)
+    visited[0] = True
+    cur, cost = 0, 0.0
+    for _ in range(nodes_num - 1):
+        row = np.where(visited, np.inf, row_fn(cur))
+        nxt = np.argmin(row)
+        cost += row[nxt]
+        visited[nxt] = True
+        cur = nxt
+    return cost + row_fn(cur)[0]
+
+
+def _prim_one_tree(row_fn: Callable, nodes_num: int, pi: np.ndarray):
+    # exact minimum 1-tree under the costs d_ij + pi_i + pi_j with O(N) memory:
+    # a spanning tree on nodes 1..N-1 plus the two cheapest edges of node 0
+    in_tree = np.zeros(shape=(nodes_num,), dtype=bool)
+    in_tree[:2] = True
+    best = np.full(shape=(nodes_num,), fill_value=np.inf)
+    parent = np.zeros(shape=(nodes_num,), dtype=np.int64)
+    degree = np.zeros(shape=(nodes_num,), dtype=np.int64)
+    cur, total = 1, 0.0
+    for _ in range(nodes_num - 2):
+        row = row_fn(cur) + pi[cur] + pi
+        update = ~in_tree & (row < best)
+        best[update] = row[update]
+        parent[update] = cur
+        nxt = np.argmin(np.where(in_tree, np.inf, best))
+        total += best[nxt]
+        degree[nxt] += 1
+        degree[parent[nxt]] += 1
+        in_tree[nxt] = True
+        cur = nxt
+    row = row_fn(0) + pi[0] + pi
+    row[0] = np.inf
+    two = np.argpartition(row, 2)[:2]
+    total += row[two].sum()
+    degree[0] += 2
+    degree[two] += 1
+    return total - 2 * pi.sum(), degree
+
+
+def _sparse_one_tree(
+    src: np.ndarray, dst: np.ndarray, weights: np.ndarray, nodes_num: int, pi: np.ndarray
+):
+    # minimum 1-tree restricted to the candidate edges (src < dst)
+    cost = weights + pi[src] + pi[dst]
+    # csgraph drops zero entries, so make every cost strictly positive first
+    offset = 1.0 - cost.min()
+    inner = src != 0
+    graph = coo_matrix(
+        (cost[inner] + offset, (src[inner], dst[inner])), shape=(nodes_num, nodes_num)
+    )
+    tree = minimum_spanning_tree(graph).tocoo()
+    total = tree.data.sum() - offset * len(tree.data)
+    degree = np.bincount(tree.row, minlength=nodes_num)
+    degree += np.bincount(tree.col, minlength=nodes_num)
+    root_edges = np.flatnonzero(~inner)
+    kth = min(2, len(root_edges) - 1)
+    two = root_edges[np.argpartition(cost[root_edges], kth)[:2]]
+    total += cost[two].sum()
+    degree[0] += 2
+    degree[dst[two]] += 1
+    return total - 2 * pi.sum(), degree
+
+
+def _supports_one_tree(src: np.ndarray, dst: np.ndarray, nodes_num: int) -> bool:
+    # a 1-tree exists in the candidate graph if node 0 has two candidate edges and
+    # the other nodes are connected without node 0 (otherwise the sparse "1-tree"
+    # is a forest and its bound is not valid)
+    inner = src != 0
+    if (~inner).sum() < 2:
+        return False
+    graph = coo_matrix(
+        (np.ones(shape=(inner.sum(),)), (src[inner] - 1, dst[inner] - 1)),
+        shape=(nodes_num - 1, nodes_num - 1)
+    )
+    return connected_components(graph, directed=False)[0] == 1
+
+
+def _delaunay_edges(points: np.ndarray) -> np.ndarray:
+    # the edges (E, 2) of the Delaunay triangulation, which is connected and
+    # contains the euclidean minimum spanning tree (none for degenerate points)
+    try:
+        simplices = Delaunay(points).simplices
+    except (QhullError, ValueError):
+        return np.zeros(shape=(0, 2), dtype=np.int64)
+    pairs = [simplices[:, [i, j]] for i in range(3) for j in range(i + 1, 3)]
+    return np.concatenate(pairs, axis=0)
+
+
+def _candidate_edges(nbrs: np.ndarray, extra_edges: np.ndarray = None):
+    # symmetric, duplicate-free candidate edges (src < dst) from neighbor lists
+    # (and the extra edges with shape (E, 2))
+    nodes_num, k = nbrs.shape
+    src = np.repeat(np.arange(nodes_num), k)
+    dst = nbrs.reshape(-1)
+    if extra_edges is not None:
+        src = np.concatenate([src, extra_edges[:, 0]])
+        dst = np.concatenate([dst, extra_edges[:, 1]])
+    mask = src != dst
+    low = np.minimum(src[mask], dst[mask])
+    high = np.maximum(src[mask], dst[mask])
+    key = np.unique(low * nodes_num + high)
+    return key // nodes_num, key % nodes_num
+
+
+def _held_karp(
+    row_fn: Callable,
+    nodes_num: int,
+    upper_bound: float,
+    candidates: tuple = None,
+    max_iters: int = 300,
+    patience: int = 20,
+) -> float:
+    # subgradient ascent on the node penalties pi (Held & Karp, 1971)
+    if candidates is not None and not _supports_one_tree(*candidates[:2], nodes_num):
+        # fall back to the dense 1-tree
+        candidates = None
+    if candidates is not None:
+        src, dst, weights = candidates
+        one_tree = lambda pi: _sparse_one_tree(src, dst, weights, nodes_num, pi)
+    else:
+        one_tree = lambda pi: _prim_one_tree(row_fn, nodes_num, pi)
+
+    pi = np.zeros(shape=(nodes_num,))
+    best_bound, best_pi = -np.inf, pi
+    alpha, no_improve = 2.0, 0
+    for _ in range(max_iters):
+        bound, degree = one_tree(pi)
+        if bound > best_bound + 1e-9:
+            best_bound, best_pi, no_improve = bound, pi.copy(), 0
+        else:
+            no_improve += 1
+        subgrad = degree - 2
+        norm = np.dot(subgrad, subgrad)
+        if norm == 0:
+            # the 1-tree is a tour, so the bound is optimal
+            break
+        if no_improve >= patience:
+            alpha, no_improve = alpha / 2, 0
+            if alpha < 1e-3:
+                break
+        step = alpha * max(upper_bound - bound, 1e-9 * abs(upper_bound)) / norm
+        pi = pi + step * subgrad
+
+    # the candidate 1-trees are only approximate, so certify with the exact one, and
+    # keep the plain 1-tree bound if the penalties do not carry over to it
+    if candidates is not None:
+        best_bound, _ = _prim_one_tree(row_fn, nodes_num, best_pi)
+        plain_bound, _ = _prim_one_tree(row_fn, nodes_num, np.zeros(shape=(nodes_num,)))
+        best_bound = max(best_bound, plain_bound)
+    return best_bound
+
+
+def tsp_held_karp_bound(
+    points: Union[list, np.ndarray],
+    norm: str = "EUC_2D",
+    upper_bound: float = None,
+    max_iters: int = 300,
+    knn_k: int = 10,
+    knn_threshold: int = 20,
+    to_int: bool = False,
+    round_func: str = "round"
+) -> float:
+    r"""
+    Computes the Held-Karp (1-tree with subgradient ascent) lower bound of a TSP instance.
+    For more than ``knn_threshold`` nodes the ascent runs on the kNN candidate graph and
+    the final bound is certified by one exact O(N^2) time / O(N) memory 1-tree, so the
+    returned value is always a valid lower bound of the optimal tour length.
+
+    :param points: np.ndarray, the coordinates of the nodes with shape (N, 2).
+    :param norm: string, the norm used to calcuate the distance ("EUC_2D" or "GEO").
+    :param upper_bound: float, the cost of a known tour, which sets the step size.
+        If None, the cost of the nearest neighbor tour is used.
+    :param max_iters: int, the maximum number of subgradient iterations.
+    :param knn_k: int, the number of nearest neighbors in the candidate graph, which
+        also contains the Delaunay edges so that it is connected. If it is not
+        connected anyway, the dense 1-tree is used.
+    :param knn_threshold: int, the number of nodes from which the candidate graph is used.
+    :param to_int: boolean, whether to round the distances.
+    :param round_func: string, the category of the rounding function, used when ``to_int`` is True.
+    """
+    if knn_k < 2:
+        raise ValueError(f"``knn_k`` must be at least 2, but got {knn_k}.")
+    points = np.asarray(points, dtype=np.float64)
+    if points.ndim != 2:
+        raise ValueError("points must be 2D array.")
+    nodes_num = points.shape[0]
+    if nodes_num < 3:
+        raise ValueError("The Held-Karp bound needs at least 3 nodes.")
+    round_func = _get_round_func(to_int, round_func)
+    row_fn = lambda i: round_func(_get_weights(points[i], points, norm))
+    if upper_bound is None:
+        upper_bound = _nearest_neighbor_cost(row_fn, nodes_num)
+
+    candidates = None
+    if nodes_num > knn_threshold:
+        k = min(knn_k, nodes_num - 1)
+        _, nbrs = cKDTree(points).query(points, k=k + 1)
+        src, dst = _candidate_edges(nbrs, _delaunay_edges(points))
+        weights = round_func(_get_weights(points[src], points[dst], norm))
+        candidates = (src, dst, weights.astype(np.float64))
+    return _held_karp(row_fn, nodes_num, upper_bound, candidates, max_iters)
+
+
+def atsp_held_karp_bound(
+    dists: Union[list, np.ndarray],
+    upper_bound: float = None,
+    max_iters: int = 300,
+    knn_k: int = 10,
+    knn_threshold: int = 1000,
+    to_int: bool = False,
+    round_func: str = "round"
+) -> float:
+    r"""
+    Computes the Held-Karp lower bound of an ATSP instance. The instance is turned into a
+    symmetric one with 2N nodes (node i is split into an in-copy i and an out-copy N+i
+    joined by an edge of cost -M, the out-copy N+i and the in-copy j are joined by an edge
+    of cost d_ij), whose 1-tree bound plus N * M bounds the optimal ATSP tour length.
+
+    :param dists: np.ndarray, the distance matrix with shape (N, N).
+    :param upper_bound: float, the cost of a known tour, which sets the step size.
+        If None, the cost of the nearest neighbor tour is used.
+    :param max_iters: int, the maximum number of subgradient iterations.
+    :param knn_k: int, the number of nearest neighbors in the candidate graph. If the
+        candidate graph is not connected, the dense 1-tree is used.
+    :param knn_threshold: int, the number of (transformed) nodes from which the candidate graph is used.
+    :param to_int: boolean, whether to round the distances.
+    :param round_func: string, the category of the rounding function, used when ``to_int`` is True.
+    """
+    if knn_k < 2:
+        raise ValueError(f"``knn_k`` must be at least 2, but got {knn_k}.")
+    dists = np.asarray(dists, dtype=np.float64)
+    if dists.ndim != 2 or dists.shape[0] != dists.shape[1]:
+        raise ValueError("dists must be a square 2D array.")
+    nodes_num = dists.shape[0]
+    if nodes_num < 2:
+        raise ValueError("The Held-Karp bound needs at least 2 nodes.")
+    dists = np.asarray(_get_round_func(to_int, round_func)(dists), dtype=np.float64)
+    if upper_bound is None:
+        upper_bound = _nearest_neighbor_cost(lambda i: dists[i], nodes_num)
+
+    # symmetric transformation
+    big_m = np.abs(dists).max() * nodes_num + 1.0
+    off_diag = dists.copy()
+    np.fill_diagonal(off_diag, np.inf)
+    sym = np.full(shape=(2 * nodes_num, 2 * nodes_num), fill_value=np.inf)
+    sym[nodes_num:, :nodes_num] = off_diag
+    sym[:nodes_num, nodes_num:] = off_diag.T
+    idx = np.arange(nodes_num)
+    sym[idx, idx + nodes_num] = -big_m
+    sym[idx + nodes_num, idx] = -big_m
+    row_fn = lambda i: sym[i]
+
+    candidates = None
+    if 2 * nodes_num > knn_threshold:
+        k = min(knn_k, nodes_num)
+        nbrs = np.argpartition(sym, k - 1, axis=1)[:, :k]
+        src, dst = _candidate_edges(nbrs)
+        finite = np.isfinite(sym[src, dst])
+        src, dst = src[finite], dst[finite]
+        candidates = (src, dst, sym[src, dst])
+    bound = _held_karp(
+        row_fn, 2 * nodes_num, upper_bound - nodes_num * big_m, candidates, max_iters
+    )
+    return bound + nodes_num * big_m
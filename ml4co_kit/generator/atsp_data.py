@@ -1,9 +1,9 @@
-import copy
 import shutil
 import pathlib
 import numpy as np
-from typing import Union, Tuple
+from typing import Union, Tuple, List
 from ml4co_kit.utils.type_utils import SOLVER_TYPE
+from ml4co_kit.utils.shortest_path import floyd_warshall
 from ml4co_kit.generator.base import EdgeGeneratorBase
 from ml4co_kit.solver import ATSPSolver, ATSPLKHSolver
 
@@ -70,139 +70,108 @@ class ATSPDataGenerator(EdgeGeneratorBase):
     #         Generate Funcs         #
     ##################################
     
-    def _generate_sat(self) -> Tuple[np.ndarray, np.ndarray]:
-        dists, ref_tours = [], []
+    def _generate_sat(
+        self, batch_size: int, rng: np.random.Generator
+    ) -> Tuple[np.ndarray, np.ndarray]:
         num_nodes = self.nodes_num
         num_variables = self.sat_vars_nums
         num_clauses = self.sat_clauses_nums
+        var_nodes_num = 2 * num_variables * num_clauses
+        batch_idx = np.arange(batch_size)[:, None]
         
-        # Generate SAT instances for each thread
-        for _ in range(self.num_threads):
-            # Initialize distance matrix with ones
-            dist = np.ones((num_nodes, num_nodes))
-            ref_tour = []
-            # Randomly generate variable values (0 or 1)
-            var_values = [np.random.randint(0, 2) for _ in range(num_variables)]
-            
-            # Generate the distance matrix and reference tour
-            for v in range(num_variables):
-                sub_tour = []
-                ofs = v * 2 * num_clauses  # Offset for variable nodes
-                
-                for c in range(num_clauses):
-                    # Set the distances between clause pairs to 0
-                    dist[ofs + 2 * c, ofs + 2 * c + 1] = 0
-                    dist[ofs + 2 * c + 1, ofs + 2 * c] = 0
-                    
-                    # Build the sub-tour based on variable value
-                    if var_values[v] == 1:
-                        sub_tour.append(ofs + 2 * c + 1)
-                        if c != num_clauses - 1:
-                            sub_tour.append(ofs + 2 * c + 2)
-                    else:
-                        sub_tour.insert(0, ofs + 2 * c)
-                        if c != num_clauses - 1:
-                            sub_tour.insert(0, ofs + 2 * c + 1)
-                        
-                    # Connect clauses in sequence
-                    if c != num_clauses - 1:
-                        dist[ofs + 2 * c + 1, ofs + 2 * c + 2] = 0
-                        dist[ofs + 2 * c + 2, ofs + 2 * c + 1] = 0
-
-                # Connect variable clauses to the next variable
-                dist[ofs, (ofs + 2 * num_clauses) % (2 * num_variables * num_clauses)] = 0
-                dist[ofs, (ofs + 4 * num_clauses - 1) % (2 * num_variables * num_clauses)] = 0
-                dist[ofs + 2 * num_clauses - 1, (ofs + 2 * num_clauses) % (2 * num_variables * num_clauses)] = 0
-                dist[ofs + 2 * num_clauses - 1, (ofs + 4 * num_clauses - 1) % (2 * num_variables * num_clauses)] = 0
-
-                # Extend the reference tour with the sub-tour
-                ref_tour.extend(sub_tour)
-                if var_values[(v + 1) % num_variables] == 1:
-                    ref_tour.append((ofs + 2 * num_clauses) % (2 * num_variables * num_clauses))
-                else:
-                    ref_tour.append((ofs + 4 * num_clauses - 1) % (2 * num_variables * num_clauses))
-
-            # Close the tour by connecting the last node to the first
-            ref_tour.insert(0, ref_tour[-1])
-            ofs_clause = 2 * num_clauses * num_variables
-
-            for c in range(num_clauses):
-                # Randomly select 3 variables for the clause
-                vars = np.random.choice(num_variables, size=3, replace=False)
-                # Randomly assign signs (0 or 1) to the selected variables
-                signs = np.random.choice(2, 3, replace=True)
-                # Ensure at least one variable satisfies the clause
-                fix_var_id = np.random.randint(0, 3)
-                signs[fix_var_id] = var_values[vars[fix_var_id]]
-                
-                # Update distance matrix and reference tour for the clause
-                for i in range(3):
-                    ofs_var = vars[i] * 2 * num_clauses
-                    if signs[i] == 1:  # Variable is True
-                        dist[ofs_var + 2 * c, ofs_clause + c] = 0
-                        dist[ofs_clause + c, ofs_var + 2 * c + 1] = 0
-                        if vars[i] == vars[fix_var_id]:
-                            ref_tour.insert(ref_tour.index(ofs_var + 2 * c + 1), ofs_clause + c)
-                    else:  # Variable is False (not x)
-                        dist[ofs_var + 2 * c + 1, ofs_clause + c] = 0
-                        dist[ofs_clause + c, ofs_var + 2 * c] = 0
-                        if vars[i] == vars[fix_var_id]:
-                            ref_tour.insert(ref_tour.index(ofs_var + 2 * c), ofs_clause + c)
-                            
-            # Append the generated distance matrix and reference tour to the lists
-            dists.append(dist)
-            ref_tours.append(ref_tour)
-            
-        # Return the distance matrices and reference tours as numpy arrays
-        return np.array(dists), np.array(ref_tours)
+        # Randomly generate variable values (0 or 1)
+        var_values = rng.integers(0, 2, size=(batch_size, num_variables))
+        # Randomly select 3 variables for each clause
+        clause_vars = np.argsort(
+            rng.random((batch_size, num_clauses, num_variables)), axis=2
+        )[:, :, :3]
+        # Randomly assign signs (0 or 1) to the selected variables
+        signs = rng.integers(0, 2, size=(batch_size, num_clauses, 3))
+        # Ensure at least one variable satisfies the clause
+        fix_var_id = rng.integers(0, 3, size=(batch_size, num_clauses))
+        fix_vars = np.take_along_axis(clause_vars, fix_var_id[..., None], axis=2)[..., 0]
+        np.put_along_axis(
+            signs, fix_var_id[..., None], np.take_along_axis(var_values, fix_vars, axis=1)[..., None], axis=2
+        )
+        
+        # The chains of variable nodes (shared by all the instances)
+        dist = np.ones((num_nodes, num_nodes))
+        chain = np.arange(var_nodes_num).reshape(num_variables, 2 * num_clauses)
+        dist[chain[:, :-1], chain[:, 1:]] = 0
+        dist[chain[:, 1:], chain[:, :-1]] = 0
+        # Connect variable clauses to the next variable
+        starts, ends = chain[:, 0], chain[:, -1]
+        next_starts, next_ends = np.roll(starts, -1), np.roll(ends, -1)
+        for u, v in [(starts, next_starts), (starts, next_ends), (ends, next_starts), (ends, next_ends)]:
+            dist[u, v] = 0
+        dists = np.repeat(dist[None], batch_size, axis=0)
+        
+        # Clause nodes: x -> clause -> x' for a true literal, x' -> clause -> x otherwise
+        clause_nodes = var_nodes_num + np.arange(num_clauses)[None, :, None]
+        even_nodes = clause_vars * 2 * num_clauses + 2 * np.arange(num_clauses)[None, :, None]
+        in_nodes = np.where(signs == 1, even_nodes, even_nodes + 1)
+        out_nodes = np.where(signs == 1, even_nodes + 1, even_nodes)
+        clause_nodes = np.broadcast_to(clause_nodes, in_nodes.shape)
+        dists[batch_idx[..., None], in_nodes, clause_nodes] = 0
+        dists[batch_idx[..., None], clause_nodes, out_nodes] = 0
+        
+        # Reference tour: each variable chain is traversed forward if the variable is true
+        # and backward otherwise, and every clause node is visited through its fixed variable
+        var_tours = np.where(var_values[..., None] == 1, chain[None], chain[None, :, ::-1])
+        var_tours = var_tours.reshape(batch_size, var_nodes_num)
+        position = np.empty_like(var_tours)
+        np.put_along_axis(position, var_tours, np.arange(var_nodes_num)[None], axis=1)
+        fix_out_nodes = np.take_along_axis(out_nodes, fix_var_id[..., None], axis=2)[..., 0]
+        keys = np.concatenate(
+            [2 * np.arange(var_nodes_num)[None].repeat(batch_size, 0),
+             2 * np.take_along_axis(position, fix_out_nodes, axis=1) - 1], axis=1
+        )
+        nodes = np.concatenate(
+            [var_tours, np.broadcast_to(var_nodes_num + np.arange(num_clauses), fix_out_nodes.shape)], axis=1
+        )
+        ref_tours = np.take_along_axis(nodes, np.argsort(keys, axis=1), axis=1)
+        
+        # Close the tour by connecting the last node to the first
+        ref_tours = np.concatenate([ref_tours, ref_tours[:, :1]], axis=1)
+        return dists, ref_tours
 
-    def _generate_hcp(self) -> Tuple[np.ndarray, np.ndarray]:
-        # prepare
-        dists, ref_tours = [], []
-        noise_level = np.random.rand() * 0.2 + 0.1
+    def _generate_hcp(
+        self, batch_size: int, rng: np.random.Generator
+    ) -> Tuple[np.ndarray, np.ndarray]:
         num_nodes = self.nodes_num
+        batch_idx = np.arange(batch_size)[:, None]
+        dists = np.ones((batch_size, num_nodes, num_nodes))
         
-        # generate
-        for _ in range(self.num_threads):
-            # Ones matrix
-            dist = np.ones((num_nodes, num_nodes))
+        # Random permutation of nodes (equivalent to torch.randperm)
+        hpath = rng.permuted(np.tile(np.arange(num_nodes), (batch_size, 1)), axis=1)
 
-            # Random permutation of nodes (equivalent to torch.randperm)
-            hpath = np.random.permutation(num_nodes)
-
-            # Set distances to 0 along the hpath
-            dist[hpath, np.roll(hpath, -1)] = 0
-
-            # Add noise to the distance matrix
-            num_noise_edges = int(noise_level * num_nodes * num_nodes)
-            if num_noise_edges > 0:
-                heads = np.random.choice(num_nodes, size=num_noise_edges, replace=True)
-                tails = np.random.choice(num_nodes, size=num_noise_edges, replace=True)
-                dist[heads, tails] = 0
-
-            # Convert the hpath to a list and append the first node to form a closed tour
-            ref_tour: list = hpath.tolist()
-            ref_tour.append(ref_tour[0])
-            
-            dists.append(dist)
-            ref_tours.append(ref_tour)
+        # Set distances to 0 along the hpath
+        dists[batch_idx, hpath, np.roll(hpath, -1, axis=1)] = 0
         
-        return np.array(dists), np.array(ref_tours)
-
-    def _generate_uniform(self) -> Tuple[np.ndarray, np.ndarray]:
+        # Add noise to the distance matrix
+        noise_level = rng.random((batch_size, 1)) * 0.2 + 0.1
+        num_noise_edges = (noise_level * num_nodes * num_nodes).astype(np.int64)
+        max_noise_edges = int(num_noise_edges.max())
+        heads = rng.integers(0, num_nodes, size=(batch_size, max_noise_edges))
+        tails = rng.integers(0, num_nodes, size=(batch_size, max_noise_edges))
+        noise_mask = np.arange(max_noise_edges)[None] < num_noise_edges
+        dists[np.broadcast_to(batch_idx, heads.shape)[noise_mask], heads[noise_mask], tails[noise_mask]] = 0
+
+        # Append the first node to form a closed tour
+        ref_tours = np.concatenate([hpath, hpath[:, :1]], axis=1)
+        return dists, ref_tours
+
+    def _generate_uniform(
+        self, batch_size: int, rng: np.random.Generator
+    ) -> Tuple[np.ndarray, np.ndarray]:
         scaler = 1e6
-        dists = list()
-        for _ in range(self.num_threads):
-            dist = np.random.randint(low=0, high=scaler, size=(self.nodes_num, self.nodes_num))
-            dist[np.arange(self.nodes_num), np.arange(self.nodes_num)] = 0
-            dist: np.ndarray
-            while True:
-                old_dist = copy.deepcopy(dist)
-                dist = (dist[:, None, :] + dist[None, :, :].transpose(0, 2, 1)).min(axis=2)
-                if (dist == old_dist).all():
-                    break
-            dists.append(dist / scaler)
-        return np.array(dists), None
+        dists = rng.integers(
+            low=0, high=scaler, size=(batch_size, self.nodes_num, self.nodes_num)
+        )
+        dists[:, np.arange(self.nodes_num), np.arange(self.nodes_num)] = 0
+        # shortest path closure, so that the distances satisfy the triangle inequality
+        dists = floyd_warshall(dists)
+        return dists / scaler, None
 
     ##################################
     #      Solver-Checking Funcs     #
@@ -229,31 +198,30 @@ class ATSPDataGenerator(EdgeGeneratorBase):
     ##################################
     
     def generate_only_instance_for_us(self, samples: int) -> np.ndarray:
-        self.num_threads = samples
-        dists = self.generate_func()[0]
+        dists = self.generate_func(samples, self.rng)[0]
         self.solver.from_data(dists=dists)
         return self.solver.dists
 
-    def _generate_core(self):
-        # call generate_func to generate data
-        batch_dists, tours = self.generate_func()
-        
-        # solve
+    def _sample_instances(self) -> List[Tuple[np.ndarray, np.ndarray]]:
+        batch_dists, tours = self.generate_func(self.num_threads, self.rng)
         if tours is None:
-            tours = self.solver.solve(
-                dists=batch_dists, num_threads=self.num_threads
-            )
-        
-        # write to txt
-        for idx, tour in enumerate(tours):
-            tour = tour[:-1]
-            if (np.sort(tour) == np.arange(self.nodes_num)).all():
-                with open(self.file_save_path, "a+") as f:
-                    for line in batch_dists[idx]:
-                        f.write(" ".join(str(x) + str(" ") for x in line))
-                        f.write(str(" "))
-                    f.write(str("output") + str(" "))
-                    f.write(str(" ").join(str(node_idx + 1) for node_idx in tour))
-                    f.write(str(" ") + str(tour[0] + 1) + str(" "))
-                    f.write("\n")
-                f.close()
\ No newline at end of file
+            tours = [None] * len(batch_dists)
+        return list(zip(batch_dists, tours))
+    
+    def _solve_instance(self, idx: int, instance: Tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+        dists, tour = instance
+        if tour is None:
+            tour = self.solver.solve(dists=dists[None], num_threads=1)[0]
+        return np.asarray(tour)
+    
+    def _instance_to_line(
+        self, instance: Tuple[np.ndarray, np.ndarray], tour: np.ndarray
+    ) -> Union[str, None]:
+        tour = tour[:-1]
+        if not (np.sort(tour) == np.arange(self.nodes_num)).all():
+            return None
+        dists = "".join(
+            " ".join(str(x) + " " for x in line) + " " for line in instance[0].tolist()
+        )
+        nodes = [str(node_idx + 1) for node_idx in tour.tolist()]
+        return dists + "output " + " ".join(nodes) + " " + nodes[0] + " \n"
@@ -1,20 +1,40 @@
 import os
 import sys
+import json
 import time
-import random
+import queue
 import shutil
 import pathlib
+import threading
 import numpy as np
-import networkx as nx
 from tqdm import tqdm
-from typing import Union, Any
+from multiprocessing import Pool
+from typing import Union, Any, List, Tuple, Iterator
 from ml4co_kit.solver.base import SolverBase
 from ml4co_kit.utils.type_utils import SOLVER_TYPE
+from ml4co_kit.utils.graph.random_graph import (
+    erdos_renyi_edges, barabasi_albert_edges, holme_kim_edges, watts_strogatz_edges
+)
 
 
 import warnings
 warnings.filterwarnings("ignore")
 
+
+# the generator held by every worker of the persistent solver pool
+_WORKER_GENERATOR = None
+
+
+def _init_solver_worker(generator: "GeneratorBase"):
+    global _WORKER_GENERATOR
+    _WORKER_GENERATOR = generator
+
+
+def _solve_in_worker(item: tuple) -> tuple:
+    idx, instance = item
+    return idx, _WORKER_GENERATOR._solve_instance(idx, instance)
+
+
 class GeneratorBase(object):
     def __init__(
         self,
@@ -41,6 +61,12 @@ class GeneratorBase(object):
         self.test_samples_num = test_samples_num
         self.save_path = save_path
         self.filename = filename
+        self.shard_id = 0
+        self.num_shards = 1
+        
+        # the random generator of all the samplers (seeded from the global numpy
+        # state, so ``np.random.seed`` still makes the generation reproducible)
+        self.rng = np.random.default_rng(np.random.randint(np.iinfo(np.int32).max))
         
         # check the data type
         self.generate_func_dict = generate_func_dict
@@ -71,12 +97,11 @@ class GeneratorBase(object):
         self.generate_func = self.generate_func_dict[self.data_type]
     
     def _check_num_threads(self):
+        if self.num_threads < 1:
+            raise ValueError("``num_threads`` must be a positive integer.")
         self.samples_num = 0
         for sample_type in self.sample_types:
             self.samples_num += getattr(self, f"{sample_type}_samples_num")
-            if self.samples_num % self.num_threads != 0:
-                message = "``samples_num`` must be divisible by the number of threads. "
-                raise ValueError(message)
 
     def _check_solver(self):
         # get solver
@@ -117,25 +142,337 @@ class GeneratorBase(object):
             "The ``generate_only_instance_for_us`` function is required to implemented in subclasses."
         )
 
-    def generate(self) -> Any:
+    def generate(
+        self, 
+        queue_size: int = None, 
+        resume: bool = False, 
+        checkpoint_interval: int = 100,
+        seed: int = None,
+        shard_id: int = None,
+        num_shards: int = 1
+    ) -> Any:
+        r"""
+        Generates, solves and writes ``samples_num`` instances. Every solved instance is 
+        appended to the output file and to the train/val/test file it belongs to.
+        
+        With ``num_shards > 1``, only the ``shard_id``-th contiguous part of the instances 
+        is generated and written to ``<filename>_shard_<shard_id>.txt``. The RNG of each 
+        shard is seeded from ``np.random.SeedSequence(seed).spawn(num_shards)``, so the 
+        shards can run on different processes or nodes and ``merge_shards`` assembles the 
+        same train/val/test files for the same ``seed``, ``num_shards`` and ``num_threads``.
+
+        :param queue_size: int, the maximum number of instances that have been sampled 
+            but not yet written. Defaults to ``4 * num_threads``.
+        :param resume: boolean, whether to continue from the progress manifest written
+            by a previous (interrupted) run. If no manifest exists, generation starts over.
+        :param checkpoint_interval: int, the number of instances between two checkpoints 
+            of the progress manifest.
+        :param seed: int, the root seed of the random generator ``self.rng``. 
+            If None, the current ``self.rng`` is used. Required for sharding.
+        :param shard_id: int, the index of the shard to generate (``0 <= shard_id < num_shards``).
+        :param num_shards: int, the number of shards the instances are divided into.
+        """
+        self._set_shard(shard_id, num_shards, seed)
         start_time = time.time()
-        for _ in tqdm(
-            range(self.samples_num // self.num_threads),
-            desc=self.solver.solve_msg,
-        ):
-            self._generate_core()
+        manifest = self._load_manifest() if resume else None
+        shard_start_idx, end_idx = self._get_shard_range()
+        start_idx = shard_start_idx if manifest is None else manifest["completed"]
+        self._generate_pipeline(manifest, queue_size, checkpoint_interval)
         end_time = time.time() - start_time
         print(
-            f"Completed generation of {self.samples_num} samples of {self.solver.task_type}."
+            f"Completed generation of {end_idx - shard_start_idx} samples of {self.solver.task_type}."
         )
         print(f"Total time: {end_time/60:.1f}m")
-        print(f"Average time: {end_time/self.samples_num:.1f}s")
-        self.devide_file()
-     
-    def _generate_core(self) -> Any:
+        print(f"Average time: {end_time/max(end_idx - start_idx, 1):.1f}s")
+
+    def _sample_instances(self) -> List[Any]:
+        raise NotImplementedError(
+            "The ``_sample_instances`` function is required to implemented in subclasses."
+        )
+    
+    def _solve_instance(self, idx: int, instance: Any) -> Any:
         raise NotImplementedError(
-            "The ``_generate_core`` function is required to implemented in subclasses."
+            "The ``_solve_instance`` function is required to implemented in subclasses."
         )
+    
+    def _instance_to_line(self, instance: Any, solution: Any) -> Union[str, None]:
+        raise NotImplementedError(
+            "The ``_instance_to_line`` function is required to implemented in subclasses."
+        )
+
+    ##################################
+    #            Sharding            #
+    ##################################
+    
+    def _set_shard(self, shard_id: Union[int, None], num_shards: int, seed: Union[int, None]):
+        if num_shards < 1:
+            raise ValueError("``num_shards`` must be a positive integer.")
+        if shard_id is None:
+            if num_shards > 1:
+                raise ValueError("``shard_id`` is required when ``num_shards`` > 1.")
+            shard_id = 0
+        if not 0 <= shard_id < num_shards:
+            raise ValueError(f"``shard_id`` must be in [0, {num_shards}), but got {shard_id}.")
+        if seed is None and num_shards > 1:
+            raise ValueError("``seed`` is required for sharded generation.")
+        self.shard_id = shard_id
+        self.num_shards = num_shards
+        if seed is not None:
+            # independent streams for the shards, derived from the same root seed
+            shard_seed = np.random.SeedSequence(seed).spawn(num_shards)[shard_id]
+            self.rng = np.random.default_rng(shard_seed)
+
+    def _is_sharded(self) -> bool:
+        return self.num_shards > 1
+
+    def _get_shard_range(self) -> tuple:
+        start_idx = self.shard_id * self.samples_num // self.num_shards
+        end_idx = (self.shard_id + 1) * self.samples_num // self.num_shards
+        return start_idx, end_idx
+
+    def _get_shard_file_path(self, shard_id: int) -> str:
+        return os.path.join(self.save_path, self.filename + f"_shard_{shard_id}.txt")
+
+    def merge_shards(self, num_shards: int):
+        r"""
+        Concatenates the outputs of the ``num_shards`` shards in shard order into the 
+        output file and divides it into train/val/test files.
+        
+        :param num_shards: int, the number of shards used in ``generate``.
+        """
+        shard_paths = [self._get_shard_file_path(shard_id) for shard_id in range(num_shards)]
+        for shard_path in shard_paths:
+            if not os.path.exists(shard_path):
+                raise ValueError(f"The output of the shard ({shard_path}) does not exist.")
+        with open(self.file_save_path, "wb") as f:
+            for shard_path in shard_paths:
+                with open(shard_path, "rb") as shard_file:
+                    shutil.copyfileobj(shard_file, f)
+        self.devide_file()
+
+    ##################################
+    #       Checkpoint & Resume      #
+    ##################################
+    
+    def _get_rng_state(self) -> dict:
+        return self.rng.bit_generator.state
+
+    def _set_rng_state(self, state: dict):
+        self.rng.bit_generator.state = state
+
+    def _get_manifest_path(self) -> str:
+        if self._is_sharded():
+            return os.path.join(
+                self.save_path, self.filename + f"_shard_{self.shard_id}_progress.json"
+            )
+        return os.path.join(self.save_path, self.filename + "_progress.json")
+    
+    def _load_manifest(self) -> Union[dict, None]:
+        manifest_path = self._get_manifest_path()
+        if not os.path.exists(manifest_path):
+            print(f"No progress manifest found in {manifest_path}, starting from scratch.")
+            return None
+        with open(manifest_path, "r") as f:
+            manifest = json.load(f)
+        keys = [f"{sample_type}_samples_num" for sample_type in self.sample_types]
+        for key in keys + ["shard_id", "num_shards", "num_threads"]:
+            if manifest[key] != getattr(self, key):
+                raise ValueError(
+                    f"The ``{key}`` ({getattr(self, key)}) does not match "
+                    f"the progress manifest ({manifest[key]})."
+                )
+        return manifest
+    
+    def _save_manifest(self, manifest: dict):
+        # write to a temporary file first so that a crash never leaves a broken manifest
+        manifest_path = self._get_manifest_path()
+        with open(manifest_path + ".tmp", "w") as f:
+            json.dump(manifest, f)
+        os.replace(manifest_path + ".tmp", manifest_path)
+    
+    def _get_split_type(self, line_idx: int) -> str:
+        if line_idx < self.train_samples_num:
+            return "train"
+        if line_idx < self.train_samples_num + self.val_samples_num:
+            return "val"
+        return "test"
+    
+    def _open_output_files(self, manifest: Union[dict, None]) -> dict:
+        # the complete output file and its incremental train/val/test splits
+        if self._is_sharded():
+            paths = {"all": self._get_shard_file_path(self.shard_id)}
+        else:
+            paths = {"all": self.file_save_path}
+            for sample_type in self.sample_types:
+                paths[sample_type] = getattr(self, f"{sample_type}_file_save_path")
+        files = dict()
+        for key, path in paths.items():
+            if manifest is None:
+                files[key] = open(path, "w", buffering=1 << 20)
+                continue
+            # drop everything written after the last checkpoint
+            offset = manifest["offsets"][key]
+            if not os.path.exists(path) or os.path.getsize(path) < offset:
+                raise ValueError(f"The output file {path} is shorter than recorded in the manifest.")
+            files[key] = open(path, "a", buffering=1 << 20)
+            files[key].truncate(offset)
+        return files
+
+    ##################################
+    #            Pipeline            #
+    ##################################
+    
+    def _generate_pipeline(
+        self, manifest: Union[dict, None], queue_size: int = None, checkpoint_interval: int = 100
+    ):
+        r"""
+        Runs the sampling, solving and writing stages concurrently. A sampling thread fills 
+        a bounded queue, a persistent pool of ``num_threads`` workers solves the instances 
+        as they arrive, and a single buffered writer serializes the solved instances in index
+        order. Every ``checkpoint_interval`` instances, the writer records the progress 
+        (written instances, file offsets, split counts and the RNG state needed to sample 
+        the remaining instances) in the manifest, so that an interrupted run can be resumed.
+        """
+        if queue_size is None:
+            queue_size = 4 * self.num_threads
+        shard_start_idx, end_idx = self._get_shard_range()
+        if manifest is None:
+            start_idx, lines_num = shard_start_idx, 0
+            splits = {sample_type: 0 for sample_type in self.sample_types}
+        else:
+            start_idx, lines_num = manifest["completed"], manifest["lines"]
+            splits = manifest["splits"]
+            self._set_rng_state(manifest["rng_state"])
+        batch_start_idx = start_idx if manifest is None else start_idx - manifest["rng_offset"]
+        
+        instance_queue = queue.Queue(maxsize=queue_size)
+        slots = threading.Semaphore(queue_size)
+        stop = threading.Event()
+        states_lock = threading.Lock()
+        batch_states = dict()
+        pending = dict()
+        error = list()
+        
+        # stage 1: sampling
+        def _put(item: tuple) -> bool:
+            while not stop.is_set():
+                try:
+                    instance_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def _produce():
+            idx = batch_start_idx
+            try:
+                while idx < end_idx and not stop.is_set():
+                    # remember the RNG state before every batch for checkpoints
+                    with states_lock:
+                        batch_states[idx] = self._get_rng_state()
+                    for instance in self._sample_instances():
+                        if idx == end_idx:
+                            break
+                        # instances before ``start_idx`` were written before resuming
+                        if idx >= start_idx and not _put((idx, instance)):
+                            break
+                        idx += 1
+            except BaseException as e:
+                error.append(e)
+            _put(None)
+
+        def _get() -> Union[tuple, None]:
+            while not stop.is_set():
+                try:
+                    return instance_queue.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+            return None
+
+        def _instances() -> Iterator[tuple]:
+            while True:
+                # at most ``queue_size`` instances are sampled but not yet written
+                slots.acquire()
+                item = _get()
+                if item is None:
+                    return
+                pending[item[0]] = item[1]
+                yield item
+        
+        def _checkpoint(completed: int):
+            for f in files.values():
+                f.flush()
+                os.fsync(f.fileno())
+            with states_lock:
+                state_idx = max(idx for idx in batch_states.keys() if idx <= completed)
+                for idx in [idx for idx in batch_states.keys() if idx < state_idx]:
+                    del batch_states[idx]
+                rng_state = batch_states[state_idx]
+            self._save_manifest({
+                "train_samples_num": self.train_samples_num,
+                "val_samples_num": self.val_samples_num,
+                "test_samples_num": self.test_samples_num,
+                "shard_id": self.shard_id,
+                "num_shards": self.num_shards,
+                "num_threads": self.num_threads,
+                "completed": completed,
+                "lines": lines_num,
+                "splits": dict(splits),
+                "offsets": {key: f.tell() for key, f in files.items()},
+                "rng_state": rng_state,
+                "rng_offset": completed - state_idx,
+            })
+
+        # stage 2: solving (the pool is forked before any other thread starts)
+        files = self._open_output_files(manifest)
+        pool = None
+        if self.num_threads == 1:
+            results = (
+                (idx, self._solve_instance(idx, instance)) for idx, instance in _instances()
+            )
+        else:
+            pool = Pool(
+                self.num_threads, initializer=_init_solver_worker, initargs=(self,)
+            )
+        producer = threading.Thread(target=_produce, daemon=True)
+        producer.start()
+        if pool is not None:
+            results = pool.imap(_solve_in_worker, _instances())
+        
+        # stage 3: writing
+        try:
+            with tqdm(
+                total=end_idx - shard_start_idx, 
+                initial=start_idx - shard_start_idx, 
+                desc=self.solver.solve_msg
+            ) as pbar:
+                for idx, solution in results:
+                    line = self._instance_to_line(pending.pop(idx), solution)
+                    if line is not None:
+                        files["all"].write(line)
+                        # shards are divided into splits by ``merge_shards``
+                        if not self._is_sharded():
+                            split_type = self._get_split_type(lines_num)
+                            files[split_type].write(line)
+                            splits[split_type] += 1
+                        lines_num += 1
+                    slots.release()
+                    pbar.update(1)
+                    if (idx + 1) % checkpoint_interval == 0 or idx + 1 == end_idx:
+                        _checkpoint(idx + 1)
+        finally:
+            # unblock the sampling thread and the pool feeder if a stage failed
+            stop.set()
+            for _ in range(queue_size):
+                slots.release()
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+            for f in files.values():
+                f.close()
+        producer.join()
+        if error:
+            raise error[0]
    
     def devide_file(self):
         with open(self.file_save_path, "r") as f:
@@ -278,46 +615,69 @@ class NodeGeneratorBase(GeneratorBase):
         if not only_instance_for_us:
             self._check_weighted()
 
-    def _random_weight(self, n, mu=1, sigma=0.1):
-        weights: np.ndarray = np.around(np.random.normal(mu, sigma, n))
+    def _random_weight(self, rng: np.random.Generator, n, mu=1, sigma=0.1):
+        weights: np.ndarray = np.around(rng.normal(mu, sigma, n))
         return weights.astype(int).clip(min=0)
     
-    def _if_need_weighted(self, nx_graph: nx.Graph):
-        if self.graph_weighted:
-            weight_mapping = {
-                vertex: int(weight)
-                for vertex, weight in zip(
-                    nx_graph.nodes,
-                    self._random_weight(
-                        nx_graph.number_of_nodes(), sigma=30, mu=100
-                    ),
-                )
-            }
-            nx.set_node_attributes(nx_graph, values=weight_mapping, name="weight")
-        return nx_graph
-
-    def _generate_erdos_renyi(self) -> nx.Graph:
-        num_nodes = random.randint(self.nodes_num_min, self.nodes_num_max)
-        nx_graph = nx.erdos_renyi_graph(num_nodes, self.er_prob)
-        return self._if_need_weighted(nx_graph)
-
-    def _generate_barabasi_albert(self) -> nx.Graph:
-        num_nodes = random.randint(self.nodes_num_min, self.nodes_num_max)
-        nx_graph = nx.barabasi_albert_graph(num_nodes, min(self.ba_conn_degree, num_nodes))
-        return self._if_need_weighted(nx_graph)
-
-    def _generate_holme_kim(self) -> nx.Graph:
-        num_nodes = random.randint(self.nodes_num_min, self.nodes_num_max)
-        nx_graph = nx.powerlaw_cluster_graph(
-            num_nodes, min(self.hk_conn_degree, num_nodes), self.hk_prob
-        )
-        return self._if_need_weighted(nx_graph)
+    def _random_nodes_num(self, batch_size: int, rng: np.random.Generator) -> List[int]:
+        return rng.integers(
+            self.nodes_num_min, self.nodes_num_max, size=batch_size, endpoint=True
+        ).tolist()
 
-    def _generate_watts_strogatz(self) -> nx.Graph:
-        num_nodes = random.randint(self.nodes_num_min, self.nodes_num_max)
-        nx_graph = nx.watts_strogatz_graph(num_nodes, self.ws_ring_neighbors, self.ws_prob)
-        return self._if_need_weighted(nx_graph)
+    # the graph samplers return (nodes_num, edges) with the undirected edges of shape (E, 2)
+
+    def _generate_erdos_renyi(
+        self, batch_size: int, rng: np.random.Generator
+    ) -> List[Tuple[int, np.ndarray]]:
+        return [
+            (nodes_num, erdos_renyi_edges(nodes_num, self.er_prob, rng))
+            for nodes_num in self._random_nodes_num(batch_size, rng)
+        ]
+
+    def _generate_barabasi_albert(
+        self, batch_size: int, rng: np.random.Generator
+    ) -> List[Tuple[int, np.ndarray]]:
+        return [
+            (nodes_num, barabasi_albert_edges(
+                nodes_num, min(self.ba_conn_degree, nodes_num), rng
+            ))
+            for nodes_num in self._random_nodes_num(batch_size, rng)
+        ]
+
+    def _generate_holme_kim(
+        self, batch_size: int, rng: np.random.Generator
+    ) -> List[Tuple[int, np.ndarray]]:
+        return [
+            (nodes_num, holme_kim_edges(
+                nodes_num, min(self.hk_conn_degree, nodes_num), self.hk_prob, rng
+            ))
+            for nodes_num in self._random_nodes_num(batch_size, rng)
+        ]
+
+    def _generate_watts_strogatz(
+        self, batch_size: int, rng: np.random.Generator
+    ) -> List[Tuple[int, np.ndarray]]:
+        return [
+            (nodes_num, watts_strogatz_edges(
+                nodes_num, self.ws_ring_neighbors, self.ws_prob, rng
+            ))
+            for nodes_num in self._random_nodes_num(batch_size, rng)
+        ]
     
+    def _sample_instances(self) -> List[Tuple[int, np.ndarray]]:
+        return self.generate_func(self.num_threads, self.rng)
+
+    def _solve_instance(self, idx: int, instance: Tuple[int, np.ndarray]) -> Any:
+        nodes_num, edges = instance
+        self.solver.from_edge_list(nodes_num=[nodes_num], edges=[edges])
+        return self.solver.solve(num_threads=1)[0]
+    
+    def _instance_to_line(self, instance: Tuple[int, np.ndarray], solution: Any) -> str:
+        # ``solution`` is the solved graph data holding ``edge_index`` and ``nodes_label``
+        edges = " ".join(str(node) for node in solution.edge_index.T.reshape(-1).tolist())
+        labels = " ".join(str(label) for label in solution.nodes_label.tolist())
+        return edges + " label " + labels + "\n"
+
     def _check_weighted(self):
         # check weighted
         if self.graph_weighted != self.solver.weighted:
@@ -1,7 +1,7 @@
 import shutil
 import pathlib
 import numpy as np
-from typing import Union, Sequence
+from typing import Union, Sequence, Tuple, List
 from ml4co_kit.utils.type_utils import SOLVER_TYPE
 from ml4co_kit.generator.base import EdgeGeneratorBase
 from ml4co_kit.solver import (
@@ -85,37 +85,41 @@ class CVRPDataGenerator(EdgeGeneratorBase):
     #         Generate Funcs         #
     ##################################
 
-    def _generate_demands(self) -> np.ndarray:
-        return np.random.randint(
+    def _generate_demands(self, batch_size: int, rng: np.random.Generator) -> np.ndarray:
+        return rng.integers(
             low=self.min_demand,
             high=self.max_demand,
-            size=(self.num_threads, self.nodes_num)
+            size=(batch_size, self.nodes_num)
         )
         
-    def _generate_capacities(self) -> np.ndarray:
+    def _generate_capacities(self, batch_size: int, rng: np.random.Generator) -> np.ndarray:
         if self.min_capacity == self.max_capacity:
-            return np.ones(shape=(self.num_threads, 1)) * self.min_capacity
-        return np.random.randint(
+            return np.ones(shape=(batch_size, 1)) * self.min_capacity
+        return rng.integers(
             low=self.min_capacity,
             high=self.max_capacity,
-            size=(self.num_threads, 1)
+            size=(batch_size, 1)
         )
     
-    def _generate_uniform(self) -> np.ndarray:
-        depots = np.random.random([self.num_threads, 2])
-        points = np.random.random([self.num_threads, self.nodes_num, 2]) 
+    def _generate_uniform(
+        self, batch_size: int, rng: np.random.Generator
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        depots = rng.random([batch_size, 2])
+        points = rng.random([batch_size, self.nodes_num, 2]) 
         return depots, points
 
-    def _generate_gaussian(self) -> np.ndarray:
-        depots = np.random.normal(
+    def _generate_gaussian(
+        self, batch_size: int, rng: np.random.Generator
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        depots = rng.normal(
             loc=[self.gaussian_mean_x, self.gaussian_mean_y],
             scale=self.gaussian_std,
-            size=(self.num_threads, 2),
+            size=(batch_size, 2),
         )
-        points = np.random.normal(
+        points = rng.normal(
             loc=[self.gaussian_mean_x, self.gaussian_mean_y],
             scale=self.gaussian_std,
-            size=(self.num_threads, self.nodes_num, 2),
+            size=(batch_size, self.nodes_num, 2),
         )
         return depots, points
     
@@ -147,10 +151,9 @@ class CVRPDataGenerator(EdgeGeneratorBase):
     ##################################
     
     def generate_only_instance_for_us(self, samples: int) -> Sequence[np.ndarray]:
-        self.num_threads = samples
-        batch_depots_coord, batch_nodes_coord = self.generate_func()
-        batch_demands = self._generate_demands()
-        batch_capacities = self._generate_capacities()
+        batch_depots_coord, batch_nodes_coord = self.generate_func(samples, self.rng)
+        batch_demands = self._generate_demands(samples, self.rng)
+        batch_capacities = self._generate_capacities(samples, self.rng)
         self.solver.from_data(
             depots=batch_depots_coord,
             points=batch_nodes_coord,
@@ -162,39 +165,30 @@ class CVRPDataGenerator(EdgeGeneratorBase):
             self.solver.demands, self.solver.capacities
         )
 
-    def _generate_core(self):
-        # call generate_func to generate data
-        batch_depots_coord, batch_nodes_coord = self.generate_func()
-        batch_demands = self._generate_demands()
-        batch_capacities = self._generate_capacities()
-        
-        # solve
+    def _sample_instances(self) -> List[Tuple[np.ndarray, ...]]:
+        batch_depots_coord, batch_nodes_coord = self.generate_func(self.num_threads, self.rng)
+        batch_demands = self._generate_demands(self.num_threads, self.rng)
+        batch_capacities = self._generate_capacities(self.num_threads, self.rng)
+        return list(zip(
+            batch_depots_coord, batch_nodes_coord, batch_demands, batch_capacities
+        ))
+
+    def _solve_instance(self, idx: int, instance: Tuple[np.ndarray, ...]) -> np.ndarray:
+        depot, points, demands, capacity = instance
         tours = self.solver.solve(
-            depots=batch_depots_coord,
-            points=batch_nodes_coord,
-            demands=batch_demands,
-            capacities=batch_capacities.reshape(-1),
-            num_threads=self.num_threads
+            depots=depot[None],
+            points=points[None],
+            demands=demands[None],
+            capacities=capacity.reshape(-1),
+            num_threads=1
         )
-
-        # write to txt
-        with open(self.file_save_path, "a+") as f:
-            for idx, tour in enumerate(tours):
-                depot = batch_depots_coord[idx]
-                points = batch_nodes_coord[idx]
-                demands = batch_demands[idx]
-                capicity = batch_capacities[idx][0]
-                f.write("depots " + str(" ").join(str(depot_coord) for depot_coord in depot))
-                f.write(" points" + str(" "))
-                f.write(
-                    " ".join(
-                        str(x) + str(" ") + str(y)
-                        for x, y in points
-                    )
-                )
-                f.write(" demands " + str(" ").join(str(demand) for demand in demands))
-                f.write(" capacity " + str(capicity))
-                f.write(str(" output "))
-                f.write(str(" ").join(str(node_idx) for node_idx in tour))
-                f.write("\n")
-        f.close()
\ No newline at end of file
+        return np.asarray(tours[0])
+    
+    def _instance_to_line(self, instance: Tuple[np.ndarray, ...], tour: np.ndarray) -> str:
+        depot, points, demands, capacity = instance
+        line = "depots " + " ".join(str(depot_coord) for depot_coord in depot.tolist())
+        line += " points " + " ".join(str(x) for x in points.reshape(-1).tolist())
+        line += " demands " + " ".join(str(demand) for demand in demands.tolist())
+        line += " capacity " + str(capacity[0])
+        line += " output " + " ".join(str(node_idx) for node_idx in tour.tolist())
+        return line + "\n"
@@ -1,10 +1,11 @@
-import random
 import pathlib
 import numpy as np
-from typing import Union, Tuple
+import scipy.sparse as sp
+from typing import Union, Tuple, List
+from scipy.sparse.csgraph import structural_rank
 from ml4co_kit.utils.type_utils import SOLVER_TYPE
 from ml4co_kit.generator.base import GeneratorBase
-from ml4co_kit.solver import LPSolver, LPGurobiSolver
+from ml4co_kit.solver import LPSolver, LPGurobiSolver, LPHiGHSSolver
 
 
 class LPDataGenerator(GeneratorBase):
@@ -15,6 +16,7 @@ class LPDataGenerator(GeneratorBase):
         vars_num: int = 20,
         constr_num: int = 16,
         sparse_ratio: float = 0.0,
+        sparse_format: bool = False,
         data_type: str = "uniform",
         solver: Union[SOLVER_TYPE, LPSolver, str] = SOLVER_TYPE.GUROBI,
         train_samples_num: int = 128000,
@@ -34,10 +36,12 @@ class LPDataGenerator(GeneratorBase):
             "uniform": self._generate_uniform
         }
         supported_solver_dict = {
-            SOLVER_TYPE.GUROBI: LPGurobiSolver
+            SOLVER_TYPE.GUROBI: LPGurobiSolver,
+            SOLVER_TYPE.HIGHS: LPHiGHSSolver
         }
         check_solver_dict = {
-            SOLVER_TYPE.GUROBI: self._check_free
+            SOLVER_TYPE.GUROBI: self._check_free,
+            SOLVER_TYPE.HIGHS: self._check_free
         }
 
         # super args
@@ -61,90 +65,124 @@ class LPDataGenerator(GeneratorBase):
         self.vars_num = vars_num
         self.constr_num = constr_num
         self.sparse_ratio = sparse_ratio
+        self.sparse_format = sparse_format
         self.nnz = int(self.constr_num * self.vars_num * (1-self.sparse_ratio))
         
     ##################################
     #         Generate Funcs         #
     ##################################
     
-    def _generate_uniform(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
-        w_list = list()
-        c_list = list()
-        b_list = list()
-        for _ in range(self.num_threads):
-            max_trials = 10
-            cur_trials = 0
-            fail_flag = False
-            while True:
-                cur_trials += 1
-                w = np.zeros((self.constr_num, self.vars_num), dtype=np.float32)
-                edge_index = np.zeros((self.nnz, 2))
-                edge_index_1d = random.sample(range(self.constr_num * self.vars_num), self.nnz)
-                edge_feature = np.random.normal(0, 1, self.nnz)
-                for l in range(self.nnz):
-                    i = int(edge_index_1d[l] / self.vars_num)
-                    j = edge_index_1d[l] - i * self.vars_num
-                    edge_index[l, 0] = i
-                    edge_index[l, 1] = j
-                    w[i, j] = edge_feature[l] 
-                
-                # break
-                if np.linalg.matrix_rank(w) == self.constr_num:
-                    break
-                if cur_trials == max_trials:
-                    fail_flag = True
-                    break
-            
-            # check fail flag
-            if fail_flag:
+    def _generate_uniform(
+        self, batch_size: int, rng: np.random.Generator
+    ) -> Tuple[Union[np.ndarray, List[sp.csr_matrix]], np.ndarray, np.ndarray]:
+        # sample the constraint matrices, resampling those without full row rank
+        max_trials = 10
+        if self.sparse_format:
+            sample_func = self._sample_csr_matrices
+        else:
+            sample_func = self._sample_sparse_matrices
+        w = sample_func(batch_size, rng)
+        for _ in range(max_trials - 1):
+            fail_idx = np.flatnonzero(~self._is_full_rank(w))
+            if len(fail_idx) == 0:
+                break
+            new_w = sample_func(len(fail_idx), rng)
+            for new_idx, idx in enumerate(fail_idx):
+                w[idx] = new_w[new_idx]
+        else:
+            if not self._is_full_rank(w).all():
                 raise ValueError(
                     f"After {max_trials} attempts, the matrix with full rank is still not generated. "
                     "Please check the parameter setting and reduce the value of ``spare_ratio`` appropriately."
                 )
-            
-            # randomly generate optimal solution for primal and dual
-            x_hat = np.random.uniform(0, 1, self.vars_num)
-            y_hat = np.random.uniform(0, 1, self.constr_num)
-            beta_indices = np.random.choice(range(self.constr_num + self.vars_num), size=self.constr_num, replace=False)
-            beta = np.zeros(self.constr_num + self.vars_num)
-            beta[beta_indices] = 1
-            x_hat[beta[:self.vars_num] == 0] = 0
-            y_hat[beta[self.vars_num:] == 1] = 0
-            b = w @ x_hat
-            c = w.T @ y_hat
-            w_list.append(w)
-            c_list.append(c)
-            b_list.append(b)
-            
-        return np.array(w_list), np.array(c_list), np.array(b_list)
+        
+        # randomly generate optimal solution for primal and dual
+        x_hat = rng.uniform(0, 1, (batch_size, self.vars_num))
+        y_hat = rng.uniform(0, 1, (batch_size, self.constr_num))
+        beta_indices = np.argsort(
+            rng.random((batch_size, self.constr_num + self.vars_num)), axis=1
+        )[:, :self.constr_num]
+        beta = np.zeros((batch_size, self.constr_num + self.vars_num))
+        np.put_along_axis(beta, beta_indices, 1, axis=1)
+        x_hat[beta[:, :self.vars_num] == 0] = 0
+        y_hat[beta[:, self.vars_num:] == 1] = 0
+        if self.sparse_format:
+            b = np.stack([_w @ _x for _w, _x in zip(w, x_hat)])
+            c = np.stack([_w.T @ _y for _w, _y in zip(w, y_hat)])
+        else:
+            b = np.einsum("bij,bj->bi", w, x_hat)
+            c = np.einsum("bij,bi->bj", w, y_hat)
+        return w, c, b
+
+    def _is_full_rank(self, w: Union[np.ndarray, List[sp.csr_matrix]]) -> np.ndarray:
+        if not self.sparse_format:
+            return np.linalg.matrix_rank(w) == self.constr_num
+        # the nonzero entries are continuous random values, so the rank equals the 
+        # structural rank (maximum matching of the sparsity pattern) almost surely
+        return np.array([structural_rank(_w) == self.constr_num for _w in w])
+
+    def _sample_sparse_matrices(self, batch_size: int, rng: np.random.Generator) -> np.ndarray:
+        # ``nnz`` standard normal entries at uniformly random positions of each matrix
+        size = self.constr_num * self.vars_num
+        w = np.zeros((batch_size, size), dtype=np.float64)
+        edge_feature = rng.normal(0, 1, (batch_size, self.nnz))
+        if self.nnz == size:
+            w[:] = edge_feature
+        else:
+            edge_index_1d = np.argpartition(rng.random((batch_size, size)), self.nnz, axis=1)
+            np.put_along_axis(w, edge_index_1d[:, :self.nnz], edge_feature, axis=1)
+        return w.reshape(batch_size, self.constr_num, self.vars_num)
+
+    def _sample_csr_matrices(
+        self, batch_size: int, rng: np.random.Generator
+    ) -> List[sp.csr_matrix]:
+        # same distribution as ``_sample_sparse_matrices`` in O(nnz) memory and time
+        size = self.constr_num * self.vars_num
+        w = list()
+        for _ in range(batch_size):
+            edge_index_1d = np.sort(rng.choice(size, self.nnz, replace=False))
+            edge_feature = rng.normal(0, 1, self.nnz)
+            w.append(sp.csr_matrix(
+                (edge_feature, (edge_index_1d // self.vars_num, edge_index_1d % self.vars_num)),
+                shape=(self.constr_num, self.vars_num)
+            ))
+        return w
 
     ##################################
     #      Data-Generating Funcs     #
     ##################################
     
-    def generate_only_instance_for_us(self, samples: int) -> np.ndarray:
-        self.num_threads = samples
-        w, c, b = self.generate_func()
+    def generate_only_instance_for_us(
+        self, samples: int
+    ) -> Tuple[Union[np.ndarray, List[sp.csr_matrix]], np.ndarray, np.ndarray]:
+        w, c, b = self.generate_func(samples, self.rng)
         self.solver.from_data(w=w, c=c, b=b)
         return self.solver.w, self.solver.c, self.solver.b
 
-    def _generate_core(self):
-        # call generate_func to generate data
-        w, c, b = self.generate_func()
-        
-        # solve
-        sols = self.solver.solve(w=w, c=c, b=b)
-        
-        # write to txt
-        for _w, _c, _b, _sol in zip(w, c, b, sols):
-            with open(self.file_save_path, "a+") as f:
-                f.write(str("w") + str(" "))
-                for line in _w:
-                    f.write(" ".join(str(x) + str(" ") for x in line))
-                    f.write(str(" "))
-                f.write("c " + str(" ").join(str(cc) for cc in _c))
-                f.write(" b " + str(" ").join(str(bb) for bb in _b))
-                f.write(str(" output") + str(" "))
-                f.write(str(" ").join(str(xx) for xx in _sol))
-                f.write("\n")
-            f.close()
\ No newline at end of file
+    def _sample_instances(self) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        w, c, b = self.generate_func(self.num_threads, self.rng)
+        return list(zip(w, c, b))
+
+    def _solve_instance(
+        self, idx: int, instance: Tuple[np.ndarray, np.ndarray, np.ndarray]
+    ) -> np.ndarray:
+        w, c, b = instance
+        w = w if sp.issparse(w) else w[None]
+        return self.solver.solve(w=w, c=c[None], b=b[None])[0]
+    
+    def _instance_to_line(
+        self, instance: Tuple[np.ndarray, np.ndarray, np.ndarray], sol: np.ndarray
+    ) -> str:
+        w, c, b = instance
+        if sp.issparse(w):
+            coo = w.tocoo()
+            line = f"w_sparse {w.shape[0]} {w.shape[1]} " + "".join(
+                f"{row} {col} {val} " 
+                for row, col, val in zip(coo.row.tolist(), coo.col.tolist(), coo.data)
+            )
+        else:
+            line = "w " + "".join(" ".join(str(x) + " " for x in row) + " " for row in w)
+        line += "c " + " ".join(str(cc) for cc in c)
+        line += " b " + " ".join(str(bb) for bb in b)
+        line += " output " + " ".join(str(xx) for xx in sol)
+        return line + "\n"
@@ -1,14 +1,12 @@
 import os
-import time
-import pickle
 import pathlib
-import networkx as nx
 from tqdm import tqdm
 from typing import Union, List
 from ml4co_kit.utils.graph.mis import MISGraphData
+from ml4co_kit.utils.graph.base import write_graph_npz
 from ml4co_kit.utils.type_utils import SOLVER_TYPE
 from ml4co_kit.generator.base import NodeGeneratorBase
-from ml4co_kit.solver import MISSolver, MISGurobiSolver, KaMISSolver
+from ml4co_kit.solver import MISSolver, MISGurobiSolver, MISHiGHSSolver, KaMISSolver
 
 
 class MISDataGenerator(NodeGeneratorBase):
@@ -41,10 +39,12 @@ class MISDataGenerator(NodeGeneratorBase):
         # re-define
         supported_solver_dict = {
             SOLVER_TYPE.GUROBI: MISGurobiSolver,
+            SOLVER_TYPE.HIGHS: MISHiGHSSolver,
             SOLVER_TYPE.KAMIS: KaMISSolver
         }
         check_solver_dict = {
             SOLVER_TYPE.GUROBI: self._check_free,
+            SOLVER_TYPE.HIGHS: self._check_free,
             SOLVER_TYPE.KAMIS: self._check_free
         }
 
@@ -88,13 +88,31 @@ class MISDataGenerator(NodeGeneratorBase):
                 os.makedirs(os.path.join(path, "solution"))
 
     def generate_only_instance_for_us(self, samples: int) -> List[MISGraphData]:
-        nx_graphs = [self.generate_func() for _ in range(samples)]
-        self.solver.from_nx_graph(nx_graphs=nx_graphs)
+        graphs = self.generate_func(samples, self.rng)
+        self.solver.from_edge_list(
+            nodes_num=[graph[0] for graph in graphs], edges=[graph[1] for graph in graphs]
+        )
         return self.solver.graph_data
   
-    def generate(self):
+    def generate(
+        self, 
+        queue_size: int = None, 
+        resume: bool = False, 
+        checkpoint_interval: int = 100,
+        seed: int = None,
+        shard_id: int = None,
+        num_shards: int = 1
+    ):
         if self.solver_type == SOLVER_TYPE.KAMIS:
             # check
+            if resume:
+                raise NotImplementedError(
+                    "``KaMISSolver`` does not support resuming the generation"
+                )
+            if num_shards > 1:
+                raise NotImplementedError(
+                    "``KaMISSolver`` does not support sharded generation"
+                )
             if self.num_threads != 1:
                 raise NotImplementedError(
                     "``KaMISSolver`` only supports single-threaded execution"
@@ -105,12 +123,19 @@ class MISDataGenerator(NodeGeneratorBase):
                 samples_num = getattr(self, f"{sample_type}_samples_num")
                 for idx in tqdm(range(samples_num),desc=self.solver.solve_msg):
                     filename = f"{self.filename}_{idx}"
-                    nx_graph: nx.Graph = self.generate_func()
+                    nodes_num, edges = self.generate_func(1, self.rng)[0]
+                    nodes_weight = None
+                    if self.graph_weighted:
+                        nodes_weight = self._random_weight(
+                            self.rng, nodes_num, sigma=30, mu=100
+                        )
                     output_file = os.path.join(
-                        getattr(self, f"{sample_type}_save_path"), "instance", f"{filename}.gpickle"
+                        getattr(self, f"{sample_type}_save_path"), "instance", f"{filename}.npz"
+                    )
+                    write_graph_npz(
+                        file_path=output_file, nodes_num=nodes_num, 
+                        edges=edges, nodes_weight=nodes_weight
                     )
-                    with open(output_file, "wb") as f:
-                        pickle.dump(nx_graph, f, pickle.HIGHEST_PROTOCOL)
 
             # generate solution
             for sample_type in self.sample_types:
@@ -120,35 +145,11 @@ class MISDataGenerator(NodeGeneratorBase):
                     os.path.join(folder, "solution")
                 )
         else:
-            start_time = time.time()
-            for _ in tqdm(
-                range(self.samples_num // self.num_threads),
-                desc=self.solver.solve_msg,
-            ):
-                # call generate_func to generate the points
-                nx_graphs = [self.generate_func() for _ in range(self.num_threads)]
-                
-                # solve
-                self.solver.from_nx_graph(nx_graphs=nx_graphs)
-                graph_data = self.solver.solve(num_threads=self.num_threads)
-                    
-                # write to txt
-                with open(self.file_save_path, "a+") as f:
-                    for graph in graph_data:
-                        graph: MISGraphData
-                        edge_index = graph.edge_index.T
-                        nodes_label = graph.nodes_label
-                        f.write(" ".join(str(src) + str(" ") + str(tgt) for src, tgt in edge_index))
-                        f.write(str(" ") + str("label") + str(" "))
-                        f.write(str(" ").join(str(node_label) for node_label in nodes_label))
-                        f.write("\n")
-                f.close()
-            
-            # info
-            end_time = time.time() - start_time
-            print(
-                f"Completed generation of {self.samples_num} samples of MIS."
+            super().generate(
+                queue_size=queue_size, 
+                resume=resume, 
+                checkpoint_interval=checkpoint_interval,
+                seed=seed,
+                shard_id=shard_id,
+                num_shards=num_shards
             )
-            print(f"Total time: {end_time/60:.1f}m")
-            print(f"Average time: {end_time/self.samples_num:.1f}s")
-            self.devide_file()            
\ No newline at end of file
@@ -3,7 +3,7 @@ from typing import Union, List
 from ml4co_kit.utils.graph.mvc import MVCGraphData
 from ml4co_kit.utils.type_utils import SOLVER_TYPE
 from ml4co_kit.generator.base import NodeGeneratorBase
-from ml4co_kit.solver import MVCSolver, MVCGurobiSolver
+from ml4co_kit.solver import MVCSolver, MVCGurobiSolver, MVCHiGHSSolver
 
 
 class MVCDataGenerator(NodeGeneratorBase):
@@ -35,10 +35,12 @@ class MVCDataGenerator(NodeGeneratorBase):
         
         # re-define
         supported_solver_dict = {
-            SOLVER_TYPE.GUROBI: MVCGurobiSolver
+            SOLVER_TYPE.GUROBI: MVCGurobiSolver,
+            SOLVER_TYPE.HIGHS: MVCHiGHSSolver
         }
         check_solver_dict = {
-            SOLVER_TYPE.GUROBI: self._check_free
+            SOLVER_TYPE.GUROBI: self._check_free,
+            SOLVER_TYPE.HIGHS: self._check_free
         }
         
         # super args
@@ -67,26 +69,8 @@ class MVCDataGenerator(NodeGeneratorBase):
         self.solver: MVCSolver
         
     def generate_only_instance_for_us(self, samples: int) -> List[MVCGraphData]:
-        nx_graphs = [self.generate_func() for _ in range(samples)]
-        self.solver.from_nx_graph(nx_graphs=nx_graphs)
+        graphs = self.generate_func(samples, self.rng)
+        self.solver.from_edge_list(
+            nodes_num=[graph[0] for graph in graphs], edges=[graph[1] for graph in graphs]
+        )
         return self.solver.graph_data
-    
-    def _generate_core(self):
-        # call generate_func to generate the points
-        nx_graphs = [self.generate_func() for _ in range(self.num_threads)]
-
-        # solve
-        self.solver.from_nx_graph(nx_graphs=nx_graphs)
-        graph_data = self.solver.solve(num_threads=self.num_threads)
-        
-        # write to txt
-        with open(self.file_save_path, "a+") as f:
-            for graph in graph_data:
-                graph: MVCGraphData
-                edge_index = graph.edge_index.T
-                nodes_label = graph.nodes_label
-                f.write(" ".join(str(src) + str(" ") + str(tgt) for src, tgt in edge_index))
-                f.write(str(" ") + str("label") + str(" "))
-                f.write(str(" ").join(str(node_label) for node_label in nodes_label))
-                f.write("\n")
-        f.close()
\ No newline at end of file
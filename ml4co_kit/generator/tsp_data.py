@@ -1,12 +1,13 @@
 import os
 import shutil
 import pathlib
-import itertools
 import numpy as np
-from typing import Union
-from multiprocessing import Pool
+from typing import Union, List
+from scipy.spatial import cKDTree
+from multiprocessing.pool import ThreadPool
 from ml4co_kit.utils.type_utils import SOLVER_TYPE
 from ml4co_kit.evaluate.tsp.base import TSPEvaluator
+from ml4co_kit.utils.distance_utils import distance_matrix
 from ml4co_kit.generator.base import EdgeGeneratorBase
 from ml4co_kit.solver import (
     TSPSolver, TSPLKHSolver, TSPConcordeSolver, TSPConcordeLargeSolver,
@@ -17,6 +18,74 @@ import warnings
 warnings.filterwarnings("ignore")
 
 
+SUPPORT_REGRET_MODE = ["lkh", "local"]
+
+
+def _or_opt_seed(dists: np.ndarray, tour: np.ndarray, pairs: np.ndarray) -> np.ndarray:
+    # for each pair (i, j), the cheapest tour obtained from ``tour`` by moving i next
+    # to j or j next to i (on either side), so that the tour contains the edge (i, j)
+    pairs_num, nodes_num = len(pairs), len(tour)
+    rows = np.arange(pairs_num)
+    rank = np.empty(shape=(nodes_num,), dtype=np.int64)
+    rank[tour] = np.arange(nodes_num)
+    best_tours, best_costs = None, None
+    for moved, anchor in [(pairs[:, 1], pairs[:, 0]), (pairs[:, 0], pairs[:, 1])]:
+        for side in [-1, 1]:
+            # the nodes sorted by their key form the tour
+            key = np.tile(2 * rank, (pairs_num, 1))
+            key[rows, moved] = 2 * rank[anchor] + side
+            tours = np.argsort(key, axis=1)
+            costs = dists[tours, np.roll(tours, -1, axis=1)].sum(axis=1)
+            if best_tours is None:
+                best_tours, best_costs = tours, costs
+            else:
+                better = costs < best_costs
+                best_tours[better] = tours[better]
+                best_costs[better] = costs[better]
+    return best_tours
+
+
+def _fixed_edge_2opt(
+    dists: np.ndarray, tours: np.ndarray, pairs: np.ndarray, max_iters: int = 1000
+) -> np.ndarray:
+    # best-improvement 2-opt on a batch of tours (without the closing node), where
+    # the move removing the fixed edge (pairs[k, 0], pairs[k, 1]) is never applied
+    tours = tours.copy()
+    nodes_num = tours.shape[1]
+    # a move (a, b) removes the edges (t[a], t[a+1]) and (t[b], t[b+1])
+    valid = np.triu(np.ones(shape=(nodes_num, nodes_num), dtype=bool), k=2)
+    valid[0, nodes_num - 1] = False
+    positions = np.arange(nodes_num)
+    active = np.arange(len(tours))
+    for _ in range(max_iters):
+        if len(active) == 0:
+            break
+        t = tours[active]
+        rows = np.arange(len(t))
+        t_next = np.roll(t, -1, axis=1)
+        edge = dists[t, t_next]
+        delta = dists[t[:, :, None], t[:, None, :]] + dists[t_next[:, :, None], t_next[:, None, :]]
+        delta -= edge[:, :, None] + edge[:, None, :]
+        delta[:, ~valid] = np.inf
+        
+        # position of the fixed edge
+        u, v = pairs[active, 0], pairs[active, 1]
+        pos = np.argmax(t == u[:, None], axis=1)
+        pos = np.where(t_next[rows, pos] == v, pos, (pos - 1) % nodes_num)
+        delta[rows, pos, :] = np.inf
+        delta[rows, :, pos] = np.inf
+        
+        # apply the best move by reversing t[a+1: b+1]
+        flat = delta.reshape(len(t), -1).argmin(axis=1)
+        improve = delta.reshape(len(t), -1)[rows, flat] < -1e-9
+        a, b = flat[improve, None] // nodes_num, flat[improve, None] % nodes_num
+        segment = (positions > a) & (positions <= b)
+        src = np.where(segment, a + 1 + b - positions, positions)
+        tours[active[improve]] = np.take_along_axis(t[improve], src, axis=1)
+        active = active[improve]
+    return tours
+
+
 class TSPDataGenerator(EdgeGeneratorBase):
     def __init__(
         self,
@@ -41,6 +110,9 @@ class TSPDataGenerator(EdgeGeneratorBase):
         regret: bool = False,
         regret_save_path: str = None,
         regret_solver: TSPSolver = None,
+        regret_mode: str = "lkh",
+        regret_knn_k: int = None,
+        regret_num_workers: int = 1,
     ):
         # filename
         if filename is None:
@@ -57,9 +129,11 @@ class TSPDataGenerator(EdgeGeneratorBase):
         
         # special args for regret
         self.regret = regret
-        self.regret_cnt = 0
         self.regret_save_path = regret_save_path
         self.regret_solver = regret_solver
+        self.regret_mode = regret_mode
+        self.regret_knn_k = regret_knn_k
+        self.regret_num_workers = regret_num_workers
 
         # re-define
         generate_func_dict = {
@@ -105,30 +179,26 @@ class TSPDataGenerator(EdgeGeneratorBase):
     #         Generate Funcs         #
     ##################################
 
-    def _generate_uniform(self) -> np.ndarray:
-        return np.random.random([self.num_threads, self.nodes_num, 2])
+    def _generate_uniform(self, batch_size: int, rng: np.random.Generator) -> np.ndarray:
+        return rng.random([batch_size, self.nodes_num, 2])
 
-    def _generate_gaussian(self) -> np.ndarray:
-        return np.random.normal(
+    def _generate_gaussian(self, batch_size: int, rng: np.random.Generator) -> np.ndarray:
+        return rng.normal(
             loc=[self.gaussian_mean_x, self.gaussian_mean_y],
             scale=self.gaussian_std,
-            size=(self.num_threads, self.nodes_num, 2),
+            size=(batch_size, self.nodes_num, 2),
         )
 
-    def _generate_cluster(self):
-        nodes_coords = np.zeros([self.num_threads, self.nodes_num, 2])
-        for i in range(self.num_threads):
-            cluster_centers = np.random.random([self.cluster_nums, 2])
-            cluster_points = []
-        for center in cluster_centers:
-            points = np.random.normal(
-                loc=center,
-                scale=self.cluster_std,
-                size=(self.nodes_num // self.cluster_nums, 2),
-            )
-            cluster_points.append(points)
-        nodes_coords[i] = np.concatenate(cluster_points, axis=0)
-        return nodes_coords
+    def _generate_cluster(self, batch_size: int, rng: np.random.Generator) -> np.ndarray:
+        # the nodes are divided into ``cluster_nums`` (almost) equal consecutive groups 
+        # around centers sampled independently for every instance
+        cluster_centers = rng.random([batch_size, self.cluster_nums, 2])
+        cluster_ids = np.arange(self.nodes_num) * self.cluster_nums // self.nodes_num
+        return rng.normal(
+            loc=cluster_centers[:, cluster_ids],
+            scale=self.cluster_std,
+            size=(batch_size, self.nodes_num, 2),
+        )
     
     ##################################
     #      Solver-Checking Funcs     #
@@ -172,6 +242,14 @@ class TSPDataGenerator(EdgeGeneratorBase):
             return
         if self.regret_save_path is None:
             self.regret_save_path = os.path.join(self.save_path, "regret")
+        if self.regret_mode not in SUPPORT_REGRET_MODE:
+            message = (
+                f"The regret mode ({self.regret_mode}) is not a valid mode, "
+                f"only {SUPPORT_REGRET_MODE} are supported."
+            )
+            raise ValueError(message)
+        if self.regret_knn_k is not None and self.regret_knn_k < 1:
+            raise ValueError("``regret_knn_k`` must be positive.")
         if self.regret_solver is None:
             self.regret_solver = TSPLKHSolver(lkh_max_trials=10)
         if not os.path.exists(self.regret_save_path):
@@ -182,84 +260,139 @@ class TSPDataGenerator(EdgeGeneratorBase):
     ##################################
     
     def generate_only_instance_for_us(self, samples: int) -> np.ndarray:
-        self.num_threads = samples
-        points = self.generate_func()
+        points = self.generate_func(samples, self.rng)
         self.solver.from_data(points=points)
         return self.solver.points
 
-    def _generate_core(self):
-        # call generate_func to generate data
-        batch_nodes_coord = self.generate_func()
-        
-        # solve
-        tours = self.solver.solve(
-            points=batch_nodes_coord, num_threads=self.num_threads
-        )
+    def _sample_instances(self) -> List[np.ndarray]:
+        return list(self.generate_func(self.num_threads, self.rng))
 
-        # deal with regret
+    def _solve_instance(self, idx: int, nodes_coord: np.ndarray) -> np.ndarray:
+        tour = self.solver.solve(points=nodes_coord[None], num_threads=1)[0]
         if self.regret:
-            if self.num_threads == 1:
-                self._generate_regret(tours[0], batch_nodes_coord[0], self.regret_cnt)    
-            else:
-                with Pool(self.num_threads) as p2:
-                    p2.starmap(
-                        self._generate_regret,
-                        [
-                            (tour, batch_nodes_coord[idx], self.regret_cnt + idx)
-                            for idx, tour in enumerate(tours)
-                        ],
-                    )
-            self.regret_cnt += self.num_threads
-            
-        # write to txt
-        for idx, tour in enumerate(tours):
-            tour = tour[:-1]
-            if (np.sort(tour) == np.arange(self.nodes_num)).all():
-                with open(self.file_save_path, "a+") as f:
-                    f.write(
-                        " ".join(
-                            str(x) + str(" ") + str(y)
-                            for x, y in batch_nodes_coord[idx]
-                        )
-                    )
-                    f.write(str(" ") + str("output") + str(" "))
-                    f.write(str(" ").join(str(node_idx + 1) for node_idx in tour))
-                    f.write(str(" ") + str(tour[0] + 1) + str(" "))
-                    f.write("\n")
-                f.close()
+            self._generate_regret(tour, nodes_coord, idx)
+        return tour
+
+    def _instance_to_line(self, nodes_coord: np.ndarray, tour: np.ndarray) -> Union[str, None]:
+        tour = tour[:-1]
+        if not (np.sort(tour) == np.arange(self.nodes_num)).all():
+            return None
+        points = " ".join(str(x) for x in nodes_coord.reshape(-1).tolist())
+        nodes = [str(node_idx + 1) for node_idx in tour.tolist()]
+        return points + " output " + " ".join(nodes) + " " + nodes[0] + " \n"
 
     def _generate_regret(self, tour: np.ndarray, nodes_coord: np.ndarray, cnt: int):
         opt_tour = list(tour) + [0]
         reg_mat = self.calc_regret(nodes_coord, opt_tour)
         np.save(os.path.join(self.regret_save_path, f"{cnt}.npy"), reg_mat)
 
-    def calc_regret(self, points: np.ndarray, opt_tour: list):
+    def calc_regret(self, points: np.ndarray, opt_tour: list) -> np.ndarray:
+        r"""
+        Computes the regret matrix, i.e. the relative cost increase of the best tour
+        forced to use each edge (i, j) over the optimal tour. The edges of ``opt_tour``
+        have zero regret, the other ones are re-optimized with ``regret_solver``
+        (``regret_mode="lkh"``, across ``regret_num_workers`` threads) or with the
+        Or-opt insertion of the edge followed by a 2-opt local search that keeps it
+        (``regret_mode="local"``, much faster but an over-estimation). If
+        ``regret_knn_k`` is given, only the edges between k-nearest neighbors are
+        evaluated and the other entries are NaN.
+
+        :param points: np.ndarray, the coordinates of the nodes with shape (N, 2).
+        :param opt_tour: list, the optimal tour starting and ending at the same node.
+        :return: np.ndarray with shape (N, N), the symmetric regret matrix.
+        """
         num_nodes = points.shape[0]
-        reg_mat = np.zeros((num_nodes, num_nodes))
         eva = TSPEvaluator(points)
-        for i, j in itertools.combinations(range(num_nodes), 2):
-            tour = self.regret_solver.regret_solve(points=points, fixed_edges=(i, j))
-            cost = eva.evaluate(tour)
-            opt_cost = eva.evaluate(opt_tour)
-            regret = (cost - opt_cost) / opt_cost
-            reg_mat[i, j] = reg_mat[j, i] = regret
+        opt_cost = eva.evaluate(opt_tour)
+        tour = np.asarray(opt_tour, dtype=np.int64)[:num_nodes]
+        
+        # candidate edges, except the edges of the optimal tour
+        if self.regret_knn_k is None:
+            reg_mat = np.zeros((num_nodes, num_nodes))
+            src, dst = np.triu_indices(num_nodes, k=1)
+            key = src * num_nodes + dst
+        else:
+            reg_mat = np.full((num_nodes, num_nodes), np.nan)
+            k = min(self.regret_knn_k, num_nodes - 1)
+            _, nbrs = cKDTree(points).query(points, k=k + 1)
+            src = np.repeat(np.arange(num_nodes), k + 1)
+            dst = nbrs.reshape(-1)
+            key = np.minimum(src, dst) * num_nodes + np.maximum(src, dst)
+            key = np.unique(key[src != dst])
+        tour_next = np.roll(tour, -1)
+        tour_key = np.minimum(tour, tour_next) * num_nodes + np.maximum(tour, tour_next)
+        key = np.setdiff1d(key, tour_key)
+        pairs = np.stack([key // num_nodes, key % num_nodes], axis=1)
+        reg_mat[np.arange(num_nodes), np.arange(num_nodes)] = 0
+        reg_mat[tour, tour_next] = reg_mat[tour_next, tour] = 0
+        if len(pairs) == 0:
+            return reg_mat
+        
+        # re-optimize the tours with fixed edges
+        if self.regret_mode == "lkh":
+            costs = self._regret_costs_lkh(points, pairs, eva)
+        else:
+            costs = self._regret_costs_local(points, pairs, tour)
+        regret = (costs - opt_cost) / opt_cost
+        reg_mat[pairs[:, 0], pairs[:, 1]] = reg_mat[pairs[:, 1], pairs[:, 0]] = regret
         return reg_mat
 
+    def _regret_costs_lkh(
+        self, points: np.ndarray, pairs: np.ndarray, eva: TSPEvaluator
+    ) -> np.ndarray:
+        def _solve(pair: list) -> float:
+            tour = self.regret_solver.regret_solve(points=points, fixed_edges=tuple(pair))
+            return eva.evaluate(tour)
+        
+        # every solve runs in its own LKH process, so threads are enough
+        if self.regret_num_workers == 1:
+            return np.array([_solve(pair) for pair in pairs.tolist()])
+        with ThreadPool(self.regret_num_workers) as pool:
+            return np.array(pool.map(_solve, pairs.tolist()))
+
+    def _regret_costs_local(
+        self, points: np.ndarray, pairs: np.ndarray, tour: np.ndarray
+    ) -> np.ndarray:
+        num_nodes = points.shape[0]
+        dists = distance_matrix(points, "EUC_2D")
+        costs = np.empty(shape=(len(pairs),))
+        # bound the (chunk, N, N) move tensors of the batched 2-opt
+        chunk = max(1, 2**22 // (num_nodes * num_nodes))
+        for begin in range(0, len(pairs), chunk):
+            sub_pairs = pairs[begin: begin + chunk]
+            tours = _or_opt_seed(dists, tour, sub_pairs)
+            tours = _fixed_edge_2opt(dists, tours, sub_pairs)
+            costs[begin: begin + chunk] = dists[tours, np.roll(tours, -1, axis=1)].sum(axis=1)
+        return costs
+
+    def generate(
+        self, 
+        queue_size: int = None, 
+        resume: bool = False, 
+        checkpoint_interval: int = 100,
+        seed: int = None,
+        shard_id: int = None,
+        num_shards: int = 1
+    ):
+        super().generate(
+            queue_size=queue_size, 
+            resume=resume, 
+            checkpoint_interval=checkpoint_interval,
+            seed=seed,
+            shard_id=shard_id,
+            num_shards=num_shards
+        )
+        # the regret of sharded generation is divided by ``merge_shards``
+        if not self._is_sharded():
+            self._devide_regret()
+
     def devide_file(self):
-        # basic
-        with open(self.file_save_path, "r") as f:
-            data = f.readlines()
+        super().devide_file()
+        self._devide_regret()
+
+    def _devide_regret(self):
         train_end_idx = self.train_samples_num
         val_end_idx = self.train_samples_num + self.val_samples_num
-        train_data = data[:train_end_idx]
-        val_data = data[train_end_idx:val_end_idx]
-        test_data = data[val_end_idx:]
-        data = [train_data, val_data, test_data]
-        for sample_type, data_content in zip(self.sample_types, data):
-            filename = getattr(self, f"{sample_type}_file_save_path")
-            with open(filename, "w") as file:
-                file.writelines(data_content)
-                
         # deal with regret
         if self.regret:
             for root, _, file in os.walk(self.regret_save_path):
@@ -2,7 +2,7 @@ import torch
 import numpy as np
 from torch import Tensor
 from typing import Union, Tuple
-from sklearn.neighbors import KDTree
+from ml4co_kit.utils.knn_utils import knn_graph
 
 
 #####################################################
@@ -55,46 +55,26 @@ def sparse_points(
     if points.ndim == 2:
         points = np.expand_dims(points, axis=0)
     
-    edge_index = list()
-    for idx in range(points.shape[0]):
-        kdt = KDTree(points[idx], leaf_size=30, metric='euclidean')
-        _, idx_knn = kdt.query(points[idx], k=sparse_factor, return_distance=True)
-        _edge_index_0 = torch.arange(points[idx].shape[0])
-        _edge_index_0 = _edge_index_0.reshape((-1, 1))
-        _edge_index_0 = _edge_index_0.repeat(1, sparse_factor)
-        _edge_index_0 = _edge_index_0.reshape(-1)
-        _edge_index_1 = torch.from_numpy(idx_knn.reshape(-1))
-        _edge_index = torch.stack([_edge_index_0, _edge_index_1], dim=0)
-        edge_index.append(_edge_index.unsqueeze(dim=0))
-    edge_index = torch.cat(edge_index, dim=0).to(device)
-
+    # kNN graphs of the whole batch (each node is its own first neighbor)
+    edge_index, _ = knn_graph(points, sparse_factor=sparse_factor, self_loop=True)
+    edge_index = torch.from_numpy(edge_index).to(device)
+    
     points = torch.from_numpy(points).to(device)
     return points, edge_index
 
 
 def points_to_distmat(points: Tensor, edge_index: Tensor = None) -> Tensor:
-    device = points.device
     if edge_index is None:
-        if points.ndim == 2:
-            distmat = torch.cdist(points, points)
-        else:
-            distmat = torch.zeros(size=(points.shape[0], points.shape[1], points.shape[1]))
-            for i, matrix in enumerate(points):
-                distmat[i] = torch.cdist(matrix, matrix)
-    else:     
-        if points.ndim == 2:
-            x = edge_index[0]
-            y = edge_index[1]
-            points_x = points[x]
-            points_y = points[y]
-            distmat = torch.norm(points_x - points_y, dim=1)
-        else:
-            matrix_list = list()
-            for i in range(points.shape[0]):
-                x = edge_index[i][0]
-                y = edge_index[i][1]
-                points_x = points[i][x]
-                points_y = points[i][y]
-                matrix_list.append(torch.norm(points_x - points_y, dim=1))
-            distmat = torch.stack(matrix_list)
-    return distmat.to(device)
+        # ``torch.cdist`` handles both (N, 2) and (B, N, 2)
+        return torch.cdist(points, points)
+    if points.ndim == 2:
+        points_x = points[edge_index[0]]
+        points_y = points[edge_index[1]]
+        return torch.norm(points_x - points_y, dim=-1)
+    
+    # gather the endpoints of all the edges of the batch at once
+    index_x = edge_index[:, 0].unsqueeze(dim=-1).expand(-1, -1, points.shape[-1])
+    index_y = edge_index[:, 1].unsqueeze(dim=-1).expand(-1, -1, points.shape[-1])
+    points_x = torch.gather(points, dim=1, index=index_x)
+    points_y = torch.gather(points, dim=1, index=index_y)
+    return torch.norm(points_x - points_y, dim=-1)
@@ -17,24 +17,28 @@ from .cvrp.pyvrp import CVRPPyVRPSolver
 #######################################
 from .lp.base import LPSolver
 from .lp.gurobi import LPGurobiSolver
+from .lp.highs import LPHiGHSSolver
 
 #######################################
 #              MCl Solver             #  
 #######################################
 from .mcl.base import MClSolver
 from .mcl.gurobi import MClGurobiSolver
+from .mcl.highs import MClHiGHSSolver
 
 #######################################
 #             MCut Solver             #  
 #######################################
 from .mcut.base import MCutSolver
 from .mcut.gurobi import MCutGurobiSolver
+from .mcut.highs import MCutHiGHSSolver
 
 #######################################
 #              MIS Solver             #  
 #######################################
 from .mis.base import MISSolver
 from .mis.gurobi import MISGurobiSolver
+from .mis.highs import MISHiGHSSolver
 from .mis.kamis import KaMISSolver
 
 #######################################
@@ -42,6 +46,7 @@ from .mis.kamis import KaMISSolver
 #######################################
 from .mvc.base import MVCSolver
 from .mvc.gurobi import MVCGurobiSolver
+from .mvc.highs import MVCHiGHSSolver
 
 #######################################
 #             TSP Solver             #  
@@ -23,11 +23,14 @@ import sys
 import math
 import numpy as np
 import networkx as nx
-from typing import Union
+from typing import Union, List
 from ml4co_kit.utils import tsplib95
+from ml4co_kit.utils.tsplib_utils import read_tsplib, render_atsp, render_tour
+from ml4co_kit.utils.distance_utils import distance_matrix, TSPLIB_ROUND_FUNCS
 from ml4co_kit.solver.base import SolverBase
-from ml4co_kit.evaluate.atsp.base import ATSPEvaluator
+from ml4co_kit.evaluate.atsp.base import atsp_batch_tours_cost, atsp_batch_evaluate
 from ml4co_kit.utils.type_utils import to_numpy, TASK_TYPE, SOLVER_TYPE
+from ml4co_kit.utils.file_utils import parallel_load
 from ml4co_kit.utils.time_utils import iterative_execution, iterative_execution_for_file
 
 
@@ -37,6 +40,40 @@ else:
     from ml4co_kit.utils.round import ROUND_FUNCS
 
 
+def _read_atsp_dists(atsp_file_path: str) -> np.ndarray:
+    # module-level (picklable) reader used by the process pool of the folder loaders
+    tsplib_data = read_tsplib(atsp_file_path)
+    if tsplib_data["edge_weights"] is not None:
+        return tsplib_data["edge_weights"].astype(np.float64)
+    
+    # the weights are computed from the coordinates, with the rounding of TSPLIB
+    norm = tsplib_data["header"].get("EDGE_WEIGHT_TYPE")
+    if tsplib_data["node_coords"] is not None and norm in TSPLIB_ROUND_FUNCS:
+        dists = distance_matrix(tsplib_data["node_coords"], norm, round_func="tsplib")
+        return dists.astype(np.float64)
+    
+    # otherwise, use the distance functions of ``tsplib95``
+    tsplib_data = tsplib95.load(atsp_file_path)
+    try:
+        dists = nx.to_numpy_array(tsplib_data.get_graph())
+    except:
+        try:
+            dists = np.array(tsplib_data.edge_weights)
+        except:
+            raise RuntimeError("Error in loading {}".format(atsp_file_path))
+    return dists
+
+
+def _read_atsp_tour(tour_file_path: str) -> np.ndarray:
+    tsp_tour = read_tsplib(tour_file_path)["tours"][0]
+    tour = np.append(tsp_tour, 1) - 1
+    return tour
+
+
+def _read_atsp_dists_and_tour(atsp_file_path: str, tour_file_path: str):
+    return _read_atsp_dists(atsp_file_path), _read_atsp_tour(tour_file_path)
+
+
 class ATSPSolver(SolverBase):
     r"""
     This class provides a basic framework for solving ATSP problems. It includes methods for 
@@ -64,6 +101,7 @@ class ATSPSolver(SolverBase):
         self.tours: np.ndarray = None
         self.ref_tours: np.ndarray = None
         self.nodes_num: int = None
+        self.load_times: List[float] = None
 
     def _check_dists_dim(self):
         r"""
@@ -200,27 +238,13 @@ class ATSPSolver(SolverBase):
         r"""
         Reads ATSP dists from a TSPLIB file.
         """
-        tsplib_data = tsplib95.load(atsp_file_path)
-        try:
-            dists = nx.to_numpy_array(tsplib_data.get_graph())
-        except:
-            try:
-                dists = np.array(tsplib_data.edge_weights)
-            except:
-                raise RuntimeError("Error in loading {}".format(atsp_file_path))
-        return dists
+        return _read_atsp_dists(atsp_file_path)
 
     def _read_tour_from_tour_file(self, tour_file_path: str) -> np.ndarray:
         r"""
         Reads an ATSP tour from a TSPLIB tour file.
         """
-        tsp_tour = tsplib95.load(tour_file_path)
-        tsp_tour = tsp_tour.tours
-        tsp_tour: list
-        tsp_tour = tsp_tour[0]
-        tsp_tour.append(1)
-        tour = np.array(tsp_tour) - 1
-        return tour
+        return _read_atsp_tour(tour_file_path)
     
     def from_tsplib(
         self, 
@@ -312,7 +336,8 @@ class ATSPSolver(SolverBase):
         return_list: bool = False,
         norm: str = "EUC_2D",
         normalize: bool = False,
-        show_time: bool = False
+        show_time: bool = False,
+        num_threads: int = 1
     ):
         """
         Read data from the folder containing TSPLIB type data
@@ -326,6 +351,9 @@ class ATSPSolver(SolverBase):
         :param norm: string, the normalization type for dists matrix.
         :param normalize: boolean, whether to normalize dists matrix.
         :param show_time: boolean, whether the data is being read with a visual progress display.
+        :param num_threads: int, the number of processes that parse the files. The files
+            are read in the sorted order of their names whatever ``num_threads`` is.
+            The reading time (seconds) of each file is kept in ``load_times``.
         
         .. dropdown:: Example
 
@@ -363,50 +391,46 @@ class ATSPSolver(SolverBase):
         
         # only dists
         if dists_flag and not tours_flag:
-            dists_list = list()
-            files = os.listdir(atsp_folder_path)
-            files.sort()
+            files = sorted(os.listdir(atsp_folder_path))
+            args_list = [
+                (os.path.join(atsp_folder_path, file_name),) for file_name in files
+                if file_name.endswith(".atsp") or file_name.endswith(".tsp")
+            ]
             load_msg = f"Loading data from {atsp_folder_path}"
-            for file_name in iterative_execution_for_file(files, load_msg, show_time):
-                atsp_file_path = os.path.join(atsp_folder_path, file_name)
-                if not atsp_file_path.endswith(".atsp")  and not atsp_file_path.endswith(".tsp"):
-                    continue
-                dists = self._read_data_from_atsp_file(atsp_file_path)
-                dists_list.append(dists)
+            dists_list, self.load_times = parallel_load(
+                _read_atsp_dists, args_list, num_threads, desc=load_msg, show_time=show_time
+            )
 
         # only tours
         if not dists_flag and tours_flag:
-            tours_list = list()
-            files = os.listdir(tour_folder_path)
-            files.sort()
+            files = sorted(os.listdir(tour_folder_path))
+            args_list = [
+                (os.path.join(tour_folder_path, file_name),) 
+                for file_name in files if file_name[-5:] == ".tour"
+            ]
             load_msg = f"Loading solutions from {tour_folder_path}"
-            for file_name in iterative_execution_for_file(files, load_msg, show_time):
-                tour_file_path = os.path.join(tour_folder_path, file_name)
-                if not tour_file_path[-5:] == ".tour":
-                    continue
-                tour = self._read_tour_from_tour_file(tour_file_path)
-                tours_list.append(tour)
+            tours_list, self.load_times = parallel_load(
+                _read_atsp_tour, args_list, num_threads, desc=load_msg, show_time=show_time
+            )
         
         # both dists and tours [must have the same filename]
         if dists_flag and tours_flag:
-            dists_list = list()
-            tours_list = list()
-            files = os.listdir(atsp_folder_path)
-            files.sort()
-            load_msg = f"Loading data from {atsp_folder_path} and solutions from {tour_folder_path}"
-            for file_name in iterative_execution_for_file(files, load_msg, show_time):
-                # dists
-                atsp_file_path = os.path.join(atsp_folder_path, file_name)
-                if not atsp_file_path.endswith(".atsp") and not atsp_file_path.endswith(".tsp"):
-                    continue
-                dists = self._read_data_from_atsp_file(atsp_file_path)
-                dists_list.append(dists)
-                # tour
-                tour_file_path = os.path.join(
-                    tour_folder_path, file_name.replace(".tsp", ".opt.tour")
+            files = sorted(os.listdir(atsp_folder_path))
+            args_list = [
+                (
+                    os.path.join(atsp_folder_path, file_name),
+                    os.path.join(tour_folder_path, file_name.replace(".tsp", ".opt.tour"))
                 )
-                tour = self._read_tour_from_tour_file(tour_file_path)
-                tours_list.append(tour)
+                for file_name in files 
+                if file_name.endswith(".atsp") or file_name.endswith(".tsp")
+            ]
+            load_msg = f"Loading data from {atsp_folder_path} and solutions from {tour_folder_path}"
+            results, self.load_times = parallel_load(
+                _read_atsp_dists_and_tour, args_list, num_threads, 
+                desc=load_msg, show_time=show_time
+            )
+            dists_list = [dists for dists, _ in results]
+            tours_list = [tour for _, tour in results]
                 
         # return list
         if return_list:
@@ -652,17 +676,7 @@ class ATSPSolver(SolverBase):
                     name = atsp_filename + f"-{idx}.atsp"
                 save_path = os.path.join(atsp_save_dir, name)
                 with open(save_path, "w") as f:
-                    f.write(f"NAME : {name}\n")
-                    f.write(f"COMMENT : Generated by ML4CO-Kit\n")
-                    f.write("TYPE : ATSP\n")
-                    f.write(f"DIMENSION : {self.nodes_num}\n")
-                    f.write(f"EDGE_WEIGHT_TYPE : EXPLICIT\n")
-                    f.write(f"EDGE_WEIGHT_FORMAT: FULL_MATRIX\n")
-                    f.write("EDGE_WEIGHT_SECTION:\n")
-                    for i in range(self.nodes_num):
-                        line = ' '.join([str(elem) for elem in dists[idx][i]])
-                        f.write(f"{line}\n")
-                    f.write("EOF\n")
+                    f.write(render_atsp(dists[idx], name))
 
         # .opt.tour files
         if tour_save_dir is not None:
@@ -688,14 +702,7 @@ class ATSPSolver(SolverBase):
                     name = tour_filename + f"-{idx}.opt.tour"
                 save_path = os.path.join(tour_save_dir, name)
                 with open(save_path, "w") as f:
-                    f.write(f"NAME: {name} Solved by ML4CO-Kit\n")
-                    f.write(f"TYPE: TOUR\n")
-                    f.write(f"DIMENSION: {self.nodes_num}\n")
-                    f.write(f"TOUR_SECTION\n")
-                    for i in range(self.nodes_num):
-                        f.write(f"{tours[idx][i]}\n")
-                    f.write(f"-1\n")
-                    f.write(f"EOF\n")
+                    f.write(render_tour(tours[idx][:self.nodes_num], name))
 
     def to_txt(
         self,
@@ -752,18 +759,9 @@ class ATSPSolver(SolverBase):
         if tours.shape[0] != samples:
             # a problem has more than one solved tour
             samples_tours = tours.reshape(samples, -1, tours.shape[-1])
-            best_tour_list = list()
-            for idx, solved_tours in enumerate(samples_tours):
-                cur_eva = ATSPEvaluator(dists[idx])
-                best_tour = solved_tours[0]
-                best_cost = cur_eva.evaluate(best_tour)
-                for tour in solved_tours:
-                    cur_cost = cur_eva.evaluate(tour)
-                    if cur_cost < best_cost:
-                        best_cost = cur_cost
-                        best_tour = tour
-                best_tour_list.append(best_tour)
-            tours = np.array(best_tour_list)
+            costs = atsp_batch_tours_cost(dists=dists, tours=samples_tours)
+            best_idx = np.argmin(costs, axis=1)
+            tours = samples_tours[np.arange(samples), best_idx]
 
         # apply scale and dtype
         dists = self._apply_scale_and_dtype(
@@ -844,65 +842,23 @@ class ATSPSolver(SolverBase):
             to_int=to_int, round_func=round_func
         )
 
-        # prepare for evaluate
-        tours_cost_list = list()
+        # a problem may have more than one solved tour
         samples = dists.shape[0]
-        if calculate_gap:
-            ref_tours_cost_list = list()
-            gap_list = list()
-
-        # deal with different situation
         if tours.shape[0] != samples:
-            # a problem has more than one solved tour
             tours = tours.reshape(samples, -1, tours.shape[-1])
-            for idx in range(samples):
-                evaluator = ATSPEvaluator(dists[idx])
-                solved_tours = tours[idx]
-                solved_costs = list()
-                for tour in solved_tours:
-                    cost = evaluator.evaluate(
-                        route=tour,
-                        to_int=to_int, 
-                        round_func=round_func
-                    )
-                    solved_costs.append(cost)
-                solved_cost = np.min(solved_costs)
-                tours_cost_list.append(solved_cost)
-                if calculate_gap:
-                    ref_cost = evaluator.evaluate(
-                        route=ref_tours[idx], 
-                        to_int=to_int, 
-                        round_func=round_func
-                    )
-                    ref_tours_cost_list.append(ref_cost)
-                    gap = (solved_cost - ref_cost) / ref_cost * 100
-                    gap_list.append(gap)
+
+        # evaluate all the tours at once
+        if calculate_gap:
+            tours_costs, ref_costs, gaps = atsp_batch_evaluate(
+                dists=dists, tours=tours, ref_tours=ref_tours, 
+                to_int=to_int, round_func=round_func
+            )
         else:
-            # a problem only one solved tour
-            for idx in range(samples):
-                evaluator = ATSPEvaluator(dists[idx])
-                solved_tour = tours[idx]
-                solved_cost = evaluator.evaluate(
-                    route=solved_tour,
-                    to_int=to_int, 
-                    round_func=round_func
-                )
-                tours_cost_list.append(solved_cost)
-                if calculate_gap:
-                    ref_cost = evaluator.evaluate(
-                        route=ref_tours[idx], 
-                        to_int=to_int, 
-                        round_func=round_func
-                    )
-                    ref_tours_cost_list.append(ref_cost)
-                    gap = (solved_cost - ref_cost) / ref_cost * 100
-                    gap_list.append(gap)
+            tours_costs = atsp_batch_evaluate(
+                dists=dists, tours=tours, to_int=to_int, round_func=round_func
+            )
 
         # calculate average cost/gap & std
-        tours_costs = np.array(tours_cost_list)
-        if calculate_gap:
-            ref_costs = np.array(ref_tours_cost_list)
-            gaps = np.array(gap_list)
         costs_avg = np.average(tours_costs)
         if calculate_gap:
             ref_costs_avg = np.average(ref_costs)
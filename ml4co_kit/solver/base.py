@@ -1,4 +1,8 @@
+import numpy as np
+from typing import List, Union
 from ml4co_kit.utils.type_utils import TASK_TYPE, SOLVER_TYPE
+from ml4co_kit.utils.graph.base import GraphData
+from ml4co_kit.utils.graph.batch import GraphBatch
 
 
 class SolverBase(object):
@@ -28,4 +32,121 @@ class SolverBase(object):
         )
 
     def __str__(self) -> str:
-        return "SolverBase"
\ No newline at end of file
+        return "SolverBase"
+
+
+class GraphSolverBase(SolverBase):
+    r"""
+    The common base of the MCl, MCut, MIS and MVC solvers. The graphs can be given
+    and taken as a ``GraphBatch``, and the solutions of all the graphs are evaluated,
+    validated and repaired at once on a ``GraphBatch``.
+
+    Subclasses set ``graph_cls`` (the ``GraphData`` subclass of the task),
+    ``objective_name`` (the attribute caching the objective of a graph),
+    ``maximize`` and ``infeasible_msg``, and implement ``from_graph_data``,
+    ``_check_edge_index_not_none`` and ``_check_nodes_label_not_none``.
+    """
+    graph_cls = GraphData
+    objective_name = "sel_nodes_num"
+    maximize = True
+    infeasible_msg = "are infeasible"
+
+    def from_graph_batch(self, batch: GraphBatch, ref: bool = False, cover: bool = True):
+        r"""
+        Loads the graphs (and the ``nodes_label`` or ``ref_nodes_label`` if ``ref``) 
+        of a ``GraphBatch``.
+        """
+        nodes_label = batch.ref_nodes_label if ref else batch.nodes_label
+        self.from_graph_data(
+            edge_index=[batch.get_edge_index(idx) for idx in range(len(batch))],
+            nodes_label=None if nodes_label is None else [
+                batch.get_nodes_label(idx, ref=ref) for idx in range(len(batch))
+            ],
+            ref=ref,
+            cover=cover
+        )
+
+    def to_graph_batch(self) -> GraphBatch:
+        r"""
+        Concatenates all the graphs (and their solutions) into a ``GraphBatch``.
+        """
+        self._check_edge_index_not_none()
+        return GraphBatch().from_graphs(self.graph_data)
+
+    def _set_graph_data(self, graph_data: Union[List[GraphData], GraphBatch]):
+        # the graphs to solve, given as a list of ``graph_cls`` or as a ``GraphBatch``
+        if isinstance(graph_data, GraphBatch):
+            graph_data = graph_data.to_graphs(graph_cls=self.graph_cls)
+        self.graph_data = graph_data
+
+    def _get_graph_data(
+        self, graph_data: Union[List[GraphData], GraphBatch] = None
+    ) -> Union[List[GraphData], GraphBatch]:
+        # the solved graphs, as a ``GraphBatch`` if they were given as one
+        if isinstance(graph_data, GraphBatch):
+            return self.to_graph_batch()
+        return self.graph_data
+
+    def _objectives(self, ref: bool) -> np.ndarray:
+        # the cached objectives are kept (e.g. those read by ``from_txt_only_sel_nodes_num``),
+        # the others are computed from the nodes labels of all the graphs at once
+        name = f"ref_{self.objective_name}" if ref else self.objective_name
+        objectives = [getattr(graph, name) for graph in self.graph_data]
+        missing = [idx for idx, value in enumerate(objectives) if value is None]
+        if len(missing) > 0:
+            graphs = [self.graph_data[idx] for idx in missing]
+            label_name = "ref_nodes_label" if ref else "nodes_label"
+            if any(getattr(graph, label_name) is None for graph in graphs):
+                raise ValueError(
+                    f"``{name}`` cannot be None! Please solve the graphs or "
+                    f"load their ``{label_name}`` first."
+                )
+            values = GraphBatch().from_graphs(graphs).evaluate(self.task_type, ref=ref)
+            for idx, value in zip(missing, values):
+                setattr(self.graph_data[idx], name, value)
+                objectives[idx] = value
+        return np.array(objectives)
+
+    def validate(self, ref: bool = False) -> np.ndarray:
+        r"""
+        Validates all the solutions in batch and returns the number of violated
+        constraints of each graph (see ``GraphBatch.validate``).
+        """
+        self._check_edge_index_not_none()
+        self._check_nodes_label_not_none(ref=ref)
+        return self.to_graph_batch().validate(self.task_type, ref=ref)
+    
+    def repair(self, ref: bool = False):
+        r"""
+        Greedily repairs all the infeasible solutions in batch.
+        """
+        self._check_edge_index_not_none()
+        self._check_nodes_label_not_none(ref=ref)
+        batch = self.to_graph_batch()
+        batch.repair(self.task_type, ref=ref)
+        self.from_graph_data(
+            nodes_label=[batch.get_nodes_label(idx, ref=ref) for idx in range(len(batch))],
+            ref=ref, 
+            cover=False
+        )
+        name = f"ref_{self.objective_name}" if ref else self.objective_name
+        for graph in self.graph_data:
+            setattr(graph, name, None)
+    
+    def evaluate(self, calculate_gap: bool = False, check_constraint: bool = False):
+        if check_constraint:
+            violations = self.validate(ref=False)
+            if np.any(violations > 0):
+                message = (
+                    f"The solutions of graphs {np.flatnonzero(violations).tolist()} "
+                    f"{self.infeasible_msg}. You can use ``repair`` to fix them."
+                )
+                raise ValueError(message)
+        objectives = self._objectives(ref=False)
+        if not calculate_gap:
+            return np.average(objectives)
+        ref_objectives = self._objectives(ref=True)
+        gap = (objectives - ref_objectives) / ref_objectives * 100
+        if self.maximize:
+            gap = -gap
+        return np.average(objectives), np.average(ref_objectives), np.average(gap), np.std(gap)
@@ -20,13 +20,15 @@ import os
 import sys
 import math
 import numpy as np
-from typing import Union
-from pyvrp import Model
-from pyvrp import read as read_vrp
+from typing import Union, List
 from ml4co_kit.solver.base import SolverBase
-from ml4co_kit.evaluate.cvrp.base import CVRPEvaluator
+from ml4co_kit.evaluate.cvrp.base import (
+    cvrp_pad_tours, cvrp_batch_tours_cost, cvrp_batch_check_tours
+)
 from ml4co_kit.utils.distance_utils import geographical
+from ml4co_kit.utils.tsplib_utils import read_tsplib, render_vrp
 from ml4co_kit.utils.type_utils import to_numpy, TASK_TYPE, SOLVER_TYPE
+from ml4co_kit.utils.file_utils import parallel_load
 from ml4co_kit.utils.time_utils import iterative_execution, iterative_execution_for_file
 
 
@@ -39,6 +41,92 @@ else:
     from ml4co_kit.utils.round import ROUND_FUNCS
 
 
+def _read_vrp_data(vrp_file_path: str, round_func: str = "none"):
+    # module-level (picklable) reader used by the process pool of the folder loaders
+    data = read_tsplib(vrp_file_path)
+    nodes_num = int(data["header"]["DIMENSION"])
+    round_func = round_func if callable(round_func) else ROUND_FUNCS[round_func]
+    
+    # the first depot and the other nodes (clients), in the order of the file
+    depot_ids = data["depots"] - 1 if data["depots"] is not None else np.array([0])
+    is_client = np.ones(shape=(nodes_num,), dtype=bool)
+    is_client[depot_ids] = False
+    
+    # depots
+    coords = data["node_coords"]
+    if coords is None:
+        coords = np.zeros(shape=(nodes_num, 2), dtype=np.int64)
+    coords = round_func(coords)
+    depots = coords[depot_ids[0]]
+    
+    # points and demands
+    points = coords[is_client]
+    demands = data["demands"]
+    if demands is None:
+        demands = np.zeros(shape=(nodes_num,), dtype=np.int64)
+    demands = round_func(demands)[is_client]
+    
+    # capacity
+    capacity = round_func(np.array(int(data["header"]["CAPACITY"]))).item()
+    
+    # return
+    return depots, points, demands, capacity
+
+
+def _read_vrp_tour(sol_file_path: str) -> list:
+    # check the .sol type
+    route_flag = None
+    with open(sol_file_path, "r") as file:
+        first_line = file.readline()
+        if "Route" in first_line:
+            # Like this
+            # Route #1: 15 17 9 3 16 29
+            # Route #2: 12 5 26 7 8 13 32 2
+            route_flag = True
+        else:
+            # Like this
+            # 36395
+            # 37
+            # 1893900
+            # 1133620
+            # 0 1 1 1144 12  14 0 217 236 105 2 169 8 311 434 362 187 136 59 0
+            # 0 1 1 1182 12  14 0 3 370 133 425 349 223 299 386 267 410 411 348 0
+            route_flag = False
+    
+    # read the data form .sol
+    if route_flag == True:
+        with open(sol_file_path, "r") as file:
+            tour = [0]
+            for line in file:
+                if line.startswith("Route"):
+                    split_line = line.replace("\n", "").split(":")[1][1:].split(" ")
+                    for node in split_line:
+                        tour.append(int(node))
+                    tour.append(0)
+    elif route_flag == False:
+        with open(sol_file_path, "r") as file:
+            line_idx = 0
+            tour = [0]
+            for line in file:
+                line_idx += 1
+                if line_idx < 5:
+                    continue
+                split_line = line.split(" ")[7:-1]
+                for node in split_line:
+                    tour.append(int(node))
+                tour.append(0)
+    else:
+        raise ValueError(
+            f"Unable to read route information from {sol_file_path}."
+        )
+        
+    return tour
+
+
+def _read_vrp_data_and_tour(vrp_file_path: str, sol_file_path: str):
+    return _read_vrp_data(vrp_file_path), _read_vrp_tour(sol_file_path)
+
+
 class CVRPSolver(SolverBase):
     r"""
     This class provides a basic framework for solving CVRP problems. It includes methods for 
@@ -91,6 +179,7 @@ class CVRPSolver(SolverBase):
         self.ref_tours: np.ndarray = None
         self.nodes_num: int = None
         self.norm: str = None
+        self.load_times: List[float] = None
         
     def _check_depots_dim(self):
         r"""
@@ -312,22 +401,21 @@ class CVRPSolver(SolverBase):
         Checks if the ``tour`` satisfies the capacities demands. Raise a `ValueError` if 
         there is a split tour don't meet the demands.
         """
-        tours_shape = self.tours.shape
-        for idx in range(tours_shape[0]):
-            cur_demand = self.demands[idx]
-            cur_capacity = self.capacities[idx]
-            cur_tour = self.tours[idx]
-            split_tours = np.split(cur_tour, np.where(cur_tour == 0)[0])[1: -1]
-            for split_idx in range(len(split_tours)):
-                split_tour = split_tours[split_idx][1:]
-                split_demand_need = np.sum(cur_demand[split_tour.astype(int) - 1], dtype=np.float32)
-                if split_demand_need > cur_capacity + 1e-5:
-                    message = (
-                        f"Capacity constraint not met in tour {idx}. "
-                        f"The split tour is ``{split_tour}`` with the demand of {split_demand_need}."
-                        f"However, the maximum capacity of the vehicle is {cur_capacity}."
-                    )
-                    raise ValueError(message)
+        tours = self.tours
+        capacities = np.broadcast_to(self.capacities.reshape(-1), (tours.shape[0],))
+        _, loads, route_batch = cvrp_batch_check_tours(
+            tours=tours, demands=self.demands, 
+            capacities=capacities, return_loads=True
+        )
+        overload = np.flatnonzero(loads > capacities[route_batch] + 1e-5)
+        if len(overload) > 0:
+            idx = route_batch[overload[0]]
+            message = (
+                f"Capacity constraint not met in tour {idx}. "
+                f"The split tour has the demand of {loads[overload[0]]}."
+                f"However, the maximum capacity of the vehicle is {capacities[idx]}."
+            )
+            raise ValueError(message)
     
     def _modify_tour(self, tour: np.ndarray):
         r"""
@@ -335,9 +423,10 @@ class CVRPSolver(SolverBase):
 
         :param tour: np.ndarray, the tour need to modified. 
         """
-        if not np.isin(-1, tour):
+        is_pad = tour == -1
+        if not is_pad.any():
             return tour
-        return tour[: np.where(tour == -1)[0][0]]
+        return tour[: np.argmax(is_pad)]
 
     def _get_distance(self, x1: float, x2: float, norm: str = None):
         r"""
@@ -391,82 +480,13 @@ class CVRPSolver(SolverBase):
         Reads CVRP data from a ".vrp" file.
         Conclude depots, points, demands and capacity.
         """
-        # instance and model
-        instance = read_vrp(where=vrp_file_path, round_func=round_func)
-        vrp_model = Model.from_data(instance)
-        
-        # depots
-        _depots = vrp_model._depots[0]
-        depots = np.array([_depots.x, _depots.y])
-        
-        # points and demands
-        _clients = vrp_model._clients
-        _vehicle_types = vrp_model._vehicle_types[0]
-        points_list = list()
-        demands_list = list()
-        for client in _clients:
-            points_list.append([client.x, client.y])
-            demands_list.append(client.demand if CP38 else client.delivery)
-        points = np.array(points_list)
-        demands = np.array(demands_list).reshape(-1)
-        
-        # capacity
-        capacity = _vehicle_types.capacity
-        
-        # return
-        return depots, points, demands, capacity
+        return _read_vrp_data(vrp_file_path, round_func)
 
     def _read_tour_from_sol_file(self, sol_file_path: str = None):
         r"""
         Reads a CVRP tour from a  ".sol" file.
         """
-        # check the .sol type
-        route_flag = None
-        with open(sol_file_path, "r") as file:
-            first_line = file.readline()
-            if "Route" in first_line:
-                # Like this
-                # Route #1: 15 17 9 3 16 29
-                # Route #2: 12 5 26 7 8 13 32 2
-                route_flag = True
-            else:
-                # Like this
-                # 36395
-                # 37
-                # 1893900
-                # 1133620
-                # 0 1 1 1144 12  14 0 217 236 105 2 169 8 311 434 362 187 136 59 0
-                # 0 1 1 1182 12  14 0 3 370 133 425 349 223 299 386 267 410 411 348 0
-                route_flag = False
-        
-        # read the data form .sol
-        if route_flag == True:
-            with open(sol_file_path, "r") as file:
-                tour = [0]
-                for line in file:
-                    if line.startswith("Route"):
-                        split_line = line.replace("\n", "").split(":")[1][1:].split(" ")
-                        for node in split_line:
-                            tour.append(int(node))
-                        tour.append(0)
-        elif route_flag == False:
-            with open(sol_file_path, "r") as file:
-                line_idx = 0
-                tour = [0]
-                for line in file:
-                    line_idx += 1
-                    if line_idx < 5:
-                        continue
-                    split_line = line.split(" ")[7:-1]
-                    for node in split_line:
-                        tour.append(int(node))
-                    tour.append(0)
-        else:
-            raise ValueError(
-                f"Unable to read route information from {sol_file_path}."
-            )
-            
-        return tour
+        return _read_vrp_tour(sol_file_path)
 
     def from_vrplib(
         self, 
@@ -547,7 +567,8 @@ class CVRPSolver(SolverBase):
         return_list: bool = False,
         norm: str = "EUC_2D",
         normalize: bool = False,
-        show_time: bool = False
+        show_time: bool = False,
+        num_threads: int = 1
     ):
         """
         Read data from the folder containing VRPLIB and solution type data.
@@ -561,6 +582,9 @@ class CVRPSolver(SolverBase):
         :param norm: string, the normalization type for data.
         :param normalize: boolean, whether to normalize data.
         :param show_time: boolean, whether the data is being read with a visual progress display.
+        :param num_threads: int, the number of processes that parse the files. The files
+            are read in the sorted order of their names whatever ``num_threads`` is.
+            The reading time (seconds) of each file is kept in ``load_times``.
         
         .. dropdown:: Example
 
@@ -602,61 +626,49 @@ class CVRPSolver(SolverBase):
         
         # only data
         if vrp_flag and not sol_flag:
-            depots_list = list()
-            points_list = list()
-            demands_list = list()
-            capacity_list = list()
-            files = os.listdir(vrp_folder_path)
-            files.sort()
-            for file_name in iterative_execution_for_file(files, "Loading", show_time):
-                vrp_file_path = os.path.join(vrp_folder_path, file_name)
-                if not vrp_file_path.endswith(".vrp"):
-                    continue
-                depots, points, demands, capacity = \
-                    self._read_data_from_vrp_file(vrp_file_path)
-                depots_list.append(depots)
-                points_list.append(points)
-                demands_list.append(demands)
-                capacity_list.append(capacity)
+            files = sorted(os.listdir(vrp_folder_path))
+            args_list = [
+                (os.path.join(vrp_folder_path, file_name),) 
+                for file_name in files if file_name.endswith(".vrp")
+            ]
+            results, self.load_times = parallel_load(
+                _read_vrp_data, args_list, num_threads, desc="Loading", show_time=show_time
+            )
+            depots_list = [data[0] for data in results]
+            points_list = [data[1] for data in results]
+            demands_list = [data[2] for data in results]
+            capacity_list = [data[3] for data in results]
 
         # only sol
         if not vrp_flag and sol_flag:
-            tours_list = list()
-            files = os.listdir(sol_folder_path)
-            files.sort()
-            for file_name in iterative_execution_for_file(files, "Loading", show_time):
-                sol_file_path = os.path.join(sol_folder_path, file_name)
-                if not sol_file_path[-4:] == ".sol":
-                    continue
-                tour = self._read_tour_from_sol_file(sol_file_path)
-                tours_list.append(tour)
+            files = sorted(os.listdir(sol_folder_path))
+            args_list = [
+                (os.path.join(sol_folder_path, file_name),) 
+                for file_name in files if file_name[-4:] == ".sol"
+            ]
+            tours_list, self.load_times = parallel_load(
+                _read_vrp_tour, args_list, num_threads, desc="Loading", show_time=show_time
+            )
         
         # both points and tours [must have the same filename]
         if vrp_flag and sol_flag:
-            depots_list = list()
-            points_list = list()
-            demands_list = list()
-            capacity_list = list()
-            tours_list = list()
-            files = os.listdir(vrp_folder_path)
-            files.sort()
-            for file_name in iterative_execution_for_file(files, "Loading", show_time):
-                # data
-                vrp_file_path = os.path.join(vrp_folder_path, file_name)
-                if not vrp_file_path.endswith(".vrp"):
-                    continue
-                depots, points, demands, capacity = \
-                    self._read_data_from_vrp_file(vrp_file_path)
-                depots_list.append(depots)
-                points_list.append(points)
-                demands_list.append(demands)
-                capacity_list.append(capacity)
-                # sol
-                sol_file_path = os.path.join(
-                    sol_folder_path, file_name.replace(".vrp", ".sol")
+            files = sorted(os.listdir(vrp_folder_path))
+            args_list = [
+                (
+                    os.path.join(vrp_folder_path, file_name),
+                    os.path.join(sol_folder_path, file_name.replace(".vrp", ".sol"))
                 )
-                tour = self._read_tour_from_sol_file(sol_file_path)
-                tours_list.append(tour)
+                for file_name in files if file_name.endswith(".vrp")
+            ]
+            results, self.load_times = parallel_load(
+                _read_vrp_data_and_tour, args_list, num_threads, 
+                desc="Loading", show_time=show_time
+            )
+            depots_list = [data[0] for data, _ in results]
+            points_list = [data[1] for data, _ in results]
+            demands_list = [data[2] for data, _ in results]
+            capacity_list = [data[3] for data, _ in results]
+            tours_list = [tour for _, tour in results]
         
         # return list
         if return_list:
@@ -883,15 +895,7 @@ class CVRPSolver(SolverBase):
                     tours = np.array(tours)
                 # 2D tours
                 else:
-                    lengths = [len(tour) for tour in tours]
-                    max_length = max(lengths)
-                    len_tours = len(tours)
-                    np_tours = np.zeros(shape=(len_tours, max_length)) - 1
-                    for idx in range(len_tours):
-                        tour = tours[idx]
-                        len_tour = len(tour)
-                        np_tours[idx][:len_tour] = tour
-                    tours = np_tours.astype(np.int32)
+                    tours = cvrp_pad_tours(tours)
             if ref:
                 self.ref_tours = tours
                 self._check_ref_tours_dim()
@@ -998,26 +1002,10 @@ class CVRPSolver(SolverBase):
                 
                 # write
                 with open(save_path, "w") as f:
-                    f.write(f"NAME : {name}\n")
-                    f.write(f"COMMENT : Generated by ML4CO-Kit\n")
-                    f.write("TYPE : CVRP\n")
-                    f.write(f"DIMENSION : {self.nodes_num + 1}\n")
-                    f.write(f"EDGE_WEIGHT_TYPE : {self.norm}\n")
-                    f.write(f"CAPACITY : {capacities[idx]}\n")
-                    f.write("NODE_COORD_SECTION\n")
-                    x, y = depots[idx]
-                    f.write(f"1 {x} {y}\n")
-                    for i in range(self.nodes_num):
-                        x, y = points[idx][i]
-                        f.write(f"{i+2} {x} {y}\n")
-                    f.write("DEMAND_SECTION \n")
-                    f.write(f"1 0\n")
-                    for i in range(self.nodes_num):
-                        f.write(f"{i+2} {demands[idx][i]}\n")
-                    f.write("DEPOT_SECTION \n")
-                    f.write("	1\n")
-                    f.write("	-1\n")
-                    f.write("EOF\n")
+                    f.write(render_vrp(
+                        depot=depots[idx], points=points[idx], demands=demands[idx],
+                        capacity=capacities[idx], name=name, norm=self.norm
+                    ))
         
         # .sol files
         if sol_save_dir is not None:
@@ -1026,6 +1014,10 @@ class CVRPSolver(SolverBase):
             
             # variables
             tours = self.tours   
+            costs = cvrp_batch_tours_cost(
+                depots=depots, points=points, tours=tours, norm=self.norm,
+                to_int=to_int, round_func=round_func
+            )
             
             # filename
             if sol_filename.endswith(".sol"):
@@ -1045,9 +1037,6 @@ class CVRPSolver(SolverBase):
                     name = sol_filename + f"-{idx}.sol"
                 save_path = os.path.join(sol_save_dir, name)
 
-                # evaluator
-                evaluator = CVRPEvaluator(depots[idx], points[idx], self.norm)
-
                 # write
                 tour = tours[idx]
                 split_tours = np.split(tour, np.where(tour == 0)[0])[1: -1]
@@ -1058,12 +1047,7 @@ class CVRPSolver(SolverBase):
                         f.write(f" ".join(str(int(node)) for node in part_tour))
                         f.write("\n")
                         
-                    cost = evaluator.evaluate(
-                        route=self._modify_tour(tour), 
-                        to_int=to_int, 
-                        round_func=round_func
-                    )
-                    f.write(f"Cost {cost}\n")
+                    f.write(f"Cost {costs[idx]}\n")
                 
     def to_txt(
         self,
@@ -1200,7 +1184,7 @@ class CVRPSolver(SolverBase):
         if _check_demands:
             self._check_demands_meet()
         if calculate_gap:
-            self._check_tours_not_none(ref=False)
+            self._check_tours_not_none(ref=True)
             
         # variables
         depots = self.ori_depots if original else self.depots
@@ -1216,38 +1200,20 @@ class CVRPSolver(SolverBase):
             apply_scale=apply_scale, to_int=to_int, round_func=round_func
         )
         
-        # prepare for evaluate
-        tours_cost_list = list()
+        # evaluate (batched)
         samples = points.shape[0]
+        tours_costs = cvrp_batch_tours_cost(
+            depots=depots, points=points, tours=tours, norm=self.norm,
+            to_int=to_int, round_func=round_func
+        )
         if calculate_gap:
-            ref_tours_cost_list = list()
-            gap_list = list()
-            
-        # evaluate
-        for idx in range(samples):
-            evaluator = CVRPEvaluator(depots[idx], points[idx], self.norm)
-            solved_tour = tours[idx]
-            solved_cost = evaluator.evaluate(
-                route=self._modify_tour(solved_tour), 
-                to_int=to_int, 
-                round_func=round_func
+            ref_costs = cvrp_batch_tours_cost(
+                depots=depots, points=points, tours=ref_tours, norm=self.norm,
+                to_int=to_int, round_func=round_func
             )
-            tours_cost_list.append(solved_cost)
-            if calculate_gap:
-                ref_cost = evaluator.evaluate(
-                    route=self._modify_tour(ref_tours[idx]), 
-                    to_int=to_int, 
-                    round_func=round_func
-                )
-                ref_tours_cost_list.append(ref_cost)
-                gap = (solved_cost - ref_cost) / ref_cost * 100
-                gap_list.append(gap)
+            gaps = (tours_costs - ref_costs) / ref_costs * 100
 
         # calculate average cost/gap & std
-        tours_costs = np.array(tours_cost_list)
-        if calculate_gap:
-            ref_costs = np.array(ref_tours_cost_list)
-            gaps = np.array(gap_list)
         costs_avg = np.average(tours_costs)
         if calculate_gap:
             ref_costs_avg = np.average(ref_costs)
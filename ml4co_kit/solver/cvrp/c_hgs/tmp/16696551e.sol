@@ -0,0 +1,9 @@
+Route #1: 35 27 6 22 39 49 29 19
+Route #2: 13 16 32 20 1 43 9 25 12 33
+Route #3: 37 26 23 47 30 38 21 34 24
+Route #4: 8 10 15 45 48 5 31 17
+Route #5: 14
+Route #6: 11 44 50 36 18 4 41 7
+Route #7: 46 40 42 28 2 3
+Cost 178057
+Time 1.00212
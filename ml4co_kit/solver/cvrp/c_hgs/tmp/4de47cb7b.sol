@@ -0,0 +1,8 @@
+Route #1: 25 20 14 18 28 38 5 47 6 26
+Route #2: 40 23 13 11 17 4 27 16
+Route #3: 46 15 22 9 36
+Route #4: 19 10 12 44 8 43 31 34 2 30 32
+Route #5: 1 42 33 29 7 45 37
+Route #6: 3 41 35 39 24 21 50 48 49
+Cost 201605
+Time 1.00092
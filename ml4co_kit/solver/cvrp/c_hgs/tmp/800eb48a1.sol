@@ -0,0 +1,8 @@
+Route #1: 47 33 21 27 18 30 25
+Route #2: 39 28 5 49 9 26 37 12
+Route #3: 4 42 3 23 13 1 8 44 2
+Route #4: 40 11 22 38 7 34 41 10 46
+Route #5: 45 14 19 43 36 31 48
+Route #6: 20 29 6 35 32 15 16 50 17 24
+Cost 205404
+Time 1.0003
@@ -0,0 +1,8 @@
+Route #1: 17 43 39 23 20 2 48 14 44
+Route #2: 38 34 50 35 6 31 27 40 19
+Route #3: 42 30 1 37 32 7
+Route #4: 46 8 22 18 13 3
+Route #5: 5 15 12 9 29 47 28 21 16 10 26 24 41
+Route #6: 11 33 49 45 25 36 4
+Cost 196268
+Time 1.00051
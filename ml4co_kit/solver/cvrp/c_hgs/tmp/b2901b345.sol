@@ -0,0 +1,9 @@
+Route #1: 1 23 19 24 32
+Route #2: 30 26 20 40 36 25 18 46 29
+Route #3: 45 31 35 5 16
+Route #4: 12 39 27 47 14 8 10 43
+Route #5: 38 21 15 33 28 4 50
+Route #6: 34 13 2 6 48 11 9 7 17 3 49
+Route #7: 44 42 41 22 37
+Cost 248089
+Time 1.0012
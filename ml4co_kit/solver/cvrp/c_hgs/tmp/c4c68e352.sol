@@ -0,0 +1,9 @@
+Route #1: 10 14 4 49 2 30 33 37 5
+Route #2: 40 23 47 31 6 48 38
+Route #3: 39 3 28 29 8 9 13 12 36 43
+Route #4: 34 1 46 50 7 22 41
+Route #5: 45 26 24 19 44
+Route #6: 11 42 21 17 18 16
+Route #7: 25 32 35 15 20 27
+Cost 237327
+Time 1.00078
@@ -0,0 +1,9 @@
+Route #1: 38 2 46 48 10 23
+Route #2: 16 31 44 45 28 17
+Route #3: 35 49 14 29 21 36 26 11 5
+Route #4: 12 32 8 22 37 39
+Route #5: 15 19 50 33 34 41 47 4
+Route #6: 20 13 24 43 30 27 3
+Route #7: 42 1 18 40 6 25 7 9
+Cost 226180
+Time 1.0009
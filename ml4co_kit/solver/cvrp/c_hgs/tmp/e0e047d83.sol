@@ -0,0 +1,9 @@
+Route #1: 2 3 32 23 39 7 34 42 12
+Route #2: 36 46
+Route #3: 1 29 31 17 49 26
+Route #4: 28 18 33 40 13 5 43 21
+Route #5: 19 24 4 50 45 25 16 20 38 37
+Route #6: 15 8 35 14 9 10 30 27 6
+Route #7: 48 44 47 22 41 11
+Cost 243629
+Time 1.00273
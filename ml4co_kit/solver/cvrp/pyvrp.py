@@ -28,6 +28,7 @@ from pyvrp.stop import MaxRuntime
 from ml4co_kit.solver.cvrp.base import CVRPSolver
 from ml4co_kit.utils.type_utils import SOLVER_TYPE
 from ml4co_kit.utils.time_utils import iterative_execution, Timer
+from ml4co_kit.utils.distance_utils import distance_matrix
 
 
 if sys.version_info.major == 3 and sys.version_info.minor == 8:
@@ -92,10 +93,13 @@ class CVRPPyVRPSolver(CVRPSolver):
             ) for idx in range(0, len(nodes_coord))
         ]
         locations = [depot] + clients
-        for frm in locations:
-            for to in locations:
-                distance = self._get_distance(x1=(frm.x, frm.y), x2=(to.x, to.y))
-                cvrp_model.add_edge(frm, to, distance=self.round_func(distance))
+        coords = np.concatenate(
+            [depot_coord[None, :], self.round_func(nodes_coord)], axis=0
+        ).astype(np.int64)
+        dists = self.round_func(distance_matrix(coords, self.norm)).tolist()
+        for frm, frm_dists in zip(locations, dists):
+            for to, distance in zip(locations, frm_dists):
+                cvrp_model.add_edge(frm, to, distance=distance)
         res = cvrp_model.solve(stop=MaxRuntime(self.time_limit))
         
         routes = res.best.get_routes() if CP38 else res.best.routes()
@@ -17,7 +17,8 @@ It involves maximizing or minimizing a linear objective function subject to line
 
 
 import numpy as np
-from typing import Union
+import scipy.sparse as sp
+from typing import Union, List
 from ml4co_kit.solver.base import SolverBase
 from ml4co_kit.utils.time_utils import iterative_execution_for_file
 from ml4co_kit.utils.type_utils import to_numpy, TASK_TYPE, SOLVER_TYPE
@@ -26,13 +27,16 @@ from ml4co_kit.utils.type_utils import to_numpy, TASK_TYPE, SOLVER_TYPE
 class LPSolver(SolverBase):
     r"""
     min cx, st wx=b 
+
+    ``w`` is either a dense array with shape (B, m, n) or a list of ``scipy.sparse``
+    CSR matrices with shape (m, n), which is used for large sparse instances.
     """
     def __init__(self, solver_type: SOLVER_TYPE = None, time_limit: float = 60.0):
         super(LPSolver, self).__init__(
             task_type=TASK_TYPE.LP, solver_type=solver_type
         )
         self.time_limit = time_limit
-        self.w: np.ndarray = None
+        self.w: Union[np.ndarray, List[sp.csr_matrix]] = None
         self.c: np.ndarray = None
         self.b: np.ndarray = None
         self.x: np.ndarray = None
@@ -44,12 +48,18 @@ class LPSolver(SolverBase):
         it adds an additional dimension to make it 3D. Raises a ``ValueError`` if ``points``
         is neither 2D nor 3D.
         """
-        if self.w is not None:
+        if self.w is not None and not self._is_sparse():
             if self.w.ndim == 2:
                 self.w = np.expand_dims(self.w, axis=0)
             if self.w.ndim != 3:
                 raise ValueError("``w`` must be a 2D or 3D array.")
 
+    def _is_sparse(self) -> bool:
+        r"""
+        Whether ``w`` is stored as a list of sparse matrices.
+        """
+        return isinstance(self.w, list)
+
     def _check_c_dim(self):
         r"""
         Ensures that the ``c`` attribute is a 2D array. If ``c`` is a 1D array,
@@ -168,10 +178,11 @@ class LPSolver(SolverBase):
             f"``{msg}`` does not meet the constraint. Please carefully check whether "
             "there is a problem in the generation of Solutions."
         )
-        if ref:
-            wx = np.squeeze(np.matmul(self.w, np.expand_dims(self.ref_x, -1)), -1)  
+        x = self.ref_x if ref else self.x
+        if self._is_sparse():
+            wx = np.stack([_w @ _x for _w, _x in zip(self.w, x)])
         else:
-            wx = np.squeeze(np.matmul(self.w, np.expand_dims(self.x, -1)), -1)
+            wx = np.squeeze(np.matmul(self.w, np.expand_dims(x, -1)), -1)
         if np.max(np.abs(wx - self.b)) > 1e-3:
             raise ValueError(message)
 
@@ -194,6 +205,15 @@ class LPSolver(SolverBase):
             x_list = list()
             load_msg = f"Loading data from {file_path}"
             for line in iterative_execution_for_file(file, load_msg, show_time):
+                # sparse ``w`` given by (row, col, value) triplets
+                if line.startswith("w_sparse "):
+                    w, c, b, x = self._read_sparse_line(line)
+                    w_list.append(w)
+                    c_list.append(c)
+                    b_list.append(b)
+                    x_list.append(x)
+                    continue
+                
                 # get data
                 line = line.strip()
                 split_lines_1 = line.split("  c ")
@@ -209,11 +229,11 @@ class LPSolver(SolverBase):
                 str_w.append('')
                 w = np.array([float(str_w[2*i]) for i in range(len(str_w) // 2)])
                 str_c = str_c.split(" ")
-                c = np.array(str_c).astype(np.float32)
+                c = np.array(str_c).astype(np.float64)
                 str_b = str_b.split(" ")
-                b = np.array(str_b).astype(np.float32)
+                b = np.array(str_b).astype(np.float64)
                 str_x = str_x.split(" ")
-                x = np.array(str_x).astype(np.float32)
+                x = np.array(str_x).astype(np.float64)
                 constr_num = len(b)
                 vars_num = len(c)
                 w = w.reshape(constr_num, vars_num)
@@ -228,7 +248,7 @@ class LPSolver(SolverBase):
             return w_list, c_list, b_list, x_list
 
         try:
-            w = np.array(w_list)
+            w = w_list if w_list and sp.issparse(w_list[0]) else np.array(w_list)
             c = np.array(c_list)
             b = np.array(b_list)
             x = np.array(x_list)
@@ -243,9 +263,68 @@ class LPSolver(SolverBase):
 
         self.from_data(w=w, c=c, b=b, x=x, ref=ref)
         
+    def _read_sparse_line(self, line: str):
+        tokens = line.split()
+        c_idx, b_idx, x_idx = tokens.index("c"), tokens.index("b"), tokens.index("output")
+        constr_num, vars_num = int(tokens[1]), int(tokens[2])
+        triplets = np.array(tokens[3:c_idx], dtype=np.float64).reshape(-1, 3)
+        w = sp.csr_matrix(
+            (triplets[:, 2].astype(np.float64), 
+             (triplets[:, 0].astype(np.int64), triplets[:, 1].astype(np.int64))),
+            shape=(constr_num, vars_num)
+        )
+        c = np.array(tokens[c_idx+1:b_idx]).astype(np.float64)
+        b = np.array(tokens[b_idx+1:x_idx]).astype(np.float64)
+        x = np.array(tokens[x_idx+1:]).astype(np.float64)
+        return w, c, b, x
+
+    def from_npz(self, file_path: str, ref: bool = False):
+        r"""
+        Loads the data saved by ``to_npz``.
+        """
+        if not file_path.endswith(".npz"):
+            raise ValueError("Invalid file format. Expected a ``.npz`` file.")
+        with np.load(file_path) as data:
+            if "w" in data:
+                w = data["w"]
+            else:
+                shapes = data["w_shape"]
+                indptr = np.split(data["w_indptr"], np.cumsum(shapes[:, 0] + 1)[:-1])
+                nnz_splits = np.cumsum(data["w_nnz"])[:-1]
+                indices = np.split(data["w_indices"], nnz_splits)
+                values = np.split(data["w_data"], nnz_splits)
+                w = [
+                    sp.csr_matrix((_data, _indices, _indptr), shape=tuple(_shape))
+                    for _data, _indices, _indptr, _shape in zip(values, indices, indptr, shapes)
+                ]
+            self.from_data(w=w, c=data["c"], b=data["b"], x=data["x"], ref=ref)
+
+    def to_npz(self, file_path: str = "example.npz"):
+        r"""
+        Saves ``w``, ``c``, ``b`` and ``x`` in the binary ``.npz`` format. Sparse ``w``
+        is stored as the concatenated CSR arrays, so no zeros are written.
+        """
+        # check
+        self._check_w_not_none()
+        self._check_c_not_none()
+        self._check_b_not_none()
+        self._check_x_not_none(ref=False)
+
+        # write
+        data = {"c": self.c, "b": self.b, "x": self.x}
+        if self._is_sparse():
+            data["w_shape"] = np.array([_w.shape for _w in self.w], dtype=np.int64)
+            data["w_nnz"] = np.array([_w.nnz for _w in self.w], dtype=np.int64)
+            data["w_indptr"] = np.concatenate([_w.indptr for _w in self.w])
+            data["w_indices"] = np.concatenate([_w.indices for _w in self.w])
+            data["w_data"] = np.concatenate([_w.data for _w in self.w])
+        else:
+            data["w"] = self.w
+        np.savez(file_path, **data)
+
     def from_data(
         self,
-        w: Union[list, np.ndarray] = None,
+        w: Union[list, np.ndarray, sp.spmatrix] = None,
         c: Union[list, np.ndarray] = None,
         b: Union[list, np.ndarray] = None,
         x: Union[list, np.ndarray] = None,
@@ -253,19 +332,24 @@ class LPSolver(SolverBase):
     ):
         # read data
         if w is not None:
-            self.w = to_numpy(w).astype(np.float32)
-            self._check_w_dim()
+            if sp.issparse(w):
+                w = [w]
+            if type(w) == list and len(w) > 0 and sp.issparse(w[0]):
+                self.w = [sp.csr_matrix(_w, dtype=np.float64) for _w in w]
+            else:
+                self.w = to_numpy(w).astype(np.float64)
+                self._check_w_dim()
             
         if c is not None:
-            self.c = to_numpy(c).astype(np.float32)
+            self.c = to_numpy(c).astype(np.float64)
             self._check_c_dim()
             
         if b is not None:
-            self.b = to_numpy(b).astype(np.float32)
+            self.b = to_numpy(b).astype(np.float64)
             self._check_b_dim()
             
         if x is not None:
-            x = to_numpy(x).astype(np.float32)
+            x = to_numpy(x).astype(np.float64)
             if ref:
                 self.ref_x = x
                 self._check_ref_x_dim()
@@ -283,10 +367,19 @@ class LPSolver(SolverBase):
         # write
         for _w, _c, _b, _sol in zip(self.w, self.c, self.b, self.x):
             with open(file_path, "a+") as f:
-                f.write(str("w") + str(" "))
-                for line in _w:
-                    f.write(" ".join(str(x) + str(" ") for x in line))
+                if sp.issparse(_w):
+                    coo = _w.tocoo()
+                    f.write(f"w_sparse {_w.shape[0]} {_w.shape[1]} ")
+                    f.write(" ".join(
+                        f"{row} {col} {val}" 
+                        for row, col, val in zip(coo.row.tolist(), coo.col.tolist(), coo.data)
+                    ))
                     f.write(str(" "))
+                else:
+                    f.write(str("w") + str(" "))
+                    for line in _w:
+                        f.write(" ".join(str(x) + str(" ") for x in line))
+                        f.write(str(" "))
                 f.write("c " + str(" ").join(str(cc) for cc in _c))
                 f.write(" b " + str(" ").join(str(bb) for bb in _b))
                 f.write(str(" output") + str(" "))
@@ -307,7 +400,7 @@ class LPSolver(SolverBase):
 
         # prepare for evaluate
         x_cost_list = list()
-        samples = self.w.shape[0]
+        samples = len(self.w)
         if calculate_gap:
             ref_x_cost_list = list()
             gap_list = list()
@@ -338,7 +431,7 @@ class LPSolver(SolverBase):
  
     def solve(
         self,
-        w: Union[list, np.ndarray] = None,
+        w: Union[list, np.ndarray, sp.spmatrix] = None,
         c: Union[list, np.ndarray] = None,
         b: Union[list, np.ndarray] = None,
         num_threads: int = 1,
@@ -2,20 +2,50 @@ import os
 import uuid
 import numpy as np
 import gurobipy as gp
+import scipy.sparse as sp
 from typing import Union
+from scipy.sparse.linalg import lsqr
 from multiprocessing import Pool
 from ml4co_kit.solver.lp.base import LPSolver
 from ml4co_kit.utils.type_utils import SOLVER_TYPE
 from ml4co_kit.utils.time_utils import iterative_execution, Timer
 
 
+def _row_space_part(
+    w: Union[np.ndarray, sp.csr_matrix], c: np.ndarray, rtol: float = 1e-5
+) -> np.ndarray:
+    r"""
+    Projects ``c`` onto the row space of ``w``. Returns None if the part of ``c``
+    outside the row space is larger than rounding noise (relative to ``c``), that is, 
+    if the LP ``min cx, st wx = b`` with free variables is really unbounded.
+    """
+    if sp.issparse(w):
+        y = lsqr(w.T, c, atol=1e-12, btol=1e-12)[0]
+    else:
+        y = np.linalg.lstsq(w.T, c, rcond=None)[0]
+    c_proj = w.T @ y
+    if np.abs(c - c_proj).max() > rtol * max(1.0, np.abs(c).max()):
+        return None
+    return c_proj
+
+
 class LPGurobiSolver(LPSolver):
-    def __init__(self, time_limit: float = 60.0):
+    r"""
+    Solve LPs using Gurobi.
+
+    :param time_limit: float, the time limit (seconds) of each instance.
+    :param lp_save_dir: string, if given, every model is also written to this
+        directory as an ``.lp`` file (for debugging).
+    """
+    def __init__(self, time_limit: float = 60.0, lp_save_dir: str = None):
         super(LPGurobiSolver, self).__init__(
             solver_type=SOLVER_TYPE.GUROBI, time_limit=time_limit
         )
+        self.lp_save_dir = lp_save_dir
         
-    def _solve(self, w: np.ndarray, c: np.ndarray, b: np.ndarray) -> np.ndarray:
+    def _solve(
+        self, w: Union[np.ndarray, sp.csr_matrix], c: np.ndarray, b: np.ndarray
+    ) -> np.ndarray:
         # create gurobi model
         tmp_name = uuid.uuid4().hex[:9]
         model = gp.Model(f"{tmp_name}")
@@ -25,26 +55,40 @@ class LPGurobiSolver(LPSolver):
         
         # variables
         vars_num = len(c)
-        model.addVars(vars_num, 1, lb=-gp.GRB.INFINITY, ub=gp.GRB.INFINITY, vtype=gp.GRB.CONTINUOUS)
-        model.update()
-        x = gp.MVar.fromlist(model.getVars())
+        x = model.addMVar(
+            vars_num, lb=-gp.GRB.INFINITY, ub=gp.GRB.INFINITY, vtype=gp.GRB.CONTINUOUS
+        )
 
-        # constr.
+        # constr. (the matrix API takes both dense and ``scipy.sparse`` matrices)
         model.addConstr(w @ x == b)
 
         # object
-        model.setObjective(c.T @ x, gp.GRB.MINIMIZE)
+        model.setObjective(c @ x, gp.GRB.MINIMIZE)
 
         # Solve
-        model.write(f"{tmp_name}.lp")
+        if self.lp_save_dir is not None:
+            model.write(os.path.join(self.lp_save_dir, f"{tmp_name}.lp"))
         model.optimize()
-        os.remove(f"{tmp_name}.lp")
+        if model.Status in (gp.GRB.UNBOUNDED, gp.GRB.INF_OR_UNBD):
+            # with data stored at float32 precision (e.g. the ``.txt`` files), ``c`` 
+            # is only nearly in the row space of ``w`` and Gurobi takes the rounding 
+            # noise as an unbounded ray; only that noise is removed, so really 
+            # unbounded LPs still fail below
+            c_proj = _row_space_part(w, c)
+            if c_proj is not None:
+                model.setObjective(c_proj @ x, gp.GRB.MINIMIZE)
+                model.optimize()
         
-        return np.array(x.x)
+        # return
+        if model.SolCount == 0:
+            raise ValueError(
+                f"Gurobi found no solution of the LP (status code {model.Status})."
+            )
+        return np.array(x.X)
         
     def solve(
         self,
-        w: Union[list, np.ndarray] = None,
+        w: Union[list, np.ndarray, sp.spmatrix] = None,
         c: Union[list, np.ndarray] = None,
         b: Union[list, np.ndarray] = None,
         num_threads: int = 1,
@@ -52,32 +96,28 @@ class LPGurobiSolver(LPSolver):
     ) -> np.ndarray:
         # preparation
         self.from_data(w=w, c=c, b=b)
+        if self.lp_save_dir is not None:
+            os.makedirs(self.lp_save_dir, exist_ok=True)
         timer = Timer(apply=show_time)
         timer.start()
 
         # solve
         sols = list()
-        w_shape = self.w.shape
-        c_shape = self.c.shape
-        b_shape = self.b.shape
-        num_instance = w_shape[0]
+        num_instance = len(self.w)
         if num_threads == 1:
             for idx in iterative_execution(range, num_instance, self.solve_msg, show_time):
                 sols.append(self._solve(self.w[idx], self.c[idx], self.b[idx]))
         else:
-            batch_w = self.w.reshape(-1, num_threads, w_shape[-2], w_shape[-1])
-            batch_b = self.b.reshape(-1, num_threads, b_shape[-1])
-            batch_c = self.c.reshape(-1, num_threads, c_shape[-1])
             for idx in iterative_execution(
-                range, num_instance // num_threads, self.solve_msg, show_time
+                range, (num_instance - 1) // num_threads + 1, self.solve_msg, show_time
             ):
+                begin_idx = idx * num_threads
+                end_idx = min(begin_idx + num_threads, num_instance)
                 with Pool(num_threads) as p1:
                     cur_sols = p1.starmap(
                         self._solve,
-                        [  (batch_w[idx][inner_idx], 
-                            batch_c[idx][inner_idx], 
-                            batch_b[idx][inner_idx]) 
-                            for inner_idx in range(num_threads)
+                        [   (self.w[inner_idx], self.c[inner_idx], self.b[inner_idx]) 
+                            for inner_idx in range(begin_idx, end_idx)
                         ],
                     )
                 for sol in cur_sols:
@@ -0,0 +1,64 @@
+import numpy as np
+import scipy.sparse as sp
+from typing import Union
+from scipy.optimize import linprog
+from ml4co_kit.solver.lp.base import LPSolver
+from ml4co_kit.utils.type_utils import SOLVER_TYPE
+from ml4co_kit.utils.time_utils import Timer
+from ml4co_kit.utils.highs_utils import highs_batch_map
+
+
+def _solve_lp(
+    w: Union[np.ndarray, sp.csr_matrix], c: np.ndarray, b: np.ndarray, time_limit: float
+) -> np.ndarray:
+    # min cx, st wx = b with free variables (with the default tolerances of Gurobi,
+    # since files stored at float32 precision leave ``c`` only nearly in the row space of ``w``)
+    result = linprog(
+        c=c, A_eq=w, b_eq=b, bounds=(None, None), method="highs",
+        options={
+            "disp": False, "time_limit": time_limit,
+            "primal_feasibility_tolerance": 1e-6, "dual_feasibility_tolerance": 1e-6
+        }
+    )
+    if result.x is None:
+        raise ValueError(f"HiGHS did not find a feasible solution: {result.message}")
+    return result.x
+
+
+class LPHiGHSSolver(LPSolver):
+    def __init__(self, time_limit: float = 60.0):
+        super(LPHiGHSSolver, self).__init__(
+            solver_type=SOLVER_TYPE.HIGHS, time_limit=time_limit
+        )
+        
+    def solve(
+        self,
+        w: Union[list, np.ndarray, sp.spmatrix] = None,
+        c: Union[list, np.ndarray] = None,
+        b: Union[list, np.ndarray] = None,
+        num_threads: int = 1,
+        show_time: bool = False
+    ) -> np.ndarray:
+        # preparation
+        self.from_data(w=w, c=c, b=b)
+        timer = Timer(apply=show_time)
+        timer.start()
+
+        # solve
+        args_list = [
+            (self.w[idx], self.c[idx], self.b[idx], self.time_limit) 
+            for idx in range(len(self.w))
+        ]
+        sols = highs_batch_map(_solve_lp, args_list, num_threads, self.solve_msg, show_time)
+
+        # format
+        self.from_data(x=sols, ref=False)
+        
+        # show time
+        timer.end()
+        timer.show_time()
+
+        return self.x  
+    
+    def __str__(self) -> str:
+        return "LPHiGHSSolver"
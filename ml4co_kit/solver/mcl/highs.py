@@ -0,0 +1,69 @@
+import numpy as np
+from typing import List, Union
+from ml4co_kit.solver.mcl.base import MClSolver
+from ml4co_kit.utils.graph.mcl import MClGraphData
+from ml4co_kit.utils.graph.batch import GraphBatch
+from ml4co_kit.utils.type_utils import SOLVER_TYPE
+from ml4co_kit.utils.time_utils import Timer
+from ml4co_kit.utils.graph.clique import mcl_model
+from ml4co_kit.utils.highs_utils import highs_batch_map, highs_solve_milp
+
+
+def _solve_mcl(
+    u: np.ndarray, v: np.ndarray, nodes_num: int, time_limit: float
+) -> np.ndarray:
+    # the model only covers the cliques larger than the greedy one
+    greedy, A, b, var_ub = mcl_model(u, v, nodes_num)
+    if A is None:
+        return greedy
+    vars_num = A.shape[1]
+    c = np.zeros(vars_num)
+    c[:nodes_num] = -1
+    x = highs_solve_milp(
+        c=c, A=A, lb=np.full(len(b), -np.inf), ub=b, integrality=np.ones(vars_num),
+        var_lb=np.zeros(vars_num), var_ub=var_ub, time_limit=time_limit
+    )
+    if x is None:
+        return greedy
+    x = np.round(x[:nodes_num]).astype(np.int64)
+    return x if x.sum() > greedy.sum() else greedy
+
+
+class MClHiGHSSolver(MClSolver):
+    def __init__(self, weighted: bool = False, time_limit: float = 60.0):
+        super(MClHiGHSSolver, self).__init__(
+            solver_type=SOLVER_TYPE.HIGHS, weighted=weighted, time_limit=time_limit
+        )
+        
+    def solve(
+        self,
+        graph_data: Union[List[MClGraphData], GraphBatch] = None,
+        num_threads: int = 1,
+        show_time: bool = False
+    ) -> Union[List[MClGraphData], GraphBatch]:
+        # preparation
+        if graph_data is not None:
+            self._set_graph_data(graph_data)
+        timer = Timer(apply=show_time)
+        timer.start()
+        
+        # solve (only the arrays of the graphs are sent to the workers)
+        args_list = list()
+        for graph in self.graph_data:
+            u, v, _ = graph.undirected_edges()
+            args_list.append((u, v, graph._infer_nodes_num(), self.time_limit))
+        solutions = highs_batch_map(
+            _solve_mcl, args_list, num_threads, self.solve_msg, show_time
+        )
+            
+        # restore solutions
+        self.from_graph_data(nodes_label=solutions, ref=False, cover=False)
+        
+        # show time
+        timer.end()
+        timer.show_time()
+        
+        return self._get_graph_data(graph_data)
+    
+    def __str__(self) -> str:
+        return "MClHiGHSSolver"
@@ -21,13 +21,34 @@ import pickle
 import numpy as np
 import networkx as nx
 from typing import List
-from ml4co_kit.solver.base import SolverBase
+from ml4co_kit.solver.base import GraphSolverBase
 from ml4co_kit.utils.graph.mcut import MCutGraphData
+from ml4co_kit.utils.graph.base import (
+    read_gpickle_edges, read_graph_npz, read_graph_txt, read_result
+)
 from ml4co_kit.utils.type_utils import TASK_TYPE, SOLVER_TYPE
+from ml4co_kit.utils.file_utils import parallel_load
 from ml4co_kit.utils.time_utils import iterative_execution, iterative_execution_for_file
 
 
-class MCutSolver(SolverBase):
+def _read_gpickle_and_result(gpickle_file_path: str, result_file_path: str):
+    # module-level (picklable) reader used by the process pool of the folder loader
+    nodes_num, edges = read_gpickle_edges(gpickle_file_path)
+    return nodes_num, edges, read_result(result_file_path)
+
+
+def _read_npz_and_result(npz_file_path: str, result_file_path: str = None):
+    # module-level (picklable) reader used by the process pool of the npz folder loader
+    nodes_num, edges, _, nodes_label = read_graph_npz(npz_file_path)
+    if result_file_path is not None:
+        nodes_label = read_result(result_file_path)
+    return nodes_num, edges, nodes_label
+
+
+class MCutSolver(GraphSolverBase):
+    graph_cls = MCutGraphData
+    objective_name = "cut_edge_num"
+
     def __init__(
         self, 
         solver_type: SOLVER_TYPE = None, 
@@ -40,6 +61,7 @@ class MCutSolver(SolverBase):
         self.weighted = weighted
         self.time_limit = time_limit
         self.graph_data: List[MCutGraphData] = list()
+        self.load_times: List[float] = None
 
     def _check_edge_index_not_none(self):
         message = (
@@ -116,8 +138,14 @@ class MCutSolver(SolverBase):
         self_loop: bool = True,
         ref: bool = False,
         cover: bool = True,
-        show_time: bool = False
+        show_time: bool = False,
+        num_threads: int = 1
     ):
+        r"""
+        Reads the graphs (``.gpickle``) and / or the solutions (``.result``) of a folder,
+        in the sorted order of the file names. The files are parsed by ``num_threads``
+        processes.
+        """
         # weighted
         if weighted == True:
             raise NotImplementedError(
@@ -134,22 +162,24 @@ class MCutSolver(SolverBase):
               
         # only data
         if gpickle_flag and not result_flag:
-            files = os.listdir(gpickle_folder_path)
-            files.sort()
+            files = sorted(os.listdir(gpickle_folder_path))
             load_msg = f"Loading data from {gpickle_folder_path}"
-            for idx, file_name in iterative_execution_for_file(
-                enumerate(files), load_msg, show_time
-            ):
-                # file path and check format
-                gpickle_file_path = os.path.join(gpickle_folder_path, file_name)
-                if not gpickle_file_path.endswith(".gpickle"):
-                    continue
-                
+            idx_list = [
+                idx for idx, file_name in enumerate(files) 
+                if file_name.endswith(".gpickle")
+            ]
+            args_list = [
+                (os.path.join(gpickle_folder_path, files[idx]),) for idx in idx_list
+            ]
+            results, self.load_times = parallel_load(
+                read_gpickle_edges, args_list, num_threads, desc=load_msg, show_time=show_time
+            )
+            for idx, (nodes_num, edges) in zip(idx_list, results):
                 # cover or not
                 graph = self.graph_data[idx] if not cover else MCutGraphData()
 
                 # read graph data
-                graph.from_gpickle(file_path=gpickle_file_path, self_loop=self_loop)
+                graph.from_edge_list(nodes_num=nodes_num, edges=edges, self_loop=self_loop)
                 
                 # cover or not
                 if cover:
@@ -159,22 +189,24 @@ class MCutSolver(SolverBase):
                 
         # only solution
         if not gpickle_flag and result_flag:
-            files = os.listdir(result_folder_path)
-            files.sort()
+            files = sorted(os.listdir(result_folder_path))
             load_msg = f"Loading solutions from {result_folder_path}"
-            for idx, file_name in iterative_execution_for_file(
-                enumerate(files), load_msg, show_time
-            ):
-                # file path and check format
-                result_file_path = os.path.join(result_folder_path, file_name)
-                if not result_file_path.endswith(".result"):
-                    continue
-                
+            idx_list = [
+                idx for idx, file_name in enumerate(files) 
+                if file_name.endswith(".result")
+            ]
+            args_list = [
+                (os.path.join(result_folder_path, files[idx]),) for idx in idx_list
+            ]
+            results, self.load_times = parallel_load(
+                read_result, args_list, num_threads, desc=load_msg, show_time=show_time
+            )
+            for idx, nodes_label in zip(idx_list, results):
                 # cover or not
                 graph = self.graph_data[idx] if not cover else MCutGraphData()
 
                 # read graph data
-                graph.from_result(file_path=result_file_path, ref=ref)
+                graph.from_data(nodes_label=nodes_label, ref=ref)
 
                 # cover or not
                 if cover:
@@ -184,30 +216,33 @@ class MCutSolver(SolverBase):
             
         # both data and solutions [must have the same filename]
         if gpickle_flag and result_flag:
-            files = os.listdir(gpickle_folder_path)
-            files.sort()
+            files = sorted(os.listdir(gpickle_folder_path))
             load_msg = f"Loading data from {gpickle_folder_path}"
-            for idx, file_name in iterative_execution_for_file(
-                enumerate(files), load_msg, show_time
-            ):
-                # file path and check format
-                file_name: str
-                gpickle_file_path = os.path.join(gpickle_folder_path, file_name)
-                if not gpickle_file_path.endswith(".gpickle"):
-                    continue
-                result_file_path = os.path.join(
-                    result_folder_path, 
-                    file_name.replace(
-                        ".gpickle", f"_{'weighted' if weighted else 'unweighted'}.result"
+            idx_list = [
+                idx for idx, file_name in enumerate(files) 
+                if file_name.endswith(".gpickle")
+            ]
+            result_suffix = f"_{'weighted' if weighted else 'unweighted'}.result"
+            args_list = [
+                (
+                    os.path.join(gpickle_folder_path, files[idx]),
+                    os.path.join(
+                        result_folder_path, files[idx].replace(".gpickle", result_suffix)
                     )
                 )
-                
+                for idx in idx_list
+            ]
+            results, self.load_times = parallel_load(
+                _read_gpickle_and_result, args_list, num_threads, 
+                desc=load_msg, show_time=show_time
+            )
+            for idx, (nodes_num, edges, nodes_label) in zip(idx_list, results):
                 # cover or not
                 graph = self.graph_data[idx] if not cover else MCutGraphData()
 
                 # read graph data
-                graph.from_gpickle(file_path=gpickle_file_path, self_loop=self_loop)
-                graph.from_result(file_path=result_file_path, ref=ref)
+                graph.from_edge_list(nodes_num=nodes_num, edges=edges, self_loop=self_loop)
+                graph.from_data(nodes_label=nodes_label, ref=ref)
                 
                 # cover or not
                 if cover:
@@ -215,6 +250,68 @@ class MCutSolver(SolverBase):
                 else:
                     self.graph_data[idx] = graph
             
+    def from_npz_folder(
+        self, 
+        npz_folder_path: str,
+        result_folder_path: str = None,
+        weighted: bool = False,
+        self_loop: bool = True,
+        ref: bool = False,
+        cover: bool = True,
+        show_time: bool = False,
+        num_threads: int = 1
+    ):
+        r"""
+        Reads the graphs of the ``.npz`` files (see ``write_graph_npz``) of a folder, in 
+        the sorted order of the file names, with the labels stored in the files or, if
+        ``result_folder_path`` is given, with the solutions (``.result``) of the same
+        name. The files are parsed by ``num_threads`` processes.
+        """
+        # weighted
+        if weighted == True:
+            raise NotImplementedError(
+                "The current version does not currently support weighted graphs"
+            )
+        
+        # cover or not
+        if cover:
+            self.graph_data = list()
+        
+        # read data (and solutions) [must have the same filename]
+        files = sorted(os.listdir(npz_folder_path))
+        load_msg = f"Loading data from {npz_folder_path}"
+        idx_list = [
+            idx for idx, file_name in enumerate(files) if file_name.endswith(".npz")
+        ]
+        result_suffix = f"_{'weighted' if weighted else 'unweighted'}.result"
+        args_list = [
+            (
+                os.path.join(npz_folder_path, files[idx]),
+                None if result_folder_path is None else os.path.join(
+                    result_folder_path, files[idx].replace(".npz", result_suffix)
+                )
+            )
+            for idx in idx_list
+        ]
+        results, self.load_times = parallel_load(
+            _read_npz_and_result, args_list, num_threads, 
+            desc=load_msg, show_time=show_time
+        )
+        for idx, (nodes_num, edges, nodes_label) in zip(idx_list, results):
+            # cover or not
+            graph = self.graph_data[idx] if not cover else MCutGraphData()
+
+            # read graph data
+            graph.from_edge_list(nodes_num=nodes_num, edges=edges, self_loop=self_loop)
+            if nodes_label is not None:
+                graph.from_data(nodes_label=nodes_label, ref=ref)
+            
+            # cover or not
+            if cover:
+                self.graph_data.append(graph)
+            else:
+                self.graph_data[idx] = graph
+            
     def from_txt(
         self,
         file_path: str, 
@@ -222,50 +319,12 @@ class MCutSolver(SolverBase):
         cover: bool = True, 
         show_time: bool = False
     ):
-        # check the file format
-        if not file_path.endswith(".txt"):
-            raise ValueError("Invalid file format. Expected a ``.txt`` file.")
-
-        # cover or not
-        if cover:
-            self.graph_data = list()
-              
-        # read the data form .txt
-        with open(file_path, "r") as file:
-            idx = 0
-            
-            # read by lines
-            for line in iterative_execution_for_file(file, "Loading", show_time):
-                # read data from one line
-                line = line.strip()
-                split_line = line.split(" label ")
-                edge_index = split_line[0]
-                nodes_label = split_line[1]
-                edge_index = edge_index.split(" ")
-                edge_index = np.array(
-                    [
-                        [int(edge_index[i]), int(edge_index[i + 1])]
-                        for i in range(0, len(edge_index), 2)
-                    ]
-                ).T
-                nodes_label = nodes_label.split(" ")
-                nodes_label = np.array([int(nodel_label) for nodel_label in nodes_label])
+        # read the edges and labels of all the graphs
+        edge_index, nodes_label = read_graph_txt(file_path=file_path, show_time=show_time)
+        self.from_graph_data(
+            edge_index=edge_index, nodes_label=nodes_label, ref=ref, cover=cover
+        )
 
-                # cover or not
-                graph = self.graph_data[idx] if not cover else MCutGraphData()
-                
-                # load data
-                graph.from_data(edge_index=edge_index, nodes_label=nodes_label, ref=ref)
-                
-                # cover or not
-                if cover:
-                    self.graph_data.append(graph)
-                else:
-                    self.graph_data[idx] = graph
-                
-                # update index
-                idx += 1
-                        
     def from_graph_data(
         self, 
         edge_index: List[np.ndarray] = None, 
@@ -362,6 +421,18 @@ class MCutSolver(SolverBase):
             graph.from_nx_graph(nx_graphs[idx])
             self.graph_data.append(graph)
 
+    def from_edge_list(self, nodes_num: List[int], edges: List[np.ndarray]):
+        r"""
+        Loads graphs from their numbers of nodes and undirected edges with shape (E, 2).
+        """
+        if not len(nodes_num) == len(edges):
+            raise ValueError("The number of ``nodes_num`` and ``edges`` does not match!")
+        self.graph_data = list()
+        for idx in range(len(edges)):
+            graph = MCutGraphData()
+            graph.from_edge_list(nodes_num=nodes_num[idx], edges=edges[idx])
+            self.graph_data.append(graph)
+
     def to_gpickle_result_folder(
         self,
         gpickle_save_dir: str = None,
@@ -448,46 +519,50 @@ class MCutSolver(SolverBase):
                         f.write(f"{node_label}\n")
                     f.close()
         
+    def to_npz_folder(
+        self,
+        npz_save_dir: str,
+        npz_filename: str,
+        compress: bool = True,
+        show_time: bool = False
+    ):
+        r"""
+        Writes each graph (and its ``nodes_label``, if any) to a ``.npz`` file with 
+        ``write_graph_npz``, which is much smaller and faster to read than a ``.gpickle``.
+        """
+        # check
+        self._check_edge_index_not_none()
+        
+        # preparation
+        if npz_filename.endswith(".npz"):
+            npz_filename = npz_filename.replace(".npz", "")
+        samples = len(self.graph_data)
+        
+        # makedirs
+        if not os.path.exists(npz_save_dir):
+            os.makedirs(npz_save_dir)
+
+        write_msg = f"Writing npz files to {npz_save_dir}"
+        for idx in iterative_execution(range, samples, write_msg, show_time):
+            # file name & save path
+            if samples == 1:
+                name = npz_filename + f".npz"
+            else:
+                name = npz_filename + f"-{idx}.npz"
+            save_path = os.path.join(npz_save_dir, name)
+            
+            # write
+            graph: MCutGraphData = self.graph_data[idx]
+            graph.to_npz(file_path=save_path, compress=compress)
+            
     def to_txt(self, file_path: str = "example.txt"):
         # check
         self._check_edge_index_not_none()
         self._check_nodes_label_not_none(ref=False)
         
         # write
-        with open(file_path, "w") as f:
-            for graph in self.graph_data:
-                edge_index = graph.edge_index.T
-                nodes_label = graph.nodes_label.astype(np.int32)
-                f.write(" ".join(str(src) + str(" ") + str(tgt) for src, tgt in edge_index))
-                f.write(str(" ") + str("label") + str(" "))
-                f.write(str(" ").join(str(node_label) for node_label in nodes_label))
-                f.write("\n")
-            f.close()
+        self.to_graph_batch().to_txt(file_path=file_path)
     
-    def evaluate(self, calculate_gap: bool = False):
-        if calculate_gap:
-            snn_list = list()
-            rsnn_list = list()
-            gap_list = list()
-            for graph in self.graph_data:
-                snn, rsnn, gap = graph.evaluate(calculate_gap=True)
-                snn_list.append(snn)
-                rsnn_list.append(rsnn)
-                gap_list.append(gap)
-            snn_avg = np.average(np.array(snn_list))    
-            rsnn_avg = np.average(np.array(rsnn_list))
-            gap = np.array(gap_list) 
-            gap_avg = np.average(gap)
-            gap_std = np.std(gap)   
-            return snn_avg, rsnn_avg, gap_avg, gap_std
-        else:
-            snn_list = list()
-            for graph in self.graph_data:
-                snn = graph.evaluate(calculate_gap=False)
-                snn_list.append(snn)
-            snn_avg = np.average(np.array(snn_list))   
-            return snn_avg
-
     def solve(self):
         raise NotImplementedError(
             "The method ``solve`` is required to implemented in subclasses."
@@ -2,30 +2,54 @@ import os
 import uuid
 import numpy as np
 import gurobipy as gp
-from typing import List
+import scipy.sparse as sp
+from typing import List, Union
 from multiprocessing import Pool
 from ml4co_kit.solver.mcut.base import MCutSolver
 from ml4co_kit.utils.graph.mcut import MCutGraphData
+from ml4co_kit.utils.graph.batch import GraphBatch
 from ml4co_kit.utils.type_utils import SOLVER_TYPE
 from ml4co_kit.utils.time_utils import iterative_execution, Timer
 
 
 class MCutGurobiSolver(MCutSolver):
-    def __init__(self, weighted: bool = False, time_limit: float = 60.0):
+    r"""
+    Solve MCuts using Gurobi.
+
+    :param weighted: boolean, whether the graphs are weighted.
+    :param time_limit: float, the time limit (seconds) of each instance.
+    :param lp_save_dir: string, if given, every model is also written to this
+        directory as an ``.lp`` file (for debugging).
+    """
+    def __init__(
+        self, weighted: bool = False, time_limit: float = 60.0, lp_save_dir: str = None
+    ):
         super(MCutGurobiSolver, self).__init__(
             solver_type=SOLVER_TYPE.GUROBI, weighted=weighted, time_limit=time_limit
         )
+        self.lp_save_dir = lp_save_dir
         self.tmp_name = None
+        self.mip_start = None
         
     def solve(
         self,
-        graph_data: List[MCutGraphData] = None,
+        graph_data: Union[List[MCutGraphData], GraphBatch] = None,
         num_threads: int = 1,
-        show_time: bool = False
-    ) -> List[MCutGraphData]:
+        show_time: bool = False,
+        mip_start: List[np.ndarray] = None
+    ) -> Union[List[MCutGraphData], GraphBatch]:
+        r"""
+        :param mip_start: list of np.ndarray, the (heuristic) nodes label of each
+            graph, used as the initial incumbent of Gurobi.
+        """
         # preparation
         if graph_data is not None:
-            self.graph_data = graph_data
+            self._set_graph_data(graph_data)
+        if mip_start is not None and len(mip_start) != len(self.graph_data):
+            raise ValueError("``mip_start`` must have one nodes label per graph.")
+        self.mip_start = mip_start
+        if self.lp_save_dir is not None:
+            os.makedirs(self.lp_save_dir, exist_ok=True)
         timer = Timer(apply=show_time)
         timer.start()
         self.tmp_name = uuid.uuid4().hex[:9]
@@ -38,16 +62,12 @@ class MCutGurobiSolver(MCutSolver):
                 solutions.append(self._solve(idx=idx))
         else:
             for idx in iterative_execution(
-                range, graph_num // num_threads, self.solve_msg, show_time
+                range, (graph_num - 1) // num_threads + 1, self.solve_msg, show_time
             ):
+                begin_idx = idx * num_threads
+                end_idx = min(begin_idx + num_threads, graph_num)
                 with Pool(num_threads) as p1:
-                    cur_sols = p1.map(
-                        self._solve,
-                        [
-                            idx * num_threads + inner_idx
-                            for inner_idx in range(num_threads)
-                        ],
-                    )
+                    cur_sols = p1.map(self._solve, range(begin_idx, end_idx))
                 for sol in cur_sols:
                     solutions.append(sol)
             
@@ -58,44 +78,43 @@ class MCutGurobiSolver(MCutSolver):
         timer.end()
         timer.show_time()
         
-        return self.graph_data
+        return self._get_graph_data(graph_data)
     
     def _solve(self, idx: int) -> np.ndarray:
         # graph
         mcut_graph: MCutGraphData = self.graph_data[idx]
         
         # number of graph's nodes
-        nodes_num = mcut_graph.nodes_num
+        nodes_num = mcut_graph._infer_nodes_num()
         
-        # edge_attr 
-        mcut_graph.check_edge_attr()
-            
         # create gurobi model
         model = gp.Model(f"MCut-{self.tmp_name}-{idx}")
         model.setParam("OutputFlag", 0)
         model.setParam("TimeLimit", self.time_limit)
         model.setParam("Threads", 1)
         
-        # edges
-        senders = mcut_graph.edge_index[0]
-        receivers = mcut_graph.edge_index[1]
-        edge_attr = mcut_graph.edge_attr
+        # undirected edges (the weights of both directions are summed)
+        u, v, weights = mcut_graph.undirected_edges()
 
-        # Object
-        var_dict = model.addVars(nodes_num, vtype=gp.GRB.BINARY)
-        object = gp.quicksum( 
-            (2 * var_dict[int(s)] - 1) * weight * (2 * var_dict[int(r)] - 1) / 2 
-            for s, r, weight in zip(senders, receivers, edge_attr)
-        )
-        model.setObjective(object, gp.GRB.MINIMIZE)
+        # Object: sum of (2x_u - 1) * w * (2x_v - 1) / 2 over the edges, expanded as
+        # x^T Q x + c^T x + const with Q_uv = 2w and c_u = c_v = -w per edge
+        x = model.addMVar(nodes_num, vtype=gp.GRB.BINARY)
+        if self.mip_start is not None:
+            x.Start = self.mip_start[idx]
+        Q = sp.csr_matrix((2 * weights, (u, v)), shape=(nodes_num, nodes_num))
+        c = -np.bincount(u, weights=weights, minlength=nodes_num)
+        c -= np.bincount(v, weights=weights, minlength=nodes_num)
+        model.setObjective(x @ Q @ x + c @ x + weights.sum() / 2, gp.GRB.MINIMIZE)
         
         # Solve
-        model.write(f"MCut-{self.tmp_name}-{idx}.lp")
+        if self.lp_save_dir is not None:
+            model.write(os.path.join(self.lp_save_dir, f"MCut-{self.tmp_name}-{idx}.lp"))
         model.optimize()
-        os.remove(f"MCut-{self.tmp_name}-{idx}.lp")
         
-        # return
-        return np.array([int(var_dict[key].X) for key in var_dict])
+        # return (all the nodes on one side if no solution is found within the time limit)
+        if model.SolCount == 0:
+            return np.zeros(nodes_num, dtype=np.int64)
+        return np.round(x.X).astype(np.int64)
     
     def __str__(self) -> str:
         return "MCutGurobiSolver"
@@ -0,0 +1,105 @@
+import numpy as np
+import scipy.sparse as sp
+from typing import List, Union
+from ml4co_kit.solver.mcut.base import MCutSolver
+from ml4co_kit.utils.graph.mcut import MCutGraphData
+from ml4co_kit.utils.graph.batch import GraphBatch
+from ml4co_kit.utils.type_utils import SOLVER_TYPE
+from ml4co_kit.utils.time_utils import Timer
+from ml4co_kit.utils.graph import edge_incidence_matrix
+from ml4co_kit.utils.highs_utils import highs_batch_map, highs_solve_milp
+
+
+def _one_flip_search(
+    u: np.ndarray, v: np.ndarray, weights: np.ndarray, nodes_num: int, x: np.ndarray
+) -> np.ndarray:
+    # moves the node with the largest cut gain to the other side until no move helps
+    x = x.copy()
+    while True:
+        sign = np.where(x[u] == x[v], 1.0, -1.0) * weights
+        gain = np.bincount(u, sign, nodes_num) + np.bincount(v, sign, nodes_num)
+        best = np.argmax(gain)
+        if gain[best] <= 1e-9:
+            return x
+        x[best] = 1 - x[best]
+
+
+def _solve_mcut(
+    u: np.ndarray, v: np.ndarray, weights: np.ndarray, nodes_num: int, time_limit: float
+) -> np.ndarray:
+    # variables: the side x of each node and the cut indicator y of each edge,
+    # max sum(w * y), st y_e <= x_u + x_v, y_e <= 2 - x_u - x_v (and for the
+    # negative weights y_e >= x_u - x_v, y_e >= x_v - x_u), so that y_e = x_u xor x_v
+    edges_num = len(u)
+    inc = edge_incidence_matrix(u, v, nodes_num)
+    eye = sp.identity(edges_num, format="csr")
+    diff = sp.csr_matrix(
+        (np.concatenate([np.ones(edges_num), -np.ones(edges_num)]), 
+         (np.tile(np.arange(edges_num), 2), np.concatenate([u, v]))),
+        shape=(edges_num, nodes_num)
+    )
+    neg = np.flatnonzero(weights < 0)
+    A = sp.vstack([
+        sp.hstack([-inc, eye]),
+        sp.hstack([inc, eye]),
+        sp.hstack([-diff[neg], eye[neg]]),
+        sp.hstack([diff[neg], eye[neg]]),
+    ], format="csr")
+    lb = np.concatenate([np.full(2 * edges_num, -np.inf), np.zeros(2 * len(neg))])
+    ub = np.concatenate([np.zeros(edges_num), np.full(edges_num, 2.0), np.full(2 * len(neg), np.inf)])
+    vars_num = nodes_num + edges_num
+    var_ub = np.ones(vars_num)
+    if nodes_num > 0:
+        # flipping all the sides gives the same cut, so fix the side of node 0
+        var_ub[0] = 0
+    x = highs_solve_milp(
+        c=np.concatenate([np.zeros(nodes_num), -weights]), A=A, lb=lb, ub=ub,
+        integrality=np.concatenate([np.ones(nodes_num), np.zeros(edges_num)]),
+        var_lb=np.zeros(vars_num), var_ub=var_ub, time_limit=time_limit
+    )
+    if x is None:
+        # no incumbent within the time limit, so start from all the nodes on one side
+        x = np.zeros(nodes_num, dtype=np.int64)
+    else:
+        x = np.round(x[:nodes_num]).astype(np.int64)
+    return _one_flip_search(u, v, weights, nodes_num, x)
+
+
+class MCutHiGHSSolver(MCutSolver):
+    def __init__(self, weighted: bool = False, time_limit: float = 60.0):
+        super(MCutHiGHSSolver, self).__init__(
+            solver_type=SOLVER_TYPE.HIGHS, weighted=weighted, time_limit=time_limit
+        )
+        
+    def solve(
+        self,
+        graph_data: Union[List[MCutGraphData], GraphBatch] = None,
+        num_threads: int = 1,
+        show_time: bool = False
+    ) -> Union[List[MCutGraphData], GraphBatch]:
+        # preparation
+        if graph_data is not None:
+            self._set_graph_data(graph_data)
+        timer = Timer(apply=show_time)
+        timer.start()
+        
+        # solve (only the arrays of the graphs are sent to the workers)
+        args_list = list()
+        for graph in self.graph_data:
+            u, v, weights = graph.undirected_edges()
+            args_list.append((u, v, weights, graph._infer_nodes_num(), self.time_limit))
+        solutions = highs_batch_map(
+            _solve_mcut, args_list, num_threads, self.solve_msg, show_time
+        )
+            
+        # restore solutions
+        self.from_graph_data(nodes_label=solutions, ref=False, cover=False)
+        
+        # show time
+        timer.end()
+        timer.show_time()
+        
+        return self._get_graph_data(graph_data)
+    
+    def __str__(self) -> str:
+        return "MCutHiGHSSolver"
@@ -0,0 +1,55 @@
+import numpy as np
+from typing import List, Union
+from ml4co_kit.solver.mis.base import MISSolver
+from ml4co_kit.utils.graph.mis import MISGraphData
+from ml4co_kit.utils.graph.batch import GraphBatch
+from ml4co_kit.utils.type_utils import SOLVER_TYPE
+from ml4co_kit.utils.time_utils import Timer
+from ml4co_kit.utils.highs_utils import highs_batch_map, highs_solve_binary_edge_model
+
+
+def _solve_mis(
+    u: np.ndarray, v: np.ndarray, nodes_num: int, time_limit: float
+) -> np.ndarray:
+    # max sum(x), st x_u + x_v <= 1 for every edge (u, v)
+    return highs_solve_binary_edge_model(u, v, nodes_num, False, time_limit)
+
+
+class MISHiGHSSolver(MISSolver):
+    def __init__(self, weighted: bool = False, time_limit: float = 60.0):
+        super(MISHiGHSSolver, self).__init__(
+            solver_type=SOLVER_TYPE.HIGHS, weighted=weighted, time_limit=time_limit
+        )
+        
+    def solve(
+        self,
+        graph_data: Union[List[MISGraphData], GraphBatch] = None,
+        num_threads: int = 1,
+        show_time: bool = False
+    ) -> Union[List[MISGraphData], GraphBatch]:
+        # preparation
+        if graph_data is not None:
+            self._set_graph_data(graph_data)
+        timer = Timer(apply=show_time)
+        timer.start()
+        
+        # solve (only the arrays of the graphs are sent to the workers)
+        args_list = list()
+        for graph in self.graph_data:
+            u, v, _ = graph.undirected_edges()
+            args_list.append((u, v, graph._infer_nodes_num(), self.time_limit))
+        solutions = highs_batch_map(
+            _solve_mis, args_list, num_threads, self.solve_msg, show_time
+        )
+            
+        # restore solutions
+        self.from_graph_data(nodes_label=solutions, ref=False, cover=False)
+        
+        # show time
+        timer.end()
+        timer.show_time()
+        
+        return self._get_graph_data(graph_data)
+    
+    def __str__(self) -> str:
+        return "MISHiGHSSolver"
@@ -1,17 +1,20 @@
 import re
 import time
 import json
+import pickle
 import shutil
 import os.path
 import pathlib
 import subprocess
 import numpy as np
+import scipy.sparse
 import networkx as nx
 from tqdm import tqdm
 from pathlib import Path
 from typing import Union, List
 from ml4co_kit.solver.mis.base import MISSolver
 from ml4co_kit.utils.graph.mis import MISGraphData
+from ml4co_kit.utils.graph.base import read_graph_npz
 from ml4co_kit.utils.type_utils import SOLVER_TYPE
 
 
@@ -35,28 +38,42 @@ class KaMISSolver(MISSolver):
         self.kamis_path = pathlib.Path(__file__).parent
 
     @staticmethod
-    def __prepare_graph(g: nx.Graph, weighted=False):
-        g.remove_edges_from(nx.selfloop_edges(g))
-        n = g.number_of_nodes()
-        m = g.number_of_edges()
+    def __prepare_graph(
+        nodes_num: int, edges: np.ndarray, nodes_weight: np.ndarray = None, weighted=False
+    ):
+        # METIS format: the sorted 1-based neighbors of each node, after its weight
+        edges = edges[edges[:, 0] != edges[:, 1]]
+        adj = scipy.sparse.csr_matrix(
+            (
+                np.ones(shape=(2 * len(edges),), dtype=bool),
+                (np.concatenate([edges[:, 0], edges[:, 1]]), 
+                 np.concatenate([edges[:, 1], edges[:, 0]]))
+            ),
+            shape=(nodes_num, nodes_num)
+        )
+        adj.sum_duplicates()
         wt = 0 if not weighted else 10
-        res = f"{n} {m} {wt}\n"
-        for n, nbrsdict in g.adjacency():
-            line = []
+        res = [f"{nodes_num} {adj.nnz // 2} {wt}\n"]
+        nbrs = list(map(str, (adj.indices + 1).tolist()))
+        if weighted:
+            if nodes_weight is None:
+                nodes_weight = np.ones(shape=(nodes_num,), dtype=np.int64)
+            weights = list(map(str, np.asarray(nodes_weight).tolist()))
+        for node in range(nodes_num):
+            line = nbrs[adj.indptr[node]: adj.indptr[node + 1]]
             if weighted:
-                line.append(g.nodes(data="weight", default=1)[n])
-            for nbr, _ in sorted(nbrsdict.items()):
-                line.append(nbr + 1)
-            res += " ".join(map(str, line)) + "\n"
-        return res
+                line = [weights[node]] + line
+            res.append(" ".join(line) + "\n")
+        return "".join(res)
 
     def prepare_instances(
         self, instance_directory: pathlib.Path, cache_directory: pathlib.Path
     ):
         instance_directory = Path(instance_directory)
         cache_directory = Path(cache_directory)
-        for graph_path in instance_directory.rglob("*.gpickle"):
-            self.prepare_instance(graph_path.resolve(), cache_directory)
+        for pattern in ["*.gpickle", "*.npz"]:
+            for graph_path in instance_directory.rglob(pattern):
+                self.prepare_instance(graph_path.resolve(), cache_directory)
 
     def prepare_instance(
         self,
@@ -76,8 +93,18 @@ class KaMISSolver(MISSolver):
             if source_mtime <= last_updated:
                 return
 
-        g = nx.read_gpickle(source_instance_file)
-        graph = KaMISSolver.__prepare_graph(g, weighted=self.weighted)
+        if source_instance_file.suffix == ".npz":
+            nodes_num, edges, nodes_weight, _ = read_graph_npz(str(source_instance_file))
+        else:
+            with open(source_instance_file, "rb") as f:
+                g: nx.Graph = pickle.load(f)
+            nodes_num = g.number_of_nodes()
+            edges = np.array(g.edges, dtype=np.int64).reshape(-1, 2)
+            weight_dict = dict(g.nodes(data="weight", default=1))
+            nodes_weight = np.array([weight_dict[node] for node in range(nodes_num)])
+        graph = KaMISSolver.__prepare_graph(
+            nodes_num, edges, nodes_weight, weighted=self.weighted
+        )
         with open(dest_path, "w") as res_file:
             res_file.write(graph)
 
@@ -93,15 +120,26 @@ class KaMISSolver(MISSolver):
         )  
         src = Path(src)
         out = Path(out)
+        suffixes = set(os.path.splitext(file_name)[1] for file_name in os.listdir(src))
+        if ".npz" in suffixes and ".gpickle" in suffixes:
+            raise ValueError(
+                f"The folder ({src}) contains both ``.gpickle`` and ``.npz`` instances. "
+                "Please put the instances of each format into a separate folder."
+            )
         try:
             self._solve(src, out)
         except TypeError:
             raise TypeError(message)
         except FileNotFoundError:
             raise FileNotFoundError(message)
-        self.from_gpickle_result_folder(
-            gpickle_folder_path=src, result_folder_path=out, ref=False, cover=True
-        )
+        if ".npz" in suffixes:
+            self.from_npz_folder(
+                npz_folder_path=src, result_folder_path=out, ref=False, cover=True
+            )
+        else:
+            self.from_gpickle_result_folder(
+                gpickle_folder_path=src, result_folder_path=out, ref=False, cover=True
+            )
         return self.graph_data
 
     def _solve(self, src: Union[str, pathlib.Path], out: Union[str, pathlib.Path]):
@@ -114,9 +152,9 @@ class KaMISSolver(MISSolver):
         results = {}
         src = Path(src)
         out = Path(out)
-        files = [f for f in os.listdir(src) if f.endswith(".gpickle")]
+        files = [f for f in os.listdir(src) if f.endswith(".gpickle") or f.endswith(".npz")]
         for graph_path in tqdm(files, desc=self.solve_msg):
-            graph_path = graph_path.replace(".gpickle", "")
+            graph_path = os.path.splitext(graph_path)[0]
             if self.weighted:
                 executable = (
                     self.kamis_path / "KaMIS" / "deploy" / "weighted_branch_reduce"
@@ -2,30 +2,54 @@ import os
 import uuid
 import numpy as np
 import gurobipy as gp
-from typing import List
+from typing import List, Union
 from multiprocessing import Pool
 from ml4co_kit.solver.mvc.base import MVCSolver
 from ml4co_kit.utils.graph.mvc import MVCGraphData
+from ml4co_kit.utils.graph.batch import GraphBatch
 from ml4co_kit.utils.type_utils import SOLVER_TYPE
 from ml4co_kit.utils.time_utils import iterative_execution, Timer
+from ml4co_kit.utils.graph import edge_incidence_matrix
 
 
 class MVCGurobiSolver(MVCSolver):
-    def __init__(self, weighted: bool = False, time_limit: float = 60.0):
+    r"""
+    Solve MVCs using Gurobi.
+
+    :param weighted: boolean, whether the graphs are weighted.
+    :param time_limit: float, the time limit (seconds) of each instance.
+    :param lp_save_dir: string, if given, every model is also written to this
+        directory as an ``.lp`` file (for debugging).
+    """
+    def __init__(
+        self, weighted: bool = False, time_limit: float = 60.0, lp_save_dir: str = None
+    ):
         super(MVCGurobiSolver, self).__init__(
             solver_type=SOLVER_TYPE.GUROBI, weighted=weighted, time_limit=time_limit
         )
+        self.lp_save_dir = lp_save_dir
         self.tmp_name = None
-
+        self.mip_start = None
+        
     def solve(
         self,
-        graph_data: List[MVCGraphData] = None,
+        graph_data: Union[List[MVCGraphData], GraphBatch] = None,
         num_threads: int = 1,
-        show_time: bool = False
-    ) -> List[MVCGraphData]:
+        show_time: bool = False,
+        mip_start: List[np.ndarray] = None
+    ) -> Union[List[MVCGraphData], GraphBatch]:
+        r"""
+        :param mip_start: list of np.ndarray, the (heuristic) nodes label of each
+            graph, used as the initial incumbent of Gurobi.
+        """
         # preparation
         if graph_data is not None:
-            self.graph_data = graph_data
+            self._set_graph_data(graph_data)
+        if mip_start is not None and len(mip_start) != len(self.graph_data):
+            raise ValueError("``mip_start`` must have one nodes label per graph.")
+        self.mip_start = mip_start
+        if self.lp_save_dir is not None:
+            os.makedirs(self.lp_save_dir, exist_ok=True)
         timer = Timer(apply=show_time)
         timer.start()
         self.tmp_name = uuid.uuid4().hex[:9]
@@ -38,16 +62,12 @@ class MVCGurobiSolver(MVCSolver):
                 solutions.append(self._solve(idx=idx))
         else:
             for idx in iterative_execution(
-                range, graph_num // num_threads, self.solve_msg, show_time
+                range, (graph_num - 1) // num_threads + 1, self.solve_msg, show_time
             ):
+                begin_idx = idx * num_threads
+                end_idx = min(begin_idx + num_threads, graph_num)
                 with Pool(num_threads) as p1:
-                    cur_sols = p1.map(
-                        self._solve,
-                        [
-                            idx * num_threads + inner_idx
-                            for inner_idx in range(num_threads)
-                        ],
-                    )
+                    cur_sols = p1.map(self._solve, range(begin_idx, end_idx))
                 for sol in cur_sols:
                     solutions.append(sol)
             
@@ -58,17 +78,14 @@ class MVCGurobiSolver(MVCSolver):
         timer.end()
         timer.show_time()
         
-        return self.graph_data
+        return self._get_graph_data(graph_data)
     
     def _solve(self, idx: int) -> np.ndarray:
         # graph
         mvc_graph: MVCGraphData = self.graph_data[idx]
         
         # number of graph's nodes
-        nodes_num = mvc_graph.nodes_num
-        
-        # remove self loop
-        mvc_graph.remove_self_loop()
+        nodes_num = mvc_graph._infer_nodes_num()
         
         # create gurobi model
         model = gp.Model(f"MVC-{self.tmp_name}-{idx}")
@@ -76,30 +93,28 @@ class MVCGurobiSolver(MVCSolver):
         model.setParam("TimeLimit", self.time_limit)
         model.setParam("Threads", 1)
         
-        # edge list
-        senders = mvc_graph.edge_index[0]
-        receivers = mvc_graph.edge_index[1]
-        edge_list = [(min([s, r]), max([s, r])) for s, r in zip(senders, receivers)]
-        unique_edge_List = set(edge_list)
+        # edge-node incidence matrix (one row per undirected edge, no self-loops)
+        u, v, _ = mvc_graph.undirected_edges()
+        inc = edge_incidence_matrix(u, v, nodes_num)
         
-        # Constr.
-        var_dict = model.addVars(nodes_num, vtype=gp.GRB.BINARY)
-        for (s, r) in unique_edge_List:
-            xs = var_dict[s]
-            xr = var_dict[r]
-            model.addConstr(xs + xr >= 1, name="e%d-%d" % (s, r))
+        # Constr. x_u + x_v >= 1
+        x = model.addMVar(nodes_num, vtype=gp.GRB.BINARY)
+        model.addMConstr(inc, x, gp.GRB.GREATER_EQUAL, np.ones(len(u)))
+        if self.mip_start is not None:
+            x.Start = self.mip_start[idx]
             
         # Object
-        object = gp.quicksum(var_dict[int(n)]  for n in range(nodes_num))
-        model.setObjective(object, gp.GRB.MINIMIZE)
+        model.setObjective(np.ones(nodes_num) @ x, gp.GRB.MINIMIZE)
         
         # Solve
-        model.write(f"MVC-{self.tmp_name}-{idx}.lp")
+        if self.lp_save_dir is not None:
+            model.write(os.path.join(self.lp_save_dir, f"MVC-{self.tmp_name}-{idx}.lp"))
         model.optimize()
-        os.remove(f"MVC-{self.tmp_name}-{idx}.lp")
         
-        # return
-        return np.array([int(var_dict[key].x) for key in var_dict])
+        # return (all the nodes if no solution is found within the time limit)
+        if model.SolCount == 0:
+            return np.ones(nodes_num, dtype=np.int64)
+        return np.round(x.X).astype(np.int64)
     
     def __str__(self) -> str:
         return "MVCGurobiSolver"
@@ -19,11 +19,12 @@ vertex of the graph exactly once and returns to the starting node.
 import os
 import sys
 import numpy as np
-from typing import Union
-from ml4co_kit.utils import tsplib95
+from typing import Union, List
+from ml4co_kit.utils.tsplib_utils import read_tsplib, render_tsp, render_tour
 from ml4co_kit.solver.base import SolverBase
 from ml4co_kit.evaluate.tsp.base import TSPEvaluator
 from ml4co_kit.utils.type_utils import to_numpy, TASK_TYPE, SOLVER_TYPE
+from ml4co_kit.utils.file_utils import parallel_load
 from ml4co_kit.utils.time_utils import iterative_execution, iterative_execution_for_file
 
 
@@ -34,6 +35,24 @@ else:
     from ml4co_kit.utils.round import ROUND_FUNCS
 
 
+def _read_tsp_points(tsp_file_path: str) -> np.ndarray:
+    # module-level (picklable) reader used by the process pool of the folder loaders
+    points = read_tsplib(tsp_file_path)["node_coords"]
+    if points is None:
+        raise RuntimeError("Error in loading {}".format(tsp_file_path))
+    return points
+
+
+def _read_tsp_tour(tour_file_path: str) -> np.ndarray:
+    tsp_tour = read_tsplib(tour_file_path)["tours"][0]
+    tour = np.append(tsp_tour, 1) - 1
+    return tour
+
+
+def _read_tsp_points_and_tour(tsp_file_path: str, tour_file_path: str):
+    return _read_tsp_points(tsp_file_path), _read_tsp_tour(tour_file_path)
+
+
 class TSPSolver(SolverBase):
     r"""
     This class provides a basic framework for solving TSP problems. It includes methods for 
@@ -63,6 +82,7 @@ class TSPSolver(SolverBase):
         self.ref_tours: np.ndarray = None
         self.nodes_num: int = None
         self.norm: str = None
+        self.load_times: List[float] = None
         
     def _check_points_dim(self):
         r"""
@@ -216,23 +236,13 @@ class TSPSolver(SolverBase):
         r"""
         Reads TSP node coordinates from a TSPLIB file.
         """
-        tsplib_data = tsplib95.load(tsp_file_path)
-        points = np.array(list(tsplib_data.node_coords.values()))
-        if points is None:
-            raise RuntimeError("Error in loading {}".format(tsp_file_path))
-        return points
+        return _read_tsp_points(tsp_file_path)
 
     def _read_tour_from_tour_file(self, tour_file_path: str) -> np.ndarray:
         r"""
         Reads a TSP tour from a TSPLIB tour file.
         """
-        tsp_tour = tsplib95.load(tour_file_path)
-        tsp_tour = tsp_tour.tours
-        tsp_tour: list
-        tsp_tour = tsp_tour[0]
-        tsp_tour.append(1)
-        tour = np.array(tsp_tour) - 1
-        return tour
+        return _read_tsp_tour(tour_file_path)
 
     def from_tsplib(
         self, 
@@ -330,7 +340,8 @@ class TSPSolver(SolverBase):
         return_list: bool = False,
         norm: str = "EUC_2D",
         normalize: bool = False,
-        show_time: bool = False
+        show_time: bool = False,
+        num_threads: int = 1
     ):
         """
         Read data from the folder containing TSPLIB type data.
@@ -344,6 +355,9 @@ class TSPSolver(SolverBase):
         :param norm: string, the normalization type for node coordinates.
         :param normalize: boolean, whether to normalize node coordinates.
         :param show_time: boolean, whether the data is being read with a visual progress display.
+        :param num_threads: int, the number of processes that parse the files. The files
+            are read in the sorted order of their names whatever ``num_threads`` is.
+            The reading time (seconds) of each file is kept in ``load_times``.
         
         .. dropdown:: Example
 
@@ -384,50 +398,45 @@ class TSPSolver(SolverBase):
         
         # only points
         if points_flag and not tours_flag:
-            points_list = list()
-            files = os.listdir(tsp_folder_path)
-            files.sort()
+            files = sorted(os.listdir(tsp_folder_path))
+            args_list = [
+                (os.path.join(tsp_folder_path, file_name),) 
+                for file_name in files if file_name.endswith(".tsp")
+            ]
             load_msg = f"Loading data from {tsp_folder_path}"
-            for file_name in iterative_execution_for_file(files, load_msg, show_time):
-                tsp_file_path = os.path.join(tsp_folder_path, file_name)
-                if not tsp_file_path.endswith(".tsp"):
-                    continue
-                points = self._read_data_from_tsp_file(tsp_file_path)
-                points_list.append(points)
+            points_list, self.load_times = parallel_load(
+                _read_tsp_points, args_list, num_threads, desc=load_msg, show_time=show_time
+            )
 
         # only tours
         if not points_flag and tours_flag:
-            tours_list = list()
-            files = os.listdir(tour_folder_path)
-            files.sort()
+            files = sorted(os.listdir(tour_folder_path))
+            args_list = [
+                (os.path.join(tour_folder_path, file_name),) 
+                for file_name in files if file_name[-5:] == ".tour"
+            ]
             load_msg = f"Loading solutions from {tour_folder_path}"
-            for file_name in iterative_execution_for_file(files, load_msg, show_time):
-                tour_file_path = os.path.join(tour_folder_path, file_name)
-                if not tour_file_path[-5:] == ".tour":
-                    continue
-                tour = self._read_tour_from_tour_file(tour_file_path)
-                tours_list.append(tour)
+            tours_list, self.load_times = parallel_load(
+                _read_tsp_tour, args_list, num_threads, desc=load_msg, show_time=show_time
+            )
         
         # both points and tours [must have the same filename]
         if points_flag and tours_flag:
-            points_list = list()
-            tours_list = list()
-            files = os.listdir(tsp_folder_path)
-            files.sort()
-            load_msg = f"Loading data from {tsp_folder_path} and solutions from {tour_folder_path}"
-            for file_name in iterative_execution_for_file(files, load_msg, show_time):
-                # points
-                tsp_file_path = os.path.join(tsp_folder_path, file_name)
-                if not tsp_file_path.endswith(".tsp"):
-                    continue
-                points = self._read_data_from_tsp_file(tsp_file_path)
-                points_list.append(points)
-                # tour
-                tour_file_path = os.path.join(
-                    tour_folder_path, file_name.replace(".tsp", ".opt.tour")
+            files = sorted(os.listdir(tsp_folder_path))
+            args_list = [
+                (
+                    os.path.join(tsp_folder_path, file_name),
+                    os.path.join(tour_folder_path, file_name.replace(".tsp", ".opt.tour"))
                 )
-                tour = self._read_tour_from_tour_file(tour_file_path)
-                tours_list.append(tour)
+                for file_name in files if file_name.endswith(".tsp")
+            ]
+            load_msg = f"Loading data from {tsp_folder_path} and solutions from {tour_folder_path}"
+            results, self.load_times = parallel_load(
+                _read_tsp_points_and_tour, args_list, num_threads, 
+                desc=load_msg, show_time=show_time
+            )
+            points_list = [points for points, _ in results]
+            tours_list = [tour for _, tour in results]
                 
         # return list
         if return_list:
@@ -684,16 +693,7 @@ class TSPSolver(SolverBase):
                 
                 # write
                 with open(save_path, "w") as f:
-                    f.write(f"NAME : {name}\n")
-                    f.write(f"COMMENT : Generated by ML4CO-Kit\n")
-                    f.write("TYPE : TSP\n")
-                    f.write(f"DIMENSION : {self.nodes_num}\n")
-                    f.write(f"EDGE_WEIGHT_TYPE : {self.norm}\n")
-                    f.write("NODE_COORD_SECTION\n")
-                    for i in range(self.nodes_num):
-                        x, y = points[idx][i]
-                        f.write(f"{i+1} {x} {y}\n")
-                    f.write("EOF\n")
+                    f.write(render_tsp(points[idx], name, self.norm))
 
         # .opt.tour files
         if tour_save_dir is not None:
@@ -719,14 +719,7 @@ class TSPSolver(SolverBase):
                     name = tour_filename + f"-{idx}.opt.tour"
                 save_path = os.path.join(tour_save_dir, name)
                 with open(save_path, "w") as f:
-                    f.write(f"NAME: {name} Solved by ML4CO-Kit\n")
-                    f.write(f"TYPE: TOUR\n")
-                    f.write(f"DIMENSION: {self.nodes_num}\n")
-                    f.write(f"TOUR_SECTION\n")
-                    for i in range(self.nodes_num):
-                        f.write(f"{tours[idx][i]}\n")
-                    f.write(f"-1\n")
-                    f.write(f"EOF\n")
+                    f.write(render_tour(tours[idx][:self.nodes_num], name))
 
     def to_txt(
         self,
@@ -819,6 +812,7 @@ class TSPSolver(SolverBase):
         apply_scale: bool = False,
         to_int: bool = False,
         round_func: str = "round",
+        gap_ref: str = "ref_tours",
     ):
         """
         Evaluate the solution quality of the solver
@@ -828,10 +822,14 @@ class TSPSolver(SolverBase):
         :param apply_scale: boolean, whether to perform data scaling for the corrdinates.
         :param to_int: boolean, whether to transfer the corrdinates to integters.
         :param round_func: string, the category of the rounding function, used when ``to_int`` is True.
+        :param gap_ref: string, the reference of the gap. ``ref_tours`` uses the cost of the reference
+            tours, ``lower_bound`` uses the Held-Karp lower bound so that no reference tours are needed
+            and the returned gaps are upper bounds of the true optimality gaps.
 
         .. note::
             - Please make sure the ``points`` and the ``tours`` are not None.
-            - If you set the ``calculate_gap`` as True, please make sure the ``ref_tours`` is not None.
+            - If you set the ``calculate_gap`` as True and ``gap_ref`` as ``ref_tours``, 
+              please make sure the ``ref_tours`` is not None.
         
         .. dropdown:: Example
 
@@ -855,7 +853,12 @@ class TSPSolver(SolverBase):
         # check
         self._check_points_not_none()
         self._check_tours_not_none(ref=False)
-        if calculate_gap:
+        if gap_ref not in ["ref_tours", "lower_bound"]:
+            raise ValueError(
+                f"The gap reference ({gap_ref}) is not a valid type, "
+                "only ``ref_tours`` and ``lower_bound`` are supported."
+            )
+        if calculate_gap and gap_ref == "ref_tours":
             self._check_tours_not_none(ref=True)
             
         # variables
@@ -889,7 +892,10 @@ class TSPSolver(SolverBase):
                 solved_cost = np.min(solved_costs)
                 tours_cost_list.append(solved_cost)
                 if calculate_gap:
-                    ref_cost = evaluator.evaluate(ref_tours[idx])
+                    if gap_ref == "lower_bound":
+                        ref_cost = evaluator.lower_bound(upper_bound=solved_cost)
+                    else:
+                        ref_cost = evaluator.evaluate(ref_tours[idx])
                     ref_tours_cost_list.append(ref_cost)
                     gap = (solved_cost - ref_cost) / ref_cost * 100
                     gap_list.append(gap)
@@ -901,7 +907,10 @@ class TSPSolver(SolverBase):
                 solved_cost = evaluator.evaluate(solved_tour)
                 tours_cost_list.append(solved_cost)
                 if calculate_gap:
-                    ref_cost = evaluator.evaluate(ref_tours[idx])
+                    if gap_ref == "lower_bound":
+                        ref_cost = evaluator.lower_bound(upper_bound=solved_cost)
+                    else:
+                        ref_cost = evaluator.evaluate(ref_tours[idx])
                     ref_tours_cost_list.append(ref_cost)
                     gap = (solved_cost - ref_cost) / ref_cost * 100
                     gap_list.append(gap)
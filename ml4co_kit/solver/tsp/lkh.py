@@ -20,7 +20,7 @@ import pathlib
 import numpy as np
 from typing import Union
 from multiprocessing import Pool
-from ml4co_kit.utils import tsplib95
+from ml4co_kit.utils.tsplib_utils import render_tsp
 from ml4co_kit.solver.tsp.base import TSPSolver
 from ml4co_kit.utils.type_utils import SOLVER_TYPE
 from ml4co_kit.solver.tsp.lkh_solver import lkh_solve
@@ -60,17 +60,11 @@ class TSPLKHSolver(TSPSolver):
         r"""
         Solve a single TSP instance
         """
-        problem = tsplib95.models.StandardProblem()
-        problem.name = "TSP"
-        problem.type = "TSP"
-        problem.dimension = self.nodes_num
-        problem.edge_weight_type = self.norm
-        problem.node_coords = {
-            n + 1: nodes_coord[n] * self.scale for n in range(self.nodes_num)
-        }
+        problem = render_tsp(nodes_coord * self.scale, "TSP", self.norm)
         solution = lkh_solve(
             solver=self.lkh_path,
             problem=problem,
+            dimension=len(nodes_coord),
             max_trials=self.lkh_max_trials,
             runs=self.lkh_runs,
             seed=self.lkh_seed,
@@ -145,18 +139,14 @@ class TSPLKHSolver(TSPSolver):
         :param fixed_edges: tuple, The edges that must be included in the tour.
         :param norm: string, The norm to use for distance calculation.                
         """
-        problem = tsplib95.models.StandardProblem()
-        problem.name = "TSP"
-        problem.type = "TSP"
-        problem.dimension = points.shape[0]
-        problem.edge_weight_type = norm
-        problem.node_coords = {
-            n + 1: self.scale * points[n] for n in range(points.shape[0])
-        }
-        problem.fixed_edges = [[n + 1 for n in fixed_edges]]
+        problem = render_tsp(
+            self.scale * points, "TSP", norm,
+            fixed_edges=np.array([[n + 1 for n in fixed_edges]])
+        )
         solution = lkh_solve(
             solver=self.lkh_path,
             problem=problem,
+            dimension=len(points),
             max_trials=self.lkh_max_trials,
             runs=self.lkh_runs,
         )
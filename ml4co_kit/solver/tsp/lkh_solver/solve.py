@@ -4,6 +4,7 @@ import subprocess
 import tempfile
 import warnings
 
+from ml4co_kit.utils.tsplib_utils import read_tsplib
 from .problems import LKHProblem
 
 
@@ -15,6 +16,8 @@ def lkh_solve(
     solver="LKH", 
     problem=None, 
     special: bool = True, 
+    dimension: int = None,
+    depots: list = None,
     **params
 ):
     if shutil.which(solver) is None:
@@ -34,18 +37,28 @@ def lkh_solve(
         # annoying, but necessary to get the original problem dimension
         problem = LKHProblem.load(params["problem_file"])
 
-    if not isinstance(problem, LKHProblem):
-        warnings.warn(
-            "Subclassing LKHProblem is recommended. Proceed at your own risk!"
-        )
-
-    if len(problem.depots) > 1:
-        warnings.warn("LKH-3 cannot solve multi-depot problems.")
-
     prob_file = tempfile.NamedTemporaryFile(mode="w", delete=False)
-    problem.write(prob_file)
-    prob_file.write("\n")
-    prob_file.close()
+    if isinstance(problem, str):
+        # already rendered in TSPLIB format (e.g. by ``render_tsp``), which is
+        # much faster than the field transformers of ``tsplib95``; the caller
+        # knows the dimension and the depots, so the text is not parsed again
+        if dimension is None:
+            raise ValueError("``dimension`` is required when ``problem`` is a string.")
+        prob_file.write(problem)
+        prob_file.close()
+        depots = set() if depots is None else set(depots)
+    else:
+        if not isinstance(problem, LKHProblem):
+            warnings.warn(
+                "Subclassing LKHProblem is recommended. Proceed at your own risk!"
+            )
+        problem.write(prob_file)
+        prob_file.write("\n")
+        prob_file.close()
+        depots, dimension = set(problem.depots), problem.dimension
+
+    if len(depots) > 1:
+        warnings.warn("LKH-3 cannot solve multi-depot problems.")
     params["problem_file"] = prob_file.name
 
     if "tour_file" not in params:
@@ -79,13 +92,12 @@ def lkh_solve(
     # the tour file produced by LKH-3 includes dummy nodes to indicate depots
     # for example, if a problem has DIMENSION=32 (1 depot node + 31 task nodes),
     # the tour file will have a SINGLE tour with DIMENSION=36 (5 depot nodes + 31 task nodes)
-    solution = LKHProblem.load(params["tour_file"])
-    tour = solution.tours[0]
+    tour = read_tsplib(params["tour_file"])["tours"][0].tolist()
     # convert this tour to multiple routes
     routes = []
     route = []
     for node in tour:
-        if node in problem.depots or node > problem.dimension:
+        if node in depots or node > dimension:
             if len(route) > 0:
                 routes.append(route)
             route = []
@@ -1,7 +1,28 @@
-from .file_utils import download, compress_folder, extract_archive, _get_md5
+from .file_utils import download, compress_folder, extract_archive, _get_md5, parallel_load
 from .type_utils import to_numpy
 from .time_utils import iterative_execution, iterative_execution_for_file, Timer
-from .graph import np_dense_to_sparse, np_sparse_to_dense, GraphData
+from .graph import np_dense_to_sparse, np_sparse_to_dense, GraphData, GraphBatch
+from .graph import edge_incidence_matrix
 from .graph import MISGraphData, MVCGraphData, MCutGraphData, MClGraphData
-from .distance_utils import geographical
-from .mis_utils import sat_to_mis_graph, cnf_to_gpickle, cnf_folder_to_gpickle_folder
\ No newline at end of file
+from .graph import (
+    mcut_cut_value, mis_check_independence, mvc_check_cover, mcl_check_clique,
+    batch_mcut_cut_value, batch_mis_check_independence, 
+    batch_mvc_check_cover, batch_mcl_check_clique
+)
+from .graph import (
+    mis_violations, mvc_violations, mcl_violations, mis_repair, mvc_repair, mcl_repair,
+    batch_mis_violations, batch_mvc_violations, batch_mcl_violations,
+    batch_mis_repair, batch_mvc_repair, batch_mcl_repair
+)
+from .graph import (
+    erdos_renyi_edges, barabasi_albert_edges, holme_kim_edges, watts_strogatz_edges
+)
+from .graph import complement_edges, degeneracy_order, greedy_clique
+from .graph import read_graph_npz, write_graph_npz
+from .distance_utils import geographical, np_distance, distance_matrix
+from .shortest_path import floyd_warshall
+from .knn_utils import knn_graph
+from .tsplib_utils import read_tsplib, tsplib_edge_weight_matrix
+from .tsplib_utils import render_tsp, render_atsp, render_vrp, render_tour
+from .mis_utils import sat_to_mis_graph, cnf_to_gpickle, cnf_folder_to_gpickle_folder
+from .mis_utils import cnf_to_npz, cnf_folder_to_npz_folder
\ No newline at end of file
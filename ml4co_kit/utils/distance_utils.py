@@ -1,4 +1,8 @@
 import math
+import functools
+import numpy as np
+from typing import Union, Callable
+from ml4co_kit.utils.round import ROUND_FUNCS
 
 
 def parse_degrees(coord):
@@ -45,4 +49,219 @@ def geographical(start, end, radius=6378.388):
     q3 = math.cos(start.lat + end.lat)
     distance = radius * math.acos(0.5 * ((1 + q1) * q2 - (1 - q1) * q3)) + 1
 
-    return distance
\ No newline at end of file
+    return distance
+
+
+def np_geographical(start: np.ndarray, end: np.ndarray, radius=6378.388) -> np.ndarray:
+    """Vectorized version of ``geographical``.
+
+    :param np.ndarray start: coordinates with shape (..., 2)
+    :param np.ndarray end: coordinates with shape (..., 2)
+    :param float radius: the radius of the Earth
+    :return: distances with shape (...)
+    """
+    start = np.asarray(start, dtype=np.float64)
+    end = np.asarray(end, dtype=np.float64)
+    if start.shape[-1] != end.shape[-1]:
+        raise ValueError("dimension mismatch between start and end")
+
+    def parse_component(component: np.ndarray):
+        degrees = np.trunc(component)
+        return np.radians(degrees + (component - degrees) * 5 / 3)
+
+    start_lat, start_lng = parse_component(start[..., 0]), parse_component(start[..., 1])
+    end_lat, end_lng = parse_component(end[..., 0]), parse_component(end[..., 1])
+
+    q1 = np.cos(start_lng - end_lng)
+    q2 = np.cos(start_lat - end_lat)
+    q3 = np.cos(start_lat + end_lat)
+    cos_value = np.clip(0.5 * ((1 + q1) * q2 - (1 - q1) * q3), -1.0, 1.0)
+    distance = radius * np.arccos(cos_value) + 1
+
+    return distance
+
+
+def _reduce_deltas(
+    start: np.ndarray, end: np.ndarray, func: np.ufunc, reduce: np.ufunc
+) -> np.ndarray:
+    # reduce(func(end_0 - start_0), func(end_1 - start_1), ...), one coordinate at a
+    # time and in place, so that no (..., D) temporary is created
+    start = np.asarray(start, dtype=np.float64)
+    end = np.asarray(end, dtype=np.float64)
+    if start.shape[-1] != end.shape[-1]:
+        raise ValueError("dimension mismatch between start and end")
+    result = func(end[..., 0] - start[..., 0])
+    for dim in range(1, start.shape[-1]):
+        delta = end[..., dim] - start[..., dim]
+        reduce(result, func(delta, out=delta), out=result)
+    return result
+
+
+def np_euclidean(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """Vectorized Euclidean distance (EUC_2D, EUC_3D and CEIL_2D problems).
+
+    :param np.ndarray start: coordinates with shape (..., D)
+    :param np.ndarray end: coordinates with shape (..., D)
+    :return: distances with shape (...)
+    """
+    squares = _reduce_deltas(start, end, np.square, np.add)
+    return np.sqrt(squares, out=squares)
+
+
+def np_manhattan(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """Vectorized Manhattan distance (MAN_2D and MAN_3D problems).
+
+    :param np.ndarray start: coordinates with shape (..., D)
+    :param np.ndarray end: coordinates with shape (..., D)
+    :return: distances with shape (...)
+    """
+    return _reduce_deltas(start, end, np.abs, np.add)
+
+
+def np_maximum(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """Vectorized maximum distance (MAX_2D and MAX_3D problems).
+
+    :param np.ndarray start: coordinates with shape (..., D)
+    :param np.ndarray end: coordinates with shape (..., D)
+    :return: distances with shape (...)
+    """
+    return _reduce_deltas(start, end, np.abs, np.maximum)
+
+
+def np_pseudo_euclidean(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """Vectorized pseudo-Euclidean distance (ATT problems), before rounding.
+
+    :param np.ndarray start: coordinates with shape (..., D)
+    :param np.ndarray end: coordinates with shape (..., D)
+    :return: distances with shape (...)
+    """
+    return np.sqrt(_reduce_deltas(start, end, np.square, np.add) / 10)
+
+
+def np_xray(
+    start: np.ndarray, end: np.ndarray, sx: float = 1.0, sy: float = 1.0, sz: float = 1.0
+) -> np.ndarray:
+    """Vectorized x-ray crystallography distance (XRAY1 problems, or XRAY2 problems
+    with ``sx=1.25``, ``sy=1.5`` and ``sz=1.15``), before rounding.
+
+    :param np.ndarray start: coordinates with shape (..., 3)
+    :param np.ndarray end: coordinates with shape (..., 3)
+    :return: distances with shape (...)
+    """
+    diff = np.abs(np.asarray(end, dtype=np.float64) - np.asarray(start, dtype=np.float64))
+    if diff.shape[-1] != 3:
+        raise ValueError("start and end must be 3-dimensional")
+    dx = np.minimum(diff[..., 0], np.abs(diff[..., 0] - 360))
+    return 100.0 * np.maximum(np.maximum(dx / sx, diff[..., 1] / sy), diff[..., 2] / sz)
+
+
+def np_nint(vals: np.ndarray) -> np.ndarray:
+    """Rounds to the nearest integer as TSPLIB does (``int(x + 0.5)``)."""
+    return np.trunc(np.asarray(vals) + 0.5).astype(np.int64)
+
+
+def _att_round(vals: np.ndarray) -> np.ndarray:
+    # the nearest integer, plus one if it is below the value
+    rounded = np_nint(vals)
+    return rounded + (rounded < vals)
+
+
+#: Map of edge weight types to vectorized distance functions (before rounding)
+NP_DISTANCE_TYPES = {
+    "EUC_2D": np_euclidean,
+    "EUC_3D": np_euclidean,
+    "MAX_2D": np_maximum,
+    "MAX_3D": np_maximum,
+    "MAN_2D": np_manhattan,
+    "MAN_3D": np_manhattan,
+    "CEIL_2D": np_euclidean,
+    "GEO": np_geographical,
+    "ATT": np_pseudo_euclidean,
+    "XRAY1": np_xray,
+    "XRAY2": functools.partial(np_xray, sx=1.25, sy=1.5, sz=1.15),
+}
+
+#: Map of edge weight types to the rounding of the TSPLIB documentation
+TSPLIB_ROUND_FUNCS = {
+    "EUC_2D": np_nint,
+    "EUC_3D": np_nint,
+    "MAX_2D": np_nint,
+    "MAX_3D": np_nint,
+    "MAN_2D": np_nint,
+    "MAN_3D": np_nint,
+    "CEIL_2D": lambda vals: np.ceil(vals).astype(np.int64),
+    "GEO": lambda vals: np.trunc(vals).astype(np.int64),
+    "ATT": _att_round,
+    "XRAY1": np_nint,
+    "XRAY2": np_nint,
+}
+
+
+def np_distance(start: np.ndarray, end: np.ndarray, norm: str = "EUC_2D") -> np.ndarray:
+    """Distances between the (broadcast) coordinates under the edge weight type.
+
+    :param np.ndarray start: coordinates with shape (..., D)
+    :param np.ndarray end: coordinates with shape (..., D)
+    :param str norm: the edge weight type, one of ``NP_DISTANCE_TYPES``
+    :return: distances with shape (...), before rounding
+    """
+    if norm not in NP_DISTANCE_TYPES:
+        raise ValueError(
+            f"The norm type ({norm}) is not supported, "
+            f"only {list(NP_DISTANCE_TYPES.keys())} are supported."
+        )
+    return NP_DISTANCE_TYPES[norm](start, end)
+
+
+def distance_matrix(
+    points: np.ndarray,
+    norm: str = "EUC_2D",
+    round_func: Union[str, Callable] = "none",
+    block_size: int = 256
+) -> np.ndarray:
+    """Builds the full distance matrix of one or many point sets, ``block_size``
+    rows at a time, so that the temporary arrays stay O(block_size * N * D).
+
+    :param np.ndarray points: coordinates with shape (N, D) or (B, N, D)
+    :param str norm: the edge weight type, one of ``NP_DISTANCE_TYPES``
+    :param round_func: the rounding applied to the distances, one of ``ROUND_FUNCS``
+        ("none", "round", "trunc", "dimacs", "exact"), "tsplib" for the rounding of
+        the TSPLIB documentation for ``norm`` (e.g. ``nint`` for EUC_2D, ``ceil`` for
+        CEIL_2D and the special rounding of ATT), or a callable
+    :param int block_size: the number of rows computed together
+    :return: distances with shape (N, N) or (B, N, N), float64 without rounding
+        and int64 with it
+    """
+    points = np.asarray(points, dtype=np.float64)
+    single = points.ndim == 2
+    if single:
+        points = points[None]
+    if points.ndim != 3:
+        raise ValueError("``points`` must have shape (N, D) or (B, N, D).")
+    if block_size < 1:
+        raise ValueError("``block_size`` must be positive.")
+    if round_func == "tsplib":
+        if norm not in TSPLIB_ROUND_FUNCS:
+            raise ValueError(f"The norm type ({norm}) has no TSPLIB rounding.")
+        round_func = TSPLIB_ROUND_FUNCS[norm]
+    elif not callable(round_func):
+        if round_func not in ROUND_FUNCS:
+            raise ValueError(
+                f"round_func = {round_func} is not understood. Can be a function, "
+                f"'tsplib' or one of {list(ROUND_FUNCS.keys())}."
+            )
+        round_func = ROUND_FUNCS[round_func]
+
+    batch_size, nodes_num, _ = points.shape
+    dists = None
+    for begin in range(0, nodes_num, block_size):
+        end = min(begin + block_size, nodes_num)
+        block = round_func(
+            np_distance(points[:, begin:end, None, :], points[:, None, :, :], norm)
+        )
+        if dists is None:
+            dists = np.empty(shape=(batch_size, nodes_num, nodes_num), dtype=block.dtype)
+        dists[:, begin:end] = block
+    if dists is None:
+        dists = np.empty(shape=(batch_size, nodes_num, nodes_num))
+    return dists[0] if single else dists
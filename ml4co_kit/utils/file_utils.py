@@ -1,5 +1,5 @@
 r"""
-The utilities used to download and compress files.
+The utilities used to download, compress and load files.
 """
 
 # Copyright (c) 2024 Thinklab@SJTU
@@ -25,7 +25,8 @@ import tarfile
 import async_timeout
 import urllib.request
 from tqdm import tqdm
-from typing import Union
+from multiprocessing import Pool
+from typing import Union, Callable, Iterable, List, Tuple, Any
 
 
 ###############################################
@@ -208,3 +209,68 @@ def extract_archive(archive_path: str, extract_path: str):
     else:
         message = "Unsupported file format. Only .zip, .tar.gz"
         raise ValueError(message)
+
+
+###############################################
+#                    Load                     #
+###############################################
+
+
+def _timed_apply(item: Tuple[Callable, tuple]) -> Tuple[Any, float]:
+    func, args = item
+    begin_time = time.time()
+    result = func(*args)
+    return result, time.time() - begin_time
+
+
+def _collect_loaded(
+    args_list: List[tuple], outputs: Iterable, desc: str, show_time: bool
+) -> Tuple[List[Any], List[float]]:
+    results = list()
+    load_times = list()
+    bar = tqdm(total=len(args_list), desc=desc) if show_time else None
+    for args, (result, load_time) in zip(args_list, outputs):
+        results.append(result)
+        load_times.append(load_time)
+        if bar is not None:
+            bar.set_postfix(file=os.path.basename(str(args[0])), time=f"{load_time:.3f}s")
+            bar.update()
+    if bar is not None:
+        bar.close()
+    return results, load_times
+
+
+def parallel_load(
+    func: Callable,
+    args_list: List[tuple],
+    num_processes: int = 1,
+    chunk_size: int = None,
+    desc: str = "Loading",
+    show_time: bool = False
+) -> Tuple[List[Any], List[float]]:
+    r"""
+    Applies the file reader ``func`` to every argument tuple across ``num_processes``
+    worker processes. The tuples are sent to the workers in chunks of ``chunk_size`` and
+    the results come back in the order of ``args_list``. With ``show_time``, the
+    progress bar shows the name (the first argument) and the time of each file.
+
+    :param func: callable, a module-level function (so that it can be pickled).
+    :param args_list: list of tuple, the arguments of each call, the file path first.
+    :param num_processes: int, the number of worker processes (not threads).
+    :param chunk_size: int, the number of calls sent to a worker at once. Defaults to
+        about a quarter of the calls per process.
+    :param desc: string, the descriptive text for the progress bar.
+    :param show_time: boolean, whether to display a progress bar.
+    :return: (results, load_times), the result and the reading time (in seconds)
+        of each call.
+    """
+    if num_processes < 1:
+        raise ValueError("``num_processes`` must be positive.")
+    items = [(func, args) for args in args_list]
+    if num_processes == 1 or len(items) <= 1:
+        return _collect_loaded(args_list, map(_timed_apply, items), desc, show_time)
+    if chunk_size is None:
+        chunk_size = max(1, len(items) // (4 * num_processes))
+    with Pool(num_processes) as pool:
+        outputs = pool.imap(_timed_apply, items, chunksize=chunk_size)
+        return _collect_loaded(args_list, outputs, desc, show_time)
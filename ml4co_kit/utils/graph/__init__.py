@@ -1,4 +1,20 @@
-from .base import GraphData, np_dense_to_sparse, np_sparse_to_dense
+from .base import GraphData, np_dense_to_sparse, np_sparse_to_dense, edge_incidence_matrix
+from .base import read_graph_npz, write_graph_npz, read_graph_txt
+from .batch import GraphBatch
+from .evaluate import (
+    mcut_cut_value, mis_check_independence, mvc_check_cover, mcl_check_clique,
+    batch_mcut_cut_value, batch_mis_check_independence, 
+    batch_mvc_check_cover, batch_mcl_check_clique
+)
+from .feasibility import (
+    mis_violations, mvc_violations, mcl_violations, mis_repair, mvc_repair, mcl_repair,
+    batch_mis_violations, batch_mvc_violations, batch_mcl_violations,
+    batch_mis_repair, batch_mvc_repair, batch_mcl_repair
+)
+from .clique import complement_edges, degeneracy_order, greedy_clique
+from .random_graph import (
+    erdos_renyi_edges, barabasi_albert_edges, holme_kim_edges, watts_strogatz_edges
+)
 from .mcl import MClGraphData
 from .mcut import MCutGraphData
 from .mis import MISGraphData
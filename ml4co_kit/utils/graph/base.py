@@ -1,10 +1,156 @@
-import copy
 import pickle
 import numpy as np
 import scipy.sparse
 import networkx as nx
 from enum import Enum
-from typing import Union, Tuple
+from typing import Union, Tuple, List
+from ml4co_kit.utils.graph.clique import complement_edges
+from ml4co_kit.utils.time_utils import iterative_execution_for_file
+
+
+def read_gpickle_edges(file_path: str) -> Tuple[int, np.ndarray]:
+    r"""
+    Reads the number of nodes and the undirected edges with shape (E, 2) of the
+    networkx graph pickled in a ``.gpickle`` file. Only arrays are returned, so
+    that the result is cheap to send back from a worker process.
+    """
+    # check file format
+    if not file_path.endswith(".gpickle"):
+        raise ValueError("Invalid file format. Expected a ``.gpickle`` file.")
+    
+    # read graph data from .gpickle
+    with open(file_path, "rb") as f:
+        graph = pickle.load(f)
+    graph: nx.Graph
+    edges = np.array(graph.edges, dtype=np.int64).reshape(-1, 2)
+    return graph.number_of_nodes(), edges
+
+
+def read_result(file_path: str) -> np.ndarray:
+    r"""
+    Reads the 0/1 label of each node from a ``.result`` file (one per line).
+    """
+    # check file format
+    if not file_path.endswith(".result"):
+        raise ValueError("Invalid file format. Expected a ``.result`` file.")
+    
+    # read solution from file
+    with open(file_path, "r") as f:
+        nodes_label = [int(_) for _ in f.read().splitlines()]
+    return np.array(nodes_label, dtype=np.int64)
+
+
+def read_graph_txt(
+    file_path: str, show_time: bool = False
+) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+    r"""
+    Reads the ``.txt`` format of the graph solvers, one graph per line:
+    ``src_0 dst_0 src_1 dst_1 ... label l_0 l_1 ...``. Returns the edges with
+    shape (2, E) and the nodes label of each graph.
+    """
+    # check file format
+    if not file_path.endswith(".txt"):
+        raise ValueError("Invalid file format. Expected a ``.txt`` file.")
+    
+    # read by lines
+    edge_index = list()
+    nodes_label = list()
+    with open(file_path, "r") as file:
+        for line in iterative_execution_for_file(file, "Loading", show_time):
+            line = line.strip()
+            if not line:
+                continue
+            edges, labels = line.split("label")
+            edge_index.append(np.fromstring(edges, dtype=np.int64, sep=" ").reshape(-1, 2).T)
+            nodes_label.append(np.fromstring(labels, dtype=np.int64, sep=" "))
+    return edge_index, nodes_label
+
+
+def _min_uint_dtype(max_value: int) -> np.dtype:
+    # the smallest unsigned integer type that holds ``max_value``
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if max_value <= np.iinfo(dtype).max:
+            return dtype
+    return np.uint64
+
+
+def write_graph_npz(
+    file_path: str,
+    nodes_num: int,
+    edges: np.ndarray,
+    nodes_weight: np.ndarray = None,
+    nodes_label: np.ndarray = None,
+    compress: bool = True
+):
+    r"""
+    Writes a graph to a compact ``.npz`` file, replacing the pickled networkx graph of
+    a ``.gpickle`` file. The undirected edges are stored once (u < v, without
+    self-loops) as the CSR arrays ``indptr`` and ``indices`` of the upper triangle,
+    in the smallest unsigned integer types, next to ``nodes_num`` and the optional
+    ``nodes_weight`` and ``nodes_label``.
+
+    :param file_path: string, path to the ``.npz`` file.
+    :param nodes_num: int, the number of nodes.
+    :param edges: np.ndarray, the undirected edges with shape (E, 2). Duplicates
+        (in either direction) and self-loops are dropped.
+    :param nodes_weight: np.ndarray, the weight of each node with shape (N,).
+    :param nodes_label: np.ndarray, the 0/1 label of each node with shape (N,).
+    :param compress: boolean, whether to compress the arrays (``np.savez_compressed``).
+    """
+    # check file format
+    if not file_path.endswith(".npz"):
+        raise ValueError("Invalid file format. Expected a ``.npz`` file.")
+
+    # the upper triangle, sorted by (u, v)
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    u, v = edges.min(axis=1), edges.max(axis=1)
+    key = np.unique(u[u != v] * nodes_num + v[u != v])
+    u, v = key // max(nodes_num, 1), key % max(nodes_num, 1)
+    indptr = np.zeros(shape=(nodes_num + 1,), dtype=np.int64)
+    np.cumsum(np.bincount(u, minlength=nodes_num), out=indptr[1:])
+
+    # write
+    arrays = {
+        "nodes_num": np.int64(nodes_num),
+        "indptr": indptr.astype(_min_uint_dtype(len(key))),
+        "indices": v.astype(_min_uint_dtype(max(nodes_num - 1, 0))),
+    }
+    if nodes_weight is not None:
+        arrays["nodes_weight"] = np.asarray(nodes_weight)
+    if nodes_label is not None:
+        arrays["nodes_label"] = np.asarray(nodes_label).astype(np.uint8)
+    save_func = np.savez_compressed if compress else np.savez
+    save_func(file_path, **arrays)
+
+
+def read_graph_npz(
+    file_path: str
+) -> Tuple[int, np.ndarray, np.ndarray, np.ndarray]:
+    r"""
+    Reads a graph written by ``write_graph_npz``.
+
+    :return: (nodes_num, edges, nodes_weight, nodes_label), where the undirected
+        edges with shape (E, 2) are listed once (u < v), sorted by (u, v). The
+        weights and the labels (int64) are None if they were not written.
+    """
+    # check file format
+    if not file_path.endswith(".npz"):
+        raise ValueError("Invalid file format. Expected a ``.npz`` file.")
+
+    # read the CSR arrays
+    with np.load(file_path) as data:
+        nodes_num = int(data["nodes_num"])
+        indptr = data["indptr"].astype(np.int64)
+        indices = data["indices"].astype(np.int64)
+        nodes_weight = data["nodes_weight"] if "nodes_weight" in data else None
+        nodes_label = data["nodes_label"] if "nodes_label" in data else None
+
+    # CSR -> edges
+    src = np.repeat(np.arange(nodes_num), np.diff(indptr))
+    edges = np.stack([src, indices], axis=1)
+    if nodes_label is not None:
+        nodes_label = nodes_label.astype(np.int64)
+    return nodes_num, edges, nodes_weight, nodes_label
 
 
 class Dense2SparseType(str, Enum):
@@ -13,12 +159,126 @@ class Dense2SparseType(str, Enum):
 
 
 class GraphData(object):
+    r"""
+    A graph stored as a COO ``edge_index`` with shape (2, E) and optional ``edge_attr``.
+    
+    The structural views (the CSR adjacency, the degrees and the deduplicated
+    undirected edges) are built lazily on first use and cached. They are dropped
+    whenever ``edge_index``, ``edge_attr`` or ``nodes_num`` is reassigned (in-place
+    changes of these arrays are not tracked). The dense ``adj_matrix`` is only
+    built when ``to_matrix`` is called explicitly.
+    """
     def __init__(self):
+        self._edge_index: np.ndarray = None
+        self._edge_attr: np.ndarray = None
+        self._nodes_num: int = None
         self.x = None
-        self.edge_index: np.ndarray = None
-        self.edge_attr: np.ndarray = None
         self.adj_matrix: np.ndarray = None
-        self.nodes_num: np.ndarray = None
+        self._clear_cache()
+    
+    def _clear_cache(self):
+        self.adj_matrix = None
+        self._csr: scipy.sparse.csr_matrix = None
+        self._degree: np.ndarray = None
+        self._undirected_edges: Tuple[np.ndarray, np.ndarray, np.ndarray] = None
+    
+    @property
+    def edge_index(self) -> np.ndarray:
+        return self._edge_index
+    
+    @edge_index.setter
+    def edge_index(self, edge_index: np.ndarray):
+        self._edge_index = edge_index
+        self._clear_cache()
+    
+    @property
+    def edge_attr(self) -> np.ndarray:
+        return self._edge_attr
+    
+    @edge_attr.setter
+    def edge_attr(self, edge_attr: np.ndarray):
+        self._edge_attr = edge_attr
+        self._clear_cache()
+    
+    @property
+    def nodes_num(self) -> int:
+        return self._nodes_num
+    
+    @nodes_num.setter
+    def nodes_num(self, nodes_num: int):
+        self._nodes_num = nodes_num
+        self._clear_cache()
+    
+    def _infer_nodes_num(self) -> int:
+        if self.nodes_num is not None:
+            return int(self.nodes_num)
+        if self.edge_index is None or self.edge_index.size == 0:
+            return 0
+        return int(self.edge_index.max()) + 1
+    
+    def to_csr(self) -> scipy.sparse.csr_matrix:
+        r"""
+        The (cached) CSR adjacency matrix with shape (N, N). Duplicate edges are
+        summed and the entries of each row are sorted by column.
+        """
+        if self._csr is None:
+            if self.edge_index is None:
+                raise ValueError("``edge_index`` cannot be None when building the CSR view.")
+            nodes_num = self._infer_nodes_num()
+            edges_num = self.edge_index.shape[1]
+            data = np.ones(shape=(edges_num,)) if self.edge_attr is None else self.edge_attr
+            csr = scipy.sparse.csr_matrix(
+                (data, (self.edge_index[0], self.edge_index[1])), 
+                shape=(nodes_num, nodes_num)
+            )
+            csr.sum_duplicates()
+            self._csr = csr
+        return self._csr
+    
+    @property
+    def indptr(self) -> np.ndarray:
+        return self.to_csr().indptr
+    
+    @property
+    def indices(self) -> np.ndarray:
+        return self.to_csr().indices
+    
+    @property
+    def degree(self) -> np.ndarray:
+        r"""
+        The (cached) out-degree of each node, counting the distinct neighbors.
+        """
+        if self._degree is None:
+            self._degree = np.diff(self.indptr)
+        return self._degree
+    
+    def neighbors(self, node: int) -> np.ndarray:
+        r"""
+        The sorted out-neighbors of ``node`` (a view into the CSR indices).
+        """
+        indptr = self.indptr
+        return self.indices[indptr[node]: indptr[node + 1]]
+    
+    def undirected_edges(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        r"""
+        The (cached) undirected edges without self-loops.
+        :return: (u, v, weights) with u < v, where the weights of the directed 
+            edges merged into one undirected edge are summed.
+        """
+        if self._undirected_edges is None:
+            src, dst = self.edge_index[0], self.edge_index[1]
+            if self.edge_attr is None:
+                edge_attr = np.ones(shape=(len(src),))
+            else:
+                edge_attr = np.asarray(self.edge_attr)
+            nodes_num = max(self._infer_nodes_num(), 1)
+            mask = src != dst
+            key = np.minimum(src[mask], dst[mask]) * nodes_num
+            key = key + np.maximum(src[mask], dst[mask])
+            key, inverse = np.unique(key, return_inverse=True)
+            weights = np.bincount(inverse, weights=edge_attr[mask], minlength=len(key))
+            self._undirected_edges = (key // nodes_num, key % nodes_num, weights)
+        return self._undirected_edges
         
     def from_adj_martix(
         self, 
@@ -53,24 +313,42 @@ class GraphData(object):
     def from_gpickle(
         self, file_path: str, self_loop: bool = True
     ):
-        # check file format
-        if not file_path.endswith(".gpickle"):
-            raise ValueError("Invalid file format. Expected a ``.gpickle`` file.")
-        
         # read graph data from .gpickle
-        with open(file_path, "rb") as f:
-            graph = pickle.load(f)
-        graph: nx.Graph
+        nodes_num, edges = read_gpickle_edges(file_path)
 
-        # use ``from_nx_graph``
-        self.from_nx_graph(graph, self_loop=self_loop)        
+        # use ``from_edge_list``
+        self.from_edge_list(nodes_num=nodes_num, edges=edges, self_loop=self_loop)
+    
+    def from_npz(self, file_path: str, self_loop: bool = True, ref: bool = False):
+        r"""
+        Reads the graph (and the ``nodes_label``, or the ``ref_nodes_label`` if ``ref``,
+        if it was written) from a ``.npz`` file written by ``write_graph_npz``.
+        """
+        # read graph data from .npz
+        nodes_num, edges, _, nodes_label = read_graph_npz(file_path)
+
+        # use ``from_edge_list`` and ``from_data``
+        self.from_edge_list(nodes_num=nodes_num, edges=edges, self_loop=self_loop)
+        if nodes_label is not None:
+            self.from_data(nodes_label=nodes_label, ref=ref)
     
     def from_nx_graph(self, nx_graph: nx.Graph, self_loop: bool = True):
+        # use ``from_edge_list``
+        self.from_edge_list(
+            nodes_num=nx_graph.number_of_nodes(),
+            edges=np.array(nx_graph.edges, dtype=np.int64).reshape(-1, 2),
+            self_loop=self_loop
+        )
+    
+    def from_edge_list(self, nodes_num: int, edges: np.ndarray, self_loop: bool = True):
+        r"""
+        Builds the graph from its undirected edges with shape (E, 2), each listed once.
+        """
         # nodes num
-        self.nodes_num = nx_graph.number_of_nodes()
+        self.nodes_num = nodes_num
         
         # edges
-        edges = np.array(nx_graph.edges, dtype=np.int64)
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
         edges = np.concatenate([edges, edges[:, ::-1]], axis=0)
         self.self_loop = self_loop
         if self.self_loop:
@@ -83,14 +361,8 @@ class GraphData(object):
         self.from_data(edge_index=edges)
     
     def from_result(self, file_path: str, ref: bool = False):
-        # check file format
-        if not file_path.endswith(".result"):
-            raise ValueError("Invalid file format. Expected a ``.result`` file.")
-        
         # read solution from file
-        with open(file_path, "r") as f:
-            nodes_label = [int(_) for _ in f.read().splitlines()]
-        nodes_label = np.array(nodes_label, dtype=np.int64)
+        nodes_label = read_result(file_path)
         
         # use ``from_data``
         self.from_data(nodes_label=nodes_label, ref=ref)  
@@ -118,6 +390,20 @@ class GraphData(object):
             )
         return self.adj_matrix
     
+    def to_npz(self, file_path: str, compress: bool = True):
+        r"""
+        Writes the undirected graph (and the ``nodes_label`` if any) to a ``.npz`` 
+        file with ``write_graph_npz``. Self-loops are not written.
+        """
+        u, v, _ = self.undirected_edges()
+        write_graph_npz(
+            file_path=file_path, 
+            nodes_num=self._infer_nodes_num(),
+            edges=np.stack([u, v], axis=1),
+            nodes_label=getattr(self, "nodes_label", None),
+            compress=compress
+        )
+    
     def to_networkx(self) -> nx.Graph:
         """
         Converts the GraphData instance to a networkx Graph.
@@ -144,20 +430,23 @@ class GraphData(object):
     def to_complement(self):
         """
         Converts the current graph to its complement by reversing the edge relationships
-        between nodes. Self-loop configurations remain unchanged.
+        between nodes. Self-loop configurations remain unchanged. The complement edges
+        are streamed from the CSR view block by block instead of inverting a dense
+        matrix, but note that the complement of a sparse graph has O(N^2) edges.
         """
-        if self.adj_matrix is None:
-            # If no adjacency matrix is present, generate it first
-            self.to_matrix()
-        
-        # Generate the complement adjacency matrix by inverting 0s and 1s
-        complement_adj_matrix = np.logical_not(self.adj_matrix).astype(int)
+        nodes_num = self._infer_nodes_num()
+        u, v, _ = self.undirected_edges()
+        pairs = list(complement_edges(u, v, nodes_num))
+        src = np.concatenate([pair[0] for pair in pairs])
+        dst = np.concatenate([pair[1] for pair in pairs])
+        loops = np.unique(self.edge_index[0][self.edge_index[0] == self.edge_index[1]])
         
-        # Preserve the diagonal values for self-loops (change to 0 to remove self-loops)
-        np.fill_diagonal(complement_adj_matrix, self.adj_matrix.diagonal())
-        
-        # Update the current graph data to reflect the complement graph
-        self.from_adj_martix(complement_adj_matrix)
+        # both directions and the self-loops, sorted by (source, target)
+        src, dst = np.concatenate([src, dst, loops]), np.concatenate([dst, src, loops])
+        order = np.lexsort((dst, src))
+        self.nodes_num = nodes_num
+        self.edge_index = np.stack([src[order], dst[order]], axis=0)
+        self.edge_attr = np.ones(shape=(len(order),))
     
     def remove_self_loop(self):
         """
@@ -232,6 +521,55 @@ def np_sparse_to_dense(
     return adj_matrix
 
 
+def edge_incidence_matrix(
+    u: np.ndarray, v: np.ndarray, nodes_num: int
+) -> scipy.sparse.csr_matrix:
+    r"""
+    The (E, N) matrix with ones at (e, u_e) and (e, v_e).
+    """
+    rows = np.repeat(np.arange(len(u)), 2)
+    cols = np.stack([u, v], axis=1).reshape(-1)
+    return scipy.sparse.csr_matrix(
+        (np.ones(shape=(len(rows),)), (rows, cols)), shape=(len(u), nodes_num)
+    )
+
+
+def _knn_indices(
+    adj_matrix: np.ndarray,
+    max_or_min: str,
+    sparse_factor: int,
+    self_loop: bool,
+    chunk_size: int
+) -> np.ndarray:
+    # the ``sparse_factor`` best columns of every row of (B, N, N) matrices in order,
+    # by a partial sort of ``chunk_size`` rows at a time
+    batch_size, nodes_num, _ = adj_matrix.shape
+    sign = -1 if max_or_min == "max" else 1
+    if self_loop is not None:
+        if sign == 1:
+            min_value, max_value = adj_matrix.min(), adj_matrix.max()
+        else:
+            min_value, max_value = -adj_matrix.max(), -adj_matrix.min()
+    idx_knn = np.empty(shape=(batch_size, nodes_num, sparse_factor), dtype=np.int64)
+    for begin in range(0, nodes_num, chunk_size):
+        end = min(begin + chunk_size, nodes_num)
+        block = adj_matrix[:, begin:end]
+        if sign == -1:
+            block = -block
+        
+        # the diagonal is only changed on a copy of the block
+        if self_loop is not None:
+            if sign == 1:
+                block = block.copy()
+            rows = np.arange(end - begin)
+            block[:, rows, begin + rows] = min_value - 1 if self_loop else max_value + 1
+        
+        part = np.argpartition(block, sparse_factor - 1, axis=-1)[..., :sparse_factor]
+        order = np.argsort(np.take_along_axis(block, part, axis=-1), axis=-1, kind="stable")
+        idx_knn[:, begin:end] = np.take_along_axis(part, order, axis=-1)
+    return idx_knn
+
+
 def np_dense_to_sparse(
     adj_matrix: np.ndarray,
     max_or_min: str = "min",
@@ -239,13 +577,29 @@ def np_dense_to_sparse(
     type: Dense2SparseType = Dense2SparseType.DISTANCE, 
     sparse_factor: int = None,
     self_loop: bool = None,
+    chunk_size: int = 1024
 ) -> Tuple[int, np.ndarray, np.ndarray]:
+    r"""
+    Sparsifies a dense matrix, either keeping the ``sparse_factor`` nearest (or, if 
+    ``max_or_min`` is "max", largest) entries of every row (``distance``) or all the 
+    one (or zero) entries (``zero-one``).
+    
+    :param adj_matrix: np.ndarray, the matrix with shape (N, N). In ``distance`` mode 
+        a batch of matrices with shape (B, N, N) is also supported, for which the
+        ``edge_index`` has shape (B, 2, N * sparse_factor) and the ``edge_attr`` has
+        shape (B, N * sparse_factor).
+    :param chunk_size: int, the number of rows partially sorted together in 
+        ``distance`` mode, which bounds the extra memory to O(B * chunk_size * N).
+    """
     # check dimension
-    if adj_matrix.ndim != 2:
-        raise ValueError("Dimension of input array must be 2!")
+    batched = adj_matrix.ndim == 3 and type == Dense2SparseType.DISTANCE
+    if adj_matrix.ndim != 2 and not batched:
+        raise ValueError(
+            "Dimension of input array must be 2 (or 3 if type is ``distance``)!"
+        )
     
     # nodes num
-    nodes_num = adj_matrix.shape[0]
+    nodes_num = adj_matrix.shape[-1]
     
     # dense to sparse (distance)
     if type == Dense2SparseType.DISTANCE:
@@ -253,32 +607,26 @@ def np_dense_to_sparse(
             raise ValueError(
                 "``sparse_factor`` can not be None if type is ``distance``"
             )
+        if chunk_size < 1:
+            raise ValueError("``chunk_size`` must be positive.")
+        sparse_factor = min(sparse_factor, nodes_num)
         
-        # max or min
-        if max_or_min == "max":
-            adj_matrix = -adj_matrix
+        # KNN (partial sort, then only the kept entries are sorted)
+        batch_adj_matrix = adj_matrix if batched else adj_matrix[None]
+        idx_knn = _knn_indices(
+            adj_matrix=batch_adj_matrix, max_or_min=max_or_min, 
+            sparse_factor=sparse_factor, self_loop=self_loop, chunk_size=chunk_size
+        )
         
-        # KNN  
-        new_adj_matrix = copy.deepcopy(adj_matrix)
-        min_value, max_value = adj_matrix.min(), adj_matrix.max()
-        if self_loop == True:
-            new_adj_matrix[range(nodes_num), range(nodes_num)] = min_value - 1
-        elif self_loop == False:
-            new_adj_matrix[range(nodes_num), range(nodes_num)] = max_value + 1
-        elif self_loop is None:
-            pass
-        idx_knn = np.argsort(new_adj_matrix, axis=1)[:, :sparse_factor]
-
         # edge_index && edge_attr
-        edge_index_0 = np.arange(nodes_num).reshape((-1, 1))
-        edge_index_0 = edge_index_0.repeat(sparse_factor, 1).reshape(-1)
-        edge_index_1 = idx_knn.reshape(-1)
-        edge_index = np.stack([edge_index_0, edge_index_1], axis=0)
-        
-        # edge_attr
-        edge_attr = adj_matrix[edge_index_0, idx_knn.reshape(-1)]
-        if max_or_min == "max":
-            edge_attr = -edge_attr
+        edge_index_0 = np.repeat(np.arange(nodes_num), sparse_factor)
+        edge_index_0 = np.broadcast_to(edge_index_0, (len(idx_knn), len(edge_index_0)))
+        edge_index_1 = idx_knn.reshape(len(idx_knn), -1)
+        edge_index = np.stack([edge_index_0, edge_index_1], axis=1)
+        edge_attr = np.take_along_axis(batch_adj_matrix, idx_knn, axis=-1)
+        edge_attr = edge_attr.reshape(len(idx_knn), -1)
+        if not batched:
+            edge_index, edge_attr = edge_index[0], edge_attr[0]
             
     # dense to sparse (zero-one)
     elif type == Dense2SparseType.ZERO_ONE:
@@ -0,0 +1,322 @@
+r"""
+A container for many graphs in one PyG-style layout.
+
+All the graphs share one concatenated ``edge_index`` of shape (2, E) whose node ids
+are shifted by the node offsets, plus the offset arrays ``node_ptr`` (B + 1,) and
+``edge_ptr`` (B + 1,) and the concatenated nodes labels. Loading, writing,
+evaluation, validation and repair then work on a handful of large arrays instead
+of one small ``GraphData`` object (and its arrays) per graph.
+"""
+
+# Copyright (c) 2024 Thinklab@SJTU
+# ML4CO-Kit is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+# http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND,
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT,
+# MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+
+
+import numpy as np
+from typing import List, Type
+from ml4co_kit.utils.type_utils import TASK_TYPE
+from ml4co_kit.utils.graph.base import GraphData, read_graph_txt
+from ml4co_kit.utils.graph.feasibility import (
+    _unique_edges, _mis_repair, _mvc_repair, _mcl_repair, _mcl_missing
+)
+
+
+SUPPORT_BATCH_TASK = [TASK_TYPE.MCl, TASK_TYPE.MCut, TASK_TYPE.MIS, TASK_TYPE.MVC]
+
+
+def _offsets(sizes: np.ndarray) -> np.ndarray:
+    ptr = np.zeros(shape=(len(sizes) + 1,), dtype=np.int64)
+    np.cumsum(sizes, out=ptr[1:])
+    return ptr
+
+
+class GraphBatch(object):
+    r"""
+    :param edge_index: np.ndarray, the concatenated edges with shape (2, E), whose
+        node ids are global (shifted by ``node_ptr``).
+    :param node_ptr: np.ndarray, the node offsets of the graphs with shape (B + 1,).
+    :param edge_ptr: np.ndarray, the edge offsets of the graphs with shape (B + 1,).
+    :param edge_attr: np.ndarray, the concatenated edge weights with shape (E,), or None.
+    :param nodes_label: np.ndarray, the concatenated solutions with shape (N,), or None.
+    :param ref_nodes_label: np.ndarray, the concatenated reference solutions
+        with shape (N,), or None.
+    """
+    def __init__(
+        self,
+        edge_index: np.ndarray = None,
+        node_ptr: np.ndarray = None,
+        edge_ptr: np.ndarray = None,
+        edge_attr: np.ndarray = None,
+        nodes_label: np.ndarray = None,
+        ref_nodes_label: np.ndarray = None
+    ):
+        self.edge_index = np.zeros(shape=(2, 0), dtype=np.int64)
+        self.node_ptr = np.zeros(shape=(1,), dtype=np.int64)
+        self.edge_ptr = np.zeros(shape=(1,), dtype=np.int64)
+        if edge_index is not None:
+            self.edge_index = np.asarray(edge_index, dtype=np.int64)
+        if node_ptr is not None:
+            self.node_ptr = np.asarray(node_ptr, dtype=np.int64)
+        if edge_ptr is not None:
+            self.edge_ptr = np.asarray(edge_ptr, dtype=np.int64)
+        self.edge_attr = edge_attr
+        self.nodes_label = nodes_label
+        self.ref_nodes_label = ref_nodes_label
+        self._check()
+
+    def _check(self):
+        if self.edge_index.ndim != 2 or self.edge_index.shape[0] != 2:
+            raise ValueError("The shape of ``edge_index`` must be like (2, E)")
+        if len(self.node_ptr) != len(self.edge_ptr):
+            raise ValueError("``node_ptr`` and ``edge_ptr`` must have the same length.")
+        if self.edge_ptr[-1] != self.edge_index.shape[1]:
+            raise ValueError("``edge_ptr`` does not match the number of edges.")
+        if self.edge_attr is not None and len(self.edge_attr) != self.edge_index.shape[1]:
+            raise ValueError("``edge_attr`` does not match the number of edges.")
+        for name in ["nodes_label", "ref_nodes_label"]:
+            nodes_label = getattr(self, name)
+            if nodes_label is not None and len(nodes_label) != self.node_ptr[-1]:
+                raise ValueError(f"``{name}`` does not match the number of nodes.")
+
+    def __len__(self) -> int:
+        return len(self.node_ptr) - 1
+
+    @property
+    def nodes_num(self) -> np.ndarray:
+        return np.diff(self.node_ptr)
+
+    @property
+    def edges_num(self) -> np.ndarray:
+        return np.diff(self.edge_ptr)
+
+    @property
+    def node_graph(self) -> np.ndarray:
+        r"""
+        The graph id of each node with shape (N,).
+        """
+        return np.repeat(np.arange(len(self)), self.nodes_num)
+
+    @property
+    def edge_graph(self) -> np.ndarray:
+        r"""
+        The graph id of each edge with shape (E,).
+        """
+        return np.repeat(np.arange(len(self)), self.edges_num)
+
+    def _get_nodes_label(self, ref: bool) -> np.ndarray:
+        nodes_label = self.ref_nodes_label if ref else self.nodes_label
+        if nodes_label is None:
+            name = "ref_nodes_label" if ref else "nodes_label"
+            raise ValueError(f"``{name}`` of the batch cannot be None!")
+        return nodes_label
+
+    ###############################################
+    #               Build and Split               #
+    ###############################################
+
+    def from_data(
+        self,
+        edge_index: List[np.ndarray],
+        nodes_num: List[int] = None,
+        edge_attr: List[np.ndarray] = None,
+        nodes_label: List[np.ndarray] = None,
+        ref_nodes_label: List[np.ndarray] = None
+    ):
+        r"""
+        Concatenates the graphs given by lists of per-graph arrays (local node ids).
+        If ``nodes_num`` is None, it is taken from the labels, or else from the
+        largest node id of each graph.
+        """
+        graphs_num = len(edge_index)
+        edges_num = np.array([e.shape[1] for e in edge_index], dtype=np.int64)
+        if nodes_num is None:
+            labels = nodes_label if nodes_label is not None else ref_nodes_label
+            if labels is not None:
+                nodes_num = [len(label) for label in labels]
+            else:
+                nodes_num = [int(e.max()) + 1 if e.size > 0 else 0 for e in edge_index]
+        nodes_num = np.asarray(nodes_num, dtype=np.int64)
+        if len(nodes_num) != graphs_num:
+            raise ValueError("The number of ``nodes_num`` and ``edge_index`` does not match!")
+
+        self.node_ptr = _offsets(nodes_num)
+        self.edge_ptr = _offsets(edges_num)
+        if graphs_num > 0 and edges_num.sum() > 0:
+            self.edge_index = np.concatenate(edge_index, axis=1).astype(np.int64)
+            self.edge_index += np.repeat(self.node_ptr[:-1], edges_num)
+        else:
+            self.edge_index = np.zeros(shape=(2, 0), dtype=np.int64)
+        self.edge_attr = None
+        if edge_attr is not None and any(w is not None for w in edge_attr):
+            self.edge_attr = np.concatenate([
+                np.ones(shape=(e,)) if w is None else np.asarray(w)
+                for w, e in zip(edge_attr, edges_num)
+            ])
+        self.nodes_label = None
+        self.ref_nodes_label = None
+        for name, labels in [("nodes_label", nodes_label), ("ref_nodes_label", ref_nodes_label)]:
+            if labels is not None:
+                if len(labels) != graphs_num:
+                    raise ValueError("The number of problems and solutions does not match!")
+                cat_labels = np.concatenate(labels) if graphs_num > 0 else np.zeros(0)
+                setattr(self, name, cat_labels.astype(np.int64))
+        self._check()
+        return self
+
+    def from_graphs(self, graphs: List[GraphData]):
+        r"""
+        Concatenates ``GraphData`` objects (such as ``MISGraphData``).
+        """
+        def _labels(name: str):
+            labels = [getattr(graph, name, None) for graph in graphs]
+            return None if any(label is None for label in labels) else labels
+        return self.from_data(
+            edge_index=[graph.edge_index for graph in graphs],
+            nodes_num=[graph._infer_nodes_num() for graph in graphs],
+            edge_attr=[graph.edge_attr for graph in graphs],
+            nodes_label=_labels("nodes_label"),
+            ref_nodes_label=_labels("ref_nodes_label")
+        )
+
+    def get_edge_index(self, idx: int) -> np.ndarray:
+        r"""
+        The edges of the ``idx``-th graph with local node ids.
+        """
+        begin, end = self.edge_ptr[idx], self.edge_ptr[idx + 1]
+        return self.edge_index[:, begin:end] - self.node_ptr[idx]
+
+    def get_edge_attr(self, idx: int) -> np.ndarray:
+        if self.edge_attr is None:
+            return None
+        return self.edge_attr[self.edge_ptr[idx]: self.edge_ptr[idx + 1]]
+
+    def get_nodes_label(self, idx: int, ref: bool = False) -> np.ndarray:
+        nodes_label = self.ref_nodes_label if ref else self.nodes_label
+        if nodes_label is None:
+            return None
+        return nodes_label[self.node_ptr[idx]: self.node_ptr[idx + 1]]
+
+    def to_graphs(self, graph_cls: Type[GraphData] = GraphData) -> List[GraphData]:
+        r"""
+        Splits the batch into ``graph_cls`` objects (such as ``MISGraphData``).
+        """
+        graphs = list()
+        for idx in range(len(self)):
+            graph = graph_cls()
+            graph.nodes_num = int(self.node_ptr[idx + 1] - self.node_ptr[idx])
+            graph.edge_index = self.get_edge_index(idx)
+            graph.edge_attr = self.get_edge_attr(idx)
+            if self.nodes_label is not None:
+                graph.nodes_label = self.get_nodes_label(idx, ref=False)
+            if self.ref_nodes_label is not None:
+                graph.ref_nodes_label = self.get_nodes_label(idx, ref=True)
+            graphs.append(graph)
+        return graphs
+
+    ###############################################
+    #                  Read/Write                 #
+    ###############################################
+
+    def from_txt(self, file_path: str, ref: bool = False, show_time: bool = False):
+        r"""
+        Reads the ``.txt`` format of the graph solvers, one graph per line:
+        ``src_0 dst_0 src_1 dst_1 ... label l_0 l_1 ...``.
+        """
+        edge_index, nodes_label = read_graph_txt(file_path=file_path, show_time=show_time)
+        if ref:
+            return self.from_data(edge_index=edge_index, ref_nodes_label=nodes_label)
+        return self.from_data(edge_index=edge_index, nodes_label=nodes_label)
+
+    def to_txt(self, file_path: str = "example.txt", ref: bool = False):
+        r"""
+        Writes the batch in the ``.txt`` format of the graph solvers.
+        """
+        nodes_label = self._get_nodes_label(ref)
+        # local node ids of all the edges at once
+        local_edges = self.edge_index - np.repeat(self.node_ptr[:-1], self.edges_num)
+        local_edges = local_edges.T.reshape(-1).tolist()
+        nodes_label = nodes_label.astype(np.int64).tolist()
+        with open(file_path, "w") as f:
+            for idx in range(len(self)):
+                edges = local_edges[2 * self.edge_ptr[idx]: 2 * self.edge_ptr[idx + 1]]
+                labels = nodes_label[self.node_ptr[idx]: self.node_ptr[idx + 1]]
+                f.write(" ".join(map(str, edges)))
+                f.write(" label ")
+                f.write(" ".join(map(str, labels)))
+                f.write("\n")
+
+    ###############################################
+    #           Evaluate/Validate/Repair          #
+    ###############################################
+
+    def _check_task_type(self, task_type: TASK_TYPE):
+        if task_type not in SUPPORT_BATCH_TASK:
+            raise ValueError(
+                f"``GraphBatch`` only supports {SUPPORT_BATCH_TASK}, but got {task_type}."
+            )
+
+    def evaluate(self, task_type: TASK_TYPE, ref: bool = False) -> np.ndarray:
+        r"""
+        Returns the objective of each graph: the cut value for MCut and
+        the number of selected nodes for MCl, MIS and MVC.
+        """
+        self._check_task_type(task_type)
+        selected = self._get_nodes_label(ref) == 1
+        if task_type == TASK_TYPE.MCut:
+            src, dst = self.edge_index
+            cut_mask = selected[src] & ~selected[dst]
+            weights = cut_mask if self.edge_attr is None else cut_mask * self.edge_attr
+            cut_value = np.bincount(self.edge_graph, weights=weights, minlength=len(self))
+            return cut_value.astype(np.int64) if self.edge_attr is None else cut_value
+        return np.bincount(self.node_graph[selected], minlength=len(self))
+
+    def validate(self, task_type: TASK_TYPE, ref: bool = False) -> np.ndarray:
+        r"""
+        Returns the number of violated constraints of each graph: the conflicting
+        edges for MIS, the uncovered edges for MVC and the non-adjacent pairs of
+        selected nodes for MCl. Every partition is a feasible cut, so MCut has none.
+        """
+        self._check_task_type(task_type)
+        selected = self._get_nodes_label(ref) == 1
+        node_graph = self.node_graph
+        if task_type == TASK_TYPE.MCut:
+            return np.zeros(shape=(len(self),), dtype=np.int64)
+        src, dst = _unique_edges(self.edge_index[0], self.edge_index[1], len(selected))
+        if task_type == TASK_TYPE.MIS:
+            violated = selected[src] & selected[dst]
+        elif task_type == TASK_TYPE.MVC:
+            violated = ~selected[src] & ~selected[dst]
+        else:
+            missing = _mcl_missing(src, dst, selected, node_graph, len(self))
+            return np.bincount(
+                node_graph, weights=np.maximum(missing, 0), minlength=len(self)
+            ).astype(np.int64) // 2
+        return np.bincount(node_graph[src[violated]], minlength=len(self))
+
+    def repair(self, task_type: TASK_TYPE, ref: bool = False):
+        r"""
+        Greedily repairs the infeasible solutions of all the graphs in place
+        (see ``mis_repair``, ``mvc_repair`` and ``mcl_repair``).
+        """
+        self._check_task_type(task_type)
+        selected = self._get_nodes_label(ref) == 1
+        if task_type == TASK_TYPE.MCut:
+            return
+        src, dst = _unique_edges(self.edge_index[0], self.edge_index[1], len(selected))
+        if task_type == TASK_TYPE.MIS:
+            selected = _mis_repair(src, dst, selected)
+        elif task_type == TASK_TYPE.MVC:
+            selected = _mvc_repair(src, dst, selected)
+        else:
+            selected = _mcl_repair(src, dst, selected, self.node_graph, len(self))
+        if ref:
+            self.ref_nodes_label = selected.astype(np.int64)
+        else:
+            self.nodes_label = selected.astype(np.int64)
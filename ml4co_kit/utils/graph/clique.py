@@ -0,0 +1,286 @@
+r"""
+Sparse complement and maximum clique models without dense adjacency matrices.
+
+The complement is never stored as an N x N matrix: ``complement_edges`` streams the
+non-edges block by block as the set difference of the CSR rows, so the working
+memory is ``block_size * N`` booleans. ``mcl_model`` builds the integer program of
+the maximum clique in O(E * d) instead of the O(N^2) of the complement formulation,
+where d is the degeneracy of the graph. A greedy clique of size L is found first and
+only nodes of core number >= L can be in a larger one. In the degeneracy order,
+every clique is contained in {v} + N+(v) of its first node v, where N+(v) are the
+later neighbors (at most d of them). The neighborhoods are peeled down to the nodes
+that can still be in a larger clique, then a root variable r_v selects the active
+neighborhood and only the non-adjacent pairs inside each N+(v) are constrained.
+"""
+
+# Copyright (c) 2024 Thinklab@SJTU
+# ML4CO-Kit is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+# http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND,
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT,
+# MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+
+
+import numpy as np
+import scipy.sparse as sp
+from typing import Iterator, Tuple
+
+
+def _symmetric_csr(u: np.ndarray, v: np.ndarray, nodes_num: int) -> sp.csr_matrix:
+    # the undirected edges (u < v, listed once) in both directions
+    rows = np.concatenate([u, v])
+    cols = np.concatenate([v, u])
+    csr = sp.csr_matrix(
+        (np.ones(shape=(len(rows),), dtype=np.int8), (rows, cols)),
+        shape=(nodes_num, nodes_num)
+    )
+    csr.sort_indices()
+    return csr
+
+
+def _neighborhood_pairs(indptr: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # all the pairs (i < j) of positions within the same row of a CSR matrix,
+    # enumerated for all the rows of the same length at once
+    sizes = np.diff(indptr)
+    first, second = [np.zeros(shape=(0,), dtype=np.int64)], [np.zeros(shape=(0,), dtype=np.int64)]
+    for size in np.unique(sizes[sizes > 1]).tolist():
+        i, j = np.triu_indices(size, k=1)
+        starts = indptr[:-1][sizes == size][:, None]
+        first.append((starts + i).reshape(-1))
+        second.append((starts + j).reshape(-1))
+    return np.concatenate(first), np.concatenate(second)
+
+
+def complement_edges(
+    u: np.ndarray, v: np.ndarray, nodes_num: int, block_size: int = 1024
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    r"""
+    Streams the undirected edges of the complement graph, block by block of rows.
+
+    :param u: np.ndarray, the sources of the undirected edges (u < v, listed once).
+    :param v: np.ndarray, the targets of the undirected edges.
+    :param nodes_num: int, the number of nodes.
+    :param block_size: int, the number of rows processed together.
+    :return: iterator of (np.ndarray, np.ndarray), the non-adjacent pairs (a < b).
+    """
+    if block_size < 1:
+        raise ValueError("``block_size`` must be positive.")
+    csr = _symmetric_csr(u, v, nodes_num)
+    cols = np.arange(nodes_num)
+    for begin in range(0, nodes_num, block_size):
+        end = min(begin + block_size, nodes_num)
+        # keep the columns after the diagonal which are not in the rows of the CSR
+        mask = cols[None, :] > np.arange(begin, end)[:, None]
+        block = csr[begin:end]
+        rows = np.repeat(np.arange(end - begin), np.diff(block.indptr))
+        mask[rows, block.indices] = False
+        a, b = np.nonzero(mask)
+        yield a + begin, b
+
+
+def degeneracy_order(
+    u: np.ndarray, v: np.ndarray, nodes_num: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    r"""
+    Peels the graph in the order of the core decomposition. Every node has at most
+    ``core[node]`` neighbors after it in the order.
+
+    :param u: np.ndarray, the sources of the undirected edges (u < v, listed once).
+    :param v: np.ndarray, the targets of the undirected edges.
+    :param nodes_num: int, the number of nodes.
+    :return: (np.ndarray, np.ndarray), the core number and the rank of each node.
+    """
+    csr = _symmetric_csr(u, v, nodes_num)
+    degree = np.diff(csr.indptr)
+    alive = np.ones(shape=(nodes_num,), dtype=bool)
+    core = np.zeros(shape=(nodes_num,), dtype=np.int64)
+    rank = np.zeros(shape=(nodes_num,), dtype=np.int64)
+    removed, k = 0, 0
+    frontier = np.zeros(shape=(0,), dtype=np.int64)
+    while removed < nodes_num:
+        if len(frontier) == 0:
+            # only raise k once no node of degree <= k is left
+            k = max(k, int(degree[alive].min()))
+            frontier = np.flatnonzero(alive & (degree <= k))
+        core[frontier] = k
+        rank[frontier] = np.arange(removed, removed + len(frontier))
+        alive[frontier] = False
+        removed += len(frontier)
+        # only the neighbors of the peeled nodes can drop to degree <= k
+        nbrs, counts = np.unique(csr[frontier].indices, return_counts=True)
+        degree[nbrs] -= counts
+        frontier = nbrs[alive[nbrs] & (degree[nbrs] <= k)]
+    return core, rank
+
+
+def greedy_clique(
+    u: np.ndarray, v: np.ndarray, nodes_num: int,
+    core: np.ndarray = None, tries: int = 32
+) -> np.ndarray:
+    r"""
+    Grows a clique from each of the ``tries`` nodes with the largest core numbers,
+    always adding the candidate with the largest core number, and keeps the largest.
+
+    :return: np.ndarray with shape (N,), the nodes label of the clique.
+    """
+    nodes_label = np.zeros(shape=(nodes_num,), dtype=np.int64)
+    if nodes_num == 0:
+        return nodes_label
+    if core is None:
+        core, _ = degeneracy_order(u, v, nodes_num)
+    csr = _symmetric_csr(u, v, nodes_num)
+    neighbors = lambda node: csr.indices[csr.indptr[node]: csr.indptr[node + 1]]
+    best = [0]
+    for start in np.argsort(-core, kind="stable")[:tries].tolist():
+        if core[start] + 1 <= len(best):
+            break
+        clique, cand = [start], neighbors(start)
+        while len(cand) > 0:
+            node = cand[np.argmax(core[cand])]
+            clique.append(node)
+            cand = np.intersect1d(cand, neighbors(node), assume_unique=True)
+        if len(clique) > len(best):
+            best = clique
+    nodes_label[best] = 1
+    return nodes_label
+
+
+def mcl_model(
+    u: np.ndarray, v: np.ndarray, nodes_num: int
+) -> Tuple[np.ndarray, sp.csr_matrix, np.ndarray, np.ndarray]:
+    r"""
+    Builds the binary program ``max sum(x), st A [x, r, y] <= b`` of the maximum
+    clique larger than a greedy one, restricted to the nodes that can be in it.
+    The complement formulation (x_a + x_b <= 1 for every non-edge) is used when it is
+    smaller than the rooted one, which is typically the case for dense graphs.
+
+    :param u: np.ndarray, the sources of the undirected edges (u < v, listed once).
+    :param v: np.ndarray, the targets of the undirected edges.
+    :param nodes_num: int, the number of nodes.
+    :return: (greedy, A, b, var_ub), the greedy clique with shape (N,), the constraints
+        over the variables [x, r, y] (the first N are the nodes) and the upper bounds of
+        the variables. ``A`` is None if the greedy clique is provably maximum.
+    """
+    core, rank = degeneracy_order(u, v, nodes_num)
+    greedy = greedy_clique(u, v, nodes_num, core=core)
+    lower_bound = int(greedy.sum())
+
+    # the members of a clique with more than ``lower_bound`` nodes
+    keep = (core >= lower_bound)[u] & (core >= lower_bound)[v]
+    u, v = u[keep], v[keep]
+    first = np.where(rank[u] < rank[v], u, v)
+    later = np.where(rank[u] < rank[v], v, u)
+    csr = sp.csr_matrix(
+        (np.ones(shape=(len(first),), dtype=np.int8), (first, later)),
+        shape=(nodes_num, nodes_num)
+    )
+    csr.sort_indices()
+    later_num = np.diff(csr.indptr)
+    roots = np.flatnonzero(later_num >= lower_bound)
+
+    # the later neighbors (one y per root v and w in N+(v)) and the pairs between them
+    sub = csr[roots]
+    owner = np.repeat(np.arange(len(roots)), np.diff(sub.indptr))
+    first_y, second_y = _neighborhood_pairs(sub.indptr)
+    a, c = sub.indices[first_y], sub.indices[second_y]
+    edge_key = np.sort(np.minimum(u, v) * nodes_num + np.maximum(u, v))
+    key = np.minimum(a, c) * nodes_num + np.maximum(a, c)
+    pos = np.minimum(np.searchsorted(edge_key, key), max(len(edge_key) - 1, 0))
+    adjacent = edge_key[pos] == key if len(edge_key) > 0 else np.zeros(len(key), bool)
+
+    # peel the neighborhoods: with root v, a larger clique needs ``lower_bound``
+    # nodes of N+(v), each adjacent to ``lower_bound - 1`` of the others
+    alive = np.ones(shape=(len(owner),), dtype=bool)
+    while True:
+        inner = adjacent & alive[first_y] & alive[second_y]
+        degree = np.bincount(first_y[inner], minlength=len(owner))
+        degree += np.bincount(second_y[inner], minlength=len(owner))
+        new_alive = alive & (degree >= lower_bound - 1)
+        root_size = np.bincount(owner[new_alive], minlength=len(roots))
+        new_alive &= (root_size >= lower_bound)[owner]
+        if (new_alive == alive).all():
+            break
+        alive = new_alive
+    root_alive = np.bincount(owner[alive], minlength=len(roots)) >= lower_bound
+    if not root_alive.any():
+        return greedy, None, None, None
+
+    # compare the sizes of the two formulations
+    y_nodes, y_owner = sub.indices[alive], owner[alive]
+    roots = roots[root_alive]
+    cand = np.unique(np.concatenate([roots, y_nodes]))
+    cand_edges_num = np.count_nonzero(np.isin(u, cand) & np.isin(v, cand))
+    complement_num = len(cand) * (len(cand) - 1) // 2 - cand_edges_num
+    conflict = ~adjacent & alive[first_y] & alive[second_y]
+    rooted_num = len(y_nodes) + np.count_nonzero(conflict)
+
+    var_ub = np.zeros(shape=(nodes_num,))
+    var_ub[cand] = 1
+    if complement_num <= rooted_num:
+        # x_a + x_b <= 1 for the non-adjacent candidates
+        local = np.full(shape=(nodes_num,), fill_value=-1, dtype=np.int64)
+        local[cand] = np.arange(len(cand))
+        inner = (local[u] >= 0) & (local[v] >= 0)
+        lu, lv = local[u[inner]], local[v[inner]]
+        pairs = list(complement_edges(np.minimum(lu, lv), np.maximum(lu, lv), len(cand)))
+        a = cand[np.concatenate([pair[0] for pair in pairs])]
+        b = cand[np.concatenate([pair[1] for pair in pairs])]
+        rows = np.repeat(np.arange(len(a)), 2)
+        A = sp.csr_matrix(
+            (np.ones(shape=(len(rows),)), (rows, np.stack([a, b], axis=1).reshape(-1))),
+            shape=(len(a), nodes_num)
+        )
+        return greedy, A, np.ones(shape=(len(a),)), var_ub
+
+    # rooted formulation over the variables [x (N), r (R), y (P)], where y_vw is
+    # x_w restricted to the neighborhood of root v
+    roots_num, y_num = len(roots), len(y_nodes)
+    root_local = np.cumsum(root_alive) - 1
+    y_local = np.cumsum(alive) - 1
+    root_var = nodes_num + np.arange(roots_num)
+    y_var = nodes_num + roots_num + np.arange(y_num)
+    y_root = root_var[root_local[y_owner]]
+    
+    # only one root is active: sum(r) <= 1
+    cover_row = np.full(shape=(nodes_num,), fill_value=-1, dtype=np.int64)
+    cover_row[cand] = 1 + np.arange(len(cand))
+    rows = [np.zeros(shape=(roots_num,), dtype=np.int64)]
+    cols = [root_var]
+    data = [np.ones(shape=(roots_num,))]
+
+    # a node is selected only inside the active neighborhood: x_w - r_w - sum_v y_vw <= 0
+    rows.append(cover_row[np.concatenate([cand, roots, y_nodes])])
+    cols.append(np.concatenate([cand, root_var, y_var]))
+    data.append(np.concatenate([
+        np.ones(shape=(len(cand),)), -np.ones(shape=(roots_num + y_num,))
+    ]))
+
+    # y_vw - r_v <= 0
+    link_rows = 1 + len(cand) + np.arange(y_num)
+    rows.append(np.concatenate([link_rows, link_rows]))
+    cols.append(np.concatenate([y_var, y_root]))
+    data.append(np.concatenate([np.ones(shape=(y_num,)), -np.ones(shape=(y_num,))]))
+
+    # y_va + y_vb - r_v <= 0 for the non-adjacent pairs (a, b) in N+(v)
+    conflict_rows = 1 + len(cand) + y_num + np.arange(np.count_nonzero(conflict))
+    first_y, second_y = y_local[first_y[conflict]], y_local[second_y[conflict]]
+    rows.append(np.concatenate([conflict_rows, conflict_rows, conflict_rows]))
+    cols.append(np.concatenate([
+        y_var[first_y], y_var[second_y], y_root[first_y]
+    ]))
+    data.append(np.concatenate([
+        np.ones(shape=(2 * len(first_y),)), -np.ones(shape=(len(first_y),))
+    ]))
+
+    rows_num = 1 + len(cand) + y_num + len(conflict_rows)
+    A = sp.csr_matrix(
+        (np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+        shape=(rows_num, nodes_num + roots_num + y_num)
+    )
+    b = np.zeros(shape=(rows_num,))
+    b[0] = 1
+    var_ub = np.concatenate([var_ub, np.ones(shape=(roots_num + y_num,))])
+    return greedy, A, b, var_ub
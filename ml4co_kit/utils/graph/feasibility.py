@@ -0,0 +1,261 @@
+r"""
+Vectorized feasibility validation and greedy repair for graph problems (MIS, MVC, MCl).
+
+The validators report the violated constraints of a solution in O(E). The repair
+functions greedily fix infeasible solutions: conflicting nodes are dropped for MIS,
+uncovered endpoints are added for MVC and non-adjacent members are pruned for MCl.
+MIS and MVC are repaired in rounds where every node whose (violation degree, id)
+is a local maximum among its violating neighbors is flipped at once, which is
+the parallel form of the max-degree greedy and costs O(E) per round. All the
+``batch_*`` variants run on the concatenation of many graphs at once.
+"""
+
+# Copyright (c) 2024 Thinklab@SJTU
+# ML4CO-Kit is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+# http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND,
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT,
+# MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+
+
+import numpy as np
+from typing import List, Tuple
+from ml4co_kit.utils.graph.evaluate import _concat_graphs
+
+
+def _unique_edges(src: np.ndarray, dst: np.ndarray, nodes_num: int) -> Tuple[np.ndarray, np.ndarray]:
+    # drop self-loops and keep every undirected edge once as (min, max)
+    mask = src != dst
+    low = np.minimum(src[mask], dst[mask])
+    high = np.maximum(src[mask], dst[mask])
+    key = np.unique(low * max(nodes_num, 1) + high)
+    return key // max(nodes_num, 1), key % max(nodes_num, 1)
+
+
+def _prepare(
+    edge_index: List[np.ndarray], nodes_label: List[np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    cat_edge_index, selected, _, _, node_graph = _concat_graphs(edge_index, nodes_label)
+    src, dst = _unique_edges(cat_edge_index[0], cat_edge_index[1], len(selected))
+    nodes_num = np.array([len(label) for label in nodes_label], dtype=np.int64)
+    return src, dst, selected, node_graph, nodes_num
+
+
+def _split(selected: np.ndarray, nodes_num: np.ndarray) -> List[np.ndarray]:
+    return np.split(selected.astype(np.int64), np.cumsum(nodes_num)[:-1])
+
+
+def _local_max_flip(src: np.ndarray, dst: np.ndarray, nodes_num: int) -> np.ndarray:
+    # nodes whose (degree, id) is larger than that of all neighbors in (src, dst)
+    degree = np.bincount(src, minlength=nodes_num) + np.bincount(dst, minlength=nodes_num)
+    key = degree * nodes_num + np.arange(nodes_num, dtype=np.int64)
+    nbr_max = np.zeros(shape=(nodes_num,), dtype=np.int64)
+    np.maximum.at(nbr_max, src, key[dst])
+    np.maximum.at(nbr_max, dst, key[src])
+    return (degree > 0) & (key > nbr_max)
+
+
+def _mis_repair(src: np.ndarray, dst: np.ndarray, selected: np.ndarray) -> np.ndarray:
+    selected = selected.copy()
+    while True:
+        # nodes only leave the set, so non-conflicting edges never conflict again
+        conflict = selected[src] & selected[dst]
+        if not conflict.any():
+            return selected
+        src, dst = src[conflict], dst[conflict]
+        selected[_local_max_flip(src, dst, len(selected))] = False
+
+
+def _mvc_repair(src: np.ndarray, dst: np.ndarray, selected: np.ndarray) -> np.ndarray:
+    selected = selected.copy()
+    while True:
+        # nodes only join the set, so covered edges stay covered
+        uncovered = ~selected[src] & ~selected[dst]
+        if not uncovered.any():
+            return selected
+        src, dst = src[uncovered], dst[uncovered]
+        selected[_local_max_flip(src, dst, len(selected))] = True
+
+
+def _mcl_missing(
+    src: np.ndarray, dst: np.ndarray, selected: np.ndarray,
+    node_graph: np.ndarray, graphs_num: int
+) -> np.ndarray:
+    # number of other members each selected node is not adjacent to
+    nodes_num = len(selected)
+    inner = selected[src] & selected[dst]
+    inner_degree = np.bincount(src[inner], minlength=nodes_num)
+    inner_degree += np.bincount(dst[inner], minlength=nodes_num)
+    sel_nodes_num = np.bincount(node_graph[selected], minlength=graphs_num)
+    missing = sel_nodes_num[node_graph] - 1 - inner_degree
+    return np.where(selected, missing, -1)
+
+
+def _mcl_repair(
+    src: np.ndarray, dst: np.ndarray, selected: np.ndarray,
+    node_graph: np.ndarray, graphs_num: int
+) -> np.ndarray:
+    selected = selected.copy()
+    while True:
+        # members only leave the clique, so edges leaving it can be dropped
+        inner = selected[src] & selected[dst]
+        src, dst = src[inner], dst[inner]
+        missing = _mcl_missing(src, dst, selected, node_graph, graphs_num)
+        graph_max = np.full(shape=(graphs_num,), fill_value=-1, dtype=np.int64)
+        np.maximum.at(graph_max, node_graph, missing)
+        if np.all(graph_max <= 0):
+            return selected
+
+        # drop the member with the most non-adjacent members in each graph
+        candidate = np.flatnonzero(
+            (missing == graph_max[node_graph]) & (graph_max[node_graph] > 0)
+        )
+        _, first = np.unique(node_graph[candidate], return_index=True)
+        selected[candidate[first]] = False
+
+
+###############################################
+#                 Validation                  #
+###############################################
+
+def mis_violations(edge_index: np.ndarray, nodes_label: np.ndarray) -> np.ndarray:
+    r"""
+    Finds the edges whose endpoints are both selected.
+    :param edge_index: np.ndarray, the edges with shape (2, E).
+    :param nodes_label: np.ndarray, the selected nodes with shape (N,).
+    :return: np.ndarray with shape (2, K), the conflicting undirected edges.
+    """
+    src, dst, selected, _, _ = _prepare([edge_index], [nodes_label])
+    conflict = selected[src] & selected[dst]
+    return np.stack([src[conflict], dst[conflict]], axis=0)
+
+
+def mvc_violations(edge_index: np.ndarray, nodes_label: np.ndarray) -> np.ndarray:
+    r"""
+    Finds the edges that have no selected endpoint.
+    :param edge_index: np.ndarray, the edges with shape (2, E).
+    :param nodes_label: np.ndarray, the selected nodes with shape (N,).
+    :return: np.ndarray with shape (2, K), the uncovered undirected edges.
+    """
+    src, dst, selected, _, _ = _prepare([edge_index], [nodes_label])
+    uncovered = ~selected[src] & ~selected[dst]
+    return np.stack([src[uncovered], dst[uncovered]], axis=0)
+
+
+def mcl_violations(edge_index: np.ndarray, nodes_label: np.ndarray) -> np.ndarray:
+    r"""
+    Finds the selected nodes that are not adjacent to every other selected node.
+    :param edge_index: np.ndarray, the edges with shape (2, E).
+    :param nodes_label: np.ndarray, the selected nodes with shape (N,).
+    :return: np.ndarray with shape (K,), the violating nodes.
+    """
+    src, dst, selected, node_graph, _ = _prepare([edge_index], [nodes_label])
+    missing = _mcl_missing(src, dst, selected, node_graph, 1)
+    return np.flatnonzero(missing > 0)
+
+
+def batch_mis_violations(
+    edge_index: List[np.ndarray], nodes_label: List[np.ndarray]
+) -> np.ndarray:
+    r"""
+    Counts the conflicting undirected edges of each graph.
+    """
+    src, dst, selected, node_graph, _ = _prepare(edge_index, nodes_label)
+    conflict = selected[src] & selected[dst]
+    return np.bincount(node_graph[src[conflict]], minlength=len(edge_index))
+
+
+def batch_mvc_violations(
+    edge_index: List[np.ndarray], nodes_label: List[np.ndarray]
+) -> np.ndarray:
+    r"""
+    Counts the uncovered undirected edges of each graph.
+    """
+    src, dst, selected, node_graph, _ = _prepare(edge_index, nodes_label)
+    uncovered = ~selected[src] & ~selected[dst]
+    return np.bincount(node_graph[src[uncovered]], minlength=len(edge_index))
+
+
+def batch_mcl_violations(
+    edge_index: List[np.ndarray], nodes_label: List[np.ndarray]
+) -> np.ndarray:
+    r"""
+    Counts the non-adjacent pairs of selected nodes of each graph.
+    """
+    src, dst, selected, node_graph, _ = _prepare(edge_index, nodes_label)
+    graphs_num = len(edge_index)
+    missing = _mcl_missing(src, dst, selected, node_graph, graphs_num)
+    return np.bincount(
+        node_graph, weights=np.maximum(missing, 0), minlength=graphs_num
+    ).astype(np.int64) // 2
+
+
+###############################################
+#                   Repair                    #
+###############################################
+
+def mis_repair(edge_index: np.ndarray, nodes_label: np.ndarray) -> np.ndarray:
+    r"""
+    Greedily drops conflicting nodes (highest conflict degree first) until the
+    selected nodes form an independent set.
+    :param edge_index: np.ndarray, the edges with shape (2, E).
+    :param nodes_label: np.ndarray, the selected nodes with shape (N,).
+    :return: np.ndarray with shape (N,), the repaired nodes label.
+    """
+    return batch_mis_repair([edge_index], [nodes_label])[0]
+
+
+def mvc_repair(edge_index: np.ndarray, nodes_label: np.ndarray) -> np.ndarray:
+    r"""
+    Greedily adds endpoints of uncovered edges (highest uncovered degree first)
+    until the selected nodes form a vertex cover.
+    :param edge_index: np.ndarray, the edges with shape (2, E).
+    :param nodes_label: np.ndarray, the selected nodes with shape (N,).
+    :return: np.ndarray with shape (N,), the repaired nodes label.
+    """
+    return batch_mvc_repair([edge_index], [nodes_label])[0]
+
+
+def mcl_repair(edge_index: np.ndarray, nodes_label: np.ndarray) -> np.ndarray:
+    r"""
+    Greedily prunes the member with the most non-adjacent members until the
+    selected nodes form a clique.
+    :param edge_index: np.ndarray, the edges with shape (2, E).
+    :param nodes_label: np.ndarray, the selected nodes with shape (N,).
+    :return: np.ndarray with shape (N,), the repaired nodes label.
+    """
+    return batch_mcl_repair([edge_index], [nodes_label])[0]
+
+
+def batch_mis_repair(
+    edge_index: List[np.ndarray], nodes_label: List[np.ndarray]
+) -> List[np.ndarray]:
+    r"""
+    Batched version of ``mis_repair``.
+    """
+    src, dst, selected, _, nodes_num = _prepare(edge_index, nodes_label)
+    return _split(_mis_repair(src, dst, selected), nodes_num)
+
+
+def batch_mvc_repair(
+    edge_index: List[np.ndarray], nodes_label: List[np.ndarray]
+) -> List[np.ndarray]:
+    r"""
+    Batched version of ``mvc_repair``.
+    """
+    src, dst, selected, _, nodes_num = _prepare(edge_index, nodes_label)
+    return _split(_mvc_repair(src, dst, selected), nodes_num)
+
+
+def batch_mcl_repair(
+    edge_index: List[np.ndarray], nodes_label: List[np.ndarray]
+) -> List[np.ndarray]:
+    r"""
+    Batched version of ``mcl_repair``.
+    """
+    src, dst, selected, node_graph, nodes_num = _prepare(edge_index, nodes_label)
+    selected = _mcl_repair(src, dst, selected, node_graph, len(edge_index))
+    return _split(selected, nodes_num)
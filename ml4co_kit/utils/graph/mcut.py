@@ -1,7 +1,8 @@
 import pickle
 import numpy as np
 import networkx as nx
-from ml4co_kit.utils.graph.base import GraphData, np_sparse_to_dense
+from ml4co_kit.utils.graph.base import GraphData
+from ml4co_kit.utils.graph.evaluate import mcut_cut_value
 
 
 class MCutGraphData(GraphData):
@@ -69,18 +70,11 @@ class MCutGraphData(GraphData):
                     "``cut_edge_num`` cannot be None! You can use solvers based on "
                     "``MCutSolver``like ``KaMIS`` to get the ``cut_edge_num``."
                 )
-            adj_matrix = np_sparse_to_dense(nodes_num=self.nodes_num, edge_index=self.edge_index)
-            self.cut_edge_num = 0
-            set_A, set_B = [], []
-            for node, label in enumerate(self.nodes_label):
-                if label == 1:
-                    set_A.append(node)
-                else:
-                    set_B.append(node)
-            for i in set_A:
-                for j in set_B:
-                    if adj_matrix[i, j] == 1:
-                        self.cut_edge_num += 1
+            self.cut_edge_num = mcut_cut_value(
+                edge_index=self.edge_index, 
+                nodes_label=self.nodes_label, 
+                edge_attr=self.edge_attr
+            )
     
         # ground truth
         if calculate_gap:
@@ -90,18 +84,11 @@ class MCutGraphData(GraphData):
                         "``ref_cut_edge_num`` cannot be None! You can use solvers based on "
                         "``MCutSolver``like ``KaMIS`` to get the ``ref_cut_edge_num``."
                     )
-                adj_matrix = np_sparse_to_dense(nodes_num=self.nodes_num, edge_index=self.edge_index)
-                self.ref_cut_edge_num = 0
-                set_A, set_B = [], []
-                for node, label in enumerate(self.ref_nodes_label):
-                    if label == 1:
-                        set_A.append(node)
-                    else:
-                        set_B.append(node)
-                for i in set_A:
-                    for j in set_B:
-                        if adj_matrix[i, j] == 1:
-                            self.ref_cut_edge_num += 1
+                self.ref_cut_edge_num = mcut_cut_value(
+                    edge_index=self.edge_index, 
+                    nodes_label=self.ref_nodes_label, 
+                    edge_attr=self.edge_attr
+                )
             gap = - (self.cut_edge_num - self.ref_cut_edge_num) / self.ref_cut_edge_num * 100
             return (self.cut_edge_num, self.ref_cut_edge_num, gap)
         else:
@@ -2,6 +2,7 @@ import pickle
 import numpy as np
 import networkx as nx
 from ml4co_kit.utils.graph.base import GraphData
+from ml4co_kit.utils.graph.feasibility import mis_violations, mis_repair
 
 
 class MISGraphData(GraphData):
@@ -61,6 +62,24 @@ class MISGraphData(GraphData):
                 self.nodes_label = nodes_label
             self._check_nodes_label(ref=ref)
         
+    def validate(self, ref: bool = False) -> np.ndarray:
+        r"""
+        Returns the conflicting edges of the (reference) solution.
+        """
+        nodes_label = self.ref_nodes_label if ref else self.nodes_label
+        return mis_violations(edge_index=self.edge_index, nodes_label=nodes_label)
+    
+    def repair(self, ref: bool = False):
+        r"""
+        Greedily repairs the (reference) solution if it is infeasible.
+        """
+        if ref:
+            self.ref_nodes_label = mis_repair(self.edge_index, self.ref_nodes_label)
+            self.ref_sel_nodes_num = None
+        else:
+            self.nodes_label = mis_repair(self.edge_index, self.nodes_label)
+            self.sel_nodes_num = None
+    
     def evaluate(self, calculate_gap: bool = False):
         # solved solution
         if self.sel_nodes_num is None:
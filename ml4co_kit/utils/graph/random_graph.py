@@ -0,0 +1,226 @@
+r"""
+NumPy random graph models (Erdos-Renyi, Barabasi-Albert, Holme-Kim, Watts-Strogatz).
+
+The generators follow the ``networkx`` constructions, so the graphs have the same
+distributions, but they draw from an ``np.random.Generator`` and return the undirected
+edges directly as an array of shape (E, 2) instead of building ``networkx`` graphs.
+Sparse ER graphs are sampled by geometric skipping over the node pairs in O(N + E),
+dense ones by a single vectorized Bernoulli draw over the upper triangle. The
+preferential attachment models keep the degree-weighted node list in a preallocated
+array, and Watts-Strogatz only visits the edges selected for rewiring.
+"""
+
+# Copyright (c) 2024 Thinklab@SJTU
+# ML4CO-Kit is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+# http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND,
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT,
+# MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+
+
+import numpy as np
+from typing import List
+
+
+def _triu_pairs(idx: np.ndarray, nodes_num: int) -> np.ndarray:
+    # maps row-major indices of the strict upper triangle to the node pairs (u, v)
+    idx = np.asarray(idx, dtype=np.int64)
+    b = 2 * nodes_num - 1
+    offset = lambda row: row * (b - row) // 2
+    u = np.floor((b - np.sqrt(b * b - 8.0 * idx)) / 2).astype(np.int64)
+    # correct the rounding errors of the square root
+    u = np.where(offset(u) > idx, u - 1, u)
+    u = np.where(offset(u + 1) <= idx, u + 1, u)
+    v = idx - offset(u) + u + 1
+    return np.stack([u, v], axis=1)
+
+
+def _random_subset(seq: np.ndarray, m: int, rng: np.random.Generator) -> np.ndarray:
+    # ``m`` distinct elements of ``seq``, each drawn uniformly (so with the multiplicity
+    # of the element in ``seq``), in random order
+    targets = np.unique(seq[rng.integers(0, len(seq), size=m)])
+    while len(targets) < m:
+        more = seq[rng.integers(0, len(seq), size=m - len(targets))]
+        targets = np.unique(np.concatenate([targets, more]))
+    return rng.permutation(targets)
+
+
+def _adj_to_edges(adj: List[set]) -> np.ndarray:
+    edges = [(u, v) for u, nbrs in enumerate(adj) for v in nbrs if u < v]
+    return np.array(edges, dtype=np.int64).reshape(-1, 2)
+
+
+def erdos_renyi_edges(
+    nodes_num: int, prob: float, rng: np.random.Generator, sparse_threshold: float = 0.1
+) -> np.ndarray:
+    r"""
+    Samples a G(n, p) graph.
+
+    :param nodes_num: int, the number of nodes.
+    :param prob: float, the probability of each edge.
+    :param rng: np.random.Generator, the random generator.
+    :param sparse_threshold: float, below this probability the edges are sampled by
+        geometric skipping instead of one Bernoulli draw per node pair.
+    :return: np.ndarray with shape (E, 2), the undirected edges (u < v).
+    """
+    pairs_num = nodes_num * (nodes_num - 1) // 2
+    if prob <= 0 or pairs_num <= 0:
+        return np.zeros(shape=(0, 2), dtype=np.int64)
+    if prob >= 1:
+        idx = np.arange(pairs_num)
+    elif prob < sparse_threshold:
+        # the gaps between consecutive edges are geometric
+        expected = pairs_num * prob
+        size = int(expected + 5 * np.sqrt(expected) + 10)
+        idx = np.cumsum(rng.geometric(prob, size=size)) - 1
+        while idx[-1] < pairs_num:
+            idx = np.concatenate([idx, idx[-1] + np.cumsum(rng.geometric(prob, size=size))])
+        idx = idx[idx < pairs_num]
+    else:
+        idx = np.flatnonzero(rng.random(pairs_num) < prob)
+    return _triu_pairs(idx, nodes_num)
+
+
+def barabasi_albert_edges(
+    nodes_num: int, conn_degree: int, rng: np.random.Generator
+) -> np.ndarray:
+    r"""
+    Samples a Barabasi-Albert preferential attachment graph, starting from a star
+    graph on ``conn_degree + 1`` nodes.
+
+    :param nodes_num: int, the number of nodes.
+    :param conn_degree: int, the number of edges from each new node to existing nodes.
+    :param rng: np.random.Generator, the random generator.
+    :return: np.ndarray with shape (E, 2), the undirected edges.
+    """
+    m = conn_degree
+    if m < 1 or m >= nodes_num:
+        raise ValueError(
+            f"Barabasi-Albert graphs must have 1 <= conn_degree < nodes_num, "
+            f"but got conn_degree={m} and nodes_num={nodes_num}."
+        )
+    edges = np.empty(shape=(m * (nodes_num - m), 2), dtype=np.int64)
+    edges[:m, 0] = 0
+    edges[:m, 1] = np.arange(1, m + 1)
+
+    # every node appears once per incident edge
+    repeated = np.empty(shape=(2 * len(edges),), dtype=np.int64)
+    repeated[:m] = 0
+    repeated[m: 2 * m] = np.arange(1, m + 1)
+    size = 2 * m
+    for source in range(m + 1, nodes_num):
+        targets = _random_subset(repeated[:size], m, rng)
+        begin = (source - m) * m
+        edges[begin: begin + m, 0] = source
+        edges[begin: begin + m, 1] = targets
+        repeated[size: size + m] = targets
+        repeated[size + m: size + 2 * m] = source
+        size += 2 * m
+    return edges
+
+
+def holme_kim_edges(
+    nodes_num: int, conn_degree: int, prob: float, rng: np.random.Generator
+) -> np.ndarray:
+    r"""
+    Samples a Holme-Kim graph (preferential attachment with triad formation).
+
+    :param nodes_num: int, the number of nodes.
+    :param conn_degree: int, the number of edges from each new node to existing nodes.
+    :param prob: float, the probability of adding a triangle after each new edge.
+    :param rng: np.random.Generator, the random generator.
+    :return: np.ndarray with shape (E, 2), the undirected edges.
+    """
+    m = conn_degree
+    if m < 1 or nodes_num < m:
+        raise ValueError(
+            f"Holme-Kim graphs must have 1 <= conn_degree <= nodes_num, "
+            f"but got conn_degree={m} and nodes_num={nodes_num}."
+        )
+    if prob < 0 or prob > 1:
+        raise ValueError(f"``prob`` must be in [0, 1], but got {prob}.")
+    adj = [set() for _ in range(nodes_num)]
+    repeated = np.empty(shape=(m + 2 * m * (nodes_num - m),), dtype=np.int64)
+    repeated[:m] = np.arange(m)
+    size = m
+    for source in range(m, nodes_num):
+        targets = _random_subset(repeated[:size], m, rng).tolist()
+        triads = (rng.random(m - 1) < prob).tolist()
+        target = targets.pop()
+        adj[source].add(target)
+        adj[target].add(source)
+        repeated[size] = target
+        size += 1
+        for count in range(1, m):
+            if triads[count - 1]:
+                # clustering step: close a triangle with a neighbor of the last target
+                nbrs = [
+                    nbr for nbr in adj[target] if nbr != source and nbr not in adj[source]
+                ]
+                if nbrs:
+                    nbr = nbrs[rng.integers(len(nbrs))]
+                    adj[source].add(nbr)
+                    adj[nbr].add(source)
+                    repeated[size] = nbr
+                    size += 1
+                    continue
+            # preferential attachment step
+            target = targets.pop()
+            adj[source].add(target)
+            adj[target].add(source)
+            repeated[size] = target
+            size += 1
+        repeated[size: size + m] = source
+        size += m
+    return _adj_to_edges(adj)
+
+
+def watts_strogatz_edges(
+    nodes_num: int, ring_neighbors: int, prob: float, rng: np.random.Generator
+) -> np.ndarray:
+    r"""
+    Samples a Watts-Strogatz small-world graph: a ring lattice where every node is
+    joined to its ``ring_neighbors // 2`` neighbors on each side, whose edges are
+    rewired to random nodes with probability ``prob``.
+
+    :param nodes_num: int, the number of nodes.
+    :param ring_neighbors: int, the number of nearest neighbors in the ring lattice.
+    :param prob: float, the probability of rewiring each edge.
+    :param rng: np.random.Generator, the random generator.
+    :return: np.ndarray with shape (E, 2), the undirected edges.
+    """
+    k = ring_neighbors
+    if k > nodes_num:
+        raise ValueError(
+            f"Watts-Strogatz graphs must have ring_neighbors <= nodes_num, "
+            f"but got ring_neighbors={k} and nodes_num={nodes_num}."
+        )
+    if k == nodes_num:
+        return _triu_pairs(np.arange(nodes_num * (nodes_num - 1) // 2), nodes_num)
+
+    # ring lattice
+    nodes = np.arange(nodes_num)
+    adj = [set() for _ in range(nodes_num)]
+    for j in range(1, k // 2 + 1):
+        for u, v in zip(nodes.tolist(), np.roll(nodes, -j).tolist()):
+            adj[u].add(v)
+            adj[v].add(u)
+
+    # rewire the edges (u, u + j) in the order of j, then u
+    rewire = np.flatnonzero(rng.random(nodes_num * (k // 2)) < prob)
+    for j, u in zip((rewire // nodes_num + 1).tolist(), (rewire % nodes_num).tolist()):
+        v = (u + j) % nodes_num
+        if len(adj[u]) >= nodes_num - 1:
+            # no self-loops or multiple edges are allowed
+            continue
+        w = int(rng.integers(nodes_num))
+        while w == u or w in adj[u]:
+            w = int(rng.integers(nodes_num))
+        adj[u].remove(v)
+        adj[v].remove(u)
+        adj[u].add(w)
+        adj[w].add(u)
+    return _adj_to_edges(adj)
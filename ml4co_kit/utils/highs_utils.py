@@ -0,0 +1,112 @@
+r"""
+The utilities used by the HiGHS solvers (``scipy.optimize.milp`` / ``linprog``).
+
+The models are built directly as sparse constraint matrices and solved in-process,
+so no license is needed, and batches are spread over a process pool where only
+the instance arrays (not the solver objects) are sent to the workers.
+"""
+
+# Copyright (c) 2024 Thinklab@SJTU
+# ML4CO-Kit is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+# http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND,
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT,
+# MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+
+
+import numpy as np
+import scipy.sparse as sp
+from multiprocessing import Pool
+from typing import Callable, List, Tuple, Any
+from scipy.optimize import milp, Bounds, LinearConstraint
+from ml4co_kit.utils.time_utils import iterative_execution_for_file
+from ml4co_kit.utils.graph.base import edge_incidence_matrix
+from ml4co_kit.utils.graph.feasibility import mis_repair, mvc_repair
+
+
+def _apply(item: Tuple[Callable, tuple]) -> Any:
+    func, args = item
+    return func(*args)
+
+
+def highs_batch_map(
+    func: Callable, args_list: List[tuple], num_threads: int = 1,
+    desc: str = "Running", show_time: bool = False
+) -> List[Any]:
+    r"""
+    Applies ``func`` to every argument tuple, across ``num_threads`` processes.
+    :param func: callable, a module-level function (so that it can be pickled).
+    :param args_list: list of tuple, the arguments of each call.
+    :param num_threads: int, the number of processes.
+    :param desc: string, the descriptive text for the progress bar.
+    :param show_time: boolean, whether to display a progress bar.
+    """
+    items = [(func, args) for args in args_list]
+    if num_threads == 1:
+        return [_apply(item) for item in iterative_execution_for_file(items, desc, show_time)]
+    with Pool(num_threads) as pool:
+        results = pool.imap(_apply, items)
+        return list(iterative_execution_for_file(results, desc, show_time))
+
+
+def highs_solve_milp(
+    c: np.ndarray,
+    A: sp.csr_matrix,
+    lb: np.ndarray,
+    ub: np.ndarray,
+    integrality: np.ndarray,
+    var_lb: np.ndarray,
+    var_ub: np.ndarray,
+    time_limit: float = 60.0
+) -> np.ndarray:
+    r"""
+    Solves ``min cx, st lb <= Ax <= ub, var_lb <= x <= var_ub`` with HiGHS.
+    :return: np.ndarray, the best solution found within ``time_limit``, or None if
+        HiGHS found no feasible solution in time.
+    """
+    constraints = LinearConstraint(A, lb, ub) if A.shape[0] > 0 else None
+    result = milp(
+        c=c,
+        integrality=integrality,
+        bounds=Bounds(var_lb, var_ub),
+        constraints=constraints,
+        options={"disp": False, "time_limit": time_limit},
+    )
+    return result.x
+
+
+def highs_solve_binary_edge_model(
+    u: np.ndarray, v: np.ndarray, nodes_num: int, cover: bool, time_limit: float = 60.0
+) -> np.ndarray:
+    r"""
+    Solves the binary program over the nodes with one constraint per undirected edge
+    (u, v), which must be listed once and without self-loops:
+    ``min sum(x), st x_u + x_v >= 1`` if ``cover`` (MVC) else
+    ``max sum(x), st x_u + x_v <= 1`` (MIS).
+    The incumbent of HiGHS is compared with the greedy repair of the empty (MVC) or
+    full (MIS) node set, which is often better when ``time_limit`` is short, and the
+    better one is returned.
+    """
+    A = edge_incidence_matrix(u, v, nodes_num)
+    if cover:
+        c, lb, ub = np.ones(nodes_num), np.ones(len(u)), np.full(len(u), np.inf)
+    else:
+        c, lb, ub = -np.ones(nodes_num), np.full(len(u), -np.inf), np.ones(len(u))
+    x = highs_solve_milp(
+        c=c, A=A, lb=lb, ub=ub, integrality=np.ones(nodes_num),
+        var_lb=np.zeros(nodes_num), var_ub=np.ones(nodes_num), time_limit=time_limit
+    )
+    edge_index = np.stack([u, v], axis=0)
+    if cover:
+        greedy = mvc_repair(edge_index, np.zeros(nodes_num, dtype=bool))
+    else:
+        greedy = mis_repair(edge_index, np.ones(nodes_num, dtype=bool))
+    if x is None:
+        return greedy
+    x = np.round(x).astype(np.int64)
+    if (x.sum() > greedy.sum()) == cover:
+        return greedy
+    return x
@@ -0,0 +1,151 @@
+r"""
+k-nearest-neighbor graphs of (batches of) point sets, without torch.
+
+For small instances the exact distances are computed in blocks of ``chunk_size`` rows
+(or of several whole instances) and the neighbors are selected by a partial sort, so
+the extra memory is O(chunk_size * N) per task. From ``tree_threshold`` nodes on, a
+spatial index (``scipy.spatial.cKDTree``) is queried instead, which is O(N log N). The instances
+(and the row blocks) are spread over a thread pool; the heavy numpy and scipy calls
+release the GIL. The output follows the layout of ``np_dense_to_sparse``.
+"""
+
+# Copyright (c) 2024 Thinklab@SJTU
+# ML4CO-Kit is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+# http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND,
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT,
+# MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+
+
+import numpy as np
+from typing import Tuple
+from scipy.spatial import cKDTree
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _knn_block(
+    points: np.ndarray, begin: int, end: int, sparse_factor: int, self_loop: bool
+) -> Tuple[np.ndarray, np.ndarray]:
+    # exact neighbors of the rows [begin, end) of the instances with shape (b, N, D),
+    # selected by the squared distances
+    diff = points[:, begin:end, None, :] - points[:, None, :, :]
+    dists = np.einsum("bijk,bijk->bij", diff, diff)
+    rows = np.arange(end - begin)
+    dists[:, rows, begin + rows] = -1 if self_loop else np.inf
+    part = np.argpartition(dists, sparse_factor - 1, axis=-1)[..., :sparse_factor]
+    part_dists = np.take_along_axis(dists, part, axis=-1)
+    order = np.argsort(part_dists, axis=-1, kind="stable")
+    idx_knn = np.take_along_axis(part, order, axis=-1)
+    knn_dists = np.take_along_axis(part_dists, order, axis=-1)
+    return idx_knn, np.sqrt(np.maximum(knn_dists, 0))
+
+
+def _knn_tree(
+    points: np.ndarray, sparse_factor: int, self_loop: bool, workers: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    # neighbors of one instance from a KD-tree
+    nodes_num = points.shape[0]
+    k = sparse_factor if self_loop else min(sparse_factor + 1, nodes_num)
+    knn_dists, idx_knn = cKDTree(points).query(points, k=k, workers=workers)
+    knn_dists, idx_knn = knn_dists.reshape(nodes_num, k), idx_knn.reshape(nodes_num, k)
+    # put the node itself first (or drop it), even if it has duplicates
+    nodes = np.arange(nodes_num)
+    is_self = idx_knn == nodes[:, None]
+    missing = ~is_self.any(axis=1)
+    if self_loop:
+        # a duplicate point may have taken the place of the node itself
+        idx_knn[missing, -1], knn_dists[missing, -1] = nodes[missing], 0
+        is_self[missing, -1] = True
+        order = np.argsort(~is_self, axis=1, kind="stable")
+    else:
+        is_self[missing, -1] = True
+        order = np.argsort(is_self, axis=1, kind="stable")[:, :sparse_factor]
+    idx_knn = np.take_along_axis(idx_knn, order, axis=1)
+    return idx_knn, np.take_along_axis(knn_dists, order, axis=1)
+
+
+def knn_graph(
+    points: np.ndarray,
+    sparse_factor: int,
+    self_loop: bool = True,
+    chunk_size: int = 512,
+    tree_threshold: int = 100,
+    num_threads: int = 1
+) -> Tuple[np.ndarray, np.ndarray]:
+    r"""
+    Builds the k-nearest-neighbor graph (Euclidean distance) of each point set.
+
+    :param points: np.ndarray, the coordinates with shape (N, D) or (B, N, D).
+    :param sparse_factor: int, the number of neighbors of each node.
+    :param self_loop: boolean, whether each node is counted as its own (first)
+        nearest neighbor, as in ``sklearn.neighbors.KDTree.query``.
+    :param chunk_size: int, the number of rows whose distances are computed together.
+    :param tree_threshold: int, the number of nodes from which a KD-tree is used.
+    :param num_threads: int, the number of threads.
+    :return: (edge_index, edge_attr), the edges with shape (2, N * sparse_factor) and
+        their lengths with shape (N * sparse_factor,), or with shapes
+        (B, 2, N * sparse_factor) and (B, N * sparse_factor) for a batch. The edges
+        of each node are consecutive and ordered by length.
+    """
+    points = np.asarray(points)
+    batched = points.ndim == 3
+    if not batched:
+        points = points[None]
+    if points.ndim != 3:
+        raise ValueError("``points`` must have shape (N, D) or (B, N, D).")
+    if chunk_size < 1 or num_threads < 1:
+        raise ValueError("``chunk_size`` and ``num_threads`` must be positive.")
+    batch_size, nodes_num, _ = points.shape
+    max_factor = nodes_num if self_loop else nodes_num - 1
+    if sparse_factor < 1 or sparse_factor > max_factor:
+        raise ValueError(
+            f"``sparse_factor`` must be in [1, {max_factor}], but got {sparse_factor}."
+        )
+
+    idx_knn = np.empty(shape=(batch_size, nodes_num, sparse_factor), dtype=np.int64)
+    knn_dists = np.empty(shape=(batch_size, nodes_num, sparse_factor))
+    if nodes_num >= tree_threshold:
+        # one tree per instance, spread over the threads (or, for fewer instances
+        # than threads, the queries of each instance are)
+        workers = 1 if batch_size >= num_threads else num_threads
+        def _run_tree(idx: int):
+            idx_knn[idx], knn_dists[idx] = _knn_tree(
+                points[idx], sparse_factor, self_loop, workers
+            )
+        if workers > 1 or num_threads == 1:
+            for idx in range(batch_size):
+                _run_tree(idx)
+        else:
+            with ThreadPoolExecutor(num_threads) as executor:
+                list(executor.map(_run_tree, range(batch_size)))
+    else:
+        # whole instances are grouped while a task has at most chunk_size * N pairs
+        insts_num = max(1, chunk_size // nodes_num)
+        tasks = [
+            (idx, min(idx + insts_num, batch_size), begin, min(begin + chunk_size, nodes_num))
+            for idx in range(0, batch_size, insts_num)
+            for begin in range(0, nodes_num, chunk_size)
+        ]
+        def _run(task: Tuple[int, int, int, int]):
+            first, last, begin, end = task
+            idx_knn[first:last, begin:end], knn_dists[first:last, begin:end] = _knn_block(
+                points[first:last], begin, end, sparse_factor, self_loop
+            )
+        if num_threads == 1:
+            for task in tasks:
+                _run(task)
+        else:
+            with ThreadPoolExecutor(num_threads) as executor:
+                list(executor.map(_run, tasks))
+
+    # edge_index && edge_attr
+    edge_index_0 = np.repeat(np.arange(nodes_num), sparse_factor)
+    edge_index_0 = np.broadcast_to(edge_index_0, (batch_size, len(edge_index_0)))
+    edge_index = np.stack([edge_index_0, idx_knn.reshape(batch_size, -1)], axis=1)
+    edge_attr = knn_dists.reshape(batch_size, -1)
+    if not batched:
+        return edge_index[0], edge_attr[0]
+    return edge_index, edge_attr
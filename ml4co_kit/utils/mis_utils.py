@@ -10,6 +10,7 @@ import networkx as nx
 from tqdm import tqdm
 from typing import Tuple
 from collections import OrderedDict
+from ml4co_kit.utils.graph.base import write_graph_npz
 
 
 class FileObject(object):
@@ -165,25 +166,58 @@ def cnf_to_gpickle(file_path: str, save_path: str = None) -> Tuple[nx.Graph, int
     return graph, clauses_num
         
 
-def cnf_folder_to_gpickle_folder(cnf_folder: str, gpickle_foler: str):
+def cnf_to_npz(file_path: str, save_path: str = None) -> Tuple[int, np.ndarray, int]:
+    r"""
+    Converts a SAT instance (``.cnf``) to its MIS graph, like ``cnf_to_gpickle``, but
+    returns (and saves with ``write_graph_npz``) the number of nodes and the 
+    undirected edges with shape (E, 2) instead of a networkx graph.
+    """
+    # check the file format
+    if not file_path.endswith(".cnf"):
+        raise ValueError("Invalid file format. Expected a ``.cnf`` file.")
+    if save_path is not None:
+        if not save_path.endswith(".npz"):
+            raise ValueError("Invalid file format. Expected a ``.npz`` file.")
+    
+    # convert sat to mis graph
+    graph, clauses_num = sat_to_mis_graph(sat_path=file_path)
+    nodes_num = graph.number_of_nodes()
+    edges = np.array(graph.edges, dtype=np.int64).reshape(-1, 2)
+    if save_path is not None:
+        write_graph_npz(file_path=save_path, nodes_num=nodes_num, edges=edges)
+    return nodes_num, edges, clauses_num
+
+
+def _cnf_folder_to_graph_folder(cnf_folder: str, save_folder: str, graph_format: str):
     # check the folder
-    mis_graph_save_dir = os.path.join(gpickle_foler, "instance")
+    mis_graph_save_dir = os.path.join(save_folder, "instance")
     if not os.path.exists(mis_graph_save_dir):
         os.makedirs(mis_graph_save_dir)
         
-    # cnf to gpickle
+    # cnf to gpickle / npz
     ref_dict = OrderedDict()
     cnf_files = os.listdir(cnf_folder)
     cnf_files.sort()
     for cnf_file in tqdm(cnf_files, desc=f"Processing files in {cnf_folder}"):
         file_path = os.path.join(cnf_folder, cnf_file)
-        gpickle_file = cnf_file.replace(".cnf", ".gpickle")
-        save_path = os.path.join(mis_graph_save_dir, gpickle_file)
-        _, clauses_num = cnf_to_gpickle(file_path, save_path)
-        ref_dict[gpickle_file] = clauses_num
+        graph_file = cnf_file.replace(".cnf", f".{graph_format}")
+        save_path = os.path.join(mis_graph_save_dir, graph_file)
+        if graph_format == "npz":
+            clauses_num = cnf_to_npz(file_path, save_path)[-1]
+        else:
+            clauses_num = cnf_to_gpickle(file_path, save_path)[-1]
+        ref_dict[graph_file] = clauses_num
     
     # save the ref. solution
-    ref_save_path = os.path.join(gpickle_foler, "ref_solution.txt")
+    ref_save_path = os.path.join(save_folder, "ref_solution.txt")
     with open(ref_save_path, 'w') as ref_file:
-        for gpickle_file, clauses_num in ref_dict.items():
-            ref_file.write(f"{gpickle_file}: {clauses_num}\n")
\ No newline at end of file
+        for graph_file, clauses_num in ref_dict.items():
+            ref_file.write(f"{graph_file}: {clauses_num}\n")
+
+
+def cnf_folder_to_gpickle_folder(cnf_folder: str, gpickle_foler: str):
+    _cnf_folder_to_graph_folder(cnf_folder, gpickle_foler, graph_format="gpickle")
+
+
+def cnf_folder_to_npz_folder(cnf_folder: str, npz_folder: str):
+    _cnf_folder_to_graph_folder(cnf_folder, npz_folder, graph_format="npz")
@@ -0,0 +1,75 @@
+r"""
+Blocked Floyd-Warshall for (batches of) dense distance matrices.
+
+The pivots are processed in blocks. The rows of a pivot block are closed first with
+plain Floyd-Warshall, then every other row is relaxed through the (now final) pivot
+rows in chunks of ``chunk_size`` rows, so the working set of the inner loop stays
+in cache and the memory is O(B * N^2) instead of the O(N^3) of a min-plus product.
+"""
+
+# Copyright (c) 2024 Thinklab@SJTU
+# ML4CO-Kit is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+# http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND,
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT,
+# MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+
+
+import numpy as np
+
+
+def _relax(rows: np.ndarray, pivot_rows: np.ndarray, cols: np.ndarray, buf: np.ndarray):
+    # rows[b, i, :] = min(rows[b, i, :], cols[b, i, k] + pivot_rows[b, k, :]) for each k
+    buf = buf[:, :rows.shape[1]]
+    for k in range(pivot_rows.shape[1]):
+        np.add(cols[:, :, k, None], pivot_rows[:, k, None, :], out=buf)
+        np.minimum(rows, buf, out=rows)
+
+
+def floyd_warshall(
+    dists: np.ndarray, block_size: int = 64, chunk_size: int = 64
+) -> np.ndarray:
+    r"""
+    Computes the all-pairs shortest path distances (the shortest path closure, which
+    satisfies the triangle inequality) of directed graphs with non-negative weights.
+
+    :param dists: np.ndarray, the distance matrix with shape (N, N) or a batch of
+        distance matrices with shape (B, N, N).
+    :param block_size: int, the number of pivots processed together.
+    :param chunk_size: int, the number of rows relaxed together.
+    :return: np.ndarray with the same shape and dtype as ``dists``.
+    """
+    dists = np.array(dists, copy=True)
+    single = dists.ndim == 2
+    if single:
+        dists = dists[None]
+    if dists.ndim != 3 or dists.shape[1] != dists.shape[2]:
+        raise ValueError("``dists`` must have shape (N, N) or (B, N, N).")
+    if block_size < 1 or chunk_size < 1:
+        raise ValueError("``block_size`` and ``chunk_size`` must be positive.")
+    if dists.size > 0 and np.any(dists < 0):
+        raise ValueError("``floyd_warshall`` only supports non-negative distances.")
+
+    batch_size, nodes_num, _ = dists.shape
+    buf_rows = max(block_size, chunk_size)
+    buf = np.empty(shape=(batch_size, buf_rows, nodes_num), dtype=dists.dtype)
+    for begin in range(0, nodes_num, block_size):
+        end = min(begin + block_size, nodes_num)
+        # close the pivot rows, which only depend on each other
+        pivot_rows = dists[:, begin:end]
+        for k in range(end - begin):
+            np.add(
+                pivot_rows[:, :, begin + k, None], pivot_rows[:, k, None, :],
+                out=buf[:, :end - begin]
+            )
+            np.minimum(pivot_rows, buf[:, :end - begin], out=pivot_rows)
+        # relax the other rows through the final pivot rows
+        for chunk in range(0, nodes_num, chunk_size):
+            if begin <= chunk < end and chunk + chunk_size <= end:
+                continue
+            rows = dists[:, chunk:chunk + chunk_size]
+            _relax(rows, pivot_rows, rows[:, :, begin:end], buf)
+    return dists[0] if single else dists
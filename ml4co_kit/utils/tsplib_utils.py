@@ -0,0 +1,333 @@
+r"""
+A fast reader and writer for TSPLIB / VRPLIB files.
+
+The header lines (``KEY : value``) are parsed as strings, while the numeric sections
+(``NODE_COORD_SECTION``, ``DEMAND_SECTION``, ``DEPOT_SECTION``, ``EDGE_WEIGHT_SECTION``
+and ``TOUR_SECTION``) are converted to NumPy arrays in one call each, instead of
+going through the field transformers of ``tsplib95``. In the same way, the sections
+are written by a single ``%`` formatting of the flattened array into a cached template.
+"""
+
+# Copyright (c) 2024 Thinklab@SJTU
+# ML4CO-Kit is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+# http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND,
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT,
+# MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+
+
+import re
+import functools
+import numpy as np
+from typing import List, Union
+
+
+# a keyword line: ``KEY : value``, ``KEY: value``, ``KEY_SECTION`` or ``EOF``
+KEYWORD_LINE = re.compile(r"^[ \t]*([A-Z][A-Z0-9_]*)[ \t]*(?::[ \t]*(.*?))?[ \t]*\r?$", re.M)
+
+# the start of the line after a section, which begins with a keyword and not a number
+# (a literal prefix, so that the numbers are skipped by a fast scan for newlines)
+SECTION_END = re.compile(r"\n[ \t]*[A-Z]")
+
+# (triu / tril, offset) of the entries of each half matrix, in the order of the file
+HALF_MATRIX_TYPES = {
+    "UPPER_ROW": (np.triu_indices, 1),
+    "LOWER_COL": (np.triu_indices, 1),
+    "UPPER_DIAG_ROW": (np.triu_indices, 0),
+    "LOWER_DIAG_COL": (np.triu_indices, 0),
+    "LOWER_ROW": (np.tril_indices, -1),
+    "UPPER_COL": (np.tril_indices, -1),
+    "LOWER_DIAG_ROW": (np.tril_indices, 0),
+    "UPPER_DIAG_COL": (np.tril_indices, 0),
+}
+
+
+###############################################
+#                    Read                     #
+###############################################
+
+def _parse_numbers(text: str) -> np.ndarray:
+    # integers stay integers (as in ``tsplib95``), otherwise float64
+    if "." not in text and "e" not in text and "E" not in text:
+        return np.fromstring(text, dtype=np.int64, sep=" ")
+    return np.fromstring(text, dtype=np.float64, sep=" ")
+
+
+def _parse_rows(text: str) -> np.ndarray:
+    # rows with the same number of values as the first row, e.g. ``idx x y``
+    text = text.strip()
+    if not text:
+        return None
+    cols = len(text.split("\n", 1)[0].split())
+    return _parse_numbers(text).reshape(-1, cols)
+
+
+def _parse_tours(text: str) -> List[np.ndarray]:
+    # tours are separated (and terminated) by -1
+    values = np.fromstring(text, dtype=np.int64, sep=" ")
+    splits = np.split(values, np.flatnonzero(values == -1))
+    tours = [tour[tour != -1] for tour in splits]
+    return [tour for tour in tours if len(tour) > 0]
+
+
+def tsplib_edge_weight_matrix(
+    values: np.ndarray, nodes_num: int, edge_weight_format: str
+) -> np.ndarray:
+    r"""
+    Expands the values of an ``EDGE_WEIGHT_SECTION`` to the full matrix.
+
+    :param values: np.ndarray, the values in the order of the file.
+    :param nodes_num: int, the dimension of the problem.
+    :param edge_weight_format: string, ``FULL_MATRIX`` or one of the half matrix
+        formats (``UPPER_ROW``, ``LOWER_DIAG_ROW``, ``UPPER_DIAG_COL`` and so on).
+        The half matrices are mirrored and the missing diagonal is zero.
+    :return: np.ndarray with shape (nodes_num, nodes_num).
+    """
+    values = np.asarray(values).reshape(-1)
+    if edge_weight_format == "FULL_MATRIX":
+        size = nodes_num * nodes_num
+        if len(values) < size:
+            raise ValueError(
+                f"Expected {size} edge weights for a FULL_MATRIX, but got {len(values)}."
+            )
+        return values[:size].reshape(nodes_num, nodes_num)
+    if edge_weight_format not in HALF_MATRIX_TYPES:
+        raise ValueError(f"Unsupported EDGE_WEIGHT_FORMAT: {edge_weight_format}.")
+    indices_func, offset = HALF_MATRIX_TYPES[edge_weight_format]
+    rows, cols = indices_func(nodes_num, offset)
+    if len(values) < len(rows):
+        raise ValueError(
+            f"Expected {len(rows)} edge weights for a {edge_weight_format}, "
+            f"but got {len(values)}."
+        )
+    matrix = np.zeros(shape=(nodes_num, nodes_num), dtype=values.dtype)
+    matrix[rows, cols] = values[:len(rows)]
+    matrix[cols, rows] = values[:len(rows)]
+    return matrix
+
+
+def read_tsplib(file_path: str) -> dict:
+    r"""
+    Reads a TSPLIB / VRPLIB problem or tour file.
+
+    :param file_path: string, path to the file.
+    :return: dict with the header (``"header"``, keyword to string) and the sections
+        found in the file, as NumPy arrays in the order of the file:
+        ``"node_coords"`` with shape (N, D), ``"demands"`` with shape (N,),
+        ``"depots"`` (1-based, without the -1 terminal), ``"edge_weights"`` with
+        shape (N, N) (only for ``EDGE_WEIGHT_TYPE: EXPLICIT``) and ``"tours"`` (a list
+        of 1-based tours). The node indices of the first column are dropped. Missing
+        sections are None.
+    """
+    with open(file_path, "r") as f:
+        text = f.read()
+
+    # split the text into the header lines and the sections, line by line for
+    # the keywords and in one slice for the values of each section
+    header = dict()
+    sections = dict()
+    pos = 0
+    while pos < len(text):
+        match = KEYWORD_LINE.match(text, pos)
+        if match is None:
+            # a blank line, or an unknown line of the header
+            line_end = text.find("\n", pos)
+            pos = len(text) if line_end == -1 else line_end + 1
+            continue
+        keyword, value = match.group(1), match.group(2)
+        if keyword == "EOF":
+            break
+        if keyword.endswith("_SECTION"):
+            section_end = SECTION_END.search(text, match.end())
+            end = len(text) if section_end is None else section_end.start()
+            sections[keyword] = text[match.end():end]
+            pos = end + 1
+        else:
+            if value is not None:
+                header[keyword] = value
+            pos = match.end() + 1
+
+    # numeric sections
+    data = {
+        "header": header, "node_coords": None, "demands": None,
+        "depots": None, "edge_weights": None, "tours": None
+    }
+    if "NODE_COORD_SECTION" in sections:
+        rows = _parse_rows(sections["NODE_COORD_SECTION"])
+        data["node_coords"] = None if rows is None else rows[:, 1:]
+    if "DEMAND_SECTION" in sections:
+        rows = _parse_rows(sections["DEMAND_SECTION"])
+        data["demands"] = None if rows is None else rows[:, 1]
+    if "DEPOT_SECTION" in sections:
+        depots = np.fromstring(sections["DEPOT_SECTION"], dtype=np.int64, sep=" ")
+        data["depots"] = depots[depots != -1]
+    if "EDGE_WEIGHT_SECTION" in sections and header.get("EDGE_WEIGHT_TYPE") == "EXPLICIT":
+        data["edge_weights"] = tsplib_edge_weight_matrix(
+            values=_parse_numbers(sections["EDGE_WEIGHT_SECTION"]),
+            nodes_num=int(header["DIMENSION"]),
+            edge_weight_format=header.get("EDGE_WEIGHT_FORMAT", "FULL_MATRIX")
+        )
+    if "TOUR_SECTION" in sections:
+        data["tours"] = _parse_tours(sections["TOUR_SECTION"])
+    return data
+
+
+###############################################
+#                    Write                    #
+###############################################
+
+@functools.lru_cache(maxsize=16)
+def _row_template(rows: int, cols: int, start: int) -> str:
+    # ``rows`` lines of ``cols`` values, each line after its index from ``start``
+    # (no index if ``start`` is negative)
+    values = " ".join(["%s"] * cols) + "\n"
+    if start < 0:
+        return values * rows
+    return "".join([f"{idx} {values}" for idx in range(start, start + rows)])
+
+
+def _format_rows(values: np.ndarray, start: int = -1) -> str:
+    # the values as in ``f"{value}"``: python scalars (the shortest repr for float64),
+    # and strings for the smaller floats, whose repr is not the one of a python float
+    values = np.asarray(values)
+    if values.ndim == 1:
+        values = values[:, None]
+    if values.dtype.kind == "f" and values.dtype.itemsize < 8:
+        values = values.astype(str)
+    template = _row_template(values.shape[0], values.shape[1], start)
+    return template % tuple(values.reshape(-1).tolist())
+
+
+def _finish(lines: List[str], to_bytes: bool) -> Union[str, bytes]:
+    text = "".join(lines)
+    return text.encode() if to_bytes else text
+
+
+def render_tsp(
+    points: np.ndarray,
+    name: str = "TSP",
+    norm: str = "EUC_2D",
+    fixed_edges: np.ndarray = None,
+    comment: str = "Generated by ML4CO-Kit",
+    to_bytes: bool = False
+) -> Union[str, bytes]:
+    r"""
+    Renders a TSP problem in TSPLIB format.
+
+    :param points: np.ndarray, the coordinates with shape (N, D).
+    :param name: string, the name of the problem.
+    :param norm: string, the ``EDGE_WEIGHT_TYPE``.
+    :param fixed_edges: np.ndarray, the 1-based edges with shape (E, 2) that must be
+        in the tour (``FIXED_EDGES_SECTION``, read by LKH).
+    :param comment: string, the comment of the problem.
+    :param to_bytes: boolean, whether to return bytes (e.g. for a pipe) instead of a string.
+    """
+    lines = [
+        f"NAME : {name}\n",
+        f"COMMENT : {comment}\n",
+        "TYPE : TSP\n",
+        f"DIMENSION : {len(points)}\n",
+        f"EDGE_WEIGHT_TYPE : {norm}\n",
+        "NODE_COORD_SECTION\n",
+        _format_rows(points, start=1),
+    ]
+    if fixed_edges is not None:
+        lines += ["FIXED_EDGES_SECTION\n", _format_rows(fixed_edges), "-1\n"]
+    lines.append("EOF\n")
+    return _finish(lines, to_bytes)
+
+
+def render_atsp(
+    dists: np.ndarray,
+    name: str = "ATSP",
+    comment: str = "Generated by ML4CO-Kit",
+    to_bytes: bool = False
+) -> Union[str, bytes]:
+    r"""
+    Renders an ATSP problem in TSPLIB format, as an explicit ``FULL_MATRIX``.
+
+    :param dists: np.ndarray, the distance matrix with shape (N, N).
+    :param name: string, the name of the problem.
+    :param comment: string, the comment of the problem.
+    :param to_bytes: boolean, whether to return bytes (e.g. for a pipe) instead of a string.
+    """
+    lines = [
+        f"NAME : {name}\n",
+        f"COMMENT : {comment}\n",
+        "TYPE : ATSP\n",
+        f"DIMENSION : {len(dists)}\n",
+        "EDGE_WEIGHT_TYPE : EXPLICIT\n",
+        "EDGE_WEIGHT_FORMAT: FULL_MATRIX\n",
+        "EDGE_WEIGHT_SECTION:\n",
+        _format_rows(dists),
+        "EOF\n",
+    ]
+    return _finish(lines, to_bytes)
+
+
+def render_vrp(
+    depot: np.ndarray,
+    points: np.ndarray,
+    demands: np.ndarray,
+    capacity: Union[int, float],
+    name: str = "CVRP",
+    norm: str = "EUC_2D",
+    comment: str = "Generated by ML4CO-Kit",
+    to_bytes: bool = False
+) -> Union[str, bytes]:
+    r"""
+    Renders a CVRP problem in VRPLIB format, with the depot as node 1.
+
+    :param depot: np.ndarray, the coordinates of the depot with shape (D,).
+    :param points: np.ndarray, the coordinates of the customers with shape (N, D).
+    :param demands: np.ndarray, the demands of the customers with shape (N,).
+    :param capacity: int or float, the capacity of the vehicles.
+    :param name: string, the name of the problem.
+    :param norm: string, the ``EDGE_WEIGHT_TYPE``.
+    :param comment: string, the comment of the problem.
+    :param to_bytes: boolean, whether to return bytes (e.g. for a pipe) instead of a string.
+    """
+    lines = [
+        f"NAME : {name}\n",
+        f"COMMENT : {comment}\n",
+        "TYPE : CVRP\n",
+        f"DIMENSION : {len(points) + 1}\n",
+        f"EDGE_WEIGHT_TYPE : {norm}\n",
+        f"CAPACITY : {capacity}\n",
+        "NODE_COORD_SECTION\n",
+        _format_rows(np.asarray(depot)[None, :], start=1),
+        _format_rows(points, start=2),
+        "DEMAND_SECTION \n",
+        "1 0\n",
+        _format_rows(demands, start=2),
+        "DEPOT_SECTION \n",
+        "\t1\n",
+        "\t-1\n",
+        "EOF\n",
+    ]
+    return _finish(lines, to_bytes)
+
+
+def render_tour(
+    tour: np.ndarray, name: str = "TOUR", to_bytes: bool = False
+) -> Union[str, bytes]:
+    r"""
+    Renders a tour in TSPLIB format.
+
+    :param tour: np.ndarray, the nodes of the tour (without the return to the start).
+    :param name: string, the name of the tour.
+    :param to_bytes: boolean, whether to return bytes (e.g. for a pipe) instead of a string.
+    """
+    lines = [
+        f"NAME: {name} Solved by ML4CO-Kit\n",
+        "TYPE: TOUR\n",
+        f"DIMENSION: {len(tour)}\n",
+        "TOUR_SECTION\n",
+        _format_rows(tour),
+        "-1\n",
+        "EOF\n",
+    ]
+    return _finish(lines, to_bytes)
@@ -30,6 +30,7 @@ class SOLVER_TYPE(str, Enum):
     GA_EAX_LARGE = "GA-EAX(Large)" # Support TSP
     GUROBI = "Gurobi" # Support for MIS, MVC, MC, MCL
     HGS = "HGS" # Support CVRP
+    HIGHS = "HiGHS" # Support for LP, MIS, MVC, MC, MCL
     KAMIS = "KaMIS" # Support MIS
     LKH = "LKH" # Support for TSP, ATSP, CVRP
     ML4ATSP = "ML4ATSP" # part of ML4CO
@@ -50,9 +51,10 @@ TASK_SUPPORT_SOLVER = {
         SOLVER_TYPE.GA_EAX_LARGE, SOLVER_TYPE.LKH
     ],
     TASK_TYPE.CVRP: [SOLVER_TYPE.HGS, SOLVER_TYPE.LKH, SOLVER_TYPE.PYVRP],
-    TASK_TYPE.MCl: [SOLVER_TYPE.GUROBI],
-    TASK_TYPE.MCut: [SOLVER_TYPE.GUROBI],
-    TASK_TYPE.MIS: [SOLVER_TYPE.GUROBI, SOLVER_TYPE.KAMIS],
-    TASK_TYPE.MVC: [SOLVER_TYPE.GUROBI],
+    TASK_TYPE.MCl: [SOLVER_TYPE.GUROBI, SOLVER_TYPE.HIGHS],
+    TASK_TYPE.MCut: [SOLVER_TYPE.GUROBI, SOLVER_TYPE.HIGHS],
+    TASK_TYPE.MIS: [SOLVER_TYPE.GUROBI, SOLVER_TYPE.HIGHS, SOLVER_TYPE.KAMIS],
+    TASK_TYPE.MVC: [SOLVER_TYPE.GUROBI, SOLVER_TYPE.HIGHS],
+    TASK_TYPE.LP: [SOLVER_TYPE.GUROBI, SOLVER_TYPE.HIGHS],
 }
     
\ No newline at end of file
@@ -3,6 +3,7 @@ import sys
 root_folder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(root_folder)
 import shutil
+import numpy as np
 from ml4co_kit import *
 
 
@@ -100,6 +101,80 @@ def test_cvrp_uniform_eval():
     CVRPUniformEvaluator()
 
 
+def test_atsp_batch_eval():
+    solver = ATSPSolver()
+    solver.from_txt("tests/data_for_tests/solver/atsp/atsp50.txt", ref=True)
+    tours = np.repeat(solver.ref_tours[:, None, :], repeats=2, axis=1)
+    costs, ref_costs, gaps = atsp_batch_evaluate(
+        dists=solver.ori_dists, tours=tours, ref_tours=solver.ref_tours
+    )
+    for idx, ref_tour in enumerate(solver.ref_tours):
+        cost = ATSPEvaluator(solver.ori_dists[idx]).evaluate(ref_tour)
+        if not np.isclose(cost, costs[idx]) or not np.isclose(cost, ref_costs[idx]):
+            raise ValueError("There is a problem with ``atsp_batch_evaluate``")
+    if np.any(gaps != 0):
+        raise ValueError("There is a problem with ``atsp_batch_evaluate``")
+
+
+def test_cvrp_batch_eval():
+    solver = CVRPSolver()
+    solver.from_txt("tests/data_for_tests/solver/cvrp/cvrp50.txt", ref=True)
+    costs, ref_costs, gaps, feasible = cvrp_batch_evaluate(
+        depots=solver.ori_depots, points=solver.ori_points, tours=solver.ref_tours,
+        demands=solver.demands, capacities=solver.capacities, ref_tours=solver.ref_tours
+    )
+    for idx, ref_tour in enumerate(solver.ref_tours):
+        evaluator = CVRPEvaluator(solver.ori_depots[idx], solver.ori_points[idx])
+        cost = evaluator.evaluate(ref_tour[ref_tour != -1])
+        if not np.isclose(cost, costs[idx]) or not np.isclose(cost, ref_costs[idx]):
+            raise ValueError("There is a problem with ``cvrp_batch_evaluate``")
+    if np.any(gaps != 0) or not np.all(feasible):
+        raise ValueError("There is a problem with ``cvrp_batch_evaluate``")
+    
+    # overloaded route and missing customer
+    demands = np.array([[1.0, 2.0, 3.0]])
+    tours = cvrp_pad_tours([np.array([0, 1, 2, 3, 0]), np.array([0, 1, 2, 0, 3, 0])])
+    tours = np.concatenate([tours, np.array([[0, 1, 0, 3, 0, -1]])], axis=0)
+    feasible = cvrp_batch_check_tours(
+        tours=tours, demands=np.repeat(demands, 3, axis=0), capacities=np.array([4.0])
+    )
+    if feasible.tolist() != [False, True, False]:
+        raise ValueError("There is a problem with ``cvrp_batch_check_tours``")
+
+
+def test_held_karp_bound():
+    # tsp
+    solver = TSPSolver()
+    solver.from_txt("tests/data_for_tests/solver/tsp/tsp50.txt", ref=True)
+    for idx, ref_tour in enumerate(solver.ref_tours):
+        evaluator = TSPEvaluator(solver.ori_points[idx])
+        opt_cost = evaluator.evaluate(ref_tour)
+        bound = evaluator.lower_bound()
+        if bound > opt_cost + 1e-6 or bound < 0.95 * opt_cost:
+            raise ValueError("There is a problem with ``tsp_held_karp_bound``")
+    solver.from_txt("tests/data_for_tests/solver/tsp/tsp50.txt", ref=False)
+    _, _, gap_avg, _ = solver.evaluate(calculate_gap=True, gap_ref="lower_bound")
+    if gap_avg < 0 or gap_avg > 5:
+        raise ValueError("There is a problem with ``tsp_held_karp_bound``")
+    
+    # atsp
+    solver = ATSPSolver()
+    solver.from_txt("tests/data_for_tests/solver/atsp/atsp50.txt", ref=True)
+    for idx, ref_tour in enumerate(solver.ref_tours):
+        evaluator = ATSPEvaluator(solver.ori_dists[idx])
+        opt_cost = evaluator.evaluate(ref_tour)
+        bound = evaluator.lower_bound()
+        if bound > opt_cost + 1e-6 or bound < 0.95 * opt_cost:
+            raise ValueError("There is a problem with ``atsp_held_karp_bound``")
+    
+    # sparse candidate graphs (knn_k=2) still give valid bounds
+    points = np.random.default_rng(2).random(size=(30, 2))
+    dense_bound = tsp_held_karp_bound(points, knn_threshold=100)
+    sparse_bound = tsp_held_karp_bound(points, knn_k=2)
+    if sparse_bound < 0.9 * dense_bound:
+        raise ValueError("There is a problem with the candidate graph of ``tsp_held_karp_bound``")
+
+
 if __name__ == "__main__":
     test_tsplib_original_eval()
     test_tsplib4ml_eval()
@@ -107,3 +182,6 @@ if __name__ == "__main__":
     test_satlib_original_eval()
     test_vrplib_original_eval()
     test_cvrp_uniform_eval()
+    test_atsp_batch_eval()
+    test_cvrp_batch_eval()
+    test_held_karp_bound()
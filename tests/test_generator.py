@@ -2,7 +2,9 @@ import os
 import sys
 root_folder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(root_folder)
+import time
 import shutil
+import numpy as np
 from ml4co_kit import *
 
 GUROBI_TEST = False
@@ -168,10 +170,123 @@ def _test_cvrp_hgs_generator(
     # generate data
     cvrp_data_hgs.generate()
     
+    # check the number of samples of each split
+    for sample_type in ["train", "val", "test"]:
+        with open(getattr(cvrp_data_hgs, f"{sample_type}_file_save_path"), "r") as f:
+            if len(f.readlines()) != 4:
+                raise ValueError(f"The number of {sample_type} samples is incorrect.")
+    
     # remove the save path
     shutil.rmtree(save_path)
     
 
+def _test_cvrp_hgs_resume(num_threads: int, nodes_num: int, capacity: int):
+    """
+    Test resuming an interrupted generation of CVRPDataGenerator
+    """
+    # save path
+    save_path = "tmp/cvrp_resume_hgs"
+    if not os.path.exists(save_path):
+        os.makedirs(save_path)
+    
+    # create CVRPDataGenerator and stop it after the 7th written instance
+    cvrp_data_hgs = CVRPDataGenerator(
+        num_threads=num_threads,
+        nodes_num=nodes_num,
+        solver=SOLVER_TYPE.HGS,
+        train_samples_num=4,
+        val_samples_num=4,
+        test_samples_num=4,
+        save_path=save_path,
+        min_capacity=capacity,
+        max_capacity=capacity
+    )
+    instance_to_line = cvrp_data_hgs._instance_to_line
+    written = list()
+    def _interrupted_instance_to_line(instance, solution):
+        if len(written) == 7:
+            raise KeyboardInterrupt
+        written.append(instance)
+        return instance_to_line(instance, solution)
+    cvrp_data_hgs._instance_to_line = _interrupted_instance_to_line
+    try:
+        cvrp_data_hgs.generate(checkpoint_interval=3)
+        raise ValueError("The generation should have been interrupted.")
+    except KeyboardInterrupt:
+        pass
+    
+    # resume from the last checkpoint (6 instances)
+    cvrp_data_hgs._instance_to_line = instance_to_line
+    cvrp_data_hgs.generate(resume=True, checkpoint_interval=3)
+    
+    # check the number of samples of each split and that no instance is duplicated
+    with open(cvrp_data_hgs.file_save_path, "r") as f:
+        instances = [line.split(" output ")[0] for line in f.readlines()]
+    if len(instances) != 12 or len(set(instances)) != 12:
+        raise ValueError("The resumed generation has missing or duplicated samples.")
+    for sample_type in ["train", "val", "test"]:
+        with open(getattr(cvrp_data_hgs, f"{sample_type}_file_save_path"), "r") as f:
+            if len(f.readlines()) != 4:
+                raise ValueError(f"The number of {sample_type} samples is incorrect.")
+    
+    # the instances are sampled in batches of ``num_threads``, so it must match the manifest
+    cvrp_data_hgs.num_threads = num_threads + 1
+    try:
+        cvrp_data_hgs.generate(resume=True, checkpoint_interval=3)
+        rejected = False
+    except ValueError:
+        rejected = True
+    if not rejected:
+        raise ValueError("Resuming with another ``num_threads`` should be rejected.")
+    
+    # remove the save path
+    shutil.rmtree(save_path)
+
+
+def _test_cvrp_hgs_shards(num_threads: int, nodes_num: int, capacity: int):
+    """
+    Test sharded generation of CVRPDataGenerator
+    """
+    merged_instances = list()
+    for shard_order in [[0, 1, 2], [2, 0, 1]]:
+        # save path
+        save_path = "tmp/cvrp_shards_hgs"
+        if not os.path.exists(save_path):
+            os.makedirs(save_path)
+
+        # generate the shards in the given order, then merge them
+        create_generator = lambda: CVRPDataGenerator(
+            num_threads=num_threads,
+            nodes_num=nodes_num,
+            solver=SOLVER_TYPE.HGS,
+            train_samples_num=4,
+            val_samples_num=4,
+            test_samples_num=4,
+            save_path=save_path,
+            min_capacity=capacity,
+            max_capacity=capacity
+        )
+        for shard_id in shard_order:
+            create_generator().generate(seed=1234, shard_id=shard_id, num_shards=3)
+        cvrp_data_hgs = create_generator()
+        cvrp_data_hgs.merge_shards(num_shards=3)
+        
+        # check the number of samples of each split
+        for sample_type in ["train", "val", "test"]:
+            with open(getattr(cvrp_data_hgs, f"{sample_type}_file_save_path"), "r") as f:
+                if len(f.readlines()) != 4:
+                    raise ValueError(f"The number of {sample_type} samples is incorrect.")
+        with open(cvrp_data_hgs.file_save_path, "r") as f:
+            merged_instances.append([line.split(" output ")[0] for line in f.readlines()])
+            
+        # remove the save path
+        shutil.rmtree(save_path)
+    
+    # the merged instances do not depend on the order of the shards
+    if merged_instances[0] != merged_instances[1]:
+        raise ValueError("Sharded generation is not deterministic.")
+
+
 def test_cvrp():
     """
     Test CVRPDataGenerator
@@ -184,6 +299,15 @@ def test_cvrp():
     _test_cvrp_hgs_generator(
         num_threads=1, nodes_num=50, data_type="uniform", capacity=40
     )
+    # samples_num (12) is not divisible by num_threads
+    _test_cvrp_hgs_generator(
+        num_threads=5, nodes_num=50, data_type="uniform", capacity=40
+    )
+    # resume
+    _test_cvrp_hgs_resume(num_threads=1, nodes_num=50, capacity=40)
+    _test_cvrp_hgs_resume(num_threads=4, nodes_num=50, capacity=40)
+    # shards
+    _test_cvrp_hgs_shards(num_threads=2, nodes_num=20, capacity=30)
     # lkh
     _test_cvrp_lkh_generator(
         num_threads=4, nodes_num=20, data_type="uniform", capacity=30
@@ -202,7 +326,7 @@ def test_cvrp():
 #             Test Func For LP               #
 ##############################################
 
-def _test_lp_gurobi(num_threads: int, data_type: str):
+def _test_lp_gurobi(num_threads: int, data_type: str, sparse_format: bool = False):
     """
     Test LPDataGenerator using LPGurobiSolver
     """
@@ -222,7 +346,8 @@ def _test_lp_gurobi(num_threads: int, data_type: str):
         num_threads=num_threads,
         vars_num=20,
         constr_num=16,
-        sparse_ratio=0.0,
+        sparse_ratio=0.5 if sparse_format else 0.0,
+        sparse_format=sparse_format,
         data_type=data_type,
         solver=solver,
         train_samples_num=4,
@@ -244,6 +369,7 @@ def test_lp():
     """
     _test_lp_gurobi(num_threads=1, data_type="uniform")
     _test_lp_gurobi(num_threads=4, data_type="uniform")
+    _test_lp_gurobi(num_threads=1, data_type="uniform", sparse_format=True)
 
 
 ##############################################
@@ -492,7 +618,8 @@ def test_mvc():
 ##############################################
 
 def _test_tsp_lkh_generator(
-    num_threads: int, nodes_num: int, data_type: str, regret: bool
+    num_threads: int, nodes_num: int, data_type: str, regret: bool,
+    regret_mode: str = "lkh", regret_knn_k: int = None
 ):
     """
     Test TSPDataGenerator using LKH Solver
@@ -512,6 +639,8 @@ def _test_tsp_lkh_generator(
         test_samples_num=4,
         save_path=save_path,
         regret=regret,
+        regret_mode=regret_mode,
+        regret_knn_k=regret_knn_k,
     )
 
     # generate data
@@ -622,6 +751,10 @@ def test_tsp():
     _test_tsp_lkh_generator(
         num_threads=4, nodes_num=10, data_type="uniform", regret=True
     )
+    _test_tsp_lkh_generator(
+        num_threads=4, nodes_num=20, data_type="uniform", regret=True, 
+        regret_mode="local", regret_knn_k=5
+    )
     # concorde
     _test_tsp_concorde_generator(
         num_threads=4, nodes_num=50, data_type="uniform", 
@@ -644,6 +777,79 @@ def test_tsp():
     )
    
     
+##############################################
+#           Test Func For Samplers           #
+##############################################
+
+def _benchmark_sampler(generator, batch_size: int):
+    """
+    Times the batch sampler of the generator
+    """
+    begin_time = time.time()
+    instances = generator.generate_func(batch_size, generator.rng)
+    sample_time = time.time() - begin_time
+    print(
+        f"{generator.__class__.__name__} ({generator.data_type}): {batch_size} instances "
+        f"in {sample_time:.3f}s ({batch_size / max(sample_time, 1e-9):.0f} instances/s)"
+    )
+    return instances
+
+
+def test_samplers():
+    """
+    Test (and benchmark) the batch instance samplers
+    """
+    # tsp (the nodes of the cluster instances are not divisible by the clusters)
+    for data_type in ["uniform", "gaussian", "cluster"]:
+        tsp_data = TSPDataGenerator(
+            only_instance_for_us=True, nodes_num=101, data_type=data_type, solver=SOLVER_TYPE.GA_EAX
+        )
+        points = _benchmark_sampler(tsp_data, batch_size=10000)
+        if points.shape != (10000, 101, 2):
+            raise ValueError(f"The shape of the sampled TSP ({data_type}) instances is incorrect.")
+    
+    # cvrp
+    for data_type in ["uniform", "gaussian"]:
+        cvrp_data = CVRPDataGenerator(only_instance_for_us=True, nodes_num=100, data_type=data_type)
+        depots, points = _benchmark_sampler(cvrp_data, batch_size=10000)
+        if depots.shape != (10000, 2) or points.shape != (10000, 100, 2):
+            raise ValueError(f"The shape of the sampled CVRP ({data_type}) instances is incorrect.")
+    
+    # lp
+    for sparse_ratio in [0.0, 0.5]:
+        lp_data = LPDataGenerator(
+            only_instance_for_us=True, vars_num=20, constr_num=16, sparse_ratio=sparse_ratio
+        )
+        w, c, b = _benchmark_sampler(lp_data, batch_size=10000)
+        if np.any((w != 0).sum(axis=(1, 2)) > lp_data.nnz):
+            raise ValueError("The number of non-zero elements of the sampled LP instances is incorrect.")
+        if np.any(np.linalg.matrix_rank(w) != 16):
+            raise ValueError("The sampled LP instances are not full rank.")
+        
+    # atsp (the reference tours of sat and hcp must be zero-cost tours)
+    for data_type in ["sat", "hcp", "uniform"]:
+        atsp_data = ATSPDataGenerator(only_instance_for_us=True, nodes_num=50, data_type=data_type)
+        dists, ref_tours = _benchmark_sampler(
+            atsp_data, batch_size=1000 if data_type != "uniform" else 10
+        )
+        if ref_tours is None:
+            continue
+        nodes_num = atsp_data.nodes_num
+        if not (np.sort(ref_tours[:, :-1], axis=1) == np.arange(nodes_num)).all():
+            raise ValueError(f"The reference tours of ATSP ({data_type}) are not tours.")
+        batch_idx = np.arange(len(dists))[:, None]
+        if dists[batch_idx, ref_tours[:, :-1], ref_tours[:, 1:]].sum() != 0:
+            raise ValueError(f"The reference tours of ATSP ({data_type}) are not optimal.")
+    
+    # graph
+    mis_data = MISDataGenerator(
+        only_instance_for_us=True, data_type="er", nodes_num_min=50, nodes_num_max=100
+    )
+    nx_graphs = _benchmark_sampler(mis_data, batch_size=100)
+    if len(nx_graphs) != 100:
+        raise ValueError("The number of the sampled graphs is incorrect.")
+    
+
 ##############################################
 #                    MAIN                    #
 ##############################################
@@ -657,4 +863,5 @@ if __name__ == "__main__":
     test_mis()
     test_mvc()
     test_tsp()
+    test_samplers()
     shutil.rmtree("tmp")
@@ -182,6 +182,88 @@ def _test_lp_gurobi_solver(show_time: bool, num_threads: int):
 def test_lp_gurobi_solver():
     _test_lp_gurobi_solver(True, 1)
     _test_lp_gurobi_solver(False, 2)
+    if not GUROBI_TEST:
+        return
+    import numpy as np
+    import scipy.sparse as sp
+
+    # the same (float32 precision) instances with sparse ``w``
+    dense_solver = LPSolver()
+    dense_solver.from_txt("tests/data_for_tests/solver/lp/lp_20_16.txt", ref=True)
+    gurobi_solver = LPGurobiSolver(time_limit=10.0)
+    gurobi_solver.from_data(
+        w=[sp.csr_matrix(w) for w in dense_solver.w], c=dense_solver.c,
+        b=dense_solver.b, x=dense_solver.ref_x, ref=True
+    )
+    gurobi_solver.solve()
+    _, _, gap_avg, _ = gurobi_solver.evaluate(calculate_gap=True)
+    if gap_avg >= 1e-2:
+        raise ValueError("LPGurobiSolver fails on the sparse LP instances.")
+
+    # ``c`` far from the row space of ``w``: the LP is really unbounded
+    rng = np.random.default_rng(0)
+    w = rng.normal(size=(16, 20))
+    try:
+        gurobi_solver.solve(w=w[None], c=rng.normal(size=(1, 20)), b=(w @ rng.random(20))[None])
+    except ValueError:
+        pass
+    else:
+        raise ValueError("LPGurobiSolver should not solve an unbounded LP.")
+
+
+def _test_lp_highs_solver(show_time: bool, num_threads: int):
+    highs_solver = LPHiGHSSolver(time_limit=10.0)
+    highs_solver.from_txt(
+        file_path="tests/data_for_tests/solver/lp/lp_20_16.txt", ref=True
+    )
+    highs_solver.solve(show_time=show_time, num_threads=num_threads)
+    _, _, gap_avg, _ = highs_solver.evaluate(calculate_gap=True)
+    print(f"LPHiGHSSolver Gap: {gap_avg}")
+    if gap_avg >= 1e-2:
+        message = (
+            f"The average gap ({gap_avg}) of LP solved by LPHiGHSSolver "
+            "is larger than or equal to 1e-2%."
+        )
+        raise ValueError(message)
+
+
+def test_lp_highs_solver():
+    _test_lp_highs_solver(True, 1)
+    _test_lp_highs_solver(False, 2)
+
+
+def test_lp_sparse_solver():
+    import numpy as np
+    import scipy.sparse as sp
+    dense_solver = LPSolver()
+    dense_solver.from_txt("tests/data_for_tests/solver/lp/lp_20_16.txt", ref=False)
+    sparse_solver = LPSolver()
+    sparse_solver.from_data(
+        w=[sp.csr_matrix(w) for w in dense_solver.w], 
+        c=dense_solver.c, b=dense_solver.b, x=dense_solver.x
+    )
+    
+    # binary round trip
+    sparse_solver.to_npz("tmp_lp_sparse.npz")
+    sparse_solver.from_npz("tmp_lp_sparse.npz")
+    os.remove("tmp_lp_sparse.npz")
+    w = np.stack([_w.toarray() for _w in sparse_solver.w])
+    if not (w == dense_solver.w).all() or sparse_solver.evaluate() != dense_solver.evaluate():
+        raise ValueError("There is a problem with the sparse ``LPSolver``")
+    
+    # solve with the sparse matrix api
+    if not GUROBI_TEST:
+        return
+    gurobi_solver = LPGurobiSolver(time_limit=10.0)
+    gurobi_solver.from_data(x=dense_solver.x, ref=True)
+    gurobi_solver.solve(w=sparse_solver.w, c=sparse_solver.c, b=sparse_solver.b)
+    _, _, gap_avg, _ = gurobi_solver.evaluate(calculate_gap=True)
+    if gap_avg >= 1e-2:
+        message = (
+            f"The average gap ({gap_avg}) of sparse LP solved by LPGurobiSolver "
+            "is larger than or equal to 1e-2%."
+        )
+        raise ValueError(message)
 
 
 def test_lp():
@@ -190,6 +272,8 @@ def test_lp():
     """
     test_lp_base_solver()
     test_lp_gurobi_solver()
+    test_lp_highs_solver()
+    test_lp_sparse_solver()
     
 
 ##############################################
@@ -209,9 +293,42 @@ def test_mis_base_solver():
         file_path="tests/data_for_tests/solver/mis/mis_example.txt",
         ref=False, cover=False
     )
-    gap_avg = solver.evaluate(calculate_gap=True)[2]
+    gap_avg = solver.evaluate(calculate_gap=True, check_constraint=True)[2]
     if gap_avg > 1e-14:
         raise ValueError("There is a problem between txt input and read in")
+    solver.repair()
+    if solver.validate().sum() != 0:
+        raise ValueError("There is a problem with ``MISSolver.repair``")
+
+
+def test_mis_npz_folder():
+    # gpickle -> npz -> the same graphs and solutions
+    solver = MISSolver()
+    solver.from_gpickle_result_folder(
+        gpickle_folder_path="tests/data_for_tests/solver/mis/mis_example/instance",
+        result_folder_path="tests/data_for_tests/solver/mis/mis_example/solution",
+        ref=False, cover=True
+    )
+    solver.to_npz_folder(npz_save_dir="tmp_mis_npz", npz_filename="mis_example")
+    npz_solver = MISSolver()
+    npz_solver.from_npz_folder(npz_folder_path="tmp_mis_npz", ref=False, cover=True)
+    # KaMIS rejects a folder mixing ``.gpickle`` and ``.npz`` instances
+    gpickle_folder = "tests/data_for_tests/solver/mis/mis_example/instance"
+    gpickle_name = os.listdir(gpickle_folder)[0]
+    shutil.copy(os.path.join(gpickle_folder, gpickle_name), "tmp_mis_npz")
+    try:
+        KaMISSolver().solve(src="tmp_mis_npz", out="tmp_mis_npz/solution")
+        rejected = False
+    except ValueError:
+        rejected = True
+    if not rejected:
+        raise ValueError("``KaMISSolver`` should reject a mixed instance folder.")
+    shutil.rmtree("tmp_mis_npz")
+    for graph, npz_graph in zip(solver.graph_data, npz_solver.graph_data):
+        if (graph.to_csr() != npz_graph.to_csr()).nnz != 0:
+            raise ValueError("There is a problem with ``MISSolver.from_npz_folder``")
+        if (graph.nodes_label != npz_graph.nodes_label).any():
+            raise ValueError("There is a problem with the labels of the ``.npz`` files")
 
 
 def _test_mis_gurobi_solver(show_time: bool, num_threads: int):
@@ -234,6 +351,61 @@ def _test_mis_gurobi_solver(show_time: bool, num_threads: int):
 def test_mis_gurobi_solver():
     _test_mis_gurobi_solver(True, 1)
     _test_mis_gurobi_solver(False, 2)
+
+
+def test_mis_gurobi_mip_start():
+    if not GUROBI_TEST:
+        return
+    # start from the reference solutions, which are written with the ``.lp`` models
+    gurobi_solver = MISGurobiSolver(time_limit=1.0, lp_save_dir="tmp_mis_lp")
+    gurobi_solver.from_txt(
+        file_path="tests/data_for_tests/solver/mis/mis_example.txt",
+        ref=True, cover=True
+    )
+    mip_start = [graph.ref_nodes_label for graph in gurobi_solver.graph_data]
+    gurobi_solver.solve(mip_start=mip_start)
+    lp_files_num = len(os.listdir("tmp_mis_lp"))
+    shutil.rmtree("tmp_mis_lp")
+    if lp_files_num != len(mip_start):
+        raise ValueError("There is a problem with ``MISGurobiSolver(lp_save_dir)``")
+    _, _, gap_avg, _ = gurobi_solver.evaluate(calculate_gap=True)
+    if gap_avg > 1e-2:
+        message = (
+            f"The average gap ({gap_avg}) of MIS solved by MISGurobiSolver "
+            "from the reference solutions is larger than 1e-2%."
+        )
+        raise ValueError(message)
+
+
+def _test_mis_highs_solver(show_time: bool, num_threads: int):
+    highs_solver = MISHiGHSSolver(time_limit=1.0)
+    highs_solver.from_txt(
+        file_path="tests/data_for_tests/solver/mis/mis_example.txt",
+        ref=True, cover=True
+    )
+    highs_solver.solve(show_time=show_time, num_threads=num_threads)
+    _, _, gap_avg, _ = highs_solver.evaluate(calculate_gap=True)
+    print(f"MISHiGHSSolver Gap: {gap_avg}")
+    if gap_avg >= 10:
+        message = (
+            f"The average gap ({gap_avg}) of MIS solved by MISHiGHSSolver "
+            "is larger than or equal to 10%."
+        )
+        raise ValueError(message)
+
+
+def test_mis_highs_solver():
+    _test_mis_highs_solver(True, 1)
+    _test_mis_highs_solver(False, 2)
+
+    # graphs given only by ``edge_index`` (``nodes_num`` is None)
+    import numpy as np
+    graph = MISGraphData()
+    graph.from_data(edge_index=np.array([[0, 1, 1, 2, 2, 3], [1, 0, 2, 1, 3, 2]]))
+    highs_solver = MISHiGHSSolver(time_limit=1.0)
+    highs_solver.solve(graph_data=[graph])
+    if highs_solver.graph_data[0].nodes_label.sum() != 2:
+        raise ValueError("MISHiGHSSolver fails on graphs without ``nodes_num``.")
     
     
 def test_mis_kamis_solver():
@@ -264,7 +436,10 @@ def test_mis():
     Test MISSolver
     """
     test_mis_base_solver()
+    test_mis_npz_folder()
     test_mis_gurobi_solver()
+    test_mis_gurobi_mip_start()
+    test_mis_highs_solver()
     test_mis_kamis_solver()
 
 
@@ -296,11 +471,34 @@ def test_mcl_gurobi_solver():
     _test_mcl_gurobi_solver(False, 2)
 
 
+def _test_mcl_highs_solver(show_time: bool, num_threads: int):
+    highs_solver = MClHiGHSSolver(time_limit=1.0)
+    highs_solver.from_txt(
+        file_path="tests/data_for_tests/solver/mcl/mcl_example.txt",
+        ref=True, cover=True
+    )
+    highs_solver.solve(show_time=show_time, num_threads=num_threads)
+    _, _, gap_avg, _ = highs_solver.evaluate(calculate_gap=True)
+    print(f"MClHiGHSSolver Gap: {gap_avg}")
+    if gap_avg >= 15:
+        message = (
+            f"The average gap ({gap_avg}) of MCl solved by MClHiGHSSolver "
+            "is larger than or equal to 15%."
+        )
+        raise ValueError(message)
+
+
+def test_mcl_highs_solver():
+    _test_mcl_highs_solver(True, 1)
+    _test_mcl_highs_solver(False, 2)
+
+
 def test_mcl():
     """
     Test MClSolver
     """
     test_mcl_gurobi_solver()
+    test_mcl_highs_solver()
 
 
 ##############################################
@@ -331,11 +529,34 @@ def test_mcut_gurobi_solver():
     _test_mcut_gurobi_solver(False, 2)
 
 
+def _test_mcut_highs_solver(show_time: bool, num_threads: int):
+    highs_solver = MCutHiGHSSolver(time_limit=1.0)
+    highs_solver.from_txt(
+        file_path="tests/data_for_tests/solver/mcut/mcut_example.txt",
+        ref=True, cover=True
+    )
+    highs_solver.solve(show_time=show_time, num_threads=num_threads)
+    _, _, gap_avg, _ = highs_solver.evaluate(calculate_gap=True)
+    print(f"MCutHiGHSSolver Gap: {gap_avg}")
+    if gap_avg >= 10:
+        message = (
+            f"The average gap ({gap_avg}) of MCut solved by MCutHiGHSSolver "
+            "is larger than or equal to 10%."
+        )
+        raise ValueError(message)
+
+
+def test_mcut_highs_solver():
+    _test_mcut_highs_solver(True, 1)
+    _test_mcut_highs_solver(False, 2)
+
+
 def test_mcut():
     """
     Test MCutSolver
     """
     test_mcut_gurobi_solver()
+    test_mcut_highs_solver()
     
     
 ##############################################
@@ -412,7 +633,10 @@ def test_mis():
     Test MISSolver
     """
     test_mis_base_solver()
+    test_mis_npz_folder()
     test_mis_gurobi_solver()
+    test_mis_gurobi_mip_start()
+    test_mis_highs_solver()
     test_mis_kamis_solver()
 
 
@@ -444,11 +668,57 @@ def test_mvc_gurobi_solver():
     _test_mvc_gurobi_solver(False, 2)
 
 
+def _test_mvc_highs_solver(show_time: bool, num_threads: int):
+    highs_solver = MVCHiGHSSolver(time_limit=1.0)
+    highs_solver.from_txt(
+        file_path="tests/data_for_tests/solver/mvc/mvc_example.txt",
+        ref=True, cover=True
+    )
+    highs_solver.solve(show_time=show_time, num_threads=num_threads)
+    _, _, gap_avg, _ = highs_solver.evaluate(calculate_gap=True)
+    print(f"MVCHiGHSSolver Gap: {gap_avg}")
+    if gap_avg >= 1e-2:
+        message = (
+            f"The average gap ({gap_avg}) of MVC solved by MVCHiGHSSolver "
+            "is larger than or equal to 1e-2%."
+        )
+        raise ValueError(message)
+
+
+def test_mvc_highs_solver():
+    _test_mvc_highs_solver(True, 1)
+    _test_mvc_highs_solver(False, 2)
+
+
+def test_mvc_graph_batch():
+    # GraphBatch in -> GraphBatch out, evaluated in batch
+    solver = MVCSolver()
+    solver.from_txt(
+        file_path="tests/data_for_tests/solver/mvc/mvc_example.txt",
+        ref=True, cover=True
+    )
+    batch = solver.to_graph_batch()
+    highs_solver = MVCHiGHSSolver(time_limit=1.0)
+    result = highs_solver.solve(graph_data=batch)
+    if not isinstance(result, GraphBatch):
+        raise ValueError("``MVCHiGHSSolver.solve`` should return a ``GraphBatch``")
+    if result.validate(TASK_TYPE.MVC).sum() != 0:
+        raise ValueError("There is a problem with the solved ``GraphBatch``")
+    highs_solver.from_graph_batch(batch=batch, ref=True, cover=False)
+    gap_avg = highs_solver.evaluate(calculate_gap=True, check_constraint=True)[2]
+    if gap_avg >= 1e-2:
+        raise ValueError("There is a problem with ``MVCSolver.evaluate``")
+    if highs_solver.validate().sum() != 0:
+        raise ValueError("There is a problem with ``MVCSolver.validate``")
+
+
 def test_mvc():
     """
     Test MVCSolver
     """
     test_mvc_gurobi_solver()
+    test_mvc_highs_solver()
+    test_mvc_graph_batch()
 
 
 ##############################################
@@ -3,7 +3,26 @@ import sys
 root_folder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(root_folder)
 import shutil
-from ml4co_kit.utils.file_utils import compress_folder, extract_archive
+import numpy as np
+from ml4co_kit.utils.file_utils import compress_folder, extract_archive, parallel_load
+from ml4co_kit.utils.graph.base import read_gpickle_edges, read_result
+from ml4co_kit.utils.graph.base import read_graph_npz, write_graph_npz
+from ml4co_kit.utils.shortest_path import floyd_warshall
+from ml4co_kit.utils.knn_utils import knn_graph
+from ml4co_kit.utils.tsplib_utils import read_tsplib, tsplib_edge_weight_matrix
+from ml4co_kit.utils.tsplib_utils import render_tsp, render_atsp, render_vrp, render_tour
+from ml4co_kit.utils.distance_utils import distance_matrix, TSPLIB_ROUND_FUNCS
+from ml4co_kit.utils import tsplib95
+from ml4co_kit.utils.graph import (
+    mcut_cut_value, mis_check_independence, mvc_check_cover, mcl_check_clique,
+    batch_mcut_cut_value, batch_mis_check_independence, 
+    batch_mvc_check_cover, batch_mcl_check_clique, mis_violations, mvc_violations, 
+    mcl_violations, batch_mis_repair, batch_mvc_repair, batch_mcl_repair,
+    erdos_renyi_edges, barabasi_albert_edges, holme_kim_edges, watts_strogatz_edges,
+    GraphData, GraphBatch, batch_mis_violations, batch_mcl_violations,
+    complement_edges, degeneracy_order, greedy_clique, np_dense_to_sparse
+)
+from ml4co_kit.utils.type_utils import TASK_TYPE
 
 
 def test_file_utils():
@@ -36,5 +55,425 @@ def test_file_utils():
     os.remove("tests/data_for_tests/utils/extract_compress.zip")
 
 
+
+def test_parallel_load():
+    # write results with different lengths, so that the order can be checked
+    folder = "tests/data_for_tests/utils/parallel_load"
+    os.makedirs(folder, exist_ok=True)
+    args_list = list()
+    for idx in range(7):
+        file_path = os.path.join(folder, f"{idx}.result")
+        with open(file_path, "w") as f:
+            f.write("\n".join(["1"] * (idx + 1)) + "\n")
+        args_list.append((file_path,))
+    for num_processes, chunk_size in [(1, None), (2, None), (2, 3)]:
+        results, load_times = parallel_load(
+            read_result, args_list, num_processes=num_processes, chunk_size=chunk_size
+        )
+        if [len(nodes_label) for nodes_label in results] != list(range(1, 8)):
+            raise ValueError("``parallel_load`` does not keep the order of the files.")
+        if len(load_times) != 7:
+            raise ValueError("``parallel_load`` should time each file.")
+    shutil.rmtree(folder)
+    
+    # gpickle
+    nodes_num, edges = read_gpickle_edges("examples/mis/instance/mis_example.gpickle")
+    if edges.ndim != 2 or edges.shape[1] != 2 or edges.max() >= nodes_num:
+        raise ValueError("``read_gpickle_edges`` should return edges with shape (E, 2).")
+
+
+def test_graph_evaluate():
+    # triangle (0, 1, 2) with a pendant node 3, both directions and self-loops
+    edges = np.array([[0, 1], [1, 2], [0, 2], [2, 3]])
+    edge_index = np.concatenate([edges, edges[:, ::-1]], axis=0).T
+    self_loop = np.arange(4).reshape(1, -1).repeat(2, axis=0)
+    edge_index = np.concatenate([self_loop, edge_index], axis=1)
+    
+    # single graph
+    if mcut_cut_value(edge_index, np.array([1, 0, 0, 1])) != 3:
+        raise ValueError("There is a problem with ``mcut_cut_value``")
+    edge_attr = np.arange(edge_index.shape[1], dtype=np.float64)
+    if mcut_cut_value(edge_index, np.array([1, 0, 0, 0]), edge_attr) != 4 + 6:
+        raise ValueError("There is a problem with ``mcut_cut_value`` (weighted)")
+    if not mis_check_independence(edge_index, np.array([1, 0, 0, 1])):
+        raise ValueError("There is a problem with ``mis_check_independence``")
+    if mis_check_independence(edge_index, np.array([0, 0, 1, 1])):
+        raise ValueError("There is a problem with ``mis_check_independence``")
+    if not mvc_check_cover(edge_index, np.array([1, 0, 1, 0])):
+        raise ValueError("There is a problem with ``mvc_check_cover``")
+    if mvc_check_cover(edge_index, np.array([1, 1, 0, 0])):
+        raise ValueError("There is a problem with ``mvc_check_cover``")
+    if not mcl_check_clique(edge_index, np.array([1, 1, 1, 0])):
+        raise ValueError("There is a problem with ``mcl_check_clique``")
+    if mcl_check_clique(edge_index, np.array([1, 1, 0, 1])):
+        raise ValueError("There is a problem with ``mcl_check_clique``")
+    
+    # batched graphs
+    edge_index_list = [edge_index, edge_index]
+    nodes_label_list = [np.array([1, 1, 1, 0]), np.array([1, 0, 0, 1])]
+    if not np.all(batch_mcut_cut_value(edge_index_list, nodes_label_list) == [1, 3]):
+        raise ValueError("There is a problem with ``batch_mcut_cut_value``")
+    if not np.all(
+        batch_mis_check_independence(edge_index_list, nodes_label_list) == [False, True]
+    ):
+        raise ValueError("There is a problem with ``batch_mis_check_independence``")
+    if not np.all(batch_mvc_check_cover(edge_index_list, nodes_label_list) == [True, False]):
+        raise ValueError("There is a problem with ``batch_mvc_check_cover``")
+    if not np.all(batch_mcl_check_clique(edge_index_list, nodes_label_list) == [True, False]):
+        raise ValueError("There is a problem with ``batch_mcl_check_clique``")
+
+
+def test_graph_feasibility():
+    # triangle (0, 1, 2) with a pendant node 3, both directions and self-loops
+    edges = np.array([[0, 1], [1, 2], [0, 2], [2, 3]])
+    edge_index = np.concatenate([edges, edges[:, ::-1]], axis=0).T
+    self_loop = np.arange(4).reshape(1, -1).repeat(2, axis=0)
+    edge_index = np.concatenate([self_loop, edge_index], axis=1)
+    nodes_label = np.array([1, 1, 0, 1])
+    
+    # validation
+    if mis_violations(edge_index, nodes_label).shape[1] != 1:
+        raise ValueError("There is a problem with ``mis_violations``")
+    if mvc_violations(edge_index, np.array([1, 0, 0, 0])).shape[1] != 2:
+        raise ValueError("There is a problem with ``mvc_violations``")
+    if mcl_violations(edge_index, nodes_label).tolist() != [0, 1, 3]:
+        raise ValueError("There is a problem with ``mcl_violations``")
+    
+    # repair
+    edge_index_list = [edge_index, edge_index]
+    nodes_label_list = [nodes_label, np.array([1, 1, 1, 1])]
+    for repaired in batch_mis_repair(edge_index_list, nodes_label_list):
+        if not mis_check_independence(edge_index, repaired):
+            raise ValueError("There is a problem with ``batch_mis_repair``")
+    for repaired in batch_mvc_repair(edge_index_list, nodes_label_list):
+        if not mvc_check_cover(edge_index, repaired):
+            raise ValueError("There is a problem with ``batch_mvc_repair``")
+    for repaired in batch_mcl_repair(edge_index_list, nodes_label_list):
+        if not mcl_check_clique(edge_index, repaired) or repaired.sum() < 2:
+            raise ValueError("There is a problem with ``batch_mcl_repair``")
+
+
+def _check_simple_edges(edges: np.ndarray, nodes_num: int, name: str):
+    # no self-loops, no multiple edges and every node id in range
+    low = np.minimum(edges[:, 0], edges[:, 1])
+    high = np.maximum(edges[:, 0], edges[:, 1])
+    if np.any(low == high) or edges.min() < 0 or edges.max() >= nodes_num:
+        raise ValueError(f"There is a problem with ``{name}``")
+    if len(np.unique(low * nodes_num + high)) != len(edges):
+        raise ValueError(f"There is a problem with ``{name}``")
+
+
+def test_random_graph():
+    rng = np.random.default_rng(0)
+    
+    # Erdos-Renyi (sparse and dense sampling)
+    for prob in [0.02, 0.5]:
+        edges_num = [len(erdos_renyi_edges(200, prob, rng)) for _ in range(20)]
+        expected = 200 * 199 / 2 * prob
+        if abs(np.mean(edges_num) - expected) > 0.05 * expected:
+            raise ValueError("There is a problem with ``erdos_renyi_edges``")
+        _check_simple_edges(erdos_renyi_edges(200, prob, rng), 200, "erdos_renyi_edges")
+    if erdos_renyi_edges(10, 1.0, rng).shape != (45, 2):
+        raise ValueError("There is a problem with ``erdos_renyi_edges``")
+    
+    # preferential attachment
+    edges = barabasi_albert_edges(300, 4, rng)
+    if len(edges) != 4 * (300 - 4):
+        raise ValueError("There is a problem with ``barabasi_albert_edges``")
+    _check_simple_edges(edges, 300, "barabasi_albert_edges")
+    # a triad may close on a later attachment target, so some edges can coincide
+    edges = holme_kim_edges(300, 4, 0.3, rng)
+    if len(edges) > 4 * (300 - 4) or len(edges) < 0.9 * 4 * (300 - 4):
+        raise ValueError("There is a problem with ``holme_kim_edges``")
+    _check_simple_edges(edges, 300, "holme_kim_edges")
+    
+    # small world (rewiring keeps the number of edges)
+    edges = watts_strogatz_edges(300, 6, 0.2, rng)
+    if len(edges) != 300 * 3:
+        raise ValueError("There is a problem with ``watts_strogatz_edges``")
+    _check_simple_edges(edges, 300, "watts_strogatz_edges")
+
+
+def test_graph_csr():
+    # path 0 - 1 - 2 with self-loops and a duplicated edge (1, 2)
+    graph = GraphData()
+    graph.from_edge_list(nodes_num=4, edges=np.array([[0, 1], [1, 2], [2, 1]]))
+    if graph.degree.tolist() != [2, 3, 2, 1]:
+        raise ValueError("There is a problem with ``GraphData.degree``")
+    if graph.neighbors(1).tolist() != [0, 1, 2]:
+        raise ValueError("There is a problem with ``GraphData.neighbors``")
+    u, v, weights = graph.undirected_edges()
+    if u.tolist() != [0, 1] or v.tolist() != [1, 2] or weights.tolist() != [2, 4]:
+        raise ValueError("There is a problem with ``GraphData.undirected_edges``")
+    
+    # the cached views are rebuilt after a mutation
+    graph.remove_self_loop()
+    if graph.degree.tolist() != [1, 2, 1, 0] or graph.neighbors(1).tolist() != [0, 2]:
+        raise ValueError("The CSR view of ``GraphData`` is not invalidated")
+    if graph.adj_matrix is not None:
+        raise ValueError("``GraphData`` should not build the dense matrix implicitly")
+
+
+def test_graph_batch():
+    # load the example graphs into one batch
+    batch = GraphBatch().from_txt("tests/data_for_tests/solver/mis/mis_example.txt")
+    graphs = batch.to_graphs()
+    edge_index = [graph.edge_index for graph in graphs]
+    nodes_label = [graph.nodes_label for graph in graphs]
+    if len(batch) != len(graphs) or batch.nodes_num.sum() != len(batch.nodes_label):
+        raise ValueError("There is a problem with ``GraphBatch.from_txt``")
+
+    # evaluation and validation against the per-graph functions
+    sel_nodes_num = [label.sum() for label in nodes_label]
+    if batch.evaluate(TASK_TYPE.MIS).tolist() != sel_nodes_num:
+        raise ValueError("There is a problem with ``GraphBatch.evaluate``")
+    cut_value = batch_mcut_cut_value(edge_index, nodes_label)
+    if not np.allclose(batch.evaluate(TASK_TYPE.MCut), cut_value):
+        raise ValueError("There is a problem with ``GraphBatch.evaluate``")
+    violations = batch_mis_violations(edge_index, nodes_label)
+    if batch.validate(TASK_TYPE.MIS).tolist() != violations.tolist():
+        raise ValueError("There is a problem with ``GraphBatch.validate``")
+    violations = batch_mcl_violations(edge_index, nodes_label)
+    if batch.validate(TASK_TYPE.MCl).tolist() != violations.tolist():
+        raise ValueError("There is a problem with ``GraphBatch.validate``")
+    batch.repair(TASK_TYPE.MCl)
+    if batch.validate(TASK_TYPE.MCl).any():
+        raise ValueError("There is a problem with ``GraphBatch.repair``")
+
+    # round trip through .txt and the graph list
+    batch.to_txt("tests/data_for_tests/utils/graph_batch.txt")
+    new_batch = GraphBatch().from_txt("tests/data_for_tests/utils/graph_batch.txt", ref=True)
+    os.remove("tests/data_for_tests/utils/graph_batch.txt")
+    new_batch = GraphBatch().from_graphs(new_batch.to_graphs())
+    if not (new_batch.edge_index == batch.edge_index).all() \
+        or not (new_batch.ref_nodes_label == batch.nodes_label).all():
+        raise ValueError("There is a problem with the ``GraphBatch`` round trip")
+
+
+def test_graph_complement():
+    edges = erdos_renyi_edges(60, 0.2, np.random.default_rng(0))
+    u, v = edges[:, 0], edges[:, 1]
+    adj = np.zeros(shape=(60, 60), dtype=bool)
+    adj[u, v] = adj[v, u] = True
+    
+    # complement edges streamed in blocks
+    pairs = [np.stack(pair, axis=1) for pair in complement_edges(u, v, 60, block_size=7)]
+    pairs = np.concatenate(pairs, axis=0)
+    ref_pairs = np.stack(np.nonzero(np.triu(~adj, k=1)), axis=1)
+    if pairs.tolist() != ref_pairs.tolist():
+        raise ValueError("There is a problem with ``complement_edges``")
+    
+    # sparse ``to_complement`` keeps the self-loops
+    graph = GraphData()
+    graph.from_edge_list(nodes_num=60, edges=np.concatenate([edges, [[3, 3]]]), self_loop=False)
+    graph.to_complement()
+    ref_adj = ~adj
+    np.fill_diagonal(ref_adj, False)
+    ref_adj[3, 3] = True
+    if graph.edge_index.tolist() != np.stack(np.nonzero(ref_adj), axis=0).tolist():
+        raise ValueError("There is a problem with ``GraphData.to_complement``")
+    
+    # every node has at most ``core`` later neighbors in the degeneracy order
+    core, rank = degeneracy_order(u, v, 60)
+    first = np.where(rank[u] < rank[v], u, v)
+    if np.any(np.bincount(first, minlength=60) > core):
+        raise ValueError("There is a problem with ``degeneracy_order``")
+    clique = np.flatnonzero(greedy_clique(u, v, 60, core=core))
+    if not adj[clique][:, clique][~np.eye(len(clique), dtype=bool)].all():
+        raise ValueError("There is a problem with ``greedy_clique``")
+
+
+def test_graph_npz():
+    # the undirected edges are written once, in a much smaller file than the gpickle
+    gpickle_path = "tests/data_for_tests/solver/mis/mis_example/instance/" \
+        "CBS_k3_n100_m403_b10_57.gpickle"
+    npz_path = "tests/graph_npz.tmp.npz"
+    nodes_num, edges = read_gpickle_edges(gpickle_path)
+    duplicated = np.concatenate([edges[:, ::-1], edges, [[0, 0]]], axis=0)
+    labels = np.arange(nodes_num) % 2
+    write_graph_npz(npz_path, nodes_num, duplicated, nodes_weight=labels + 1, nodes_label=labels)
+    npz_size = os.path.getsize(npz_path)
+    npz_nodes_num, npz_edges, nodes_weight, nodes_label = read_graph_npz(npz_path)
+    os.remove(npz_path)
+    if npz_nodes_num != nodes_num or npz_size * 5 > os.path.getsize(gpickle_path):
+        raise ValueError("``write_graph_npz`` writes a wrong or large file.")
+    ref_edges = np.unique(np.sort(edges, axis=1), axis=0)
+    if not np.array_equal(npz_edges, ref_edges):
+        raise ValueError("``read_graph_npz`` reads wrong edges.")
+    if not np.array_equal(nodes_label, labels) or not np.array_equal(nodes_weight, labels + 1):
+        raise ValueError("``read_graph_npz`` reads wrong weights or labels.")
+
+
+def test_np_dense_to_sparse():
+    dists = np.random.default_rng(0).random(size=(3, 50, 50))
+    nodes_num, edge_index, edge_attr = np_dense_to_sparse(
+        dists, sparse_factor=6, self_loop=False, chunk_size=7
+    )
+    if nodes_num != 50 or edge_index.shape != (3, 2, 300) or edge_attr.shape != (3, 300):
+        raise ValueError("There is a problem with the batched ``np_dense_to_sparse``")
+    
+    # reference: full sort of every row without the diagonal
+    for dist, sparse_edge_index, sparse_edge_attr in zip(dists, edge_index, edge_attr):
+        masked = dist + np.diag(np.full(50, np.inf))
+        ref_knn = np.argsort(masked, axis=1)[:, :6].reshape(-1)
+        if not (sparse_edge_index[1] == ref_knn).all():
+            raise ValueError("There is a problem with ``np_dense_to_sparse``")
+        if not (sparse_edge_attr == dist[sparse_edge_index[0], ref_knn]).all():
+            raise ValueError("There is a problem with ``np_dense_to_sparse``")
+    
+    # the largest entries with self-loops, and the input is left unchanged
+    dist = dists[0].copy()
+    _, single_edge_index, _ = np_dense_to_sparse(
+        dist, max_or_min="max", sparse_factor=4, self_loop=True
+    )
+    if not (single_edge_index[1].reshape(50, 4)[:, 0] == np.arange(50)).all():
+        raise ValueError("There is a problem with ``np_dense_to_sparse``")
+    if not (dist == dists[0]).all():
+        raise ValueError("``np_dense_to_sparse`` should not modify the input matrix")
+
+
+def test_knn_graph():
+    points = np.random.default_rng(0).random(size=(3, 150, 2))
+    for tree_threshold in [100, 1000]:
+        for self_loop in [True, False]:
+            edge_index, edge_attr = knn_graph(
+                points, sparse_factor=8, self_loop=self_loop, 
+                chunk_size=64, tree_threshold=tree_threshold, num_threads=2
+            )
+            if edge_index.shape != (3, 2, 1200) or edge_attr.shape != (3, 1200):
+                raise ValueError("There is a problem with the shape of ``knn_graph``")
+            
+            # reference: full sort of the distance matrices
+            for point, knn_edge_index, knn_edge_attr in zip(points, edge_index, edge_attr):
+                dists = np.linalg.norm(point[:, None] - point[None], axis=-1)
+                np.fill_diagonal(dists, -1 if self_loop else np.inf)
+                ref_knn = np.argsort(dists, axis=1)[:, :8]
+                ref_dists = np.maximum(np.take_along_axis(dists, ref_knn, axis=1), 0)
+                if not (knn_edge_index[0] == np.repeat(np.arange(150), 8)).all():
+                    raise ValueError("There is a problem with ``knn_graph``")
+                if not (knn_edge_index[1] == ref_knn.reshape(-1)).all():
+                    raise ValueError("There is a problem with ``knn_graph``")
+                if not np.allclose(knn_edge_attr, ref_dists.reshape(-1)):
+                    raise ValueError("There is a problem with ``knn_graph``")
+
+
+def test_read_tsplib():
+    # node coordinates and tours, compared with ``tsplib95``
+    for file_path in [
+        "examples/tsp/tsplib_1/problem/a280.tsp", 
+        "examples/tsp/tsplib_1/solution/a280.opt.tour"
+    ]:
+        data = read_tsplib(file_path)
+        problem = tsplib95.load(file_path)
+        if file_path.endswith(".tsp"):
+            points = np.array(list(problem.node_coords.values()))
+            if not np.array_equal(data["node_coords"], points):
+                raise ValueError("``read_tsplib`` reads wrong node coordinates.")
+        elif not np.array_equal(data["tours"][0], problem.tours[0]):
+            raise ValueError("``read_tsplib`` reads a wrong tour.")
+        if int(data["header"]["DIMENSION"]) != problem.dimension:
+            raise ValueError("``read_tsplib`` reads a wrong header.")
+    
+    # explicit edge weights
+    data = read_tsplib("examples/atsp/tsplib_1/problem/gr24.tsp")
+    problem = tsplib95.load("examples/atsp/tsplib_1/problem/gr24.tsp")
+    dists = np.array([[problem.get_weight(i, j) for j in range(24)] for i in range(24)])
+    if not np.array_equal(data["edge_weights"], dists):
+        raise ValueError("``read_tsplib`` reads a wrong LOWER_DIAG_ROW matrix.")
+    
+    # the half matrices are mirrored
+    full = np.array([[0, 1, 2], [1, 0, 3], [2, 3, 0]])
+    for edge_weight_format, values in [
+        ("UPPER_ROW", [1, 2, 3]), ("LOWER_ROW", [1, 2, 3]), 
+        ("UPPER_DIAG_ROW", [0, 1, 2, 0, 3, 0]), ("LOWER_COL", [1, 2, 3])
+    ]:
+        matrix = tsplib_edge_weight_matrix(np.array(values), 3, edge_weight_format)
+        if not np.array_equal(matrix, full):
+            raise ValueError(f"Wrong {edge_weight_format} matrix.")
+
+
+def test_render_tsplib():
+    # the rendered files are read back by ``read_tsplib``
+    rng = np.random.default_rng(0)
+    tmp_path = "tests/render_tsplib.tmp"
+    points = rng.random(size=(20, 2))
+    dists = rng.integers(low=0, high=1000, size=(20, 20))
+    demands = rng.integers(low=1, high=10, size=(20,))
+    tour = rng.permutation(20) + 1
+    for text, key, expected in [
+        (render_tsp(points, "test"), "node_coords", points),
+        (render_atsp(dists, "test"), "edge_weights", dists),
+        (render_vrp(points[0] / 2, points, demands, 30), "node_coords", 
+         np.concatenate([points[:1] / 2, points], axis=0)),
+        (render_vrp(points[0] / 2, points, demands, 30), "demands", np.append(0, demands)),
+        (render_tour(tour, "test"), "tours", tour[None, :]),
+    ]:
+        with open(tmp_path, "w") as f:
+            f.write(text)
+        data = read_tsplib(tmp_path)
+        if not np.array_equal(np.array(data[key]), expected):
+            raise ValueError(f"The rendered ``{key}`` are not read back.")
+    os.remove(tmp_path)
+    
+    # the in-memory variant
+    if render_tsp(points, "test", to_bytes=True) != render_tsp(points, "test").encode():
+        raise ValueError("``render_tsp`` returns wrong bytes.")
+
+
+def test_distance_matrix():
+    # every edge weight type (with the rounding of TSPLIB), compared with ``tsplib95``
+    rng = np.random.default_rng(0)
+    points = np.round(rng.uniform(low=-90, high=90, size=(2, 12, 3)), 2)
+    for norm in TSPLIB_ROUND_FUNCS.keys():
+        dim = 3 if norm.endswith("_3D") or norm.startswith("XRAY") else 2
+        dists = distance_matrix(points[..., :dim], norm, round_func="tsplib")
+        if dists.shape != (2, 12, 12):
+            raise ValueError(f"``distance_matrix`` returns a wrong shape for {norm}.")
+        for pts, dist in zip(points[..., :dim], dists):
+            dist_func = tsplib95.distances.TYPES[norm]
+            ref = np.array([[dist_func(a, b) for b in pts] for a in pts])
+            if not np.array_equal(dist, ref):
+                raise ValueError(f"``distance_matrix`` computes wrong {norm} distances.")
+    
+    # the unrounded euclidean distances do not depend on the block size
+    dists = distance_matrix(points[0, :, :2], "EUC_2D", block_size=5)
+    diff = points[0, :, None, :2] - points[0, None, :, :2]
+    if not np.allclose(dists, np.sqrt((diff ** 2).sum(axis=-1))):
+        raise ValueError("``distance_matrix`` computes wrong blocked distances.")
+
+
+def test_floyd_warshall():
+    rng = np.random.default_rng(0)
+    dists = rng.integers(low=0, high=1000, size=(3, 70, 70))
+    dists[:, np.arange(70), np.arange(70)] = 0
+    closure = floyd_warshall(dists, block_size=16, chunk_size=24)
+    
+    # reference: repeated min-plus squaring until convergence
+    for dist, result in zip(dists, closure):
+        while True:
+            new_dist = (dist[:, :, None] + dist[None, :, :]).min(axis=1)
+            if (new_dist == dist).all():
+                break
+            dist = new_dist
+        if not (result == dist).all():
+            raise ValueError("There is a problem with ``floyd_warshall``")
+    if not (floyd_warshall(dists[0]) == closure[0]).all():
+        raise ValueError("There is a problem with ``floyd_warshall``")
+
+
 if __name__ == "__main__":
     test_file_utils()
+    test_parallel_load()
+    test_graph_evaluate()
+    test_graph_feasibility()
+    test_random_graph()
+    test_graph_csr()
+    test_graph_batch()
+    test_graph_complement()
+    test_graph_npz()
+    test_np_dense_to_sparse()
+    test_knn_graph()
+    test_read_tsplib()
+    test_render_tsplib()
+    test_distance_matrix()
+    test_floyd_warshall()